@@ -6,16 +6,24 @@ para análise de dados em linguagem natural.
 """
 
 import os
-from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import google.generativeai as genai
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 from dotenv import load_dotenv
 
+from src.infrastructure.config import get_settings
+from src.infrastructure.lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+    from src.application.loading.cube import AnalyticsCube
+
+# Importados no primeiro uso: a página aparece antes de pandas e plotly serem carregados
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
 # Carregar variáveis de ambiente
 load_dotenv()
 
@@ -58,13 +66,15 @@ st.markdown("""
 
 
 # Configurar Gemini
-def configure_gemini() -> Optional[genai.GenerativeModel]:
-    """Configurar Google Gemini API."""
+def configure_gemini() -> Optional["genai.GenerativeModel"]:
+    """Configurar Google Gemini API (o SDK só é importado se houver chave)."""
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         return None
 
     try:
+        import google.generativeai as genai
+
         genai.configure(api_key=api_key)
         return genai.GenerativeModel("gemini-2.5-flash")
     except Exception as e:
@@ -72,33 +82,115 @@ def configure_gemini() -> Optional[genai.GenerativeModel]:
         return None
 
 
-@st.cache_data
-def load_data() -> dict:
-    """Carregar dados da camada Gold."""
-    gold_dir = Path("data/refined")
+GOLD_FILES = {
+    "movies": "movies_enriched.parquet",
+    "yearly": "yearly_analytics.parquet",
+    "genres": "genre_analytics.parquet",
+    "top_movies": "top_movies.parquet",
+    "leaderboards": "leaderboards.parquet",
+    "directors": "director_analytics.parquet",
+    "cube": "cube_analytics.parquet",
+}
+
+
+def read_gold(snapshot) -> dict:
+    """Ler as tabelas do dashboard de uma geração da Gold e indexá-las (cubo, similares e chat)."""
+    from src.application.loading.cube import AnalyticsCube
+    from src.application.loading.similarity import (
+        CENTROIDS_TABLE,
+        INDEX_TABLE,
+        TERMS_TABLE,
+        SimilarityIndex,
+    )
+    from src.presentation.dashboard import ContextRetriever
 
-    if not gold_dir.exists():
-        return {}
+    # Uma única geração (snapshot) para que todas as tabelas sejam consistentes
+    data = {
+        key: snapshot.read_parquet(filename)
+        for key, filename in GOLD_FILES.items()
+        if snapshot.has_table(filename)
+    }
+    cube = data.pop("cube", None)
 
-    data = {}
+    tables = [INDEX_TABLE, TERMS_TABLE, CENTROIDS_TABLE]
+    similarity_index = None
+    if all(snapshot.has_table(table) for table in tables):
+        similarity_index = SimilarityIndex.from_tables(
+            *(snapshot.read_table(table) for table in tables)
+        )
 
-    files = {
-        "movies": "movies_enriched.parquet",
-        "yearly": "yearly_analytics.parquet",
-        "genres": "genre_analytics.parquet",
-        "top_movies": "top_movies.parquet",
-        "directors": "director_analytics.parquet",
+    return {
+        "generation": snapshot.generation,
+        "tables": data,
+        "similarity_index": similarity_index,
+        "cube": AnalyticsCube(cube) if cube is not None else None,
+        "retriever": ContextRetriever(data),
     }
 
-    for key, filename in files.items():
-        filepath = gold_dir / filename
-        if filepath.exists():
-            data[key] = pd.read_parquet(filepath)
 
-    return data
+@st.cache_resource
+def gold_store():
+    """Dados da Gold compartilhados entre as sessões.
+
+    Quando o pipeline publica uma nova geração, ela é carregada em segundo plano
+    e substitui a anterior de uma vez; os caches derivados (``st.cache_data`` e as
+    figuras) são limpos na troca. Assim os usuários nunca esperam uma recarga a frio.
+    """
+    from src.infrastructure.repositories import DataRepository
+    from src.presentation.dashboard import GoldDataStore
+
+    return GoldDataStore(
+        DataRepository.for_layer(get_settings(), "gold"),
+        read_gold,
+        on_swap=[st.cache_data.clear, figure_cache().clear],
+    )
+
+
+def load_gold() -> dict:
+    """Carregar a geração da camada Gold em uso (vazio se ainda não existir)."""
+    settings = get_settings()
 
+    if settings.storage_backend == "local" and not settings.gold_dir.exists():
+        return {}
+
+    return gold_store().get()
+
+
+def stream_answer(model: "genai.GenerativeModel", prompt: str) -> None:
+    """Mostrar a resposta do modelo à medida que chega e guardá-la no histórico.
 
-def generate_chart_with_ai(prompt: str, data: dict, model: genai.GenerativeModel) -> None:
+    Uma nova pergunta cancela a resposta anterior ainda em andamento (o Streamlit
+    interrompe a execução e ela é guardada até onde chegou), e a resposta inteira
+    tem o limite de ``CHAT_TIMEOUT_SECONDS`` segundos.
+    """
+    from src.presentation.dashboard import AnswerStream
+
+    previous = st.session_state.get("answer_stream")
+    if previous is not None:
+        previous.cancel()
+    stream = AnswerStream(model, prompt, timeout=get_settings().chat_timeout_seconds)
+    st.session_state.answer_stream = stream
+
+    placeholder = st.empty()
+    placeholder.markdown("_Pensando..._")
+    answer = None
+    try:
+        for _ in stream:
+            placeholder.markdown(stream.text + "▌")
+        answer = stream.text
+        placeholder.markdown(answer)
+    except TimeoutError:
+        answer = f"{stream.text}\n\n⏱️ *Resposta interrompida: tempo limite excedido.*"
+        placeholder.markdown(answer)
+    finally:
+        if answer is None and stream.text:
+            # Interrompida por uma nova pergunta: sem chamadas ao Streamlit aqui
+            answer = f"{stream.text}\n\n*(resposta interrompida)*"
+        if answer is not None:
+            st.session_state.messages.append({"role": "assistant", "content": answer})
+
+
+def generate_chart_with_ai(prompt: str, data: dict, model: "genai.GenerativeModel") -> None:
     """Gerar gráfico usando IA."""
     try:
         # Criar contexto dos dados disponíveis
@@ -149,6 +241,385 @@ O código deve criar uma variável 'fig' com o gráfico plotly.
         st.code(code if "code" in locals() else "Código não gerado")
 
 
+@st.cache_resource
+def figure_cache():
+    """Figuras já construídas, compartilhadas entre as sessões."""
+    from src.presentation.dashboard import FigureCache
+
+    return FigureCache()
+
+
+def show_figure(chart: str, generation: Optional[str], build, **filters) -> None:
+    """Mostrar um gráfico, construído só se o gráfico, os filtros ou a geração mudaram."""
+    st.plotly_chart(
+        figure_cache().get(chart, generation, build, **filters), use_container_width=True
+    )
+
+
+def yearly_movies_figure(yearly_df: "pd.DataFrame") -> "go.Figure":
+    """Produção de filmes por ano."""
+    yearly_recent = yearly_df[yearly_df["release_year"] >= 1990]
+
+    fig = go.Figure()
+
+    # Linha de filmes
+    fig.add_trace(go.Scatter(
+        x=yearly_recent["release_year"],
+        y=yearly_recent["movie_count"],
+        mode='lines+markers',
+        name='Filmes Produzidos',
+        line=dict(color='#1f77b4', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(31, 119, 180, 0.2)'
+    ))
+
+    fig.update_layout(
+        title="📅 Produção de Filmes por Ano (1990+)",
+        xaxis_title="Ano",
+        yaxis_title="Número de Filmes",
+        hovermode='x unified',
+        template='plotly_dark'
+    )
+    return fig
+
+
+def top_genres_figure(genres_df: "pd.DataFrame") -> "go.Figure":
+    """Gêneros com mais filmes."""
+    top_genres = genres_df.nlargest(10, "movie_count")
+
+    fig = px.bar(
+        top_genres,
+        x="movie_count",
+        y="genre_names",
+        orientation="h",
+        title="🎭 Top 10 Gêneros por Número de Filmes",
+        labels={
+            "movie_count": "Número de Filmes",
+            "genre_names": "Gênero",
+        },
+        color="movie_count",
+        color_continuous_scale="Blues",
+        template='plotly_dark'
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"})
+    return fig
+
+
+def yearly_revenue_figure(yearly_df: "pd.DataFrame") -> "go.Figure":
+    """Evolução da receita por ano."""
+    yearly_recent = yearly_df[yearly_df["release_year"] >= 1990]
+
+    fig = go.Figure()
+
+    # Receita total
+    fig.add_trace(go.Bar(
+        x=yearly_recent["release_year"],
+        y=yearly_recent["total_revenue"] / 1e9,
+        name='Receita Total',
+        marker_color='#2ecc71',
+        opacity=0.7
+    ))
+
+    # Receita média (linha)
+    fig.add_trace(go.Scatter(
+        x=yearly_recent["release_year"],
+        y=yearly_recent["avg_revenue"] / 1e6,
+        name='Receita Média/Filme',
+        yaxis='y2',
+        line=dict(color='#e74c3c', width=3),
+        mode='lines+markers'
+    ))
+
+    fig.update_layout(
+        title="💰 Evolução de Receita (1990+)",
+        xaxis_title="Ano",
+        yaxis_title="Receita Total (Bilhões $)",
+        yaxis2=dict(
+            title="Receita Média (Milhões $)",
+            overlaying='y',
+            side='right'
+        ),
+        hovermode='x unified',
+        template='plotly_dark',
+        legend=dict(x=0.01, y=0.99)
+    )
+    return fig
+
+
+def genre_revenue_figure(genres_df: "pd.DataFrame") -> "go.Figure":
+    """Gêneros com maior receita média."""
+    top_revenue_genres = genres_df.nlargest(10, "avg_revenue")
+
+    fig = px.bar(
+        top_revenue_genres,
+        x="avg_revenue",
+        y="genre_names",
+        orientation="h",
+        title="💵 Top 10 Gêneros por Receita Média",
+        labels={
+            "avg_revenue": "Receita Média ($)",
+            "genre_names": "Gênero",
+        },
+        color="avg_revenue",
+        color_continuous_scale="Greens",
+        template='plotly_dark'
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"})
+    fig.update_traces(
+        hovertemplate='<b>%{y}</b><br>Receita: $%{x:,.0f}<extra></extra>'
+    )
+    return fig
+
+
+def ratings_figure(movies_df: "pd.DataFrame") -> "go.Figure":
+    """Distribuição das avaliações."""
+    movies_rated = movies_df[movies_df["vote_average"] > 0]
+
+    fig = px.histogram(
+        movies_rated,
+        x="vote_average",
+        nbins=20,
+        title="⭐ Distribuição de Avaliações",
+        labels={"vote_average": "Nota (0-10)", "count": "Número de Filmes"},
+        color_discrete_sequence=['#f39c12'],
+        template='plotly_dark'
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+def top_directors_figure(directors_df: "pd.DataFrame") -> "go.Figure":
+    """Diretores com maior receita total."""
+    top_directors = directors_df.nlargest(10, "total_revenue")
+
+    fig = px.bar(
+        top_directors,
+        x="total_revenue",
+        y="director",
+        orientation="h",
+        title="🎬 Top 10 Diretores por Receita Total",
+        labels={
+            "total_revenue": "Receita Total ($)",
+            "director": "Diretor",
+        },
+        color="total_revenue",
+        color_continuous_scale="Purples",
+        template='plotly_dark'
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"})
+    fig.update_traces(
+        hovertemplate='<b>%{y}</b><br>Receita: $%{x:,.0f}<extra></extra>'
+    )
+    return fig
+
+
+def top_movies_figure(filtered: "pd.DataFrame", rank_type: str) -> "go.Figure":
+    """Filmes do ranking selecionado."""
+    metric_col = "revenue" if rank_type == "revenue" else "profit" if rank_type == "profit" else "vote_average"
+    metric_name = {"revenue": "Receita", "profit": "Lucro", "vote_average": "Avaliação"}[metric_col]
+
+    fig = px.bar(
+        filtered.head(15),
+        x=metric_col if rank_type != "rating" else "vote_average",
+        y="title",
+        orientation="h",
+        title=f"Top 15 Filmes por {metric_name}",
+        labels={metric_col: metric_name, "title": "Filme", "vote_average": "Nota"},
+        color=metric_col if rank_type != "rating" else "vote_average",
+        color_continuous_scale="Viridis" if rank_type != "rating" else "YlOrRd",
+        template='plotly_dark'
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"}, height=600)
+    return fig
+
+
+def budget_revenue_figure(movies_df: "pd.DataFrame") -> "go.Figure":
+    """Orçamento contra receita de todos os filmes com os dois valores."""
+    from src.presentation.dashboard import point_trace
+
+    fig = go.Figure()
+
+    # Scatter de budget vs revenue (WebGL quando há muitos pontos)
+    movies_with_data = movies_df[
+        (movies_df["has_budget"]) & (movies_df["has_revenue"]) & (movies_df["budget"] > 0)
+    ]
+
+    fig.add_trace(point_trace(
+        x=movies_with_data["budget"] / 1e6,
+        y=movies_with_data["revenue"] / 1e6,
+        mode='markers',
+        marker=dict(
+            size=8,
+            color=movies_with_data["vote_average"],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="Nota"),
+            line=dict(width=0.5, color='white')
+        ),
+        text=movies_with_data["title"],
+        hovertemplate='<b>%{text}</b><br>Orçamento: $%{x:.1f}M<br>Receita: $%{y:.1f}M<extra></extra>',
+        showlegend=False
+    ))
+
+    # Linha de referência ROI 100%
+    max_val = max(movies_with_data["budget"].max(), movies_with_data["revenue"].max()) / 1e6
+    fig.add_trace(go.Scatter(
+        x=[0, max_val],
+        y=[0, max_val],
+        mode='lines',
+        line=dict(color='red', dash='dash', width=2),
+        name='ROI = 100%',
+        hoverinfo='skip'
+    ))
+
+    fig.update_layout(
+        title=f"💰 Orçamento vs Receita ({len(movies_with_data):,} filmes)",
+        xaxis_title="Orçamento (Milhões $)",
+        yaxis_title="Receita (Milhões $)",
+        template='plotly_dark',
+        height=600
+    )
+    return fig
+
+
+def top_movies_by_year_figure(filtered: "pd.DataFrame") -> "go.Figure":
+    """Distribuição por ano dos filmes do ranking selecionado."""
+    yearly_top = filtered.groupby("release_year").agg({
+        "revenue": "mean",
+        "profit": "mean",
+        "vote_average": "mean",
+        "title": "count"
+    }).reset_index()
+    yearly_top.columns = ["release_year", "avg_revenue", "avg_profit", "avg_rating", "count"]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=yearly_top["release_year"],
+        y=yearly_top["count"],
+        name='Número de Filmes',
+        marker_color='rgba(55, 128, 191, 0.7)',
+        yaxis='y'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=yearly_top["release_year"],
+        y=yearly_top["avg_revenue"] / 1e6,
+        name='Receita Média',
+        line=dict(color='#2ecc71', width=3),
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        title="📊 Distribuição Temporal dos Top Filmes",
+        xaxis_title="Ano",
+        yaxis_title="Número de Filmes",
+        yaxis2=dict(
+            title="Receita Média (Milhões $)",
+            overlaying='y',
+            side='right'
+        ),
+        template='plotly_dark',
+        hovermode='x unified'
+    )
+    return fig
+
+
+def cube_slice_figure(by_year: "pd.DataFrame") -> "go.Figure":
+    """Filmes e receita média por ano de uma fatia do cubo."""
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=by_year["release_year"],
+        y=by_year["movie_count"],
+        name='Número de Filmes',
+        marker_color='rgba(55, 128, 191, 0.7)',
+        yaxis='y'
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=by_year["release_year"],
+        y=by_year["avg_revenue"] / 1e6,
+        name='Receita Média',
+        line=dict(color='#2ecc71', width=3),
+        yaxis='y2'
+    ))
+
+    fig.update_layout(
+        title="🧊 Filmes da Fatia por Ano",
+        xaxis_title="Ano",
+        yaxis_title="Número de Filmes",
+        yaxis2=dict(
+            title="Receita Média (Milhões $)",
+            overlaying='y',
+            side='right'
+        ),
+        template='plotly_dark',
+        hovermode='x unified'
+    )
+    return fig
+
+
+def show_cube_slice(cube: "AnalyticsCube", generation: Optional[str]) -> None:
+    """Fatiar os filmes por década, gênero, idioma e país.
+
+    Cada combinação de filtros é uma célula pré-calculada do cubo da Gold: as
+    métricas e o gráfico vêm de buscas pela chave das células, sem group-by.
+    """
+    st.subheader("🧊 Fatiar por Década, Gênero, Idioma e País")
+
+    def every(member) -> str:
+        return "Todos" if member is None else str(member)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        decade = st.selectbox(
+            "Década:",
+            [None, *cube.members["decade"]],
+            format_func=lambda d: "Todas" if d is None else f"{d}s",
+            key="cube_decade",
+        )
+    with col2:
+        genre = st.selectbox(
+            "Gênero:", [None, *cube.members["genre"]], format_func=every, key="cube_genre"
+        )
+    with col3:
+        language = st.selectbox(
+            "Idioma:",
+            [None, *cube.members["original_language"]],
+            format_func=every,
+            key="cube_language",
+        )
+    with col4:
+        country = st.selectbox(
+            "País:",
+            [None, *cube.members["production_country"]],
+            format_func=every,
+            key="cube_country",
+        )
+
+    members = {"genre": genre, "original_language": language, "production_country": country}
+    cell = cube.cell(decade=decade, **members)
+    if cell is None:
+        st.info("Nenhum filme nesta combinação.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Filmes", f"{cell['movie_count']:,}")
+    col2.metric("Receita Total", f"${cell['total_revenue']/1e9:.2f}B")
+    col3.metric("Receita Média", f"${cell['avg_revenue']/1e6:.1f}M")
+    rating = cell["avg_rating"]
+    col4.metric("Nota Média", "-" if pd.isna(rating) else f"{rating:.1f}/10")
+
+    def by_year() -> "pd.DataFrame":
+        years = cube.breakdown("release_year", **members)
+        return years if decade is None else years[years["decade"] == decade]
+
+    show_figure(
+        "cube_slice", generation, lambda: cube_slice_figure(by_year()), decade=decade, **members
+    )
+
+
 def main() -> None:
     """Função principal da aplicação."""
 
@@ -158,7 +629,9 @@ def main() -> None:
 
     # Carregar dados
     with st.spinner("Carregando dados..."):
-        data = load_data()
+        gold = load_gold()
+        data = gold.get("tables", {})
+        generation = gold.get("generation")
 
     if not data:
         st.error(
@@ -189,6 +662,9 @@ def main() -> None:
         st.sidebar.metric("Diretores", f"{data['directors'].shape[0]:,}")
         st.sidebar.metric("Gêneros", f"{data['genres'].shape[0]}")
 
+    if gold.get("generation"):
+        st.sidebar.caption(f"Geração da Gold: `{gold['generation'][:12]}`")
+
     # Inicializar estado da tab se não existir
     if 'active_tab' not in st.session_state:
         st.session_state.active_tab = 0
@@ -254,53 +730,13 @@ def main() -> None:
                 # Evolução temporal
                 yearly_df = data.get("yearly", pd.DataFrame())
                 if not yearly_df.empty:
-                    yearly_recent = yearly_df[yearly_df["release_year"] >= 1990]
-
-                    fig = go.Figure()
-                    
-                    # Linha de filmes
-                    fig.add_trace(go.Scatter(
-                        x=yearly_recent["release_year"],
-                        y=yearly_recent["movie_count"],
-                        mode='lines+markers',
-                        name='Filmes Produzidos',
-                        line=dict(color='#1f77b4', width=3),
-                        fill='tozeroy',
-                        fillcolor='rgba(31, 119, 180, 0.2)'
-                    ))
-                    
-                    fig.update_layout(
-                        title="📅 Produção de Filmes por Ano (1990+)",
-                        xaxis_title="Ano",
-                        yaxis_title="Número de Filmes",
-                        hovermode='x unified',
-                        template='plotly_dark'
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure("yearly_movies", generation, lambda: yearly_movies_figure(yearly_df))
 
             with col2:
                 # Top gêneros
                 genres_df = data.get("genres", pd.DataFrame())
                 if not genres_df.empty:
-                    top_genres = genres_df.nlargest(10, "movie_count")
-
-                    fig = px.bar(
-                        top_genres,
-                        x="movie_count",
-                        y="genre_names",
-                        orientation="h",
-                        title="🎭 Top 10 Gêneros por Número de Filmes",
-                        labels={
-                            "movie_count": "Número de Filmes",
-                            "genre_names": "Gênero",
-                        },
-                        color="movie_count",
-                        color_continuous_scale="Blues",
-                        template='plotly_dark'
-                    )
-                    fig.update_layout(yaxis={"categoryorder": "total ascending"})
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure("top_genres", generation, lambda: top_genres_figure(genres_df))
 
             # Segunda linha de gráficos
             col1, col2 = st.columns(2)
@@ -308,114 +744,30 @@ def main() -> None:
             with col1:
                 # Evolução de receita
                 if not yearly_df.empty:
-                    yearly_recent = yearly_df[yearly_df["release_year"] >= 1990]
-                    
-                    fig = go.Figure()
-                    
-                    # Receita total
-                    fig.add_trace(go.Bar(
-                        x=yearly_recent["release_year"],
-                        y=yearly_recent["total_revenue"] / 1e9,
-                        name='Receita Total',
-                        marker_color='#2ecc71',
-                        opacity=0.7
-                    ))
-                    
-                    # Receita média (linha)
-                    fig.add_trace(go.Scatter(
-                        x=yearly_recent["release_year"],
-                        y=yearly_recent["avg_revenue"] / 1e6,
-                        name='Receita Média/Filme',
-                        yaxis='y2',
-                        line=dict(color='#e74c3c', width=3),
-                        mode='lines+markers'
-                    ))
-                    
-                    fig.update_layout(
-                        title="💰 Evolução de Receita (1990+)",
-                        xaxis_title="Ano",
-                        yaxis_title="Receita Total (Bilhões $)",
-                        yaxis2=dict(
-                            title="Receita Média (Milhões $)",
-                            overlaying='y',
-                            side='right'
-                        ),
-                        hovermode='x unified',
-                        template='plotly_dark',
-                        legend=dict(x=0.01, y=0.99)
-                    )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure("yearly_revenue", generation, lambda: yearly_revenue_figure(yearly_df))
 
             with col2:
                 # Receita por gênero
                 if not genres_df.empty:
-                    top_revenue_genres = genres_df.nlargest(10, "avg_revenue")
-                    
-                    fig = px.bar(
-                        top_revenue_genres,
-                        x="avg_revenue",
-                        y="genre_names",
-                        orientation="h",
-                        title="💵 Top 10 Gêneros por Receita Média",
-                        labels={
-                            "avg_revenue": "Receita Média ($)",
-                            "genre_names": "Gênero",
-                        },
-                        color="avg_revenue",
-                        color_continuous_scale="Greens",
-                        template='plotly_dark'
-                    )
-                    fig.update_layout(yaxis={"categoryorder": "total ascending"})
-                    fig.update_traces(
-                        hovertemplate='<b>%{y}</b><br>Receita: $%{x:,.0f}<extra></extra>'
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure("genre_revenue", generation, lambda: genre_revenue_figure(genres_df))
 
             # Terceira linha - Análise de avaliações
             col1, col2 = st.columns(2)
             
             with col1:
                 # Distribuição de avaliações
-                movies_rated = movies_df[movies_df["vote_average"] > 0]
-                
-                fig = px.histogram(
-                    movies_rated,
-                    x="vote_average",
-                    nbins=20,
-                    title="⭐ Distribuição de Avaliações",
-                    labels={"vote_average": "Nota (0-10)", "count": "Número de Filmes"},
-                    color_discrete_sequence=['#f39c12'],
-                    template='plotly_dark'
-                )
-                fig.update_layout(showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+                show_figure("ratings", generation, lambda: ratings_figure(movies_df))
             
             with col2:
                 # Top diretores
                 directors_df = data.get("directors", pd.DataFrame())
                 if not directors_df.empty:
-                    top_directors = directors_df.nlargest(10, "total_revenue")
-                    
-                    fig = px.bar(
-                        top_directors,
-                        x="total_revenue",
-                        y="director",
-                        orientation="h",
-                        title="🎬 Top 10 Diretores por Receita Total",
-                        labels={
-                            "total_revenue": "Receita Total ($)",
-                            "director": "Diretor",
-                        },
-                        color="total_revenue",
-                        color_continuous_scale="Purples",
-                        template='plotly_dark'
-                    )
-                    fig.update_layout(yaxis={"categoryorder": "total ascending"})
-                    fig.update_traces(
-                        hovertemplate='<b>%{y}</b><br>Receita: $%{x:,.0f}<extra></extra>'
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_figure("top_directors", generation, lambda: top_directors_figure(directors_df))
+
+        cube = gold.get("cube")
+        if cube is not None:
+            st.divider()
+            show_cube_slice(cube, generation)
 
     # ==================== TAB 2: FILMES ====================
     with tab2:
@@ -502,113 +854,106 @@ def main() -> None:
 
             with col1:
                 # Gráfico de barras principal
-                metric_col = "revenue" if rank_type == "revenue" else "profit" if rank_type == "profit" else "vote_average"
-                metric_name = {"revenue": "Receita", "profit": "Lucro", "vote_average": "Avaliação"}[rank_type]
-                
-                fig = px.bar(
-                    filtered.head(15),
-                    x=metric_col if rank_type != "rating" else "vote_average",
-                    y="title",
-                    orientation="h",
-                    title=f"Top 15 Filmes por {metric_name}",
-                    labels={metric_col: metric_name, "title": "Filme", "vote_average": "Nota"},
-                    color=metric_col if rank_type != "rating" else "vote_average",
-                    color_continuous_scale="Viridis" if rank_type != "rating" else "YlOrRd",
-                    template='plotly_dark'
+                show_figure(
+                    "top_movies",
+                    generation,
+                    lambda: top_movies_figure(filtered, rank_type),
+                    rank_type=rank_type,
+                    top_n=top_n,
                 )
-                fig.update_layout(yaxis={"categoryorder": "total ascending"}, height=600)
-                st.plotly_chart(fig, use_container_width=True)
 
             with col2:
                 # Scatter plot - Relação entre métricas
-                fig = go.Figure()
-                
-                # Scatter de budget vs revenue
-                movies_with_data = movies_df[
-                    (movies_df["has_budget"]) & (movies_df["has_revenue"]) & (movies_df["budget"] > 0)
-                ].head(500)
-                
-                fig.add_trace(go.Scatter(
-                    x=movies_with_data["budget"] / 1e6,
-                    y=movies_with_data["revenue"] / 1e6,
-                    mode='markers',
-                    marker=dict(
-                        size=8,
-                        color=movies_with_data["vote_average"],
-                        colorscale='Viridis',
-                        showscale=True,
-                        colorbar=dict(title="Nota"),
-                        line=dict(width=0.5, color='white')
-                    ),
-                    text=movies_with_data["title"],
-                    hovertemplate='<b>%{text}</b><br>Orçamento: $%{x:.1f}M<br>Receita: $%{y:.1f}M<extra></extra>',
-                    showlegend=False
-                ))
-                
-                # Linha de referência ROI 100%
-                max_val = max(movies_with_data["budget"].max(), movies_with_data["revenue"].max()) / 1e6
-                fig.add_trace(go.Scatter(
-                    x=[0, max_val],
-                    y=[0, max_val],
-                    mode='lines',
-                    line=dict(color='red', dash='dash', width=2),
-                    name='ROI = 100%',
-                    hoverinfo='skip'
-                ))
-                
-                fig.update_layout(
-                    title="💰 Orçamento vs Receita (Top 500 filmes)",
-                    xaxis_title="Orçamento (Milhões $)",
-                    yaxis_title="Receita (Milhões $)",
-                    template='plotly_dark',
-                    height=600
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                show_figure("budget_revenue", generation, lambda: budget_revenue_figure(movies_df))
 
             # Análise temporal dos top filmes
             st.subheader("📅 Análise Temporal")
             
-            yearly_top = filtered.groupby("release_year").agg({
-                "revenue": "mean",
-                "profit": "mean",
-                "vote_average": "mean",
-                "title": "count"
-            }).reset_index()
-            yearly_top.columns = ["release_year", "avg_revenue", "avg_profit", "avg_rating", "count"]
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Bar(
-                x=yearly_top["release_year"],
-                y=yearly_top["count"],
-                name='Número de Filmes',
-                marker_color='rgba(55, 128, 191, 0.7)',
-                yaxis='y'
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=yearly_top["release_year"],
-                y=yearly_top["avg_revenue"] / 1e6,
-                name='Receita Média',
-                line=dict(color='#2ecc71', width=3),
-                yaxis='y2'
-            ))
-            
-            fig.update_layout(
-                title="📊 Distribuição Temporal dos Top Filmes",
-                xaxis_title="Ano",
-                yaxis_title="Número de Filmes",
-                yaxis2=dict(
-                    title="Receita Média (Milhões $)",
-                    overlaying='y',
-                    side='right'
+            show_figure(
+                "top_movies_by_year",
+                generation,
+                lambda: top_movies_by_year_figure(filtered),
+                rank_type=rank_type,
+                top_n=top_n,
+            )
+
+        leaderboards_df = data.get("leaderboards", pd.DataFrame())
+
+        if not leaderboards_df.empty:
+            # Rankings por gênero, ano e década, pré-calculados na camada Gold
+            st.subheader("🏅 Rankings por Grupo")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                leaderboard = st.selectbox(
+                    "Ranking:",
+                    list(leaderboards_df["leaderboard"].unique()),
+                    format_func=lambda x: {
+                        "revenue_by_genre": "💰 Receita por gênero",
+                        "rating_by_genre": "⭐ Avaliação por gênero",
+                        "revenue_by_year": "💰 Receita por ano",
+                        "rating_by_decade": "⭐ Avaliação por década",
+                    }.get(x, x),
+                )
+
+            board = leaderboards_df[leaderboards_df["leaderboard"] == leaderboard]
+
+            with col2:
+                group = st.selectbox("Grupo:", sorted(board["group"].unique(), reverse=True))
+
+            st.dataframe(
+                board[board["group"] == group][
+                    ["rank", "title", "release_year", "revenue", "vote_average", "vote_count"]
+                ].style.format(
+                    {
+                        "revenue": "${:,.0f}",
+                        "vote_average": "{:.1f}",
+                        "vote_count": "{:,.0f}",
+                        "release_year": "{:.0f}",
+                    }
                 ),
-                template='plotly_dark',
-                hovermode='x unified'
+                use_container_width=True,
+                hide_index=True,
             )
-            
-            st.plotly_chart(fig, use_container_width=True)
+
+        similarity_index = gold.get("similarity_index")
+        movies_df = data.get("movies", pd.DataFrame())
+
+        if similarity_index is not None and not movies_df.empty:
+            # Busca "mais como este" no índice TF-IDF da camada Gold
+            st.subheader("🔎 Filmes Parecidos")
+
+            titles = movies_df.drop_duplicates("id").set_index("id")
+            search = st.text_input("Buscar título:", placeholder="Ex: Toy Story")
+            matches = titles[
+                titles["title"].str.contains(search, case=False, na=False, regex=False)
+            ]
+
+            if search and matches.empty:
+                st.info("Nenhum filme encontrado")
+            elif search:
+                def movie_label(movie_id: int) -> str:
+                    title, year = titles.at[movie_id, "title"], titles.at[movie_id, "release_year"]
+                    return f"{title} ({year:.0f})" if pd.notna(year) else title
+
+                movie_id = st.selectbox("Filme:", matches.index[:50], format_func=movie_label)
+                similar = similarity_index.similar(movie_id, n=10)
+                similar = similar.join(
+                    titles[["title", "release_year", "vote_average"]], on="id"
+                )
+
+                st.dataframe(
+                    similar[["title", "release_year", "vote_average", "score"]].style.format(
+                        {
+                            "release_year": "{:.0f}",
+                            "vote_average": "{:.1f}",
+                            "score": "{:.2f}",
+                        }
+                    ),
+                    use_container_width=True,
+                    hide_index=True,
+                )
 
     # ==================== TAB 3: ANÁLISE COM IA ====================
     with tab3:
@@ -651,32 +996,13 @@ def main() -> None:
 
                     # Gerar resposta
                     with st.chat_message("assistant"):
-                        with st.spinner("Pensando..."):
-                            try:
-                                # Criar contexto detalhado com dados temporais
-                                yearly_df = data.get('yearly', pd.DataFrame())
-                                
-                                # Dados de tendência temporal (últimos 30 anos)
-                                recent_years = yearly_df[yearly_df['release_year'] >= 1990].copy() if not yearly_df.empty else pd.DataFrame()
-                                
-                                temporal_context = ""
-                                if not recent_years.empty:
-                                    temporal_context = f"""
-
-DADOS TEMPORAIS DISPONÍVEIS (1990-2017):
-- Anos com dados: {len(recent_years)} anos
-- Receita total por ano: de ${recent_years['total_revenue'].min()/1e9:.1f}B a ${recent_years['total_revenue'].max()/1e9:.1f}B
-- Receita média por filme: de ${recent_years['avg_revenue'].min()/1e6:.1f}M a ${recent_years['avg_revenue'].max()/1e6:.1f}M
-- Tendência de filmes: de {int(recent_years['movie_count'].min())} filmes/ano em {int(recent_years.iloc[0]['release_year'])} para {int(recent_years['movie_count'].max())} em {int(recent_years.loc[recent_years['movie_count'].idxmax(), 'release_year'])}
-- Década de 1990: receita média ${recent_years[recent_years["release_year"] < 2000]["avg_revenue"].mean()/1e6:.1f}M/filme
-- Década de 2000: receita média ${recent_years[(recent_years["release_year"] >= 2000) & (recent_years["release_year"] < 2010)]["avg_revenue"].mean()/1e6:.1f}M/filme
-- Década de 2010: receita média ${recent_years[recent_years["release_year"] >= 2010]["avg_revenue"].mean()/1e6:.1f}M/filme
-
-DADOS COMPLETOS POR ANO (amostra dos últimos 5 anos):
-{recent_years[['release_year', 'movie_count', 'avg_revenue', 'total_revenue', 'avg_profit']].tail(5).to_string(index=False)}
-"""
-                                
-                                movies_summary = f"""
+                        try:
+                            # Linhas da Gold relevantes para a pergunta
+                            relevant_context = gold["retriever"].context(
+                                prompt, get_settings().chat_context_tokens
+                            )
+
+                            movies_summary = f"""
 Você é um analista de dados especializado em cinema. Analise os dados a seguir para responder à pergunta do usuário.
 
 RESUMO GERAL DOS DADOS:
@@ -685,33 +1011,28 @@ RESUMO GERAL DOS DADOS:
 - Receita média global: ${data['movies']['revenue'].mean()/1e6:.1f}M
 - Nota média: {data['movies']['vote_average'].mean():.1f}/10
 - Top 5 gêneros: {', '.join(data['genres'].nlargest(5, 'movie_count')['genre_names'].tolist())}
-{temporal_context}
+
+DADOS RELEVANTES PARA A PERGUNTA (valores em $ com M = milhões):
+{relevant_context}
 
 PERGUNTA DO USUÁRIO: {prompt}
 
 INSTRUÇÕES:
-1. Use os DADOS TEMPORAIS acima para responder questões sobre tendências ao longo do tempo
+1. Baseie a resposta nos DADOS RELEVANTES acima
 2. Forneça números específicos e percentuais quando relevante
 3. Identifique padrões e insights interessantes
 4. Seja específico e baseado em dados, não genérico
-5. Se a pergunta é sobre tendências temporais, SEMPRE use os dados temporais fornecidos
+5. Se os dados não bastarem para responder, diga quais dados faltam
 """
 
-                                response = gemini_model.generate_content(movies_summary)
-                                answer = response.text
-
-                                st.markdown(answer)
-
-                                # Adicionar à sessão
-                                st.session_state.messages.append(
-                                    {"role": "assistant", "content": answer}
-                                )
-                            except Exception as e:
-                                error_msg = f"Erro ao processar sua pergunta: {str(e)}"
-                                st.error(error_msg)
-                                st.session_state.messages.append(
-                                    {"role": "assistant", "content": error_msg}
-                                )
+                            # Mostrar a resposta à medida que é gerada
+                            stream_answer(gemini_model, movies_summary)
+                        except Exception as e:
+                            error_msg = f"Erro ao processar sua pergunta: {str(e)}"
+                            st.error(error_msg)
+                            st.session_state.messages.append(
+                                {"role": "assistant", "content": error_msg}
+                            )
 
             # Botão para limpar histórico
             if st.session_state.messages:
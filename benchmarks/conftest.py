@@ -0,0 +1,107 @@
+"""Fixtures for the pipeline benchmarks.
+
+Benchmarks run on the synthetic dataset, generated once per scale and seed
+under ``.cache/synthetic`` and reused by later runs. Every step is timed once
+per engine (pandas and, when installed, Polars).
+"""
+
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from benchmarks.synthetic_dataset import GENERATOR_VERSION, generate_dataset
+from src.application.loading import LoadAnalyticsUseCase
+from src.application.transformation import TransformMoviesUseCase
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import LayerSnapshot
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BASELINE_DIR = Path(__file__).parent / "baselines"
+SYNTHETIC_DIR = PROJECT_ROOT / ".cache" / "synthetic"
+
+_DEFAULT_STORAGE = "file://./.benchmarks"
+
+ENGINES = ["pandas", "polars"]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the synthetic dataset options."""
+    group = parser.getgroup("synthetic dataset")
+    group.addoption(
+        "--synthetic-scale",
+        default="1x",
+        help="Scale of the synthetic dataset: 1x, 10x, 100x or a factor (default: 1x)",
+    )
+    group.addoption("--synthetic-seed", type=int, default=42, help="Seed of the dataset")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep saved benchmark runs (the baselines) next to the benchmarks."""
+    if getattr(config.option, "benchmark_storage", None) == _DEFAULT_STORAGE:
+        config.option.benchmark_storage = f"file://{BASELINE_DIR}"
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings(request: pytest.FixtureRequest) -> Settings:
+    """Settings whose Bronze layer holds the synthetic dataset."""
+    scale = request.config.getoption("--synthetic-scale")
+    seed = request.config.getoption("--synthetic-seed")
+    data_dir = SYNTHETIC_DIR / f"{scale}-seed{seed}-v{GENERATOR_VERSION}"
+
+    marker = data_dir / "raw" / ".complete"
+    if not marker.exists():
+        generate_dataset(data_dir / "raw", scale=scale, seed=seed)
+        marker.touch()
+
+    settings = Settings(data_dir=data_dir)
+    settings.ensure_directories()
+    return settings
+
+
+@pytest.fixture(scope="session", params=ENGINES)
+def engine(request: pytest.FixtureRequest) -> str:
+    """DataFrame engine under benchmark."""
+    if importlib.util.find_spec(request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def transform_use_case(benchmark_settings: Settings, engine: str) -> TransformMoviesUseCase:
+    """Silver use case reading the synthetic Bronze files."""
+    return TransformMoviesUseCase(benchmark_settings.model_copy(update={"engine": engine}))
+
+
+@pytest.fixture(scope="session")
+def silver_snapshot(benchmark_settings: Settings) -> LayerSnapshot:
+    """Silver layer built once from the synthetic dataset."""
+    use_case = TransformMoviesUseCase(benchmark_settings)
+    use_case.execute()
+    return use_case.silver_repo.snapshot()
+
+
+@pytest.fixture(scope="session")
+def load_use_case(benchmark_settings: Settings, engine: str) -> LoadAnalyticsUseCase:
+    """Gold use case over the synthetic Silver layer."""
+    return LoadAnalyticsUseCase(benchmark_settings.model_copy(update={"engine": engine}))
+
+
+@pytest.fixture(scope="session")
+def silver_tables(
+    load_use_case: LoadAnalyticsUseCase, silver_snapshot: LayerSnapshot
+) -> Dict[str, Any]:
+    """Silver tables in the format of the engine under benchmark."""
+    return {
+        table: load_use_case._read_silver(silver_snapshot, table)
+        for table in ("movies", "credits", "keywords")
+    }
+
+
+@pytest.fixture(scope="session")
+def enriched_df(load_use_case: LoadAnalyticsUseCase, silver_tables: Dict[str, Any]) -> Any:
+    """Enriched movies table fed to the Gold generators."""
+    return load_use_case._merge_datasets(
+        silver_tables["movies"], silver_tables["credits"], silver_tables["keywords"]
+    )
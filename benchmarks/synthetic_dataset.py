@@ -0,0 +1,398 @@
+"""Synthetic generator for The Movies Dataset Bronze files.
+
+Produces ``movies_metadata.csv``, ``credits.csv``, ``keywords.csv`` and
+``ratings_small.csv`` with the Kaggle schema and its quirks:
+
+- list columns stored as Python-repr strings of dicts (single quotes)
+- ids that are not integers (dates shifted into the id column, blanks)
+- release dates in mixed formats, blanks and garbage
+- numeric columns stored as strings with occasional junk values
+- duplicated ids in credits and keywords
+
+Output is fully determined by the seed and scale, so benchmark runs on
+different machines process identical data.
+"""
+
+import csv
+import logging
+import random
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the generated content changes, invalidating cached datasets
+GENERATOR_VERSION = 1
+
+# Row counts of the Kaggle release at 1x scale
+BASE_ROWS: Dict[str, int] = {
+    "movies_metadata": 45466,
+    "credits": 45476,
+    "keywords": 46419,
+    "ratings_small": 100004,
+}
+
+SCALES: Dict[str, float] = {"1x": 1.0, "10x": 10.0, "100x": 100.0}
+
+# Rows generated and written per chunk, bounding memory at 100x
+CHUNK_ROWS = 50_000
+
+# Share of rows carrying each quirk
+QUIRK_RATES: Dict[str, float] = {
+    "bad_id": 0.0005,
+    "blank_list": 0.01,
+    "alt_date_format": 0.02,
+    "bad_date": 0.005,
+    "bad_number": 0.001,
+    "duplicate_id": 0.001,
+}
+
+GENRES = [
+    (28, "Action"), (12, "Adventure"), (16, "Animation"), (35, "Comedy"), (80, "Crime"),
+    (99, "Documentary"), (18, "Drama"), (10751, "Family"), (14, "Fantasy"), (36, "History"),
+    (27, "Horror"), (10402, "Music"), (9648, "Mystery"), (10749, "Romance"),
+    (878, "Science Fiction"), (10770, "TV Movie"), (53, "Thriller"), (10752, "War"),
+    (37, "Western"),
+]  # fmt: skip
+
+COUNTRIES = [
+    ("US", "United States of America"), ("GB", "United Kingdom"), ("FR", "France"),
+    ("DE", "Germany"), ("JP", "Japan"), ("IT", "Italy"), ("CA", "Canada"), ("IN", "India"),
+    ("ES", "Spain"), ("BR", "Brazil"), ("KR", "South Korea"), ("MX", "Mexico"),
+]  # fmt: skip
+
+LANGUAGES = [
+    ("en", "English"), ("fr", "Français"), ("de", "Deutsch"), ("ja", "日本語"),
+    ("it", "Italiano"), ("es", "Español"), ("hi", "हिन्दी"), ("pt", "Português"),
+    ("ko", "한국어/조선말"), ("ru", "Pусский"),
+]  # fmt: skip
+
+STATUSES = ["Released", "Rumored", "Post Production", "In Production", "Planned", "Canceled"]
+STATUS_WEIGHTS = [0.985, 0.005, 0.004, 0.003, 0.002, 0.001]
+
+CREW_JOBS = [
+    ("Directing", "Director"), ("Writing", "Screenplay"), ("Production", "Producer"),
+    ("Sound", "Original Music Composer"), ("Camera", "Director of Photography"),
+    ("Editing", "Editor"),
+]  # fmt: skip
+
+WORDS = (
+    "love war city night lost last dark king secret star dream blood road world home "
+    "girl man life death time ghost island summer winter heart fire water game story"
+).split()
+
+# Size of the pools that list-valued cells are drawn from
+_POOL_SIZE = 4096
+
+
+def generate_dataset(
+    output_dir: Path, scale: str = "1x", seed: int = 42, chunk_rows: int = CHUNK_ROWS
+) -> Dict[str, Path]:
+    """Generate the four Bronze CSV files.
+
+    Args:
+        output_dir: Directory receiving the CSV files
+        scale: Scale name ('1x', '10x', '100x') or a numeric factor
+        seed: Random seed
+        chunk_rows: Rows generated and written per chunk
+
+    Returns:
+        Mapping of dataset name to written file
+
+    Raises:
+        ValueError: If the scale is invalid
+    """
+    factor = _parse_scale(scale)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    # Movie ids shared by every file so that Silver joins find matches
+    n_movies = max(int(BASE_ROWS["movies_metadata"] * factor), 1)
+    movie_ids = rng.permutation(np.arange(2, n_movies * 10, 5))[:n_movies]
+
+    pools = _build_pools(rng)
+    generators = {
+        "movies_metadata": _movies_chunk,
+        "credits": _credits_chunk,
+        "keywords": _keywords_chunk,
+        "ratings_small": _ratings_chunk,
+    }
+
+    written = {}
+    for name, generator in generators.items():
+        n_rows = max(int(BASE_ROWS[name] * factor), 1)
+        path = output_dir / f"{name}.csv"
+        logger.info(f"Generating {n_rows} rows for {path}")
+
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        for start in range(0, n_rows, chunk_rows):
+            size = min(chunk_rows, n_rows - start)
+            chunk = generator(rng, pools, movie_ids, start, size)
+            chunk.to_csv(
+                tmp_path,
+                mode="w" if start == 0 else "a",
+                header=start == 0,
+                index=False,
+                quoting=csv.QUOTE_MINIMAL,
+            )
+        tmp_path.replace(path)
+        written[name] = path
+
+    return written
+
+
+def _parse_scale(scale: str) -> float:
+    """Convert a scale name or factor to a float."""
+    if scale in SCALES:
+        return SCALES[scale]
+    try:
+        factor = float(str(scale).rstrip("x"))
+    except ValueError:
+        raise ValueError(f"Invalid scale '{scale}' (use {', '.join(SCALES)} or a factor)")
+    if factor <= 0:
+        raise ValueError(f"Scale must be positive, got {scale}")
+    return factor
+
+
+def _dict_list(items: List[Dict]) -> str:
+    """Render a list of dicts the way the Kaggle CSVs do (Python repr)."""
+    return repr(items)
+
+
+def _build_pools(rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Pre-render list-valued cells; rows draw from these pools."""
+    # Scalar draws are much cheaper with the stdlib generator
+    draw = random.Random(int(rng.integers(2**32)))
+
+    def sample(options: List, low: int, high: int) -> List:
+        picks = draw.sample(range(len(options)), min(draw.randint(low, high), len(options)))
+        return [options[i] for i in sorted(picks)]
+
+    def name() -> str:
+        return f"{draw.choice(WORDS).title()} {draw.choice(WORDS).title()}"
+
+    def credit_id() -> str:
+        return f"52fe{draw.getrandbits(32):08x}"
+
+    def cast() -> str:
+        return _dict_list(
+            [
+                {
+                    "cast_id": draw.randrange(1, 200),
+                    "character": name(),
+                    "credit_id": credit_id(),
+                    "gender": draw.randrange(3),
+                    "id": draw.randrange(1, 2_000_000),
+                    "name": name(),
+                    "order": order,
+                    "profile_path": None,
+                }
+                for order in range(draw.randrange(25))
+            ]
+        )
+
+    def crew() -> str:
+        members = [("Directing", "Director")] + sample(CREW_JOBS, 0, 5)
+        return _dict_list(
+            [
+                {
+                    "credit_id": credit_id(),
+                    "department": department,
+                    "gender": draw.randrange(3),
+                    "id": draw.randrange(1, 2_000_000),
+                    "job": job,
+                    "name": name(),
+                    "profile_path": None,
+                }
+                for department, job in members
+            ]
+        )
+
+    def genres() -> str:
+        return _dict_list([{"id": i, "name": n} for i, n in sample(GENRES, 1, 4)])
+
+    def companies() -> str:
+        return _dict_list(
+            [
+                {"name": f"{name()} Pictures", "id": draw.randrange(1, 100_000)}
+                for _ in range(draw.randrange(4))
+            ]
+        )
+
+    def countries() -> str:
+        return _dict_list([{"iso_3166_1": c, "name": n} for c, n in sample(COUNTRIES, 1, 3)])
+
+    def languages() -> str:
+        return _dict_list([{"iso_639_1": c, "name": n} for c, n in sample(LANGUAGES, 1, 3)])
+
+    def keywords() -> str:
+        return _dict_list(
+            [
+                {"id": draw.randrange(1, 250_000), "name": f"{draw.choice(WORDS)} {word}"}
+                for word in draw.choices(WORDS, k=draw.randrange(15))
+            ]
+        )
+
+    def title() -> str:
+        return " ".join(draw.choice(WORDS) for _ in range(draw.randint(1, 4))).title()
+
+    factories = {
+        "genres": genres,
+        "companies": companies,
+        "countries": countries,
+        "languages": languages,
+        "keywords": keywords,
+        "cast": cast,
+        "crew": crew,
+        "titles": title,
+    }
+    return {
+        pool: np.array([factory() for _ in range(_POOL_SIZE)], dtype=object)
+        for pool, factory in factories.items()
+    }
+
+
+def _pick(rng: np.random.Generator, pool: np.ndarray, size: int) -> np.ndarray:
+    """Draw cells from a pre-rendered pool."""
+    return pool[rng.integers(0, len(pool), size)]
+
+
+def _mask(rng: np.random.Generator, quirk: str, size: int) -> np.ndarray:
+    """Select the rows carrying a quirk."""
+    return rng.random(size) < QUIRK_RATES[quirk]
+
+
+def _ids_for(
+    rng: np.random.Generator, movie_ids: np.ndarray, start: int, size: int
+) -> np.ndarray:
+    """Movie ids for a chunk of a file keyed by movie, with some duplicates."""
+    positions = np.arange(start, start + size) % len(movie_ids)
+    ids = movie_ids[positions].copy()
+    duplicates = _mask(rng, "duplicate_id", size)
+    ids[duplicates] = movie_ids[rng.integers(0, len(movie_ids), int(duplicates.sum()))]
+    return ids
+
+
+def _movies_chunk(
+    rng: np.random.Generator,
+    pools: Dict[str, np.ndarray],
+    movie_ids: np.ndarray,
+    start: int,
+    size: int,
+) -> pd.DataFrame:
+    """Generate a chunk of ``movies_metadata.csv``."""
+    ids = movie_ids[np.arange(start, start + size) % len(movie_ids)].astype(str).astype(object)
+
+    # Dates shifted into the id column, as in the Kaggle file
+    bad_ids = _mask(rng, "bad_id", size)
+    ids[bad_ids] = "1997-08-20"
+
+    # Release dates: ISO, day-first, blank and garbage
+    days = rng.integers(0, 365 * 125, size)
+    dates = (np.datetime64("1890-01-01") + days).astype("datetime64[D]")
+    release = pd.Series(pd.to_datetime(dates).strftime("%Y-%m-%d"), dtype=object)
+    alt = _mask(rng, "alt_date_format", size)
+    release[alt] = pd.to_datetime(dates[alt]).strftime("%d/%m/%Y")
+    release[_mask(rng, "bad_date", size)] = "1"
+    release[_mask(rng, "blank_list", size)] = None
+
+    budget = np.where(rng.random(size) < 0.8, 0, rng.integers(1, 300, size) * 1_000_000)
+    revenue = np.where(
+        (budget > 0) & (rng.random(size) < 0.7),
+        (budget * rng.lognormal(0.5, 1.0, size)).astype(np.int64),
+        0,
+    )
+    budget_str = budget.astype(str).astype(object)
+    # Image paths shifted into the budget column
+    budget_str[_mask(rng, "bad_number", size)] = "/ff9qCepilowshEtG2GYWwzt2bs4.jpg"
+
+    genres = _pick(rng, pools["genres"], size)
+    genres[_mask(rng, "blank_list", size)] = "[]"
+    companies = _pick(rng, pools["companies"], size)
+    companies[_mask(rng, "blank_list", size)] = None
+    languages = _pick(rng, pools["languages"], size)
+    titles = _pick(rng, pools["titles"], size)
+    vote_count = rng.poisson(110, size)
+
+    return pd.DataFrame(
+        {
+            "adult": np.where(rng.random(size) < 0.001, "True", "False"),
+            "belongs_to_collection": None,
+            "budget": budget_str,
+            "genres": genres,
+            "homepage": None,
+            "id": ids,
+            "imdb_id": [f"tt{i:07d}" for i in rng.integers(1, 9_999_999, size)],
+            "original_language": [
+                LANGUAGES[i][0] for i in rng.integers(0, len(LANGUAGES), size)
+            ],
+            "original_title": titles,
+            "overview": _pick(rng, pools["titles"], size),
+            "popularity": np.round(rng.exponential(3.0, size), 6).astype(str),
+            "poster_path": None,
+            "production_companies": companies,
+            "production_countries": _pick(rng, pools["countries"], size),
+            "release_date": release,
+            "revenue": revenue.astype(float),
+            "runtime": np.where(rng.random(size) < 0.01, np.nan, rng.normal(95, 25, size).round()),
+            "spoken_languages": languages,
+            "status": rng.choice(STATUSES, size, p=STATUS_WEIGHTS),
+            "tagline": None,
+            "title": np.where(rng.random(size) < 0.0001, None, titles),
+            "video": "False",
+            "vote_average": np.round(rng.uniform(0, 10, size), 1),
+            "vote_count": vote_count.astype(float),
+        }
+    )
+
+
+def _credits_chunk(
+    rng: np.random.Generator,
+    pools: Dict[str, np.ndarray],
+    movie_ids: np.ndarray,
+    start: int,
+    size: int,
+) -> pd.DataFrame:
+    """Generate a chunk of ``credits.csv``."""
+    return pd.DataFrame(
+        {
+            "cast": _pick(rng, pools["cast"], size),
+            "crew": _pick(rng, pools["crew"], size),
+            "id": _ids_for(rng, movie_ids, start, size),
+        }
+    )
+
+
+def _keywords_chunk(
+    rng: np.random.Generator,
+    pools: Dict[str, np.ndarray],
+    movie_ids: np.ndarray,
+    start: int,
+    size: int,
+) -> pd.DataFrame:
+    """Generate a chunk of ``keywords.csv``."""
+    keywords = _pick(rng, pools["keywords"], size)
+    keywords[_mask(rng, "blank_list", size)] = "[]"
+    return pd.DataFrame({"id": _ids_for(rng, movie_ids, start, size), "keywords": keywords})
+
+
+def _ratings_chunk(
+    rng: np.random.Generator,
+    pools: Dict[str, np.ndarray],
+    movie_ids: np.ndarray,
+    start: int,
+    size: int,
+) -> pd.DataFrame:
+    """Generate a chunk of ``ratings_small.csv``."""
+    n_users = max(len(movie_ids) // 68, 1)
+    return pd.DataFrame(
+        {
+            "userId": np.sort(rng.integers(1, n_users + 1, size)),
+            "movieId": movie_ids[rng.zipf(1.3, size) % len(movie_ids)],
+            "rating": rng.integers(1, 11, size) / 2,
+            "timestamp": rng.integers(789_652_009, 1_468_000_000, size),
+        }
+    )
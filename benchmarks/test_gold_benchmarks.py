@@ -0,0 +1,76 @@
+"""Benchmarks of the Gold (analytics) steps."""
+
+from typing import Any, Dict
+
+import pandas as pd
+import pytest
+
+from src.application.loading import LoadAnalyticsUseCase
+from src.application.loading.similarity import SimilarityIndex
+
+GENERATE_STEPS = [
+    "_generate_yearly_stats",
+    "_generate_genre_stats",
+    "_generate_top_movies",
+    "_generate_leaderboards",
+    "_generate_director_stats",
+]
+
+
+def test_merge_datasets(
+    benchmark, load_use_case: LoadAnalyticsUseCase, silver_tables: Dict[str, Any]
+) -> None:
+    """Time the enrichment join of movies, credits and keywords."""
+    benchmark.group = "gold: _merge_datasets"
+    result = benchmark.pedantic(
+        load_use_case._merge_datasets,
+        args=(silver_tables["movies"], silver_tables["credits"], silver_tables["keywords"]),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert len(result) >= len(silver_tables["movies"])
+
+
+@pytest.mark.parametrize("step", GENERATE_STEPS)
+def test_generate(
+    benchmark, load_use_case: LoadAnalyticsUseCase, enriched_df: Any, step: str
+) -> None:
+    """Time one analytics generator on its own copy of the enriched table."""
+    benchmark.group = f"gold: {step}"
+    result = benchmark.pedantic(
+        getattr(load_use_case, step),
+        setup=lambda: ((_fresh_copy(enriched_df),), {}),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert len(result) > 0
+
+
+def test_similarity_build(
+    benchmark, load_use_case: LoadAnalyticsUseCase, enriched_df: Any
+) -> None:
+    """Time building the similar movies index."""
+    benchmark.group = "gold: similarity_build"
+    rows = load_use_case._similarity_rows(enriched_df)
+    index = benchmark.pedantic(SimilarityIndex.build, args=(rows,), rounds=3, iterations=1)
+
+    assert index.num_docs > 0
+
+
+def test_similarity_query(
+    benchmark, load_use_case: LoadAnalyticsUseCase, enriched_df: Any
+) -> None:
+    """Time one "more like this" query."""
+    benchmark.group = "gold: similarity_query"
+    index = SimilarityIndex.build(load_use_case._similarity_rows(enriched_df))
+    movie_id = int(index.ids[len(index.ids) // 2])
+    result = benchmark.pedantic(index.similar, args=(movie_id,), rounds=50, iterations=1)
+
+    assert len(result) > 0
+
+
+def _fresh_copy(df: Any) -> Any:
+    """Deep-copy a pandas DataFrame (Polars frames are immutable)."""
+    return df.copy() if isinstance(df, pd.DataFrame) else df
@@ -0,0 +1,21 @@
+"""Benchmarks of the Silver (transformation) steps."""
+
+import pytest
+
+from src.application.transformation import TransformMoviesUseCase
+
+TRANSFORM_STEPS = [
+    "_transform_movies",
+    "_transform_credits",
+    "_transform_keywords",
+    "_transform_ratings",
+]
+
+
+@pytest.mark.parametrize("step", TRANSFORM_STEPS)
+def test_transform(benchmark, transform_use_case: TransformMoviesUseCase, step: str) -> None:
+    """Time one transformation step, CSV read included."""
+    benchmark.group = f"silver: {step}"
+    result = benchmark.pedantic(getattr(transform_use_case, step), rounds=3, iterations=1)
+
+    assert len(result) > 0
@@ -0,0 +1,90 @@
+"""Benchmark Parquet write profiles on a pipeline table.
+
+Usage:
+    python scripts/benchmark_parquet_profiles.py [path/to/table.parquet]
+
+Defaults to the Gold ``movies_enriched`` table. For every profile the table is
+written to a temporary directory and the file size, write time, full read time
+and a point lookup by ``id`` are reported.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Allow running as a plain script from the project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.repositories import PARQUET_PROFILES, DataRepository  # noqa: E402
+
+
+def benchmark_profiles(df: pd.DataFrame, workdir: Path, repeat: int = 3) -> pd.DataFrame:
+    """Measure size and speed of every Parquet write profile.
+
+    Args:
+        df: Table to write
+        workdir: Scratch directory for the written files
+        repeat: Number of timed repetitions (best time is kept)
+
+    Returns:
+        DataFrame with one row per profile
+    """
+    repo = DataRepository(workdir)
+    lookup_id = df["id"].iloc[len(df) // 2] if "id" in df.columns else None
+    results = []
+
+    for name in PARQUET_PROFILES:
+        write_times, read_times, lookup_times = [], [], []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            filepath = repo.save_parquet(df, f"bench_{name}", profile=name)
+            write_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            pq.read_table(filepath)
+            read_times.append(time.perf_counter() - start)
+
+            if lookup_id is not None:
+                start = time.perf_counter()
+                pq.read_table(filepath, filters=[("id", "=", lookup_id)])
+                lookup_times.append(time.perf_counter() - start)
+
+        metadata = pq.ParquetFile(filepath).metadata
+        results.append(
+            {
+                "profile": name,
+                "size_mb": filepath.stat().st_size / 1024 / 1024,
+                "row_groups": metadata.num_row_groups,
+                "write_s": min(write_times),
+                "read_s": min(read_times),
+                "lookup_s": min(lookup_times) if lookup_times else None,
+            }
+        )
+
+    return pd.DataFrame(results)
+
+
+def main() -> None:
+    """Run the benchmark and print the report."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("data/refined/movies_enriched.parquet")
+
+    if not source.exists():
+        print(f"ERROR: {source} not found. Run the pipeline first: python -m src.main")
+        sys.exit(1)
+
+    df = pd.read_parquet(source)
+    print(f"Benchmarking {source} ({len(df):,} rows, {len(df.columns)} columns)\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = benchmark_profiles(df, Path(tmp))
+
+    print(report.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -38,7 +38,6 @@ def main() -> None:
         "--hidden-import=pandas",
         "--hidden-import=numpy",
         "--hidden-import=pyarrow",
-        "--hidden-import=kaggle",
         # Entry point
         "src/main.py",
     ]
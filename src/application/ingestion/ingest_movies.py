@@ -1,12 +1,18 @@
 """Use case for ingesting movies dataset from Kaggle."""
 
 import logging
+import os
+import shutil
+import zipfile
 from pathlib import Path
+from typing import Dict, List
 
 from src.domain.exceptions import DataIngestionError
 from src.infrastructure.config import Settings
-from src.infrastructure.external import KaggleDatasetClient
-from src.infrastructure.repositories import DataRepository
+from src.infrastructure.external import DatasetDownloader, DownloadReport, kaggle_credentials
+from src.infrastructure.monitoring import record_bytes_read
+from src.infrastructure.repositories import BronzeChangeCapture, DataRepository
+from src.infrastructure.storage import get_filesystem, layer_root, upload_files
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +20,20 @@ logger = logging.getLogger(__name__)
 class IngestMoviesUseCase:
     """Use case for ingesting movies data from Kaggle (Bronze Layer)."""
 
+    # Key columns of the dataset CSVs, used to diff successive ingestions
+    CHANGE_KEYS: Dict[str, List[str]] = {
+        "movies_metadata.csv": ["id"],
+        "credits.csv": ["id"],
+        "keywords.csv": ["id"],
+        "links.csv": ["movieId"],
+        "links_small.csv": ["movieId"],
+        "ratings.csv": ["userId", "movieId"],
+        "ratings_small.csv": ["userId", "movieId"],
+    }
+
+    # Directory of the Bronze layer holding downloads (and their resumable parts)
+    DOWNLOADS_DIR = "_downloads"
+
     def __init__(self, settings: Settings):
         """Initialize use case.
 
@@ -21,15 +41,26 @@ class IngestMoviesUseCase:
             settings: Application settings
         """
         self.settings = settings
-        self.kaggle_client = KaggleDatasetClient(
-            username=settings.kaggle_username, key=settings.kaggle_key
+        self.sources = settings.ingestion_sources or [settings.kaggle_dataset]
+        self.downloader = DatasetDownloader(
+            settings.bronze_dir / self.DOWNLOADS_DIR,
+            kaggle_api_url=settings.kaggle_api_url,
+            auth=kaggle_credentials(settings.kaggle_username, settings.kaggle_key),
+            max_concurrency=settings.ingestion_concurrency,
+            retries=settings.ingestion_retries,
+            backoff_seconds=settings.ingestion_backoff_seconds,
+            timeout=settings.ingestion_timeout_seconds,
         )
         self.repository = DataRepository(settings.bronze_dir)
+        self.change_capture = BronzeChangeCapture(
+            settings.bronze_dir, settings.chunk_size, spill_dir=settings.spill_dir
+        )
 
     def execute(self) -> Path:
         """Execute data ingestion.
 
-        Downloads the dataset from Kaggle and stores it in the bronze layer.
+        Downloads the dataset sources concurrently and stores their files in
+        the bronze layer.
 
         Returns:
             Path to the ingested data directory
@@ -38,33 +69,53 @@ class IngestMoviesUseCase:
             DataIngestionError: If ingestion fails
         """
         try:
-            logger.info("Starting data ingestion from Kaggle")
-            logger.info(f"Dataset: {self.settings.kaggle_dataset}")
+            logger.info("Starting data ingestion")
+            logger.info(f"Sources: {', '.join(self.sources)}")
             logger.info(f"Destination: {self.settings.bronze_dir}")
 
             # Ensure bronze directory exists
             self.settings.bronze_dir.mkdir(parents=True, exist_ok=True)
 
-            # List available files
-            logger.info("Listing dataset files...")
-            files = self.kaggle_client.list_dataset_files(self.settings.kaggle_dataset)
-            logger.info(f"Found {len(files)} files in dataset:")
-            for file in files:
-                logger.info(f"  - {file}")
+            # Keep the signatures of the files about to be overwritten
+            if self.settings.bronze_changelog_enabled:
+                self._snapshot_previous_files()
 
-            # Download dataset
-            dataset_path = self.kaggle_client.download_dataset(
-                dataset=self.settings.kaggle_dataset,
-                destination_path=self.settings.bronze_dir,
-                unzip=True,
-            )
+            # Download all sources, then unpack them into the Bronze directory
+            reports = self.downloader.download_all(self.sources)
+            record_bytes_read(sum(report.bytes for report in reports))
+            dataset_path = self.settings.bronze_dir
+            downloaded_files = self._unpack(reports)
 
             # Verify downloaded files
-            downloaded_files = list(dataset_path.glob("*.csv"))
             logger.info(f"Downloaded {len(downloaded_files)} CSV files:")
             for file in downloaded_files:
                 logger.info(f"  - {file.name} ({file.stat().st_size / 1024 / 1024:.2f} MB)")
 
+            # Diff each file against the previous ingestion
+            changelogs = []
+            if self.settings.bronze_changelog_enabled:
+                changelogs = self._capture_changes(downloaded_files)
+
+            # Publish to the object store when the lake is not on local disk
+            if self.settings.storage_backend != "local":
+                destination = layer_root(self.settings, "bronze")
+                logger.info(f"Uploading bronze files to {destination}...")
+                filesystem = get_filesystem(self.settings)
+                uploaded = upload_files(
+                    downloaded_files,
+                    filesystem,
+                    destination,
+                    max_workers=self.settings.storage_upload_workers,
+                )
+                if changelogs:
+                    uploaded += upload_files(
+                        changelogs,
+                        filesystem,
+                        f"{destination}/{BronzeChangeCapture.CHANGES_DIR}",
+                        max_workers=self.settings.storage_upload_workers,
+                    )
+                logger.info(f"Uploaded {uploaded / 1024 / 1024:.2f} MB to {destination}")
+
             logger.info("Data ingestion completed successfully")
 
             return dataset_path
@@ -73,3 +124,76 @@ class IngestMoviesUseCase:
             logger.error(f"Data ingestion failed: {e}")
             raise DataIngestionError(f"Failed to ingest data: {e}")
 
+    def _unpack(self, reports: List[DownloadReport]) -> List[Path]:
+        """Move the CSV files of the downloaded sources into the Bronze directory.
+
+        Archives are extracted (and then removed); other files are moved as is.
+
+        Args:
+            reports: Download reports, one per source
+
+        Returns:
+            CSV files written to the Bronze directory
+
+        Raises:
+            DataIngestionError: If two sources provide a file with the same name
+        """
+        bronze_dir = self.settings.bronze_dir
+        owners: Dict[str, str] = {}
+
+        def claim(name: str, source: str) -> None:
+            if name in owners:
+                raise DataIngestionError(
+                    f"Sources {owners[name]} and {source} both provide {name}"
+                )
+            owners[name] = source
+
+        files = []
+        for report in reports:
+            if zipfile.is_zipfile(report.path):
+                with zipfile.ZipFile(report.path) as archive:
+                    members = [m for m in archive.infolist() if not m.is_dir()]
+                    for member in members:
+                        name = Path(member.filename).name
+                        claim(name, report.source)
+                        with archive.open(member) as src, open(bronze_dir / name, "wb") as dst:
+                            shutil.copyfileobj(src, dst)
+                        files.append(bronze_dir / name)
+                report.path.unlink()
+            else:
+                claim(report.path.name, report.source)
+                os.replace(report.path, bronze_dir / report.path.name)
+                files.append(bronze_dir / report.path.name)
+
+        return sorted(file for file in files if file.suffix == ".csv")
+
+    def _snapshot_previous_files(self) -> None:
+        """Record the signatures of Bronze files ingested before changelogs existed."""
+        for filename, keys in self.CHANGE_KEYS.items():
+            if (self.settings.bronze_dir / filename).exists() and not (
+                self.change_capture.has_snapshot(filename)
+            ):
+                logger.info(f"Recording baseline signatures of {filename}...")
+                self.change_capture.snapshot(filename, keys)
+
+    def _capture_changes(self, files: List[Path]) -> List[Path]:
+        """Write the changelog of each downloaded file with known key columns.
+
+        Args:
+            files: Downloaded CSV files
+
+        Returns:
+            Changelog files written
+        """
+        changelogs = []
+        for file in files:
+            keys = self.CHANGE_KEYS.get(file.name)
+            if keys is None:
+                logger.info(f"No key columns known for {file.name}, skipping its changelog")
+                continue
+
+            logger.info(f"Capturing changes of {file.name}...")
+            self.change_capture.capture(file.name, keys)
+            changelogs.append(self.change_capture.changelog_path(file.name))
+
+        return changelogs
@@ -0,0 +1,145 @@
+"""Mergeable partial aggregates for chunked and incremental analytics.
+
+A measure is declared once, as ``output name -> (column, function)`` with
+function ``count``, ``sum``, ``mean`` or ``std``, and computed either in one
+pass with ``DataFrame.groupby(...).agg(**measures)`` or from partials: each
+chunk of rows is reduced to per-group sums, sums of squares and non-null
+counts. Partials are combined by adding them, rows are retracted by
+subtracting their partial, and the measures are finalized at the end.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Output column -> (source column, aggregation function)
+Measures = Dict[str, Tuple[str, str]]
+
+# Number of rows of each group in a partial
+ROWS_COLUMN = "__rows"
+
+_FUNCTIONS = ("count", "sum", "mean", "std")
+
+
+def partial_aggregate(df: pd.DataFrame, by: str, measures: Measures) -> pd.DataFrame:
+    """Reduce rows to mergeable per-group partials.
+
+    Args:
+        df: Rows to aggregate
+        by: Grouping column
+        measures: Measures to compute
+
+    Returns:
+        DataFrame indexed by group with ``<column>__sum``, ``<column>__sumsq``
+        and ``<column>__count`` columns, and the group size in ``__rows``
+    """
+    columns = source_columns(measures)
+    # Keys are hashed once and rows grouped on their integer codes (rows
+    # without a group have code -1)
+    codes, groups = pd.factorize(df[by], sort=True)
+    known = codes >= 0
+    values = df[columns] if known.all() else df[columns][known]
+    codes = codes[known]
+    grouped = values.groupby(codes)
+
+    sums = grouped.sum(min_count=0).add_suffix("__sum")
+    sumsq = values.astype("float64").pow(2).groupby(codes).sum(min_count=0).add_suffix("__sumsq")
+    counts = grouped.count().add_suffix("__count")
+    rows = grouped.size().rename(ROWS_COLUMN)
+    partial = pd.concat([sums, sumsq, counts, rows], axis=1)
+    partial.index = pd.Index(groups[partial.index], name=by)
+    return partial
+
+
+def partial_columns(measures: Measures) -> List[str]:
+    """Get the columns of the partials of some measures.
+
+    Args:
+        measures: Measures to compute
+
+    Returns:
+        Partial column names, in ``partial_aggregate`` order
+    """
+    columns = source_columns(measures)
+    suffixes = ("__sum", "__sumsq", "__count")
+    return [f"{column}{suffix}" for suffix in suffixes for column in columns] + [ROWS_COLUMN]
+
+
+def combine_partials(partials: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Merge partials of the same measures.
+
+    Args:
+        partials: Partials to merge (None entries are ignored)
+
+    Returns:
+        Combined partial, indexed by group in sorted order
+    """
+    frames = [partial for partial in partials if partial is not None]
+    combined = pd.concat(frames)
+    return combined.groupby(level=0).sum()
+
+
+def subtract_partials(partial: pd.DataFrame, removed: pd.DataFrame) -> pd.DataFrame:
+    """Retract rows from a partial.
+
+    Groups left without rows are dropped. Integer columns (counts and sums of
+    integer columns) keep their type.
+
+    Args:
+        partial: Combined partial
+        removed: Partial of rows aggregated into ``partial`` earlier
+
+    Returns:
+        Partial without the removed rows, indexed by group in sorted order
+    """
+    result = partial.sub(removed.reindex(columns=partial.columns), fill_value=0)
+    integers = [col for col in partial.columns if pd.api.types.is_integer_dtype(partial[col])]
+    result[integers] = result[integers].round().astype("int64")
+
+    return result[result[ROWS_COLUMN] > 0].sort_index()
+
+
+def finalize(partial: pd.DataFrame, by: str, measures: Measures) -> pd.DataFrame:
+    """Turn combined partials into the measures.
+
+    Matches ``groupby(by).agg(**measures).reset_index()``: counts exclude
+    nulls, sums of all-null groups are 0, means of all-null groups NaN and
+    standard deviations are sample deviations (NaN below two values).
+
+    Args:
+        partial: Combined partial
+        by: Grouping column
+        measures: Measures to compute
+
+    Returns:
+        DataFrame with the grouping column and one column per measure
+
+    Raises:
+        ValueError: If a measure uses an unsupported function
+    """
+    result = pd.DataFrame(index=partial.index)
+    for name, (column, function) in measures.items():
+        count = partial[f"{column}__count"].astype("int64")
+        # Retracted rows can leave rounding residue in the sums of empty groups
+        total = partial[f"{column}__sum"].where(count > 0, 0)
+        if function == "count":
+            result[name] = count
+        elif function == "sum":
+            result[name] = total
+        elif function == "mean":
+            result[name] = total / count.where(count > 0)
+        elif function == "std":
+            squares = partial[f"{column}__sumsq"]
+            variance = (squares - total**2 / count.where(count > 0)) / (count - 1).where(count > 1)
+            result[name] = np.sqrt(variance.clip(lower=0))
+        else:
+            raise ValueError(f"Unsupported aggregation '{function}' (use {', '.join(_FUNCTIONS)})")
+
+    result.index.name = by
+    return result.reset_index()
+
+
+def source_columns(measures: Measures) -> List[str]:
+    """Get the distinct source columns of the measures."""
+    return list(dict.fromkeys(column for column, _ in measures.values()))
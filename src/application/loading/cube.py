@@ -0,0 +1,257 @@
+"""Sparse cube of movie measures over time, genre, language and country.
+
+A cube cell is one combination of the dimensions at one roll-up level: year,
+decade or all years, times each genre or all genres, each original language
+or all languages and each production country or all countries ("Drama movies
+in English of 1995", "French movies of the 1990s", "all US movies"...). Only
+cells holding movies exist.
+
+Cells are identified by a single key (``cell_key``), so the cube is
+aggregated with the mergeable partials of
+``src.application.loading.aggregates`` like any other Gold table (chunked,
+out of core and incrementally), and any slice of the dashboard is a lookup of
+its key instead of a group-by over the enriched movies.
+
+Genres and countries are lists: a movie belongs to the cells of each of its
+genres and countries, and once to the cells rolled up over them (a movie with
+two genres counts once among all genres).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Key column of the cube tables and value of a rolled-up dimension in it
+KEY_COLUMN = "cell"
+ALL = "*"
+SEPARATOR = "|"
+
+# Time levels of the cells: one column per level below "all years"
+TIME_COLUMNS = ["release_year", "decade"]
+
+# Cube column -> (enriched movies column, field of its list items or None)
+DIMENSIONS: Dict[str, Tuple[str, Optional[str]]] = {
+    "genre": ("genre_names", None),
+    "original_language": ("original_language", None),
+    "production_country": ("production_countries", "iso_3166_1"),
+}
+
+_POSITION = "__position"
+
+
+def cube_columns() -> List[str]:
+    """Get the enriched movies columns the cells are derived from."""
+    return ["release_year", *(source for source, _ in DIMENSIONS.values())]
+
+
+def cube_rows(df: pd.DataFrame, columns: List[str], min_year: int) -> pd.DataFrame:
+    """Expand enriched movies into one row per cube cell they belong to.
+
+    Args:
+        df: Enriched movies
+        columns: Measured columns
+        min_year: Earliest release year of the year and decade cells (older
+            movies only count in the cells of all years)
+
+    Returns:
+        Cell key column and the measured columns
+    """
+    cells, labels = _time_members(df["release_year"], min_year)
+    members = [labels]
+    for column, (source, field) in DIMENSIONS.items():
+        pairs, labels = _members(df[source], field, column)
+        cells = cells.merge(pairs, on=_POSITION)
+        members.append(labels)
+
+    # Cells are joined on member codes; each distinct key is built once
+    code = np.zeros(len(cells), dtype=np.int64)
+    for column, labels in zip(cells.columns[1:], members):
+        code = code * len(labels) + cells[column].to_numpy()
+    distinct, inverse = np.unique(code, return_inverse=True)
+
+    parts = []
+    for labels in reversed(members):
+        parts.append(labels[distinct % len(labels)])
+        distinct = distinct // len(labels)
+    keys = parts.pop()
+    while parts:
+        keys = keys + SEPARATOR + parts.pop()
+
+    rows = df[columns].iloc[cells[_POSITION].to_numpy()].reset_index(drop=True)
+    rows.insert(0, KEY_COLUMN, keys[inverse])
+    return rows
+
+
+def cell_key(
+    release_year: Optional[int] = None, decade: Optional[int] = None, **members: Optional[str]
+) -> str:
+    """Build the key of a cube cell.
+
+    Args:
+        release_year: Year of the cell (all years if None)
+        decade: Decade of the cell, e.g. 1990 (all years if None)
+        **members: Member of the other dimensions (``genre``,
+            ``original_language``, ``production_country``; all if None or
+            omitted)
+
+    Returns:
+        Cell key
+
+    Raises:
+        ValueError: If both a year and a decade are given, or for an unknown
+            dimension
+    """
+    if release_year is not None and decade is not None:
+        raise ValueError("A cell has either a release year or a decade, not both")
+    unknown = set(members) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown cube dimensions: {', '.join(sorted(unknown))}")
+
+    if release_year is not None:
+        time = str(int(release_year))
+    elif decade is not None:
+        time = f"{int(decade) // 10 * 10}s"
+    else:
+        time = ALL
+    parts = [ALL if members.get(column) is None else str(members[column]) for column in DIMENSIONS]
+    return SEPARATOR.join([time, *parts])
+
+
+def cell_dimensions(keys: pd.Series) -> pd.DataFrame:
+    """Decode cell keys into one column per dimension (null when rolled up).
+
+    Cells of a year also hold its decade.
+
+    Args:
+        keys: Cell keys
+
+    Returns:
+        DataFrame with the time columns and one column per other dimension
+    """
+    parts = keys.str.split(SEPARATOR, n=len(DIMENSIONS), expand=True)
+    time = parts[0]
+    numbers = pd.to_numeric(time.str.rstrip("s").where(time != ALL))
+    dimensions = {
+        "release_year": numbers.where(~time.str.endswith("s")).astype("Int64"),
+        "decade": (numbers // 10 * 10).astype("Int64"),
+    }
+    for i, column in enumerate(DIMENSIONS, start=1):
+        dimensions[column] = parts[i].where(parts[i] != ALL, None)
+    return pd.DataFrame(dimensions, index=keys.index)
+
+
+def add_dimensions(cells: pd.DataFrame) -> pd.DataFrame:
+    """Insert the dimension columns decoded from the cell keys after them.
+
+    Args:
+        cells: Cell key column and measures
+
+    Returns:
+        Cell key, dimension and measure columns
+    """
+    dimensions = cell_dimensions(cells[KEY_COLUMN])
+    return pd.concat([cells[[KEY_COLUMN]], dimensions, cells.drop(columns=KEY_COLUMN)], axis=1)
+
+
+class AnalyticsCube:
+    """Answer dashboard slices from the precomputed cube cells."""
+
+    def __init__(self, cube: pd.DataFrame):
+        """Index the cube cells by key.
+
+        Args:
+            cube: Gold cube table (cell key, dimensions and measures)
+        """
+        self.cells = cube.set_index(KEY_COLUMN)
+        # Members of each dimension, in order
+        self.members: Dict[str, List] = {
+            column: sorted(self.cells[column].dropna().unique().tolist())
+            for column in [*TIME_COLUMNS, *DIMENSIONS]
+        }
+
+    def cell(self, **members: Optional[object]) -> Optional[pd.Series]:
+        """Look up the measures of one slice.
+
+        Args:
+            **members: Members of the slice, as for ``cell_key``
+
+        Returns:
+            Dimensions and measures of the cell, or None if no movie is in it
+        """
+        key = cell_key(**members)
+        if key not in self.cells.index:
+            return None
+        return self.cells.loc[key]
+
+    def breakdown(self, dimension: str, **members: Optional[object]) -> pd.DataFrame:
+        """Look up the cells of each member of a dimension within a slice.
+
+        Args:
+            dimension: Dimension broken down (``release_year``, ``decade``,
+                ``genre``, ``original_language`` or ``production_country``)
+            **members: Members of the slice on the other dimensions
+
+        Returns:
+            One row per member holding movies, in member order
+
+        Raises:
+            ValueError: If the dimension is unknown or also fixed by the slice
+        """
+        if dimension not in self.members:
+            raise ValueError(f"Unknown cube dimension: {dimension}")
+        fixed = {column for column, member in members.items() if member is not None}
+        if dimension in fixed or (dimension in TIME_COLUMNS and fixed & set(TIME_COLUMNS)):
+            raise ValueError(f"The slice already fixes {dimension}")
+
+        keys = [
+            cell_key(**{**members, dimension: member}) for member in self.members[dimension]
+        ]
+        return self.cells.loc[[key for key in keys if key in self.cells.index]].reset_index()
+
+
+def _time_members(years: pd.Series, min_year: int) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Pair each movie position with the codes of its year, decade and all years.
+
+    Returns:
+        Position and member code pairs, and the key part of each code
+    """
+    values = years.to_numpy(dtype="float64", na_value=np.nan)
+    positions = np.arange(len(values))
+    known = values >= min_year
+    year = values[known].astype(np.int64)
+
+    parts = np.concatenate(
+        [
+            year.astype(str).astype(object),
+            np.char.add((year // 10 * 10).astype(str), "s").astype(object),
+            np.full(len(values), ALL, dtype=object),
+        ]
+    )
+    codes, labels = pd.factorize(parts)
+    pairs = pd.DataFrame(
+        {_POSITION: np.concatenate([positions[known], positions[known], positions]), "time": codes}
+    )
+    return pairs, np.asarray(labels, dtype=object)
+
+
+def _members(
+    values: pd.Series, field: Optional[str], column: str
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """Pair each movie position with the codes of its distinct members and of ALL.
+
+    Returns:
+        Position and member code pairs, and the key part of each code
+    """
+    exploded = values.reset_index(drop=True).explode()
+    if field is not None:
+        exploded = exploded.str.get(field)
+    exploded = exploded.dropna().astype(str)
+
+    positions = np.concatenate([exploded.index.to_numpy(), np.arange(len(values))])
+    parts = np.concatenate(
+        [exploded.to_numpy(dtype=object), np.full(len(values), ALL, dtype=object)]
+    )
+    codes, labels = pd.factorize(parts)
+    pairs = pd.DataFrame({_POSITION: positions, column: codes}).drop_duplicates()
+    return pairs, np.asarray(labels, dtype=object)
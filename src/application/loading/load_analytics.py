@@ -1,13 +1,46 @@
 """Use case for loading analytics data."""
 
 import logging
-from typing import Any, Dict
+import math
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
+from src.application.loading.aggregates import (
+    Measures,
+    combine_partials,
+    finalize,
+    partial_aggregate,
+    partial_columns,
+    source_columns,
+    subtract_partials,
+)
+from src.application.loading.cube import KEY_COLUMN, add_dimensions, cube_columns, cube_rows
+from src.application.loading.ranking import Ranking, rank, rank_frame
+from src.application.loading.similarity import (
+    CENTROIDS_TABLE,
+    INDEX_TABLE,
+    TERMS_TABLE,
+    SimilarityIndex,
+)
+from src.application.loading.sketches import (
+    Sketches,
+    combine_sketches,
+    partial_sketches,
+    sketch_table,
+)
+from src.application.transformation.schema_optimizer import restore_types
 from src.domain.exceptions import DataLoadingError
 from src.infrastructure.config import Settings
-from src.infrastructure.repositories import DataRepository
+from src.infrastructure.monitoring import instrumented, track
+from src.infrastructure.repositories import DataRepository, LayerSnapshot, hash_rows, sum_by_key
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +48,181 @@ logger = logging.getLogger(__name__)
 class LoadAnalyticsUseCase:
     """Use case for loading analytics data (Gold Layer)."""
 
+    # Parquet write profile per Gold table, overridable via settings.parquet_profiles.
+    # Year-keyed tables are clustered by release year and the id-keyed
+    # signatures sorted by id. The enriched movies and the similarity index
+    # keep their row order: incremental refreshes splice changed movies in at
+    # their Silver position, and index rows are the movie positions.
+    DEFAULT_PARQUET_PROFILES: Dict[str, str] = {
+        "yearly_analytics": "scan",
+        "cube_analytics": "scan",
+        "silver_signatures": "lookup",
+    }
+
+    YEARLY_MEASURES: Measures = {
+        "movie_count": ("id", "count"),
+        "avg_budget": ("budget", "mean"),
+        "total_budget": ("budget", "sum"),
+        "avg_revenue": ("revenue", "mean"),
+        "total_revenue": ("revenue", "sum"),
+        "avg_profit": ("profit", "mean"),
+        "total_profit": ("profit", "sum"),
+        "avg_rating": ("vote_average", "mean"),
+        "avg_popularity": ("popularity", "mean"),
+        "avg_runtime": ("runtime", "mean"),
+    }
+
+    GENRE_MEASURES: Measures = {
+        "movie_count": ("id", "count"),
+        "avg_budget": ("budget", "mean"),
+        "total_revenue": ("revenue", "sum"),
+        "avg_revenue": ("revenue", "mean"),
+        "avg_profit": ("profit", "mean"),
+        "avg_rating": ("vote_average", "mean"),
+        "avg_popularity": ("popularity", "mean"),
+        "avg_runtime": ("runtime", "mean"),
+    }
+
+    DIRECTOR_MEASURES: Measures = {
+        "movie_count": ("id", "count"),
+        "avg_budget": ("budget", "mean"),
+        "total_revenue": ("revenue", "sum"),
+        "avg_revenue": ("revenue", "mean"),
+        "total_profit": ("profit", "sum"),
+        "avg_profit": ("profit", "mean"),
+        "avg_rating": ("vote_average", "mean"),
+        "avg_popularity": ("popularity", "mean"),
+    }
+
+    # Measures of every cell of the year/decade x genre x language x country cube
+    CUBE_MEASURES: Measures = {
+        "movie_count": ("id", "count"),
+        "total_budget": ("budget", "sum"),
+        "avg_budget": ("budget", "mean"),
+        "total_revenue": ("revenue", "sum"),
+        "avg_revenue": ("revenue", "mean"),
+        "total_profit": ("profit", "sum"),
+        "avg_profit": ("profit", "mean"),
+        "avg_rating": ("vote_average", "mean"),
+        "avg_runtime": ("runtime", "mean"),
+    }
+
+    # Distributions and frequent items per group, kept as mergeable sketches
+    YEARLY_SKETCHES: Sketches = {
+        "budget": ("budget", "quantiles"),
+        "revenue": ("revenue", "quantiles"),
+    }
+    GENRE_SKETCHES: Sketches = {
+        "budget": ("budget", "quantiles"),
+        "revenue": ("revenue", "quantiles"),
+        "keywords": ("keyword_names", "heavy_hitters"),
+    }
+    DIRECTOR_SKETCHES: Sketches = {
+        "budget": ("budget", "quantiles"),
+        "revenue": ("revenue", "quantiles"),
+    }
+    # Distinct raters per movie, from the Silver ratings
+    RATER_SKETCHES: Sketches = {"raters": ("userId", "distinct")}
+
+    # Silver stores unknown budgets and revenues as 0, which would drag the
+    # quantiles down; only known values are sketched
+    UNKNOWN_AS_ZERO = ["budget", "revenue"]
+
+    # Top movies rankings (the rating ranking only considers movies with a
+    # minimum vote count)
+    TOP_N = 100
+    TOP_RANKINGS = [
+        Ranking("revenue", "revenue", n=TOP_N),
+        Ranking("profit", "profit", n=TOP_N),
+        Ranking("rating", "vote_average", n=TOP_N, support="vote_count", min_support=100),
+    ]
+
+    # Per-genre, per-year and per-decade leaderboards of the dashboard
+    LEADERBOARD_N = 10
+    LEADERBOARDS = [
+        Ranking("revenue_by_genre", "revenue", n=LEADERBOARD_N, by="genre_names"),
+        Ranking(
+            "rating_by_genre",
+            "vote_average",
+            n=LEADERBOARD_N,
+            by="genre_names",
+            support="vote_count",
+            min_support=100,
+        ),
+        Ranking("revenue_by_year", "revenue", n=LEADERBOARD_N, by="release_year"),
+        Ranking(
+            "rating_by_decade",
+            "vote_average",
+            n=LEADERBOARD_N,
+            by="release_year",
+            bucket=10,
+            support="vote_count",
+            min_support=100,
+        ),
+    ]
+    LEADERBOARD_COLUMNS = [
+        "id",
+        "title",
+        "release_year",
+        "revenue",
+        "profit",
+        "vote_average",
+        "vote_count",
+        "director",
+    ]
+    MIN_RELEASE_YEAR = 1900
+    MIN_DIRECTOR_MOVIES = 3
+    TOP_MOVIE_COLUMNS = [
+        "id",
+        "title",
+        "release_year",
+        "revenue",
+        "budget",
+        "profit",
+        "roi",
+        "vote_average",
+        "vote_count",
+        "genre_names",
+        "director",
+    ]
+
+    # Position of a movie in the Silver table, used by out-of-core mode to
+    # reproduce the in-memory row order when breaking ties
+    ROW_COLUMN = "_row"
+
+    # Silver tables joined into movies_enriched -> columns read (all if None)
+    JOIN_INPUTS: Dict[str, Optional[List[str]]] = {
+        "movies": None,
+        "credits": ["id", "cast_names", "director"],
+        "keywords": ["id", "keyword_names"],
+    }
+
+    # Mergeable partials of each aggregated Gold table, kept in Gold so that
+    # incremental refreshes only retract and add the changed movies
+    PARTIAL_TABLES = {
+        "yearly_analytics": "yearly_partials",
+        "genre_analytics": "genre_partials",
+        "director_analytics": "director_partials",
+        "cube_analytics": "cube_partials",
+    }
+
+    # Sketch table and sketches of each aggregated Gold table. Sketches cannot
+    # retract rows, so every build folds them from all enriched rows (which
+    # incremental refreshes stream anyway)
+    SKETCH_TABLES: Dict[str, Tuple[str, Sketches]] = {
+        "yearly_analytics": ("yearly_sketches", YEARLY_SKETCHES),
+        "genre_analytics": ("genre_sketches", GENRE_SKETCHES),
+        "director_analytics": ("director_sketches", DIRECTOR_SKETCHES),
+    }
+    RATER_SKETCH_TABLE = "rater_sketches"
+
+    # Gold tables of the similar movies index
+    SIMILARITY_TABLES = [INDEX_TABLE, TERMS_TABLE, CENTROIDS_TABLE]
+
+    # Per-movie row hash signatures of the Silver join inputs at the last build
+    SIGNATURE_TABLE = "silver_signatures"
+    POSITION_COLUMN = "position"
+
     def __init__(self, settings: Settings):
         """Initialize use case.
 
@@ -22,8 +230,8 @@ class LoadAnalyticsUseCase:
             settings: Application settings
         """
         self.settings = settings
-        self.silver_repo = DataRepository(settings.silver_dir)
-        self.gold_repo = DataRepository(settings.gold_dir)
+        self.silver_repo = DataRepository.for_layer(settings, "silver")
+        self.gold_repo = DataRepository.for_layer(settings, "gold")
 
     def execute(self) -> Dict[str, Any]:
         """Execute analytics loading.
@@ -39,22 +247,57 @@ class LoadAnalyticsUseCase:
         try:
             logger.info("Starting analytics loading (Silver → Gold)")
 
-            stats = {}
+            # Load source data from a single Silver generation
+            silver = self.silver_repo.snapshot()
+            gold = self.gold_repo.snapshot()
+
+            logger.info("Computing Silver row signatures...")
+            signatures = self._silver_signatures(silver)
 
-            # Load source data
-            movies_df = self.silver_repo.read_parquet("movies")
-            credits_df = self.silver_repo.read_parquet("credits")
-            keywords_df = self.silver_repo.read_parquet("keywords")
+            if self.settings.gold_refresh == "incremental" and self._can_refresh(gold):
+                stats = self._execute_incremental(silver, gold, signatures)
+            elif self.settings.execution_mode == "out_of_core":
+                stats = self._execute_out_of_core(silver, signatures)
+            else:
+                stats = self._execute_in_memory(silver, signatures)
 
-            # Merge data
-            logger.info("Merging datasets...")
-            full_df = movies_df.merge(credits_df[["id", "cast_names", "director"]], on="id", how="left")
-            full_df = full_df.merge(keywords_df[["id", "keyword_names"]], on="id", how="left")
+            logger.info("Analytics loading completed successfully")
+            logger.info(f"Loading statistics: {stats}")
 
+            return stats
+
+        except Exception as e:
+            logger.error(f"Analytics loading failed: {e}")
+            raise DataLoadingError(f"Failed to load analytics: {e}")
+
+    def _execute_in_memory(
+        self, silver: LayerSnapshot, signatures: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """Build the Gold tables with the whole Silver layer in memory.
+
+        Args:
+            silver: Silver snapshot to read
+            signatures: Silver row signatures, saved for later refreshes
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        stats = {}
+
+        movies_df = self._read_silver(silver, "movies")
+        credits_df = self._read_silver(silver, "credits")
+        keywords_df = self._read_silver(silver, "keywords")
+
+        # Merge data
+        logger.info("Merging datasets...")
+        full_df = self._merge_datasets(movies_df, credits_df, keywords_df)
+
+        # Publish all Gold tables together as one generation
+        with self.gold_repo.generation():
             # Generate analytics
             logger.info("Generating yearly analytics...")
             yearly_stats = self._generate_yearly_stats(full_df)
-            self.gold_repo.save_parquet(yearly_stats, "yearly_analytics")
+            self._save(yearly_stats, "yearly_analytics")
             stats["yearly_analytics"] = {
                 "rows": len(yearly_stats),
                 "columns": len(yearly_stats.columns),
@@ -62,7 +305,7 @@ class LoadAnalyticsUseCase:
 
             logger.info("Generating genre analytics...")
             genre_stats = self._generate_genre_stats(full_df)
-            self.gold_repo.save_parquet(genre_stats, "genre_analytics")
+            self._save(genre_stats, "genre_analytics")
             stats["genre_analytics"] = {
                 "rows": len(genre_stats),
                 "columns": len(genre_stats.columns),
@@ -70,32 +313,776 @@ class LoadAnalyticsUseCase:
 
             logger.info("Generating top movies...")
             top_movies = self._generate_top_movies(full_df)
-            self.gold_repo.save_parquet(top_movies, "top_movies")
+            self._save(top_movies, "top_movies")
             stats["top_movies"] = {"rows": len(top_movies), "columns": len(top_movies.columns)}
 
+            logger.info("Generating leaderboards...")
+            leaderboards = self._generate_leaderboards(full_df)
+            self._save(leaderboards, "leaderboards")
+            stats["leaderboards"] = {
+                "rows": len(leaderboards),
+                "columns": len(leaderboards.columns),
+            }
+
             logger.info("Generating director analytics...")
             director_stats = self._generate_director_stats(full_df)
-            self.gold_repo.save_parquet(director_stats, "director_analytics")
+            self._save(director_stats, "director_analytics")
             stats["director_analytics"] = {
                 "rows": len(director_stats),
                 "columns": len(director_stats.columns),
             }
 
+            logger.info("Generating analytics cube...")
+            cube_partial = self._partial(full_df, "cube_analytics")
+            cube = add_dimensions(finalize(cube_partial, KEY_COLUMN, self.CUBE_MEASURES))
+            self._save(cube, "cube_analytics")
+            stats["cube_analytics"] = {"rows": len(cube), "columns": len(cube.columns)}
+
+            logger.info("Building sketches...")
+            stats.update(
+                self._save_sketches(
+                    {table: self._sketch_partial(full_df, table) for table in self.SKETCH_TABLES}
+                )
+            )
+            stats.update(self._save_rater_sketches(silver))
+
+            logger.info("Building similar movies index...")
+            stats.update(
+                self._save_similarity(SimilarityIndex.build(self._similarity_rows(full_df)))
+            )
+
             # Save full enriched dataset
             logger.info("Saving full enriched dataset...")
-            self.gold_repo.save_parquet(full_df, "movies_enriched")
+            self._save(full_df, "movies_enriched")
             stats["movies_enriched"] = {"rows": len(full_df), "columns": len(full_df.columns)}
 
-            logger.info("Analytics loading completed successfully")
-            logger.info(f"Loading statistics: {stats}")
+            # Save the state of later incremental refreshes (the cube partial
+            # is the one built above)
+            partials = {"cube_analytics": cube_partial}
+            for table, partial_table in self.PARTIAL_TABLES.items():
+                partial = partials.get(table)
+                if partial is None:
+                    partial = self._partial(full_df, table)
+                self._save(partial.reset_index(), partial_table)
+            self._save(signatures.reset_index(), self.SIGNATURE_TABLE)
+
+        return stats
+
+    def _execute_out_of_core(
+        self, silver: LayerSnapshot, signatures: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """Build the Gold tables with bounded memory.
+
+        Silver movies, credits and keywords are hash-partitioned by ``id`` into
+        local spill files, so each bucket can be joined on its own. Every
+        enriched bucket is streamed into ``movies_enriched`` and folded into
+        mergeable partial aggregates and top movie candidates, which are
+        finalized into the same tables as the in-memory mode, and added to the
+        similar movies index. Only the ``movies_enriched`` row order differs
+        (it follows the buckets), and with it the similarity index lists.
+
+        Args:
+            silver: Silver snapshot to read
+            signatures: Silver row signatures, saved for later refreshes
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        spill_dir = self._spill_dir()
+
+        n_buckets = max(math.ceil(silver.num_rows("movies") / self.settings.chunk_size), 1)
+        state: Dict[str, Any] = {"rows": 0, "columns": 0}
+
+        with tempfile.TemporaryDirectory(prefix="gold-", dir=spill_dir) as tmp_dir:
+            buckets_dir = Path(tmp_dir)
 
+            logger.info(f"Partitioning Silver tables into {n_buckets} buckets...")
+            self._partition_by_id(silver, buckets_dir, n_buckets)
+
+            # Publish all Gold tables together as one generation
+            with self.gold_repo.generation():
+                logger.info("Merging datasets and saving full enriched dataset...")
+                self.gold_repo.save_parquet_chunks(
+                    self._enriched_chunks(buckets_dir, n_buckets, state),
+                    "movies_enriched",
+                    profile=self._profile_for("movies_enriched"),
+                    spill_dir=spill_dir,
+                )
+
+                logger.info("Finalizing analytics...")
+                state["similarity"].train()
+                stats = self._save_aggregates(state)
+                stats.update(self._save_rater_sketches(silver))
+                self._save(signatures.reset_index(), self.SIGNATURE_TABLE)
+
+        stats["movies_enriched"] = {"rows": state["rows"], "columns": state["columns"]}
+
+        return stats
+
+    def _execute_incremental(
+        self, silver: LayerSnapshot, gold: LayerSnapshot, signatures: pd.DataFrame
+    ) -> Dict[str, Any]:
+        """Update the Gold tables from the Silver movies changed since the last build.
+
+        A movie changed when the row hash signature of its movie, credits or
+        keywords rows differs from the one stored with the previous Gold
+        generation. Its previous enriched rows are retracted from the stored
+        partials and its new ones added, so only the years, genres and
+        directors it belongs to change, and it is removed from and added back
+        to the stored similar movies index. ``movies_enriched`` is streamed
+        into the new generation with the changed rows replaced, which also
+        refreshes the top movies candidates. Memory is bounded by the chunk
+        size and the number of changed movies.
+
+        Args:
+            silver: Silver snapshot to read
+            gold: Gold snapshot holding the previous build and its partials
+            signatures: Silver row signatures
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        changed = self._changed_ids(gold.read_parquet(self.SIGNATURE_TABLE), signatures)
+        if len(changed) == 0:
+            stats = {
+                table: {"rows": gold.num_rows(table), "columns": len(self._columns(gold, table))}
+                for table in ["movies_enriched", *self.PARTIAL_TABLES, "top_movies", "leaderboards"]
+            }
+            # Ratings are not part of the signatures: refresh their sketches alone
+            raters = self._rater_sketch_table(silver)
+            if raters is not None and not self._is_stored(gold, self.RATER_SKETCH_TABLE, raters):
+                logger.info("Only Silver ratings changed, refreshing rater sketches...")
+                with self.gold_repo.generation():
+                    self._save(raters, self.RATER_SKETCH_TABLE)
+                stats[self.RATER_SKETCH_TABLE] = {
+                    "rows": len(raters),
+                    "columns": len(raters.columns),
+                }
+            else:
+                logger.info("Gold is up to date with Silver, nothing to refresh")
             return stats
 
-        except Exception as e:
-            logger.error(f"Analytics loading failed: {e}")
-            raise DataLoadingError(f"Failed to load analytics: {e}")
+        logger.info(f"Refreshing Gold for {len(changed)} changed movies...")
+        is_changed = pc.field("id").isin(pa.array(changed))
+
+        removed = gold.read_table(
+            "movies_enriched", columns=self._columns(gold, "movies_enriched"), filter=is_changed
+        ).to_pandas()
+        added = self._merge_frames(
+            *(
+                self._silver_table(
+                    silver,
+                    table,
+                    columns=columns or self._columns(silver, table),
+                    filter=is_changed,
+                ).to_pandas()
+                for table, columns in self.JOIN_INPUTS.items()
+            )
+        )
+        added[self.ROW_COLUMN] = self._positions(signatures, added["id"])
+
+        state: Dict[str, Any] = {"rows": 0, "columns": 0, "top": None}
+        state.update(dict.fromkeys(name for name, _ in self.SKETCH_TABLES.values()))
+        with track("aggregate_chunk"):
+            for table, partial_table in self.PARTIAL_TABLES.items():
+                partial = gold.read_parquet(partial_table).set_index(self._aggregations()[table][0])
+                partial = combine_partials([partial, self._partial(added, table)])
+                state[table] = subtract_partials(partial, self._partial(removed, table))
+
+            state["similarity"] = self._read_similarity(gold)
+            state["similarity"].remove(changed)
+            state["similarity"].add(self._similarity_rows(added))
+
+        spill_dir = self._spill_dir()
+
+        # Publish all Gold tables together as one generation
+        with self.gold_repo.generation():
+            logger.info("Saving refreshed enriched dataset...")
+            self.gold_repo.save_parquet_chunks(
+                self._refreshed_chunks(gold, ~is_changed, added, signatures, state),
+                "movies_enriched",
+                profile=self._profile_for("movies_enriched"),
+                spill_dir=spill_dir,
+            )
+
+            logger.info("Finalizing analytics...")
+            stats = self._save_aggregates(state)
+            stats.update(self._save_rater_sketches(silver))
+            self._save(signatures.reset_index(), self.SIGNATURE_TABLE)
+
+        stats["movies_enriched"] = {"rows": state["rows"], "columns": state["columns"]}
+
+        return stats
+
+    def _can_refresh(self, gold: LayerSnapshot) -> bool:
+        """Check whether Gold holds the state of an incremental refresh.
+
+        Args:
+            gold: Gold snapshot
+
+        Returns:
+            True if the signatures and partials of the current measures exist
+        """
+        tables = [
+            "movies_enriched",
+            self.SIGNATURE_TABLE,
+            *self.PARTIAL_TABLES.values(),
+            *(name for name, _ in self.SKETCH_TABLES.values()),
+            *self.SIMILARITY_TABLES,
+        ]
+        missing = [table for table in tables if not gold.has_table(table)]
+        if missing:
+            logger.info(f"Gold has no {', '.join(missing)}, rebuilding it in full")
+            return False
+
+        for table, (by, measures, _, _) in self._aggregations().items():
+            stored = set(gold.schema(self.PARTIAL_TABLES[table]).names)
+            if not stored.issuperset([by, *partial_columns(measures)]):
+                logger.info(f"Measures of {table} changed, rebuilding Gold in full")
+                return False
+
+        return True
+
+    @instrumented()
+    def _silver_signatures(self, silver: LayerSnapshot) -> pd.DataFrame:
+        """Hash the Silver join inputs into one signature per movie id.
+
+        Signatures are sums of row hashes, so they do not depend on row order.
+        Tables are read in chunks and only the ids and hashes are kept.
+
+        Args:
+            silver: Silver snapshot to read
+
+        Returns:
+            DataFrame indexed by id with one ``uint64`` signature column per
+            join input (0 when the id has no rows there) and the position of
+            the id's first movie row in Silver (-1 when there is none)
+        """
+        columns: Dict[str, pd.Series] = {}
+        positions = pd.Series(dtype="int64")
+
+        for table, selected in self.JOIN_INPUTS.items():
+            ids, hashes = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.uint64)]
+            for batch in silver.iter_batches(
+                table, self.settings.chunk_size, columns=selected or self._columns(silver, table)
+            ):
+                data = pa.Table.from_batches([batch])
+                ids.append(data.column("id").to_numpy())
+                hashes.append(hash_rows(data))
+
+            table_ids = np.concatenate(ids)
+            keys, sums, _ = sum_by_key(table_ids, np.concatenate(hashes))
+            columns[table] = pd.Series(sums, index=keys)
+
+            if table == "movies":
+                unique_ids, first = np.unique(table_ids, return_index=True)
+                positions = pd.Series(first.astype("int64"), index=unique_ids)
+
+        index = pd.Index(np.unique(np.concatenate([c.index for c in columns.values()])), name="id")
+        signatures = pd.DataFrame(
+            {table: column.reindex(index, fill_value=0) for table, column in columns.items()}
+        )
+        signatures[self.POSITION_COLUMN] = positions.reindex(index, fill_value=-1)
+        return signatures
+
+    def _changed_ids(self, stored: pd.DataFrame, signatures: pd.DataFrame) -> np.ndarray:
+        """Find the movie ids whose Silver rows changed.
+
+        Args:
+            stored: Signatures saved with the previous Gold build
+            signatures: Current Silver signatures
+
+        Returns:
+            Ids added, removed or modified in any join input
+        """
+        tables = list(self.JOIN_INPUTS)
+        previous = stored.set_index("id")[tables]
+        current = signatures[tables]
+
+        index = previous.index.union(current.index)
+        previous = previous.reindex(index, fill_value=0)
+        current = current.reindex(index, fill_value=0)
+        return index[(previous != current).any(axis=1)].to_numpy()
+
+    def _refreshed_chunks(
+        self,
+        gold: LayerSnapshot,
+        is_kept: pc.Expression,
+        added: pd.DataFrame,
+        signatures: pd.DataFrame,
+        state: Dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
+        """Stream the previous enriched movies with the changed rows replaced.
+
+        Rows are placed in Silver order and folded into the top movies
+        candidates, so rankings break ties as a full rebuild would, and into
+        the sketches.
+
+        Args:
+            gold: Gold snapshot holding the previous enriched movies
+            is_kept: Filter selecting the unchanged movies
+            added: Enriched rows of the changed movies, with Silver positions
+            signatures: Silver signatures holding the movie positions
+            state: Running candidates and counts, updated in place
+
+        Yields:
+            Enriched movies
+        """
+        pending = added.sort_values(self.ROW_COLUMN, kind="stable")
+        kept = gold.iter_batches(
+            "movies_enriched",
+            self.settings.chunk_size,
+            columns=self._columns(gold, "movies_enriched"),
+            filter=is_kept,
+        )
 
-    def _generate_yearly_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+        for batch in kept:
+            chunk = batch.to_pandas()
+            if chunk.empty:
+                continue
+            chunk[self.ROW_COLUMN] = self._positions(signatures, chunk["id"])
+
+            due = pending[self.ROW_COLUMN] <= chunk[self.ROW_COLUMN].max()
+            chunk = pd.concat([chunk, pending[due]], ignore_index=True)
+            pending = pending[~due]
+            chunk = chunk.sort_values(self.ROW_COLUMN, kind="stable")
+            yield self._fold_chunk(chunk, state)
+
+        if not pending.empty:
+            yield self._fold_chunk(pending.reset_index(drop=True), state)
+
+    def _fold_chunk(self, chunk: pd.DataFrame, state: Dict[str, Any]) -> pd.DataFrame:
+        """Fold an enriched chunk into the running top movies candidates and sketches.
+
+        Args:
+            chunk: Enriched movies with the Silver position column
+            state: Running candidates, sketches and counts, updated in place
+
+        Returns:
+            Chunk without the Silver position column
+        """
+        candidates = [state["top"], self._top_candidates(chunk)]
+        state["top"] = self._top_candidates(
+            pd.concat([c for c in candidates if c is not None], ignore_index=True)
+        )
+        for table, (name, _) in self.SKETCH_TABLES.items():
+            state[name] = combine_sketches([state[name], self._sketch_partial(chunk, table)])
+
+        enriched = chunk.drop(columns=self.ROW_COLUMN).reset_index(drop=True)
+        state["rows"] += len(enriched)
+        state["columns"] = len(enriched.columns)
+        return enriched
+
+    def _save_aggregates(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Finalize and save the aggregated tables, their partials and the rankings.
+
+        Args:
+            state: Combined partials per aggregated table and top movies candidates
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        tables = {}
+        for table, (by, measures, _, finish) in self._aggregations().items():
+            self._save(state[table].reset_index(), self.PARTIAL_TABLES[table])
+            tables[table] = finish(finalize(state[table], by, measures))
+        tables["top_movies"] = self._rank_top_movies(state["top"])
+        tables["leaderboards"] = self._rank_leaderboards(state["top"])
+
+        stats = {}
+        for table, df in tables.items():
+            self._save(df, table)
+            stats[table] = {"rows": len(df), "columns": len(df.columns)}
+        stats.update(
+            self._save_sketches(
+                {table: state[name] for table, (name, _) in self.SKETCH_TABLES.items()}
+            )
+        )
+        stats.update(self._save_similarity(state["similarity"]))
+
+        return stats
+
+    def _save_similarity(self, index: SimilarityIndex) -> Dict[str, Any]:
+        """Save the similar movies index.
+
+        Args:
+            index: Trained index
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        stats = {}
+        for table, data in index.to_tables().items():
+            self._save(data, table)
+            stats[table] = {"rows": data.num_rows, "columns": data.num_columns}
+        return stats
+
+    def _read_similarity(self, gold: LayerSnapshot) -> SimilarityIndex:
+        """Load the similar movies index of a Gold snapshot."""
+        return SimilarityIndex.from_tables(*(gold.read_table(t) for t in self.SIMILARITY_TABLES))
+
+    def _similarity_rows(self, df: Any) -> pd.DataFrame:
+        """Select the columns of enriched movies (pandas or Polars) the index reads."""
+        columns = SimilarityIndex.columns()
+        if isinstance(df, pd.DataFrame):
+            return df[columns]
+        return self._polars().to_arrow(df.select(columns)).to_pandas()
+
+    def _save_sketches(self, partials: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+        """Save the sketches of the aggregated tables.
+
+        Args:
+            partials: Combined sketches per aggregated table
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        stats = {}
+        for table, partial in partials.items():
+            name, sketches = self.SKETCH_TABLES[table]
+            df = sketch_table(partial, sketches)
+            self._save(df, name)
+            stats[name] = {"rows": len(df), "columns": len(df.columns)}
+        return stats
+
+    def _sketch_partial(self, df: Any, table: str) -> pd.DataFrame:
+        """Reduce enriched movies to the sketches of an aggregated table.
+
+        Args:
+            df: Enriched movies (pandas or Polars)
+            table: Aggregated Gold table
+
+        Returns:
+            Sketches indexed by group
+        """
+        by, _, rows, _ = self._aggregations()[table]
+        sketches = self.SKETCH_TABLES[table][1]
+        columns = sorted({column for column, _ in sketches.values()})
+        if isinstance(df, pd.DataFrame):
+            selected = rows(df)[[by, *columns]]
+        else:
+            selected = self._polars().measure_rows(df, by, columns).to_pandas()
+
+        known = {
+            column: selected[column].where(selected[column] > 0)
+            for column in self.UNKNOWN_AS_ZERO
+            if column in columns
+        }
+        return partial_sketches(selected.assign(**known), by, sketches)
+
+    def _save_rater_sketches(self, silver: LayerSnapshot) -> Dict[str, Any]:
+        """Save the distinct raters sketches (nothing if Silver has no ratings).
+
+        Args:
+            silver: Silver snapshot to read
+
+        Returns:
+            Dictionary with loading statistics
+        """
+        raters = self._rater_sketch_table(silver)
+        if raters is None:
+            return {}
+        self._save(raters, self.RATER_SKETCH_TABLE)
+        return {self.RATER_SKETCH_TABLE: {"rows": len(raters), "columns": len(raters.columns)}}
+
+    @instrumented()
+    def _rater_sketch_table(self, silver: LayerSnapshot) -> Optional[pd.DataFrame]:
+        """Sketch the distinct raters of each movie, streaming the Silver ratings.
+
+        Args:
+            silver: Silver snapshot to read
+
+        Returns:
+            Serialized sketches per ``movieId``, or None if Silver has no ratings
+        """
+        if not silver.has_table("ratings"):
+            return None
+
+        columns = ["movieId", *(column for column, _ in self.RATER_SKETCHES.values())]
+        partial = None
+        for batch in silver.iter_batches("ratings", self.settings.chunk_size, columns=columns):
+            chunk = batch.to_pandas()
+            partial = combine_sketches(
+                [partial, partial_sketches(chunk, "movieId", self.RATER_SKETCHES)]
+            )
+
+        if partial is None:
+            partial = partial_sketches(
+                pd.DataFrame(columns=columns), "movieId", self.RATER_SKETCHES
+            )
+        return sketch_table(partial, self.RATER_SKETCHES)
+
+    @staticmethod
+    def _is_stored(gold: LayerSnapshot, table: str, df: pd.DataFrame) -> bool:
+        """Check whether Gold already holds a table with the same content."""
+        if not gold.has_table(table):
+            return False
+        stored = gold.read_parquet(table)
+        return list(stored.columns) == list(df.columns) and all(
+            stored[column].tolist() == df[column].tolist() for column in df.columns
+        )
+
+    def _aggregations(
+        self,
+    ) -> Dict[str, Tuple[str, Measures, Callable[[pd.DataFrame], pd.DataFrame], Callable]]:
+        """Get the grouping column, measures, row selection and finishing step per table."""
+        return {
+            "yearly_analytics": (
+                "release_year",
+                self.YEARLY_MEASURES,
+                self._yearly_rows,
+                self._finish_yearly_stats,
+            ),
+            "genre_analytics": (
+                "genre_names",
+                self.GENRE_MEASURES,
+                self._genre_rows,
+                self._finish_genre_stats,
+            ),
+            "director_analytics": (
+                "director",
+                self.DIRECTOR_MEASURES,
+                self._director_rows,
+                self._finish_director_stats,
+            ),
+            "cube_analytics": (
+                KEY_COLUMN,
+                self.CUBE_MEASURES,
+                self._cube_rows,
+                add_dimensions,
+            ),
+        }
+
+    def _partial(self, df: Any, table: str) -> pd.DataFrame:
+        """Reduce enriched movies to the partials of an aggregated table.
+
+        Args:
+            df: Enriched movies (pandas or Polars)
+            table: Aggregated Gold table
+
+        Returns:
+            Partial aggregate indexed by group
+        """
+        by, measures, rows, _ = self._aggregations()[table]
+        if isinstance(df, pd.DataFrame):
+            return partial_aggregate(rows(df), by, measures)
+        if table == "cube_analytics":
+            # Cells are expanded in pandas, from the few columns involved
+            columns = list(dict.fromkeys([*cube_columns(), *source_columns(measures)]))
+            selected = self._polars().to_arrow(df.select(columns)).to_pandas()
+            return partial_aggregate(rows(selected), by, measures)
+
+        selected = self._polars().measure_rows(df, by, source_columns(measures))
+        return partial_aggregate(selected.to_pandas(), by, measures)
+
+    def _positions(self, signatures: pd.DataFrame, ids: pd.Series) -> np.ndarray:
+        """Look up the Silver position of movie ids."""
+        return signatures[self.POSITION_COLUMN].reindex(ids.to_numpy()).to_numpy()
+
+    def _spill_dir(self) -> Optional[Path]:
+        """Get the configured spill directory, creating it if needed."""
+        spill_dir = self.settings.spill_dir
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+        return spill_dir
+
+    @staticmethod
+    def _columns(snapshot: LayerSnapshot, table: str) -> List[str]:
+        """Get the data columns of a table (without the stored pandas index)."""
+        return [name for name in snapshot.schema(table).names if not name.startswith("__index")]
+
+    @instrumented()
+    def _partition_by_id(self, silver: LayerSnapshot, buckets_dir: Path, n_buckets: int) -> None:
+        """Hash-partition the Silver join inputs by movie id into spill files.
+
+        Args:
+            silver: Silver snapshot to read
+            buckets_dir: Directory receiving ``<table>/<bucket>.parquet`` files
+            n_buckets: Number of buckets
+        """
+        for table, columns in self.JOIN_INPUTS.items():
+            (buckets_dir / table).mkdir()
+            writers: Dict[int, pq.ParquetWriter] = {}
+            offset = 0
+            schema = silver.schema(table)
+            try:
+                for batch in silver.iter_batches(table, self.settings.chunk_size, columns=columns):
+                    data = restore_types(pa.Table.from_batches([batch]), schema)
+                    if table == "movies":
+                        positions = np.arange(offset, offset + data.num_rows)
+                        data = data.append_column(self.ROW_COLUMN, pa.array(positions))
+                    offset += data.num_rows
+
+                    bucket_ids = data.column("id").to_numpy() % n_buckets
+                    for bucket in np.unique(bucket_ids):
+                        if bucket not in writers:
+                            path = buckets_dir / table / f"{bucket}.parquet"
+                            writers[bucket] = pq.ParquetWriter(
+                                str(path), data.schema, compression="none"
+                            )
+                        writers[bucket].write_table(data.filter(pa.array(bucket_ids == bucket)))
+            finally:
+                for writer in writers.values():
+                    writer.close()
+
+    def _enriched_chunks(
+        self, buckets_dir: Path, n_buckets: int, state: Dict[str, Any]
+    ) -> Iterator[pd.DataFrame]:
+        """Join each bucket and fold it into the running aggregates.
+
+        Args:
+            buckets_dir: Directory holding the bucket spill files
+            n_buckets: Number of buckets
+            state: Running partials, candidates, sketches and similarity index,
+                updated in place
+
+        Yields:
+            Enriched movies of one bucket
+        """
+        aggregations = self._aggregations()
+        state.update(dict.fromkeys(aggregations), top=None)
+        state.update(dict.fromkeys(name for name, _ in self.SKETCH_TABLES.values()))
+        state["similarity"] = SimilarityIndex()
+
+        for bucket in range(n_buckets):
+            movies_df = self._read_bucket(buckets_dir, "movies", bucket)
+            if movies_df.empty:
+                continue
+
+            chunk = self._merge_datasets(
+                movies_df,
+                self._read_bucket(buckets_dir, "credits", bucket),
+                self._read_bucket(buckets_dir, "keywords", bucket),
+            )
+
+            with track("aggregate_chunk"):
+                for table in aggregations:
+                    state[table] = combine_partials([state[table], self._partial(chunk, table)])
+                enriched = self._fold_chunk(chunk, state)
+            with track("index_chunk"):
+                state["similarity"].add(self._similarity_rows(chunk))
+
+            yield enriched
+
+    @staticmethod
+    def _read_bucket(buckets_dir: Path, table: str, bucket: int) -> pd.DataFrame:
+        """Read one bucket spill file (empty frame if no row hashed to it)."""
+        path = buckets_dir / table / f"{bucket}.parquet"
+        if path.exists():
+            return pq.read_table(str(path)).to_pandas()
+
+        # Any other bucket of the table has the same schema
+        other = next((buckets_dir / table).glob("*.parquet"), None)
+        if other is None:
+            raise DataLoadingError(f"Silver table '{table}' is empty")
+        return pq.read_schema(str(other)).empty_table().to_pandas()
+
+    def _top_candidates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the rows that can appear in a top movies ranking or leaderboard.
+
+        Rows are ordered by Silver position first, so that the rankings break
+        ties exactly as they do over the whole table.
+
+        Args:
+            df: Enriched movies with the Silver position column
+
+        Returns:
+            Union of the per-ranking (and per-group) top rows, in Silver order
+        """
+        df = df.sort_values(self.ROW_COLUMN, kind="stable").reset_index(drop=True)
+        keep = np.zeros(len(df), dtype=bool)
+        for ranking in [*self.TOP_RANKINGS, *self.LEADERBOARDS]:
+            keep[rank(df, ranking)[0]] = True
+        return df[keep]
+
+    def _read_silver(self, silver: LayerSnapshot, table: str) -> Any:
+        """Read a Silver table as a DataFrame of the configured engine.
+
+        Args:
+            silver: Silver snapshot to read
+            table: Table name
+
+        Returns:
+            pandas or Polars DataFrame
+        """
+        if self._use_polars():
+            return self._polars().read_table(silver, table)
+        return self._silver_table(silver, table).to_pandas()
+
+    @staticmethod
+    def _silver_table(
+        silver: LayerSnapshot,
+        table: str,
+        columns: Optional[List[str]] = None,
+        filter: Optional[pc.Expression] = None,
+    ) -> pa.Table:
+        """Read a Silver table with the column types of its cleaning.
+
+        Silver stores narrowed types; the analytics depend on the cleaning
+        types (e.g. sums of ``int32`` columns keep that type in pandas when
+        they fit and overflow in Polars), so they are restored on read.
+        """
+        data = silver.read_table(table, columns=columns, filter=filter)
+        return restore_types(data, silver.schema(table))
+
+    def _save(self, df: Any, table: str) -> None:
+        """Save a Gold table using its configured Parquet write profile.
+
+        Args:
+            df: DataFrame (pandas or Polars) or Arrow table to save
+            table: Table name
+        """
+        data = df if isinstance(df, (pd.DataFrame, pa.Table)) else self._polars().to_arrow(df)
+        self.gold_repo.save_parquet(data, table, profile=self._profile_for(table))
+
+    def _use_polars(self) -> bool:
+        """Check whether the in-memory analytics run on Polars."""
+        return self.settings.engine == "polars" and self.settings.execution_mode == "in_memory"
+
+    @staticmethod
+    def _polars() -> ModuleType:
+        """Import the Polars engine (optional dependency)."""
+        try:
+            from src.application.loading import polars_analytics
+        except ImportError:
+            raise DataLoadingError(
+                "The polars engine requires the 'polars' package: pip install polars"
+            )
+        return polars_analytics
+
+    def _profile_for(self, table: str) -> str:
+        """Get the Parquet write profile of a Gold table."""
+        return self.settings.parquet_profile_for(
+            table, self.DEFAULT_PARQUET_PROFILES.get(table, "default")
+        )
+
+    @instrumented()
+    def _merge_datasets(self, movies_df: Any, credits_df: Any, keywords_df: Any) -> Any:
+        """Enrich movies with cast, director and keywords.
+
+        Args:
+            movies_df: Silver movies
+            credits_df: Silver credits
+            keywords_df: Silver keywords
+
+        Returns:
+            Enriched movies DataFrame
+        """
+        if self._use_polars():
+            return self._polars().merge_datasets(movies_df, credits_df, keywords_df)
+
+        return self._merge_frames(movies_df, credits_df, keywords_df)
+
+    @staticmethod
+    def _merge_frames(
+        movies_df: pd.DataFrame, credits_df: pd.DataFrame, keywords_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Left-join pandas credits and keywords columns onto movies by ``id``."""
+        full_df = movies_df.merge(credits_df[["id", "cast_names", "director"]], on="id", how="left")
+        return full_df.merge(keywords_df[["id", "keyword_names"]], on="id", how="left")
+
+    @instrumented()
+    def _generate_yearly_stats(self, df: Any) -> Any:
         """Generate yearly statistics.
 
         Args:
@@ -104,30 +1091,32 @@ class LoadAnalyticsUseCase:
         Returns:
             Yearly statistics dataframe
         """
+        if self._use_polars():
+            return self._polars().yearly_stats(df, self.YEARLY_MEASURES, self.MIN_RELEASE_YEAR)
+
         yearly = (
-            df[df["release_year"].notna()]
+            self._yearly_rows(df)
             .groupby("release_year")
-            .agg(
-                movie_count=("id", "count"),
-                avg_budget=("budget", "mean"),
-                total_budget=("budget", "sum"),
-                avg_revenue=("revenue", "mean"),
-                total_revenue=("revenue", "sum"),
-                avg_profit=("profit", "mean"),
-                total_profit=("profit", "sum"),
-                avg_rating=("vote_average", "mean"),
-                avg_popularity=("popularity", "mean"),
-                avg_runtime=("runtime", "mean"),
-            )
+            .agg(**self.YEARLY_MEASURES)
             .reset_index()
         )
 
-        yearly = yearly[yearly["release_year"] >= 1900]
+        return self._finish_yearly_stats(yearly)
+
+    @staticmethod
+    def _yearly_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Select the rows aggregated into yearly statistics."""
+        return df[df["release_year"].notna()]
+
+    def _finish_yearly_stats(self, yearly: pd.DataFrame) -> pd.DataFrame:
+        """Filter and order aggregated yearly statistics."""
+        yearly = yearly[yearly["release_year"] >= self.MIN_RELEASE_YEAR]
         yearly = yearly.sort_values("release_year")
 
         return yearly
 
-    def _generate_genre_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+    @instrumented()
+    def _generate_genre_stats(self, df: Any) -> Any:
         """Generate genre statistics.
 
         Args:
@@ -136,30 +1125,28 @@ class LoadAnalyticsUseCase:
         Returns:
             Genre statistics dataframe
         """
-        # Explode genres
-        df_exploded = df.explode("genre_names")
-        df_exploded = df_exploded[df_exploded["genre_names"].notna()]
+        if self._use_polars():
+            return self._polars().genre_stats(df, self.GENRE_MEASURES)
 
         genre_stats = (
-            df_exploded.groupby("genre_names")
-            .agg(
-                movie_count=("id", "count"),
-                avg_budget=("budget", "mean"),
-                total_revenue=("revenue", "sum"),
-                avg_revenue=("revenue", "mean"),
-                avg_profit=("profit", "mean"),
-                avg_rating=("vote_average", "mean"),
-                avg_popularity=("popularity", "mean"),
-                avg_runtime=("runtime", "mean"),
-            )
-            .reset_index()
+            self._genre_rows(df).groupby("genre_names").agg(**self.GENRE_MEASURES).reset_index()
         )
 
-        genre_stats = genre_stats.sort_values("movie_count", ascending=False)
+        return self._finish_genre_stats(genre_stats)
 
-        return genre_stats
+    @staticmethod
+    def _genre_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Explode movies into one row per genre."""
+        df_exploded = df.explode("genre_names")
+        return df_exploded[df_exploded["genre_names"].notna()]
+
+    @staticmethod
+    def _finish_genre_stats(genre_stats: pd.DataFrame) -> pd.DataFrame:
+        """Order aggregated genre statistics."""
+        return genre_stats.sort_values("movie_count", ascending=False)
 
-    def _generate_top_movies(self, df: pd.DataFrame) -> pd.DataFrame:
+    @instrumented()
+    def _generate_top_movies(self, df: Any) -> Any:
         """Generate top movies list.
 
         Args:
@@ -168,69 +1155,57 @@ class LoadAnalyticsUseCase:
         Returns:
             Top movies dataframe
         """
-        # Top by revenue
-        top_revenue = df.nlargest(100, "revenue")[
-            [
-                "id",
-                "title",
-                "release_year",
-                "revenue",
-                "budget",
-                "profit",
-                "roi",
-                "vote_average",
-                "vote_count",
-                "genre_names",
-                "director",
-            ]
-        ].copy()
-        top_revenue["rank_type"] = "revenue"
-        top_revenue["rank"] = range(1, len(top_revenue) + 1)
-
-        # Top by profit
-        top_profit = df.nlargest(100, "profit")[
-            [
-                "id",
-                "title",
-                "release_year",
-                "revenue",
-                "budget",
-                "profit",
-                "roi",
-                "vote_average",
-                "vote_count",
-                "genre_names",
-                "director",
-            ]
-        ].copy()
-        top_profit["rank_type"] = "profit"
-        top_profit["rank"] = range(1, len(top_profit) + 1)
-
-        # Top by rating (with minimum vote threshold)
-        top_rating = df[df["vote_count"] >= 100].nlargest(100, "vote_average")[
-            [
-                "id",
-                "title",
-                "release_year",
-                "revenue",
-                "budget",
-                "profit",
-                "roi",
-                "vote_average",
-                "vote_count",
-                "genre_names",
-                "director",
-            ]
-        ].copy()
-        top_rating["rank_type"] = "rating"
-        top_rating["rank"] = range(1, len(top_rating) + 1)
+        if self._use_polars():
+            return self._polars().top_movies(df, self.TOP_RANKINGS, self.TOP_MOVIE_COLUMNS)
+
+        return self._rank_top_movies(df)
+
+    def _rank_top_movies(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Build the top movies rankings of pandas enriched movies."""
+        rankings = []
+        for ranking in self.TOP_RANKINGS:
+            top = rank_frame(df, ranking, self.TOP_MOVIE_COLUMNS)
+            top.insert(len(self.TOP_MOVIE_COLUMNS), "rank_type", ranking.name)
+            rankings.append(top)
 
         # Combine all rankings
-        top_movies = pd.concat([top_revenue, top_profit, top_rating], ignore_index=True)
+        top_movies = pd.concat(rankings, ignore_index=True)
 
         return top_movies
 
-    def _generate_director_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+    @instrumented()
+    def _generate_leaderboards(self, df: Any) -> pd.DataFrame:
+        """Generate the per-group leaderboards.
+
+        Args:
+            df: Full movies dataframe
+
+        Returns:
+            Leaderboards dataframe (one row per leaderboard, group and rank)
+        """
+        if self._use_polars():
+            # Ranked on the few columns involved, converted from Arrow
+            columns = {
+                column
+                for ranking in self.LEADERBOARDS
+                for column in [*ranking.columns, *self.LEADERBOARD_COLUMNS]
+            }
+            df = self._polars().to_arrow(df.select(sorted(columns))).to_pandas()
+
+        return self._rank_leaderboards(df)
+
+    def _rank_leaderboards(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Build the leaderboards of pandas enriched movies."""
+        leaderboards = []
+        for ranking in self.LEADERBOARDS:
+            board = rank_frame(df, ranking, self.LEADERBOARD_COLUMNS)
+            board.insert(0, "leaderboard", ranking.name)
+            leaderboards.append(board)
+
+        return pd.concat(leaderboards, ignore_index=True)
+
+    @instrumented()
+    def _generate_director_stats(self, df: Any) -> Any:
         """Generate director statistics.
 
         Args:
@@ -239,25 +1214,33 @@ class LoadAnalyticsUseCase:
         Returns:
             Director statistics dataframe
         """
+        if self._use_polars():
+            return self._polars().director_stats(
+                df, self.DIRECTOR_MEASURES, self.MIN_DIRECTOR_MOVIES
+            )
+
         director_stats = (
-            df[df["director"].notna()]
+            self._director_rows(df)
             .groupby("director")
-            .agg(
-                movie_count=("id", "count"),
-                avg_budget=("budget", "mean"),
-                total_revenue=("revenue", "sum"),
-                avg_revenue=("revenue", "mean"),
-                total_profit=("profit", "sum"),
-                avg_profit=("profit", "mean"),
-                avg_rating=("vote_average", "mean"),
-                avg_popularity=("popularity", "mean"),
-            )
+            .agg(**self.DIRECTOR_MEASURES)
             .reset_index()
         )
 
-        # Filter directors with at least 3 movies
-        director_stats = director_stats[director_stats["movie_count"] >= 3]
+        return self._finish_director_stats(director_stats)
+
+    @staticmethod
+    def _director_rows(df: pd.DataFrame) -> pd.DataFrame:
+        """Select the rows aggregated into director statistics."""
+        return df[df["director"].notna()]
+
+    def _finish_director_stats(self, director_stats: pd.DataFrame) -> pd.DataFrame:
+        """Filter and order aggregated director statistics."""
+        # Filter directors with at least MIN_DIRECTOR_MOVIES movies
+        director_stats = director_stats[director_stats["movie_count"] >= self.MIN_DIRECTOR_MOVIES]
         director_stats = director_stats.sort_values("total_revenue", ascending=False)
 
         return director_stats
 
+    def _cube_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Expand enriched movies into one row per cube cell they belong to."""
+        return cube_rows(df, source_columns(self.CUBE_MEASURES), self.MIN_RELEASE_YEAR)
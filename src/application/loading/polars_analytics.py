@@ -0,0 +1,179 @@
+"""Polars implementation of the Gold analytics.
+
+Each function produces the same table as the matching
+``LoadAnalyticsUseCase`` method, from the same measure and ranking
+definitions. Queries are built lazily, so Polars can prune columns and push
+filters down before running its multi-threaded group-bys. Rows that tie in a
+descending sort keep their input order (pandas uses an unstable sort there).
+"""
+
+from typing import List, Optional
+
+import polars as pl
+
+from src.application.loading.aggregates import Measures
+from src.application.loading.ranking import Ranking
+from src.application.polars_frames import from_arrow, to_arrow
+from src.application.transformation.schema_optimizer import restore_types
+from src.infrastructure.repositories import LayerSnapshot
+
+__all__ = [
+    "director_stats",
+    "genre_stats",
+    "measure_rows",
+    "merge_datasets",
+    "read_table",
+    "to_arrow",
+    "top_movies",
+    "yearly_stats",
+]
+
+
+def read_table(
+    snapshot: LayerSnapshot, table: str, columns: Optional[List[str]] = None
+) -> pl.DataFrame:
+    """Read a table of a layer snapshot into Polars (Silver with its cleaning types).
+
+    Args:
+        snapshot: Layer snapshot
+        table: Table name
+        columns: Columns to read (all columns if None)
+
+    Returns:
+        Polars DataFrame
+    """
+    data = snapshot.read_table(table, columns=columns)
+    return from_arrow(restore_types(data, snapshot.schema(table)))
+
+
+def merge_datasets(
+    movies: pl.DataFrame, credits: pl.DataFrame, keywords: pl.DataFrame
+) -> pl.DataFrame:
+    """Enrich movies with cast, director and keywords (left joins on ``id``).
+
+    Only the ids are joined; the rows are then gathered by position. The
+    movie rows go through Arrow, whose ``take`` copies the nested
+    ``list<struct>`` columns much faster than a Polars gather.
+    """
+    positions = (
+        movies.select("id")
+        .with_row_index("movie")
+        .join(
+            credits.select("id").with_row_index("credit"),
+            on="id",
+            how="left",
+            maintain_order="left",
+        )
+        .join(
+            keywords.select("id").with_row_index("keyword"),
+            on="id",
+            how="left",
+            maintain_order="left",
+        )
+    )
+
+    enriched = from_arrow(movies.to_arrow().take(positions["movie"].to_arrow()))
+    return pl.concat(
+        [
+            enriched,
+            credits.select("cast_names", "director")[positions["credit"]],
+            keywords.select("keyword_names")[positions["keyword"]],
+        ],
+        how="horizontal",
+    )
+
+
+def measure_rows(df: pl.DataFrame, by: str, columns: List[str]) -> pl.DataFrame:
+    """Select the rows and columns aggregated per group.
+
+    List grouping columns (genres) are exploded into one row per item. Rows
+    without a group are dropped.
+
+    Args:
+        df: Enriched movies
+        by: Grouping column
+        columns: Measured columns
+
+    Returns:
+        Grouping column and measured columns of the aggregated rows
+    """
+    rows = df.lazy().select(by, *columns)
+    if isinstance(df.schema[by], pl.List):
+        rows = rows.explode(by)
+    return rows.filter(pl.col(by).is_not_null()).collect()
+
+
+def yearly_stats(df: pl.DataFrame, measures: Measures, min_year: int) -> pl.DataFrame:
+    """Aggregate movies per release year."""
+    return (
+        _aggregate(df.lazy().filter(pl.col("release_year").is_not_null()), "release_year", measures)
+        .filter(pl.col("release_year") >= min_year)
+        .sort("release_year")
+        .collect()
+    )
+
+
+def genre_stats(df: pl.DataFrame, measures: Measures) -> pl.DataFrame:
+    """Aggregate movies per genre, most common genres first."""
+    rows = df.lazy().explode("genre_names").filter(pl.col("genre_names").is_not_null())
+    return (
+        _aggregate(rows, "genre_names", measures)
+        .sort("movie_count", descending=True, maintain_order=True)
+        .collect()
+    )
+
+
+def director_stats(df: pl.DataFrame, measures: Measures, min_movies: int) -> pl.DataFrame:
+    """Aggregate movies per director, highest total revenue first."""
+    return (
+        _aggregate(df.lazy().filter(pl.col("director").is_not_null()), "director", measures)
+        .filter(pl.col("movie_count") >= min_movies)
+        .sort("total_revenue", descending=True, maintain_order=True)
+        .collect()
+    )
+
+
+def top_movies(df: pl.DataFrame, rankings: List[Ranking], columns: List[str]) -> pl.DataFrame:
+    """Build the top rankings, ties broken by input order like ``select_top``.
+
+    Args:
+        df: Enriched movies
+        rankings: Global (ungrouped) rankings
+        columns: Movie columns to keep
+
+    Returns:
+        Concatenated rankings with ``rank_type`` and ``rank`` columns
+    """
+    queries = []
+    for ranking in rankings:
+        eligible = df.lazy().filter(pl.col(ranking.metric).is_not_null())
+        if ranking.support is not None:
+            eligible = eligible.filter(pl.col(ranking.support) >= ranking.min_support)
+        queries.append(
+            eligible.sort(ranking.metric, descending=True, maintain_order=True)
+            .head(ranking.n)
+            .select(columns)
+            .with_columns(
+                pl.lit(ranking.name).alias("rank_type"),
+                pl.int_range(1, pl.len() + 1, dtype=pl.Int64).alias("rank"),
+            )
+        )
+
+    return pl.concat(pl.collect_all(queries))
+
+
+def _aggregate(rows: pl.LazyFrame, by: str, measures: Measures) -> pl.LazyFrame:
+    """Group-by with the semantics of ``groupby(by).agg(**measures)``."""
+    expressions = []
+    for name, (column, function) in measures.items():
+        if function == "count":
+            expression = pl.col(column).count().cast(pl.Int64)
+        elif function == "sum":
+            expression = pl.col(column).sum()
+        elif function == "mean":
+            expression = pl.col(column).mean()
+        else:
+            raise ValueError(f"Unsupported aggregation '{function}'")
+        expressions.append(expression.alias(name))
+
+    return rows.group_by(by).agg(expressions).sort(by)
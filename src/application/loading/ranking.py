@@ -0,0 +1,197 @@
+"""Grouped top-N rankings by partial selection.
+
+A ranking is declared once, as the top ``n`` rows by a metric, optionally per
+group of a column (list columns such as ``genre_names`` rank a row in each of
+its groups, and numeric groups can be bucketed, e.g. years into decades) and
+among the rows meeting a minimum support (e.g. ``vote_count >= 100``).
+
+Rows are never sorted as a whole: groups with at most ``n`` rows are kept
+entirely and each larger group is cut with ``np.partition``, so only the
+selected rows are sorted. Ties at the cut keep the earliest rows, as
+``DataFrame.nlargest`` does, or all of them.
+"""
+
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Column holding the rank of a row within its group
+RANK_COLUMN = "rank"
+# Column holding the group of a row in grouped rankings
+GROUP_COLUMN = "group"
+
+
+@dataclass(frozen=True)
+class Ranking:
+    """Top ``n`` rows by ``metric``, per group of ``by``.
+
+    Attributes:
+        name: Ranking name
+        metric: Column ranked in descending order (rows where it is missing
+            are skipped)
+        n: Rows kept per group
+        by: Grouping column (one global ranking if None)
+        bucket: Width of the numeric buckets of ``by`` (e.g. 10 for decades)
+        support: Column the minimum support applies to
+        min_support: Rows need ``support >= min_support`` to be ranked
+        ties: ``first`` keeps the earliest of the rows tied at the cut (ranks
+            are then 1..n), ``all`` keeps every tied row (tied rows share the
+            lowest rank)
+    """
+
+    name: str
+    metric: str
+    n: int = 100
+    by: Optional[str] = None
+    bucket: Optional[int] = None
+    support: Optional[str] = None
+    min_support: float = 0
+    ties: Literal["first", "all"] = "first"
+
+    @property
+    def columns(self) -> List[str]:
+        """Get the columns the ranking reads."""
+        return [c for c in (self.metric, self.by, self.support) if c is not None]
+
+
+def select_top(
+    values: np.ndarray,
+    n: int,
+    groups: Optional[np.ndarray] = None,
+    ties: Literal["first", "all"] = "first",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Select the top ``n`` values of each group.
+
+    Args:
+        values: Values to rank (NaN values are skipped)
+        n: Values kept per group
+        groups: Non-negative integer group code of each value (negative codes
+            are skipped); a single group if None
+        ties: ``first`` or ``all`` (see ``Ranking``)
+
+    Returns:
+        Positions of the selected values, ordered by group code, descending
+        value and position, and the rank of each within its group
+    """
+    values = np.asarray(values, dtype="float64")
+    codes = np.zeros(len(values), dtype=np.int64) if groups is None else np.asarray(groups)
+
+    positions = np.flatnonzero(~np.isnan(values) & (codes >= 0))
+    if len(positions) == 0 or n <= 0:
+        return positions, np.zeros(0, dtype=np.int64)
+
+    # Make groups contiguous (positions stay ascending within each group)
+    positions = positions[np.argsort(codes[positions], kind="stable")]
+    sorted_codes = codes[positions]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(positions)])
+
+    selected = [positions[np.repeat(sizes <= n, sizes)]]
+    for start, size in zip(starts[sizes > n], sizes[sizes > n]):
+        members = positions[start : start + size]
+        selected.append(_cut(values[members], members, n, ties))
+    selected = np.concatenate(selected)
+
+    # Only the selected values are sorted
+    selected = selected[np.lexsort((selected, -values[selected], codes[selected]))]
+    return selected, _ranks(codes[selected], values[selected], ties)
+
+
+def rank(df: pd.DataFrame, ranking: Ranking) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """Rank the rows of a DataFrame.
+
+    Args:
+        df: Rows to rank
+        ranking: Ranking to compute
+
+    Returns:
+        Row positions in ``df`` (a row appears once per group it is selected
+        in), their ranks, and their groups (empty for a global ranking)
+    """
+    rows = np.arange(len(df))
+    codes = None
+    labels = pd.Index([])
+
+    if ranking.by is not None:
+        keys = df[ranking.by].to_numpy()
+        if keys.dtype == object:
+            lists = [key if pd.api.types.is_list_like(key) else None for key in keys]
+            if any(key is not None for key in lists):
+                rows, keys = _flatten(lists)
+        if ranking.bucket:
+            keys = pd.to_numeric(keys) // ranking.bucket * ranking.bucket
+        codes, labels = pd.factorize(keys, sort=True)
+
+    values = df[ranking.metric].to_numpy(dtype="float64", na_value=np.nan)[rows]
+    if ranking.support is not None:
+        support = df[ranking.support].to_numpy(dtype="float64", na_value=np.nan)[rows]
+        values = np.where(support >= ranking.min_support, values, np.nan)
+
+    selected, ranks = select_top(values, ranking.n, codes, ranking.ties)
+    groups = pd.Index(labels)[codes[selected]] if codes is not None else pd.Index([])
+    return rows[selected], ranks, groups
+
+
+def rank_frame(df: pd.DataFrame, ranking: Ranking, columns: List[str]) -> pd.DataFrame:
+    """Build the rows of a ranking.
+
+    Args:
+        df: Rows to rank
+        ranking: Ranking to compute
+        columns: Columns of ``df`` to keep
+
+    Returns:
+        Selected rows with a ``group`` column (grouped rankings only, as text
+        so that genres and years share it) and a ``rank`` column
+    """
+    rows, ranks, groups = rank(df, ranking)
+    ranked = df[columns].iloc[rows].reset_index(drop=True)
+    if ranking.by is not None:
+        ranked[GROUP_COLUMN] = [_label(group) for group in groups]
+    ranked[RANK_COLUMN] = ranks
+    return ranked
+
+
+def _flatten(lists: List[Optional[Sequence]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Flatten list groups (much faster than ``Series.explode`` on arrays).
+
+    Returns:
+        Row of each item, and the items
+    """
+    lengths = np.fromiter(
+        (len(key) if key is not None else 0 for key in lists), dtype=np.int64, count=len(lists)
+    )
+    items = [np.asarray(key, dtype=object) for key in lists if key is not None and len(key)]
+    if not items:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=object)
+    return np.repeat(np.arange(len(lists)), lengths), np.concatenate(items)
+
+
+def _label(group: object) -> str:
+    """Format a group, without the decimals of whole numbers (years read as floats)."""
+    if isinstance(group, float) and group.is_integer():
+        return str(int(group))
+    return str(group)
+
+
+def _cut(values: np.ndarray, members: np.ndarray, n: int, ties: str) -> np.ndarray:
+    """Keep the ``n`` largest values of one group (members in position order)."""
+    threshold = np.partition(values, len(values) - n)[len(values) - n]
+    above = members[values > threshold]
+    tied = members[values == threshold]
+    if ties == "first":
+        tied = tied[: n - len(above)]
+    return np.concatenate([above, tied])
+
+
+def _ranks(codes: np.ndarray, values: np.ndarray, ties: str) -> np.ndarray:
+    """Rank rows sorted by group and descending value."""
+    index = np.arange(len(codes))
+    group_start = np.maximum.accumulate(np.where(np.r_[True, codes[1:] != codes[:-1]], index, 0))
+    if ties == "first":
+        return index - group_start + 1
+
+    run_start = np.r_[True, (codes[1:] != codes[:-1]) | (values[1:] != values[:-1])]
+    return np.maximum.accumulate(np.where(run_start, index, 0)) - group_start + 1
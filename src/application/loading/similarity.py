@@ -0,0 +1,484 @@
+"""Content-based "more like this" index over movie text.
+
+Each movie is a sparse TF-IDF vector of the words of its overview and tagline,
+plus its keywords and genres as whole terms, and two movies are as similar as
+the cosine of their vectors.
+
+Queries do not scan the catalog. Vectors are also projected to a small dense
+embedding (with random signs derived from each term's hash, so the vocabulary
+can grow at any time) and clustered with spherical k-means into inverted
+lists (IVF). A query scores the centroids, probes the closest lists and ranks
+their movies by exact TF-IDF cosine.
+
+The index is updated in place as movies are added, changed or removed. Term
+weights are stored without IDF, which is applied when scoring, so exact
+scores always use the current document frequencies. New movies join their
+closest list, and the lists are clustered again once the catalog has grown by
+``RETRAIN_GROWTH`` since the last clustering.
+"""
+
+import json
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Gold tables holding the index
+INDEX_TABLE = "similarity_index"
+TERMS_TABLE = "similarity_terms"
+CENTROIDS_TABLE = "similarity_centroids"
+
+_TOKEN = r"[a-z][a-z0-9']+"
+_STOP_WORDS = frozenset(
+    """about after all also and are as at be been but by can for from has have he her his
+    in into is it its of on one or she that the their them they this to was were when
+    which while who will with an""".split()
+)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+class SimilarityIndex:
+    """Sparse TF-IDF vectors of movies with an IVF index over their embeddings."""
+
+    # Free-text columns -> weight of each occurrence of a word
+    TEXT_FIELDS: Dict[str, float] = {"overview": 1.0, "tagline": 1.0}
+    # List columns -> (term prefix, weight); each item is one term
+    TERM_FIELDS: Dict[str, Tuple[str, float]] = {
+        "keyword_names": ("keyword", 2.0),
+        "genre_names": ("genre", 1.0),
+    }
+
+    # Dimensions of the embeddings the lists are clustered on
+    DIM = 128
+    # Lists probed per query
+    N_PROBE = 8
+    # Catalog growth since the last clustering that triggers a new one
+    RETRAIN_GROWTH = 0.25
+    KMEANS_ITERATIONS = 10
+    # Movies sampled per list to train the centroids
+    TRAIN_SAMPLE = 64
+    SEED = 42
+
+    # Rows embedded at once (bounds the projection's scratch memory)
+    _EMBED_CHUNK = 512
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.terms = pd.Index([], dtype=object)
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        # CSR rows of weighted term frequencies (without IDF)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.weights = np.zeros(0, dtype=np.float32)
+
+        self.embeddings = np.zeros((0, self.DIM), dtype=np.float32)
+        self.centroids = np.zeros((0, self.DIM), dtype=np.float32)
+        self.lists = np.zeros(0, dtype=np.int32)
+        self.trained_docs = 0
+
+        self._projection = np.zeros((0, self.DIM), dtype=np.float32)
+        self._cache: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def columns(cls) -> List[str]:
+        """Get the movie columns the index reads."""
+        return ["id", *cls.TEXT_FIELDS, *cls.TERM_FIELDS]
+
+    @classmethod
+    def build(cls, movies: pd.DataFrame) -> "SimilarityIndex":
+        """Index movies and cluster them.
+
+        Args:
+            movies: Movies with the ``columns()`` columns
+
+        Returns:
+            Trained index
+        """
+        index = cls()
+        index.add(movies)
+        index.train()
+        return index
+
+    @property
+    def num_docs(self) -> int:
+        """Get the number of indexed movies."""
+        return len(self.ids)
+
+    def add(self, movies: pd.DataFrame) -> None:
+        """Add movies, replacing the ones already indexed.
+
+        New movies join their closest list if the index is trained; the lists
+        are clustered again once the catalog outgrew them.
+
+        Args:
+            movies: Movies with the ``columns()`` columns
+        """
+        if movies.empty:
+            return
+        movies = movies.drop_duplicates("id", keep="last")
+        self.remove(movies["id"].to_numpy())
+
+        docs, terms, tf = self._term_frequencies(movies)
+        codes = self._term_codes(terms)
+        self.doc_freq += np.bincount(codes, minlength=len(self.terms))
+
+        first = self.num_docs
+        lengths = np.bincount(docs, minlength=len(movies))
+        self.ids = np.concatenate([self.ids, movies["id"].to_numpy(dtype=np.int64)])
+        self.indptr = np.concatenate([self.indptr, self.indptr[-1] + np.cumsum(lengths)])
+        self.indices = np.concatenate([self.indices, codes.astype(np.int32)])
+        self.weights = np.concatenate([self.weights, tf.astype(np.float32)])
+        self._cache.clear()
+
+        if self.trained_docs == 0:
+            self.embeddings = np.zeros((self.num_docs, self.DIM), dtype=np.float32)
+            self.lists = np.zeros(self.num_docs, dtype=np.int32)
+            return
+        if self.num_docs > self.trained_docs * (1 + self.RETRAIN_GROWTH):
+            self.train()
+            return
+        added = self._embed(np.arange(first, self.num_docs))
+        self.embeddings = np.concatenate([self.embeddings, added])
+        self.lists = np.concatenate([self.lists, self._assign(added)])
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Remove movies (ids not in the index are ignored).
+
+        Args:
+            ids: Movie ids
+        """
+        removed = np.isin(self.ids, np.fromiter(ids, dtype=np.int64))
+        if not removed.any():
+            return
+
+        lengths = np.diff(self.indptr)
+        removed_terms = np.repeat(removed, lengths)
+        self.doc_freq -= np.bincount(self.indices[removed_terms], minlength=len(self.terms))
+
+        keep = ~removed
+        self.ids = self.ids[keep]
+        self.indptr = np.r_[0, np.cumsum(lengths[keep])]
+        self.indices = self.indices[~removed_terms]
+        self.weights = self.weights[~removed_terms]
+        self.embeddings = self.embeddings[keep]
+        self.lists = self.lists[keep]
+        self._cache.clear()
+
+    def train(self) -> None:
+        """Embed all movies and cluster them into about ``sqrt(n)`` lists.
+
+        Centroids are trained on a sample of ``TRAIN_SAMPLE`` movies per list,
+        then every movie joins its closest list.
+        """
+        self.embeddings = self._embed(np.arange(self.num_docs))
+        self.trained_docs = self.num_docs
+        self._cache.clear()
+        if self.num_docs == 0:
+            self.centroids = np.zeros((0, self.DIM), dtype=np.float32)
+            self.lists = np.zeros(0, dtype=np.int32)
+            return
+
+        n_lists = max(1, round(math.sqrt(self.num_docs)))
+        rng = np.random.default_rng(self.SEED)
+        sample = self.embeddings
+        if self.num_docs > n_lists * self.TRAIN_SAMPLE:
+            sample = sample[rng.choice(self.num_docs, n_lists * self.TRAIN_SAMPLE, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)]
+        for _ in range(self.KMEANS_ITERATIONS):
+            self.centroids = centroids
+            sums = _sum_by(sample, self._assign(sample), n_lists)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Lists left empty keep their centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+            centroids = centroids.astype(np.float32)
+
+        self.centroids = centroids
+        self.lists = self._assign(self.embeddings)
+
+    def similar(self, movie_id: int, n: int = 10, n_probe: Optional[int] = None) -> pd.DataFrame:
+        """Find the movies most similar to one of the indexed movies.
+
+        Args:
+            movie_id: Movie to find similar movies of
+            n: Number of movies to return
+            n_probe: Lists probed (``N_PROBE`` by default; more is slower and
+                closer to an exhaustive search)
+
+        Returns:
+            DataFrame with ``id`` and ``score`` (cosine) columns, most similar
+            first, without the movie itself
+
+        Raises:
+            KeyError: If the movie is not indexed
+        """
+        positions = self._positions()
+        if movie_id not in positions.index:
+            raise KeyError(f"Movie {movie_id} is not in the similarity index")
+        row = int(positions[movie_id])
+
+        candidates = self._probe(self.embeddings[row], n_probe or self.N_PROBE)
+        candidates = candidates[candidates != row]
+        scores = self._scores(row, candidates)
+
+        keep = scores > 0
+        candidates, scores = candidates[keep], scores[keep]
+        if len(candidates) > n:
+            top = np.argpartition(-scores, n - 1)[:n]
+            candidates, scores = candidates[top], scores[top]
+        order = np.lexsort((self.ids[candidates], -scores))
+        return pd.DataFrame({"id": self.ids[candidates][order], "score": scores[order]})
+
+    def to_tables(self) -> Dict[str, pa.Table]:
+        """Get the Gold tables holding the index."""
+        offsets = pa.array(self.indptr.astype(np.int32))
+        index = pa.table(
+            {
+                "id": pa.array(self.ids),
+                "terms": pa.ListArray.from_arrays(offsets, pa.array(self.indices)),
+                "weights": pa.ListArray.from_arrays(offsets, pa.array(self.weights)),
+                "list": pa.array(self.lists),
+                "embedding": pa.FixedSizeListArray.from_arrays(
+                    pa.array(self.embeddings.ravel()), self.DIM
+                ),
+            }
+        ).replace_schema_metadata({"similarity": json.dumps({"trained_docs": self.trained_docs})})
+        return {
+            INDEX_TABLE: index,
+            TERMS_TABLE: pa.table(
+                {"term": pa.array(self.terms.to_numpy(), pa.string()), "df": self.doc_freq}
+            ),
+            CENTROIDS_TABLE: pa.table(
+                {
+                    "centroid": pa.FixedSizeListArray.from_arrays(
+                        pa.array(self.centroids.ravel()), self.DIM
+                    )
+                }
+            ),
+        }
+
+    @classmethod
+    def from_tables(
+        cls, index: pa.Table, terms: pa.Table, centroids: pa.Table
+    ) -> "SimilarityIndex":
+        """Load an index saved with ``to_tables``.
+
+        Args:
+            index: Similarity index table
+            terms: Terms table
+            centroids: Centroids table
+
+        Returns:
+            Index, ready for queries and updates
+        """
+        loaded = cls()
+        loaded.ids = index.column("id").to_numpy()
+        lengths = pc.list_value_length(index.column("terms")).to_numpy(zero_copy_only=False)
+        loaded.indptr = np.r_[0, np.cumsum(lengths)].astype(np.int64)
+        loaded.indices = pc.list_flatten(index.column("terms")).to_numpy().astype(np.int32)
+        loaded.weights = pc.list_flatten(index.column("weights")).to_numpy().astype(np.float32)
+        loaded.lists = index.column("list").to_numpy().astype(np.int32)
+        loaded.embeddings = _fixed_lists(index.column("embedding"), cls.DIM)
+        loaded.trained_docs = json.loads(index.schema.metadata[b"similarity"])["trained_docs"]
+
+        loaded.terms = pd.Index(terms.column("term").to_pylist(), dtype=object)
+        loaded.doc_freq = terms.column("df").to_numpy().astype(np.int64)
+        loaded.centroids = _fixed_lists(centroids.column("centroid"), cls.DIM)
+        return loaded
+
+    def _term_frequencies(self, movies: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tokenize movies into weighted term frequencies.
+
+        Returns:
+            Movie position, term and sublinear weighted frequency of each
+            (movie, term) pair, ordered by movie
+        """
+        docs: List[np.ndarray] = []
+        terms: List[np.ndarray] = []
+        weights: List[np.ndarray] = []
+
+        for field, weight in self.TEXT_FIELDS.items():
+            tokens = movies[field].fillna("").astype(str).str.lower().str.findall(_TOKEN)
+            positions, items = _flatten(tokens.to_numpy())
+            kept = ~np.isin(items, list(_STOP_WORDS))
+            docs.append(positions[kept])
+            terms.append(items[kept])
+            weights.append(np.full(kept.sum(), weight))
+
+        for field, (prefix, weight) in self.TERM_FIELDS.items():
+            positions, items = _flatten(movies[field].to_numpy())
+            codes, uniques = pd.factorize(items)
+            labels = np.array([f"{prefix}:{str(item).lower()}" for item in uniques], dtype=object)
+            docs.append(positions)
+            terms.append(labels[codes])
+            weights.append(np.full(len(items), weight))
+
+        pairs = pd.DataFrame(
+            {
+                "doc": np.concatenate(docs),
+                "term": np.concatenate(terms).astype(object),
+                "weight": np.concatenate(weights),
+            }
+        )
+        counts = pairs.groupby(["doc", "term"], sort=True)["weight"].sum()
+        return (
+            counts.index.get_level_values("doc").to_numpy(),
+            counts.index.get_level_values("term").to_numpy(),
+            1 + np.log(counts.to_numpy()),
+        )
+
+    def _term_codes(self, terms: np.ndarray) -> np.ndarray:
+        """Map terms to their vocabulary positions, adding unknown terms."""
+        codes = self.terms.get_indexer(terms)
+        unknown = pd.unique(terms[codes < 0])
+        if len(unknown):
+            self.terms = self.terms.append(pd.Index(unknown, dtype=object))
+            self.doc_freq = np.concatenate([self.doc_freq, np.zeros(len(unknown), np.int64)])
+            codes = self.terms.get_indexer(terms)
+        return codes
+
+    def _idf(self) -> np.ndarray:
+        """Get the smoothed inverse document frequency of each term."""
+        if "idf" not in self._cache:
+            idf = np.log((1 + self.num_docs) / (1 + self.doc_freq)) + 1
+            self._cache["idf"] = idf.astype(np.float32)
+        return self._cache["idf"]
+
+    def _norms(self) -> np.ndarray:
+        """Get the length of each movie's TF-IDF vector."""
+        if "norms" not in self._cache:
+            rows = np.repeat(np.arange(self.num_docs), np.diff(self.indptr))
+            weighted = self.weights * self._idf()[self.indices]
+            squares = np.bincount(rows, weights=weighted * weighted, minlength=self.num_docs)
+            self._cache["norms"] = np.sqrt(squares)
+        return self._cache["norms"]
+
+    def _positions(self) -> pd.Series:
+        """Get the row of each movie id."""
+        if "positions" not in self._cache:
+            self._cache["positions"] = pd.Series(np.arange(self.num_docs), index=self.ids)
+        return self._cache["positions"]
+
+    def _projection_rows(self) -> np.ndarray:
+        """Get the random sign vector of each term, derived from its hash."""
+        known = len(self._projection)
+        if known < len(self.terms):
+            hashes = pd.util.hash_array(self.terms[known:].to_numpy())
+            words = np.stack(
+                [_mix(hashes + _GOLDEN * np.uint64(i)) for i in range(self.DIM // 64)], axis=1
+            )
+            bits = np.unpackbits(words.view(np.uint8), axis=1)[:, : self.DIM]
+            signs = (bits.astype(np.float32) * 2 - 1) / np.float32(math.sqrt(self.DIM))
+            self._projection = np.concatenate([self._projection, signs])
+        return self._projection
+
+    def _embed(self, rows: np.ndarray) -> np.ndarray:
+        """Project movies' TF-IDF vectors to normalized dense embeddings."""
+        projection = self._projection_rows()
+        idf, norms = self._idf(), self._norms()
+        embeddings = np.zeros((len(rows), self.DIM), dtype=np.float32)
+
+        for start in range(0, len(rows), self._EMBED_CHUNK):
+            chunk = rows[start : start + self._EMBED_CHUNK]
+            nnz, owners = self._gather(chunk)
+            terms = self.indices[nnz]
+            values = self.weights[nnz] * idf[terms] / np.maximum(norms[chunk][owners], 1e-12)
+            contributions = projection[terms] * values[:, None].astype(np.float32)
+
+            lengths = np.bincount(owners, minlength=len(chunk))
+            embeddings[start : start + len(chunk)] = _segment_sums(contributions, lengths)
+
+        lengths = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(lengths, 1e-12)
+
+    def _assign(self, embeddings: np.ndarray) -> np.ndarray:
+        """Get the closest list of each embedding."""
+        lists = np.zeros(len(embeddings), dtype=np.int32)
+        for start in range(0, len(embeddings), self._EMBED_CHUNK):
+            block = embeddings[start : start + self._EMBED_CHUNK]
+            lists[start : start + len(block)] = np.argmax(block @ self.centroids.T, axis=1)
+        return lists
+
+    def _probe(self, embedding: np.ndarray, n_probe: int) -> np.ndarray:
+        """Get the rows of the lists closest to an embedding."""
+        if "order" not in self._cache:
+            order = np.argsort(self.lists, kind="stable")
+            self._cache["order"] = order
+            self._cache["offsets"] = np.searchsorted(
+                self.lists[order], np.arange(len(self.centroids) + 1)
+            )
+        order, offsets = self._cache["order"], self._cache["offsets"]
+
+        if len(self.centroids) == 0:
+            return np.arange(self.num_docs)
+        n_probe = min(n_probe, len(self.centroids))
+        probed = np.argpartition(-(self.centroids @ embedding), n_probe - 1)[:n_probe]
+        return np.concatenate([order[offsets[p] : offsets[p + 1]] for p in probed])
+
+    def _scores(self, row: int, candidates: np.ndarray) -> np.ndarray:
+        """Get the exact cosine of a movie with candidate movies."""
+        idf, norms = self._idf(), self._norms()
+        query = np.zeros(len(self.terms), dtype=np.float32)
+        terms = self.indices[self.indptr[row] : self.indptr[row + 1]]
+        query[terms] = self.weights[self.indptr[row] : self.indptr[row + 1]] * idf[terms]
+        query /= max(norms[row], 1e-12)
+
+        nnz, owners = self._gather(candidates)
+        products = self.weights[nnz] * idf[self.indices[nnz]] * query[self.indices[nnz]]
+        dots = np.bincount(owners, weights=products, minlength=len(candidates))
+        return dots / np.maximum(norms[candidates], 1e-12)
+
+    def _gather(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the CSR entries of some rows and the position of their row in ``rows``."""
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        owners = np.repeat(np.arange(len(rows)), lengths)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        return np.repeat(starts, lengths) + offsets, owners
+
+
+def _flatten(lists: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the position and value of each item of a column of lists."""
+    lengths = np.fromiter(
+        (len(v) if pd.api.types.is_list_like(v) else 0 for v in lists),
+        dtype=np.int64,
+        count=len(lists),
+    )
+    items = [np.asarray(v, dtype=object) for v, n in zip(lists, lengths) if n]
+    if not items:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=object)
+    return np.repeat(np.arange(len(lists)), lengths), np.concatenate(items)
+
+
+def _sum_by(rows: np.ndarray, codes: np.ndarray, n_codes: int) -> np.ndarray:
+    """Sum the rows of a 2-D array per code (0 for codes without rows)."""
+    order = np.argsort(codes, kind="stable")
+    return _segment_sums(rows[order], np.bincount(codes, minlength=n_codes))
+
+
+def _segment_sums(rows: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Sum consecutive runs of rows of a 2-D array (empty runs sum to 0)."""
+    sums = np.zeros((len(lengths), rows.shape[1]), dtype=rows.dtype)
+    nonempty = np.flatnonzero(lengths)
+    if len(nonempty):
+        starts = (np.cumsum(lengths) - lengths)[nonempty]
+        sums[nonempty] = np.add.reduceat(rows, starts, axis=0)
+    return sums
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Scramble 64-bit integers (SplitMix64 finalizer)."""
+    with np.errstate(over="ignore"):
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def _fixed_lists(column: pa.ChunkedArray, width: int) -> np.ndarray:
+    """Read a fixed-size list column as a 2-D float32 array."""
+    values = pc.list_flatten(column).to_numpy().astype(np.float32)
+    return values.reshape(-1, width)
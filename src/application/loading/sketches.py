@@ -0,0 +1,480 @@
+"""Mergeable sketches for quantiles, distinct counts and heavy hitters.
+
+A sketch is declared once, as ``name -> (column, kind)`` with kind
+``quantiles`` (KLL), ``distinct`` (HyperLogLog) or ``heavy_hitters``
+(Space-Saving), and built per group like the partial aggregates: each chunk of
+rows is reduced to one sketch per group, and sketches of the same group are
+merged. Unlike partials, sketches cannot retract rows, and their answers are
+approximate once a group outgrows them (small groups are exact).
+
+Sketches are stored serialized, next to a few answers read from them, so
+that they can be merged again later (e.g. years into decades) without the
+rows they summarize.
+"""
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Sketch name -> (source column, sketch kind)
+Sketches = Dict[str, Tuple[str, str]]
+
+# Quantiles stored next to each quantile sketch, as <name>_p<percent>
+SUMMARY_QUANTILES = (0.25, 0.5, 0.75, 0.9)
+# Items stored next to each heavy hitters sketch, as <name>_top
+SUMMARY_TOP = 10
+
+
+class QuantileSketch:
+    """KLL quantile sketch.
+
+    Values are kept in levels of compactors: an item of level ``h`` stands
+    for ``2**h`` values. A full level is sorted and every other item is
+    promoted to the next level. Lower levels get geometrically smaller
+    capacities, so the sketch holds about ``3 * k`` items whatever the number
+    of values, with a rank error of about ``1.7 / k``. Compactions alternate
+    between the odd and even items, so results do not depend on a random
+    seed; up to ``k`` values the sketch is exact.
+    """
+
+    def __init__(self, k: int = 200):
+        """Initialize sketch.
+
+        Args:
+            k: Capacity of the top level (accuracy)
+        """
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.zeros(0)]
+        self._compactions = 0
+
+    def update(self, values: Any) -> "QuantileSketch":
+        """Add values (missing values are skipped).
+
+        Returns:
+            This sketch
+        """
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Merge another sketch into this one.
+
+        Returns:
+            This sketch
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.zeros(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Get the smallest value whose rank is at least ``q`` of the values.
+
+        Returns:
+            Value (NaN if the sketch is empty)
+        """
+        if self.n == 0:
+            return math.nan
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 2**level) for level, level_items in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        ranks = np.cumsum(weights[order])
+        position = np.searchsorted(ranks, q * ranks[-1], side="left")
+        return float(items[order][min(position, len(items) - 1)])
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch."""
+        self.levels[0] = np.sort(self.levels[0])
+        header = [self.k, self.n, self._compactions, len(self.levels)]
+        header += [len(items) for items in self.levels]
+        items = np.concatenate(self.levels).astype("<f8")
+        return np.array(header, dtype="<i8").tobytes() + items.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "QuantileSketch":
+        """Deserialize a sketch written by ``to_bytes``."""
+        k, n, compactions, n_levels = np.frombuffer(data, dtype="<i8", count=4)
+        sizes = np.frombuffer(data, dtype="<i8", count=n_levels, offset=32)
+        items = np.frombuffer(data, dtype="<f8", offset=32 + 8 * int(n_levels))
+
+        sketch = cls(int(k))
+        sketch.n, sketch._compactions = int(n), int(compactions)
+        sketch.levels = [level.copy() for level in np.split(items, np.cumsum(sizes)[:-1])]
+        return sketch
+
+    def _capacity(self, level: int) -> int:
+        """Get the number of items a level holds before it is compacted."""
+        depth = len(self.levels) - level - 1
+        return max(math.ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _compress(self) -> None:
+        """Compact full levels until the sketch fits its capacity."""
+        while sum(map(len, self.levels)) > sum(map(self._capacity, range(len(self.levels)))):
+            for level, items in enumerate(self.levels):
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0))
+
+                items = np.sort(items)
+                # An odd item out stays on its level
+                kept, items = items[: len(items) % 2], items[len(items) % 2 :]
+                promoted = items[self._compactions % 2 :: 2]
+                self._compactions += 1
+
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                break
+
+
+class DistinctSketch:
+    """HyperLogLog distinct count sketch.
+
+    Each value is hashed to one of ``2**precision`` registers, which keeps
+    the highest rank (leading zeros of the rest of the hash, plus one) seen.
+    Registers are kept sparse, as sorted (register, rank) pairs, so a sketch
+    of few values stays small. The standard error is about
+    ``1.04 / sqrt(2**precision)`` (1.6% by default); counts below a few
+    thousand use linear counting, which is more accurate.
+    """
+
+    def __init__(self, precision: int = 12):
+        """Initialize sketch.
+
+        Args:
+            precision: Number of hash bits selecting the register (4 to 16)
+
+        Raises:
+            ValueError: If the precision is out of range
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 16, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(0, dtype=np.uint16)
+        self.ranks = np.zeros(0, dtype=np.uint8)
+
+    def update(self, values: Any) -> "DistinctSketch":
+        """Add values (missing values are skipped).
+
+        Returns:
+            This sketch
+        """
+        registers, ranks = self._hash(values)
+        return self._fold(registers, ranks)
+
+    def merge(self, other: "DistinctSketch") -> "DistinctSketch":
+        """Merge another sketch of the same precision into this one.
+
+        Returns:
+            This sketch
+
+        Raises:
+            ValueError: If the precisions differ
+        """
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog sketches of precision {self.precision} "
+                f"and {other.precision}"
+            )
+        return self._fold(other.registers, other.ranks)
+
+    def estimate(self) -> float:
+        """Estimate the number of distinct values."""
+        m = 1 << self.precision
+        zeros = m - len(self.registers)
+        if zeros == m:
+            return 0.0
+
+        alpha = 0.7213 / (1 + 1.079 / m)
+        harmonic = np.sum(np.ldexp(1.0, -self.ranks.astype(np.int64))) + zeros
+        raw = alpha * m * m / harmonic
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return float(raw)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch."""
+        header = np.array([self.precision, len(self.registers)], dtype="<i8").tobytes()
+        return header + self.registers.astype("<u2").tobytes() + self.ranks.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DistinctSketch":
+        """Deserialize a sketch written by ``to_bytes``."""
+        precision, size = np.frombuffer(data, dtype="<i8", count=2)
+        sketch = cls(int(precision))
+        sketch.registers = np.frombuffer(data, dtype="<u2", count=size, offset=16).astype(
+            np.uint16
+        )
+        sketch.ranks = np.frombuffer(data, dtype=np.uint8, offset=16 + 2 * int(size)).copy()
+        return sketch
+
+    def _hash(self, values: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the register and rank of each non-missing value."""
+        values = pd.Series(values).dropna().to_numpy()
+        # Same values hash alike whatever the chunk they come in
+        hashes = pd.util.hash_array(values) if len(values) else np.zeros(0, dtype=np.uint64)
+
+        suffix_bits = 64 - self.precision
+        registers = (hashes >> np.uint64(suffix_bits)).astype(np.uint16)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        ranks = (suffix_bits - _bit_length(suffix) + 1).astype(np.uint8)
+        return registers, ranks
+
+    def _fold(self, registers: np.ndarray, ranks: np.ndarray) -> "DistinctSketch":
+        """Keep the highest rank of each register."""
+        self.registers, self.ranks = _max_per_key(
+            np.concatenate([self.registers, registers]), np.concatenate([self.ranks, ranks])
+        )
+        return self
+
+
+class HeavyHitters:
+    """Space-Saving heavy hitters sketch.
+
+    Keeps the counts of at most ``capacity`` items. Once full, an item that
+    is not kept occurred at most ``floor`` times (the smallest count kept),
+    and the count of a kept item overestimates its frequency by at most its
+    error. Any item more frequent than ``total / capacity`` is kept. Merging
+    adds the counts of both sketches, using the other sketch's floor for the
+    items it does not keep, and keeps the ``capacity`` largest.
+    """
+
+    def __init__(self, capacity: int = 64):
+        """Initialize sketch.
+
+        Args:
+            capacity: Number of items kept
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+
+    @property
+    def floor(self) -> int:
+        """Get the bound on the count of the items not kept."""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, values: Any) -> "HeavyHitters":
+        """Add values (missing values are skipped).
+
+        Returns:
+            This sketch
+        """
+        counts = pd.Series(values).value_counts(dropna=True)
+        return self.merge(self._from_counts(counts))
+
+    def merge(self, other: "HeavyHitters") -> "HeavyHitters":
+        """Merge another sketch into this one.
+
+        Returns:
+            This sketch
+        """
+        items = self.counts.index.union(other.counts.index)
+        counts = self.counts.reindex(items, fill_value=self.floor) + other.counts.reindex(
+            items, fill_value=other.floor
+        )
+        errors = self.errors.reindex(items, fill_value=self.floor) + other.errors.reindex(
+            items, fill_value=other.floor
+        )
+        self._keep(counts, errors)
+        return self
+
+    def top(self, n: int) -> List[Tuple[Any, int]]:
+        """Get the ``n`` most frequent items and their (over)estimated counts."""
+        return list(zip(self.counts.index[:n].tolist(), self.counts.iloc[:n].tolist()))
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch."""
+        content = {
+            "capacity": self.capacity,
+            "items": self.counts.index.tolist(),
+            "counts": self.counts.tolist(),
+            "errors": self.errors.tolist(),
+        }
+        return json.dumps(content, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HeavyHitters":
+        """Deserialize a sketch written by ``to_bytes``."""
+        content = json.loads(data)
+        sketch = cls(content["capacity"])
+        sketch.counts = pd.Series(content["counts"], index=content["items"], dtype="int64")
+        sketch.errors = pd.Series(content["errors"], index=content["items"], dtype="int64")
+        return sketch
+
+    def _from_counts(self, counts: pd.Series) -> "HeavyHitters":
+        """Build a sketch of exact counts."""
+        sketch = HeavyHitters(self.capacity)
+        sketch._keep(counts.astype("int64"), pd.Series(0, index=counts.index, dtype="int64"))
+        return sketch
+
+    def _keep(self, counts: pd.Series, errors: pd.Series) -> None:
+        """Keep the largest counts, ordered by count and then item."""
+        order = np.lexsort((counts.index.astype(str), -counts.to_numpy()))[: self.capacity]
+        self.counts = counts.iloc[order]
+        self.errors = errors.iloc[order]
+
+
+SKETCH_TYPES = {
+    "quantiles": QuantileSketch,
+    "distinct": DistinctSketch,
+    "heavy_hitters": HeavyHitters,
+}
+
+
+def partial_sketches(df: pd.DataFrame, by: str, sketches: Sketches) -> pd.DataFrame:
+    """Reduce rows to one sketch per group.
+
+    List-valued columns (e.g. keywords) add each of their items.
+
+    Args:
+        df: Rows to sketch
+        by: Grouping column (rows without a group are skipped)
+        sketches: Sketches to build
+
+    Returns:
+        DataFrame indexed by group, in sorted order, with one sketch object
+        column per sketch name
+    """
+    codes, groups = pd.factorize(df[by], sort=True)
+    result = pd.DataFrame(index=pd.Index(groups, name=by))
+
+    for name, (column, kind) in sketches.items():
+        values = df[column].to_numpy()
+        rows = codes
+        if values.dtype == object and any(pd.api.types.is_list_like(v) for v in values):
+            rows, values = _flatten(codes, values)
+
+        keep = (rows >= 0) & ~pd.isna(values)
+        order = np.argsort(rows[keep], kind="stable")
+        rows, values = rows[keep][order], values[keep][order]
+        bounds = np.searchsorted(rows, np.arange(len(groups) + 1))
+        slices = list(zip(bounds, bounds[1:]))
+
+        if kind == "distinct":
+            # Hash all values at once, then fold each group's registers
+            registers, ranks = DistinctSketch()._hash(values)
+            result[name] = [
+                DistinctSketch()._fold(registers[start:end], ranks[start:end])
+                for start, end in slices
+            ]
+        else:
+            sketch_type = SKETCH_TYPES[kind]
+            result[name] = [sketch_type().update(values[start:end]) for start, end in slices]
+
+    return result
+
+
+def combine_sketches(partials: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Merge sketches of the same groups.
+
+    Sketches of the first partial are merged into in place.
+
+    Args:
+        partials: Partial sketches (None entries are ignored)
+
+    Returns:
+        Combined sketches, indexed by group in sorted order
+    """
+    frames = [partial for partial in partials if partial is not None]
+    combined = frames[0]
+    for frame in frames[1:]:
+        common = combined.index.intersection(frame.index)
+        for name in combined.columns:
+            for sketch, other in zip(combined.loc[common, name], frame.loc[common, name]):
+                sketch.merge(other)
+        added = frame.loc[frame.index.difference(combined.index)]
+        combined = pd.concat([combined, added]).sort_index()
+    return combined
+
+
+def sketch_table(partial: pd.DataFrame, sketches: Sketches) -> pd.DataFrame:
+    """Serialize sketches and read their summaries.
+
+    Args:
+        partial: Sketches indexed by group
+        sketches: Sketch declarations
+
+    Returns:
+        DataFrame with the grouping column, the serialized sketches (one
+        binary column per sketch name) and their summaries: ``<name>_p<N>``
+        quantiles, ``<name>_distinct`` counts and ``<name>_top`` items
+    """
+    table = pd.DataFrame(index=partial.index)
+    for name, (_, kind) in sketches.items():
+        column = partial[name]
+        table[name] = [sketch.to_bytes() for sketch in column]
+        if kind == "quantiles":
+            for q in SUMMARY_QUANTILES:
+                table[f"{name}_p{round(q * 100)}"] = [sketch.quantile(q) for sketch in column]
+        elif kind == "distinct":
+            table[f"{name}_distinct"] = [round(sketch.estimate()) for sketch in column]
+        else:
+            table[f"{name}_top"] = [
+                [str(item) for item, _ in sketch.top(SUMMARY_TOP)] for sketch in column
+            ]
+    return table.reset_index()
+
+
+def read_sketches(table: pd.DataFrame, by: str, sketches: Sketches) -> pd.DataFrame:
+    """Deserialize a table written from ``sketch_table``.
+
+    Args:
+        table: Stored sketch table
+        by: Grouping column
+        sketches: Sketch declarations
+
+    Returns:
+        Sketches indexed by group, ready for ``combine_sketches``
+    """
+    partial = pd.DataFrame(index=pd.Index(table[by], name=by))
+    for name, (_, kind) in sketches.items():
+        partial[name] = [SKETCH_TYPES[kind].from_bytes(data) for data in table[name]]
+    return partial
+
+
+def _flatten(codes: np.ndarray, lists: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """Repeat the group code of each row for every item of its list."""
+    lengths = np.fromiter(
+        (len(v) if pd.api.types.is_list_like(v) else 0 for v in lists),
+        dtype=np.int64,
+        count=len(lists),
+    )
+    items = [np.asarray(v, dtype=object) for v, n in zip(lists, lengths) if n]
+    if not items:
+        return np.zeros(0, dtype=codes.dtype), np.zeros(0, dtype=object)
+    return np.repeat(codes, lengths), np.concatenate(items)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Get the bit length of unsigned 64-bit integers."""
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = values >= np.uint64(1 << shift)
+        lengths += shift * wide
+        values = np.where(wide, values >> np.uint64(shift), values)
+    return lengths + (values > 0)
+
+
+def _max_per_key(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the sorted unique keys and the largest value of each."""
+    if len(keys) == 0:
+        return keys, values
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return keys[starts], np.maximum.reduceat(values, starts)
@@ -0,0 +1,55 @@
+"""Conversions between Polars frames and the Arrow tables of the data lake.
+
+Polars exports strings and lists as their ``large_*`` Arrow variants, while
+pandas writes the regular ones. Frames are narrowed on export so that a table
+has the same Parquet schema whichever engine produced it.
+"""
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.types as pat
+
+
+def from_arrow(table: pa.Table) -> pl.DataFrame:
+    """Load an Arrow table into Polars, dropping any stored pandas index.
+
+    Args:
+        table: Arrow table read from the data lake
+
+    Returns:
+        Polars DataFrame
+    """
+    metadata = table.schema.pandas_metadata or {}
+    index_columns = [col for col in metadata.get("index_columns", []) if isinstance(col, str)]
+    if index_columns:
+        table = table.drop(index_columns)
+    return pl.from_arrow(table)
+
+
+def to_arrow(df: pl.DataFrame) -> pa.Table:
+    """Export a Polars DataFrame with the Arrow types pandas would write.
+
+    Args:
+        df: Polars DataFrame
+
+    Returns:
+        Arrow table
+    """
+    table = df.to_arrow(compat_level=pl.CompatLevel.oldest())
+    schema = pa.schema([pa.field(field.name, _narrow(field.type)) for field in table.schema])
+    return table if schema.equals(table.schema) else table.cast(schema)
+
+
+def _narrow(data_type: pa.DataType) -> pa.DataType:
+    """Replace ``large_*`` types by their regular variant, recursively."""
+    if pat.is_large_string(data_type):
+        return pa.string()
+    if pat.is_large_binary(data_type):
+        return pa.binary()
+    if pat.is_large_list(data_type) or pat.is_list(data_type):
+        return pa.list_(_narrow(data_type.value_type))
+    if pat.is_struct(data_type):
+        return pa.struct(
+            [pa.field(field.name, _narrow(field.type), field.nullable) for field in data_type]
+        )
+    return data_type
@@ -0,0 +1,149 @@
+"""Batch coercion of raw Bronze columns to numbers and dates.
+
+Bronze CSVs hold dirty values (dates shifted into the id column, image paths
+in the budget column), so pandas reads those columns as strings. The coercer
+converts every such column of a table in one pass with Arrow casts, which
+parse the strings natively, instead of one ``pd.to_numeric``/``pd.to_datetime``
+call per column:
+
+- numbers are cast directly when the whole column parses, otherwise the
+  values that do not look like numbers are nulled first (as with
+  ``errors="coerce"``), and the result has the type ``pd.to_numeric`` gives;
+- dates are parsed with an explicit format or, failing that, with the first
+  candidate format matching most of a sample of the column, detected once
+  and kept for the following chunks so every chunk parses alike.
+
+The values that could not be converted are counted per column.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+NUMBER = "number"
+DATETIME = "datetime"
+
+# Strings the Arrow cast to float64 accepts (after trimming whitespace)
+_NUMBER_PATTERN = r"(?i)^[+-]?((\d+\.?\d*|\.\d+)(e[+-]?\d+)?|inf|infinity|nan)$"
+
+# Range of the nanosecond timestamps pandas stores, in seconds
+_DATE_RANGE = (pd.Timestamp.min.ceil("s").value // 10**9, pd.Timestamp.max.value // 10**9)
+
+
+class ColumnCoercer:
+    """Coerce the raw columns of a table (or of each of its chunks)."""
+
+    # Formats tried, in order, on date columns without an explicit format
+    DATE_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y", "%m/%d/%Y"]
+    # Values sampled to detect a date format
+    FORMAT_SAMPLE = 1000
+
+    def __init__(self, types: Dict[str, str], formats: Optional[Dict[str, str]] = None):
+        """Initialize coercer.
+
+        Args:
+            types: Kind (``NUMBER`` or ``DATETIME``) of each column to coerce
+            formats: Explicit ``strptime`` format of date columns
+        """
+        self.types = types
+        self.formats = dict(formats or {})
+        self.rejected: Dict[str, int] = {}
+
+    def coerce(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the columns of a DataFrame, counting the rejected values.
+
+        Args:
+            df: Raw DataFrame (missing columns are left out)
+
+        Returns:
+            DataFrame with the converted columns
+        """
+        columns = {}
+        for column, kind in self.types.items():
+            if column not in df.columns:
+                continue
+            values = df[column]
+            if kind == DATETIME:
+                coerced = self._dates(column, values)
+            else:
+                coerced = self._numbers(values)
+            rejected = int((coerced.isna().to_numpy() & values.notna().to_numpy()).sum())
+            self.rejected[column] = self.rejected.get(column, 0) + rejected
+            columns[column] = coerced
+
+        return df.assign(**columns)
+
+    def reset(self) -> None:
+        """Forget the rejected counts (detected formats are kept)."""
+        self.rejected = {}
+
+    @staticmethod
+    def _numbers(values: pd.Series) -> pd.Series:
+        """Coerce a column to numbers like ``pd.to_numeric(errors="coerce")``."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values
+        strings = _strings(values)
+        if strings is None:
+            return pd.to_numeric(values, errors="coerce")
+
+        if strings.null_count == 0:
+            try:
+                return _series(pc.cast(strings, pa.int64()), values)
+            except pa.ArrowInvalid:
+                pass
+        try:
+            numbers = pc.cast(strings, pa.float64())
+        except pa.ArrowInvalid:
+            strings = pc.utf8_trim_whitespace(strings)
+            numeric = pc.match_substring_regex(strings, _NUMBER_PATTERN)
+            numbers = pc.cast(pc.if_else(numeric, strings, None), pa.float64())
+        return _series(numbers, values)
+
+    def _dates(self, column: str, values: pd.Series) -> pd.Series:
+        """Coerce a column to dates, detecting its format on first use."""
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        strings = _strings(values)
+        if strings is None:
+            strings = pa.array(values.astype("string"), type=pa.string(), from_pandas=True)
+
+        if column not in self.formats:
+            detected = self._detect_format(strings)
+            if detected is None:
+                return pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+            self.formats[column] = detected
+
+        seconds = pc.strptime(strings, self.formats[column], "s", error_is_null=True)
+        as_int = seconds.cast(pa.int64())
+        in_range = pc.and_(
+            pc.greater_equal(as_int, _DATE_RANGE[0]), pc.less_equal(as_int, _DATE_RANGE[1])
+        )
+        dates = pc.if_else(in_range, seconds, None).cast(pa.timestamp("ns"))
+        return _series(dates, values)
+
+    def _detect_format(self, strings: pa.Array) -> Optional[str]:
+        """Find the candidate format parsing most of a sample (None without values)."""
+        sample = strings.drop_null()[: self.FORMAT_SAMPLE]
+        if len(sample) == 0:
+            return None
+        parsed = [
+            len(sample) - pc.strptime(sample, fmt, "s", error_is_null=True).null_count
+            for fmt in self.DATE_FORMATS
+        ]
+        return self.DATE_FORMATS[int(np.argmax(parsed))]
+
+
+def _strings(values: pd.Series) -> Optional[pa.Array]:
+    """Convert a column of strings to Arrow (None if it holds other objects)."""
+    try:
+        return pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _series(array: pa.Array, like: pd.Series) -> pd.Series:
+    """Convert a coerced Arrow array back to a column of the DataFrame."""
+    return pd.Series(array.to_numpy(zero_copy_only=False), index=like.index, name=like.name)
@@ -0,0 +1,63 @@
+"""Parsing of the Python-literal columns of the Kaggle CSVs.
+
+Columns such as ``genres`` or ``cast`` hold the ``repr`` of a list of dicts,
+e.g. ``[{'id': 16, 'name': 'Animation'}]``.
+"""
+
+import ast
+from typing import Any, List, Optional
+
+import pandas as pd
+
+
+def parse_literal(value: Any) -> Any:
+    """Safely parse a Python literal string.
+
+    Args:
+        value: Value to parse
+
+    Returns:
+        Parsed value or empty list
+    """
+    if pd.isna(value):
+        return []
+
+    if isinstance(value, str):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return []
+
+    return value
+
+
+def extract_names(value: Any, limit: Optional[int] = None) -> List[Any]:
+    """Get the ``name`` of each dict of a parsed list.
+
+    Args:
+        value: Parsed literal
+        limit: Only look at the first ``limit`` items
+
+    Returns:
+        Names, in list order (empty if the value is not a list)
+    """
+    if not isinstance(value, list):
+        return []
+    return [item["name"] for item in value[:limit] if isinstance(item, dict) and "name" in item]
+
+
+def find_director(value: Any) -> Optional[Any]:
+    """Get the name of the first crew member whose job is Director.
+
+    Args:
+        value: Parsed crew literal
+
+    Returns:
+        Director name, or None
+    """
+    if not isinstance(value, list):
+        return None
+    return next(
+        (c["name"] for c in value if isinstance(c, dict) and c.get("job") == "Director"),
+        None,
+    )
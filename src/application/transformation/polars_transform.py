@@ -0,0 +1,205 @@
+"""Polars implementation of the Silver cleaning steps.
+
+Each ``clean_*`` function produces the same table as the matching
+``TransformMoviesUseCase._clean_*`` method. Vectorized expressions replace the
+row-wise ``apply`` calls. The Python-literal columns still go through
+``ast.literal_eval`` (they are not JSON), but every distinct string is parsed
+only once.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import polars as pl
+import pyarrow as pa
+
+from src.application.polars_frames import to_arrow
+from src.application.transformation.literals import extract_names, find_director, parse_literal
+
+__all__ = [
+    "clean_credits",
+    "clean_keywords",
+    "clean_movies",
+    "clean_ratings",
+    "read_csv",
+    "to_arrow",
+]
+
+# Strings pandas.read_csv reads as missing values by default
+PANDAS_NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+
+INTEGER_TYPES = (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64)
+
+
+def read_csv(content: bytes) -> pl.DataFrame:
+    """Read a Bronze CSV with the column types pandas would infer.
+
+    Args:
+        content: CSV file content
+
+    Returns:
+        Polars DataFrame
+    """
+    df = pl.read_csv(content, infer_schema_length=None, null_values=list(PANDAS_NA_VALUES))
+    return _pandas_numeric_types(df, df.columns)
+
+
+def clean_movies(df: pl.DataFrame) -> pl.DataFrame:
+    """Clean raw movies metadata rows."""
+    # Remove rows with invalid IDs
+    df = df.filter(pl.col("id").is_not_null())
+    df = df.with_columns(_to_numeric(df, "id")).drop_nulls("id")
+    df = df.with_columns(pl.col("id").cast(pl.Int64))
+
+    # Parse literal columns and extract genre names
+    df = df.with_columns(
+        _parse_literals(df, "genres", {"genre_names": extract_names})
+        + _parse_literals(df, "production_companies")
+        + _parse_literals(df, "production_countries")
+        + _parse_literals(df, "spoken_languages")
+    )
+
+    # Clean financial data, dates and numeric columns (dates must be ISO 8601,
+    # as in the pandas transformation)
+    df = df.with_columns(
+        _to_numeric(df, "budget").fill_null(0),
+        _to_numeric(df, "revenue").fill_null(0),
+        pl.col("release_date")
+        .cast(pl.String)
+        .str.strptime(pl.Datetime("ns"), "%Y-%m-%d", strict=False),
+        _to_numeric(df, "runtime"),
+        _to_numeric(df, "popularity").fill_null(0),
+        _to_numeric(df, "vote_average").fill_null(0),
+        _to_numeric(df, "vote_count").fill_null(0),
+    )
+    df = _pandas_numeric_types(
+        df.with_columns(pl.col("release_date").dt.year().alias("release_year")), ["release_year"]
+    )
+
+    # Calculate derived columns
+    df = df.with_columns(
+        (pl.col("revenue") - pl.col("budget")).alias("profit"),
+        (pl.col("budget") > 0).alias("has_budget"),
+        (pl.col("revenue") > 0).alias("has_revenue"),
+    )
+    df = df.with_columns(
+        pl.when(pl.col("budget") > 0)
+        .then(pl.col("profit") / pl.col("budget") * 100)
+        .otherwise(None)
+        .cast(pl.Float64)
+        .alias("roi")
+    )
+
+    # Filter valid movies
+    return df.filter(pl.col("title").is_not_null() & pl.col("status").is_not_null())
+
+
+def clean_credits(df: pl.DataFrame) -> pl.DataFrame:
+    """Clean raw credits rows."""
+    df = df.with_columns(_to_numeric(df, "id")).drop_nulls("id")
+    df = df.with_columns(pl.col("id").cast(pl.Int64))
+
+    # Parse literal columns, extract cast names (top 10) and director
+    return df.with_columns(
+        _parse_literals(df, "cast", {"cast_names": lambda x: extract_names(x, limit=10)})
+        + _parse_literals(df, "crew", {"director": find_director})
+    )
+
+
+def clean_keywords(df: pl.DataFrame) -> pl.DataFrame:
+    """Clean raw keywords rows."""
+    df = df.with_columns(_to_numeric(df, "id")).drop_nulls("id")
+    df = df.with_columns(pl.col("id").cast(pl.Int64))
+
+    return df.with_columns(_parse_literals(df, "keywords", {"keyword_names": extract_names}))
+
+
+def clean_ratings(df: pl.DataFrame) -> pl.DataFrame:
+    """Clean raw ratings rows."""
+    df = df.drop_nulls().with_columns(
+        pl.col("userId").cast(pl.Int64),
+        pl.col("movieId").cast(pl.Int64),
+        pl.col("rating").cast(pl.Float64),
+        pl.col("timestamp").cast(pl.Int64),
+    )
+
+    # Validate rating range
+    return df.filter(pl.col("rating").is_between(0.5, 5.0))
+
+
+def _to_numeric(df: pl.DataFrame, column: str) -> pl.Expr:
+    """Equivalent of ``pd.to_numeric(errors="coerce")`` for a column."""
+    if df.schema[column].is_numeric():
+        return pl.col(column)
+    return pl.col(column).cast(pl.Float64, strict=False)
+
+
+def _pandas_numeric_types(df: pl.DataFrame, columns: List[str]) -> pl.DataFrame:
+    """Give columns the type pandas would use for them.
+
+    pandas has no missing value for integers and no type for all-missing
+    columns: both are stored as ``float64``.
+    """
+    to_float = [
+        column
+        for column in columns
+        if df[column].null_count() > 0
+        and (df.schema[column] in INTEGER_TYPES or df[column].null_count() == len(df))
+    ]
+    if not to_float:
+        return df
+    return df.with_columns(pl.col(to_float).cast(pl.Float64))
+
+
+def _parse_literals(
+    df: pl.DataFrame,
+    column: str,
+    derived: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> List[pl.Series]:
+    """Parse a literal column and compute columns derived from the parsed values.
+
+    Values are converted to Arrow the way ``pa.Table.from_pandas`` converts the
+    object columns of the pandas transformation, so both produce the same type.
+
+    Args:
+        df: Frame holding the column
+        column: Literal column to parse
+        derived: Derived column name -> function of the parsed value
+
+    Returns:
+        Parsed column followed by the derived columns
+    """
+    derived = derived or {}
+    names = [column, *derived]
+
+    cache: Dict[Any, Tuple[Any, ...]] = {}
+    rows = []
+    for value in df[column].to_list():
+        entry = cache.get(value)
+        if entry is None:
+            parsed = parse_literal(value)
+            entry = (parsed, *(function(parsed) for function in derived.values()))
+            cache[value] = entry
+        rows.append(entry)
+
+    values = list(zip(*rows)) if rows else [()] * len(names)
+    return [pl.from_arrow(pa.array(list(data))).alias(name) for name, data in zip(names, values)]
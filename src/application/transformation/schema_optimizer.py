@@ -0,0 +1,284 @@
+"""Narrowest lossless column types for Silver tables.
+
+Cleaning leaves most numeric columns as ``int64``/``float64`` (integers read
+with missing values, such as ``release_year`` or ``runtime``, become floats).
+The optimizer observes a table, in one pass or chunk by chunk, and picks for
+each column the narrowest type holding all its values exactly:
+
+- integers (and floats holding only whole numbers) become ``int16``, ``int32``
+  or ``int64`` by range, missing values becoming nulls;
+- other floats become ``float32`` when every value survives the round trip;
+- strings with few distinct values become dictionaries (pandas categoricals).
+
+The chosen types are recorded in the table's schema metadata, with the types
+cleaning produced. The next run never picks a narrower type than the recorded
+one, so types only widen when new values need it instead of changing from run
+to run, and readers whose computations depend on the column types (the Gold
+analytics) restore the cleaning types with ``restore_types``.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.types as pat
+
+from src.infrastructure.repositories.chunk_spill import cast_table
+
+# Schema metadata key holding the chosen and the source types
+SCHEMA_METADATA_KEY = b"silver_schema"
+
+CATEGORY = "category"
+
+# Candidate types of integer and floating point columns, narrowest first
+_INTEGER_CANDIDATES = ["int16", "int32", "int64"]
+_FLOAT_CANDIDATES = ["int16", "int32", "float32", "float64"]
+_RANGES = {name: np.iinfo(name) for name in ("int16", "int32", "int64")}
+_WIDTHS = {"int16": 2, "int32": 4, "int64": 8, "float32": 4, "float64": 8}
+
+
+@dataclass
+class _ColumnFacts:
+    """Mergeable facts about the values of a column."""
+
+    rows: int = 0
+    nbytes: int = 0
+    # Numeric columns
+    count: int = 0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    whole: bool = True
+    float32_exact: bool = True
+    # String columns (values stop being tracked past the category limit)
+    values: Optional[Set[str]] = field(default_factory=set)
+
+
+class SchemaOptimizer:
+    """Pick the narrowest lossless type of each column of a table."""
+
+    # Strings become categories up to this many distinct values...
+    MAX_CATEGORIES = 1000
+    # ...and at most this many distinct values per row
+    CATEGORY_RATIO = 0.05
+
+    def __init__(self, recorded: Optional[Dict[str, str]] = None):
+        """Initialize optimizer.
+
+        Args:
+            recorded: Types chosen by a previous run (never narrowed)
+        """
+        self.recorded = recorded or {}
+        self._facts: Dict[str, _ColumnFacts] = {}
+        self._kinds: Dict[str, str] = {}
+
+    @staticmethod
+    def recorded_types(schema: Optional[pa.Schema]) -> Dict[str, str]:
+        """Read the types recorded in a table schema (none if it has no record)."""
+        return _record(schema).get("types", {})
+
+    def observe(self, table: pa.Table) -> None:
+        """Gather the facts of a table or chunk.
+
+        Args:
+            table: Table (or one of its chunks) to observe
+        """
+        for name, column in zip(table.column_names, table.columns):
+            if name.startswith("__index"):
+                # Stored pandas index
+                continue
+            kind = self._merge_kind(name, _kind(column.type))
+            if kind is None:
+                continue
+
+            facts = self._facts.setdefault(name, _ColumnFacts())
+            facts.rows += len(column)
+            facts.nbytes += column.nbytes
+            if kind == "string":
+                self._observe_strings(facts, column)
+            else:
+                self._observe_numbers(facts, column)
+
+    def types(self) -> Dict[str, str]:
+        """Get the type chosen for each optimized column."""
+        chosen = {}
+        for name, facts in self._facts.items():
+            kind = self._kinds[name]
+            if kind == "string" and self._is_category(name, facts):
+                chosen[name] = CATEGORY
+            elif kind in ("integer", "float") and facts.count:
+                chosen[name] = self._numeric_type(name, kind, facts)
+        return chosen
+
+    def schema(self, schema: pa.Schema) -> pa.Schema:
+        """Narrow a schema to the chosen types and record them in its metadata.
+
+        Args:
+            schema: Schema of the observed table
+
+        Returns:
+            Schema to cast the table to
+        """
+        chosen = self.types()
+        fields, source = [], {}
+        for schema_field in schema:
+            name = chosen.get(schema_field.name)
+            if name is None:
+                fields.append(schema_field)
+                continue
+            if name == CATEGORY:
+                data_type = pa.dictionary(pa.int32(), schema_field.type)
+            else:
+                data_type = pa.type_for_alias(name)
+            fields.append(schema_field.with_type(data_type))
+            source[schema_field.name] = str(schema_field.type)
+
+        record = json.dumps({"types": chosen, "source": source})
+        return pa.schema(fields, metadata={**(schema.metadata or {}), SCHEMA_METADATA_KEY: record})
+
+    def optimize(self, table: pa.Table) -> pa.Table:
+        """Observe a whole table and cast it to the chosen types.
+
+        Args:
+            table: Table to optimize
+
+        Returns:
+            Table with narrowed columns
+        """
+        self.observe(table)
+        return cast_table(table, self.schema(table.schema))
+
+    def memory(self) -> Dict[str, int]:
+        """Estimate the Arrow memory of the optimized columns before and after.
+
+        Returns:
+            ``bytes`` before the optimization and ``bytes_saved`` by it
+        """
+        chosen = self.types()
+        before = after = 0
+        for name, facts in self._facts.items():
+            before += facts.nbytes
+            if chosen.get(name) == CATEGORY:
+                dictionary = sum(len(value.encode()) + 4 for value in facts.values)
+                after += facts.rows * 4 + dictionary
+            elif name in chosen:
+                after += facts.rows * _WIDTHS[chosen[name]]
+            else:
+                after += facts.nbytes
+        return {"bytes": before, "bytes_saved": max(before - after, 0)}
+
+    def _merge_kind(self, name: str, kind: Optional[str]) -> Optional[str]:
+        """Reconcile the kind of a column across chunks (None to skip the column).
+
+        A column holding integers in one chunk and floats (missing values) in
+        another is a float column; any other disagreement leaves it as is.
+        """
+        previous = self._kinds.get(name)
+        if kind is None or previous == "mixed":
+            return None
+        if previous is None or previous == kind:
+            self._kinds[name] = kind
+        elif {previous, kind} == {"integer", "float"}:
+            self._kinds[name] = "float"
+        else:
+            self._kinds[name] = "mixed"
+            self._facts.pop(name, None)
+            return None
+        return self._kinds[name]
+
+    def _observe_numbers(self, facts: _ColumnFacts, column: pa.ChunkedArray) -> None:
+        """Update the range, wholeness and float32 exactness of a numeric column."""
+        values = column.drop_null().to_numpy()
+        facts.count += len(values)
+        if len(values) == 0:
+            return
+        if values.dtype.kind == "f":
+            finite = values[np.isfinite(values)]
+            facts.whole &= len(finite) == len(values) and bool(np.all(np.floor(finite) == finite))
+            narrowed = values.astype(np.float32).astype(values.dtype)
+            facts.float32_exact &= bool(np.all((narrowed == values) | np.isnan(values)))
+            values = finite
+        if len(values):
+            facts.minimum = min(facts.minimum, float(values.min()))
+            facts.maximum = max(facts.maximum, float(values.max()))
+
+    def _observe_strings(self, facts: _ColumnFacts, column: pa.ChunkedArray) -> None:
+        """Track the distinct values of a string column while they are few."""
+        if facts.values is None:
+            return
+        facts.values.update(pc.unique(column.drop_null()).to_pylist())
+        if len(facts.values) > self.MAX_CATEGORIES:
+            facts.values = None
+
+    def _is_category(self, name: str, facts: _ColumnFacts) -> bool:
+        """Check whether a string column is worth a dictionary."""
+        if self.recorded.get(name, CATEGORY) != CATEGORY:
+            # Recorded as plain strings
+            return False
+        return (
+            facts.values is not None
+            and len(facts.values) > 0
+            and len(facts.values) <= facts.rows * self.CATEGORY_RATIO
+        )
+
+    def _numeric_type(self, name: str, kind: str, facts: _ColumnFacts) -> str:
+        """Pick the narrowest lossless type of a numeric column."""
+        candidates = _INTEGER_CANDIDATES if kind == "integer" else _FLOAT_CANDIDATES
+        floor = self.recorded.get(name)
+        start = candidates.index(floor) if floor in candidates else 0
+
+        for candidate in candidates[start:]:
+            if candidate.startswith("int"):
+                fits = facts.whole and (
+                    facts.minimum > facts.maximum
+                    or _RANGES[candidate].min <= facts.minimum <= facts.maximum
+                    <= _RANGES[candidate].max
+                )
+            else:
+                fits = candidate == "float64" or facts.float32_exact
+            if fits:
+                return candidate
+        return candidates[-1]
+
+
+def _kind(data_type: pa.DataType) -> Optional[str]:
+    """Classify the columns the optimizer handles (None for the others)."""
+    if pat.is_signed_integer(data_type):
+        return "integer"
+    if pat.is_floating(data_type):
+        return "float"
+    if pat.is_string(data_type) or pat.is_large_string(data_type):
+        return "string"
+    return None
+
+
+def restore_types(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast narrowed columns back to the types cleaning produced.
+
+    Args:
+        table: Table (or batch, or column selection) read from a Silver table
+        schema: Stored schema of the Silver table, holding the record
+
+    Returns:
+        Table with the cleaning types (unchanged if the table has no record)
+    """
+    source = _record(schema).get("source", {})
+    if not source:
+        return table
+
+    fields = [
+        schema_field.with_type(pa.type_for_alias(source[schema_field.name]))
+        if schema_field.name in source
+        else schema_field
+        for schema_field in table.schema
+    ]
+    return cast_table(table, pa.schema(fields, metadata=table.schema.metadata))
+
+
+def _record(schema: Optional[pa.Schema]) -> Dict[str, Dict[str, str]]:
+    """Read the types recorded in a table schema (empty if it has no record)."""
+    if schema is None or not schema.metadata or SCHEMA_METADATA_KEY not in schema.metadata:
+        return {}
+    return json.loads(schema.metadata[SCHEMA_METADATA_KEY])
@@ -1,13 +1,21 @@
 """Use case for transforming movies dataset."""
 
-import ast
 import logging
-from typing import Any, Dict, List
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
-
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from src.application.transformation.coercion import DATETIME, NUMBER, ColumnCoercer
+from src.application.transformation.literals import extract_names, find_director, parse_literal
+from src.application.transformation.schema_optimizer import SchemaOptimizer
+from src.application.transformation.validation import ColumnarValidator, merge_metrics
+from src.domain.entities import Movie, MovieRating
 from src.domain.exceptions import DataTransformationError
 from src.infrastructure.config import Settings
+from src.infrastructure.monitoring import instrumented, track
 from src.infrastructure.repositories import DataRepository
 
 logger = logging.getLogger(__name__)
@@ -16,6 +24,39 @@ logger = logging.getLogger(__name__)
 class TransformMoviesUseCase:
     """Use case for transforming movies data (Silver Layer)."""
 
+    # Parquet write profile per Silver table, overridable via settings.parquet_profiles
+    DEFAULT_PARQUET_PROFILES: Dict[str, str] = {
+        "credits": "archive",
+        "keywords": "archive",
+        "ratings": "archive",
+    }
+
+    # Entity each Silver table is validated against (rejected rows go to <table>_rejects)
+    ENTITY_VALIDATORS: Dict[str, ColumnarValidator] = {
+        "movies": ColumnarValidator(Movie),
+        "ratings": ColumnarValidator(MovieRating, {"movie_id": "movieId", "user_id": "userId"}),
+    }
+
+    # Raw columns converted to numbers and dates in one pass (per Silver table)
+    COLUMN_TYPES: Dict[str, Dict[str, str]] = {
+        "movies": {
+            "id": NUMBER,
+            "budget": NUMBER,
+            "revenue": NUMBER,
+            "release_date": DATETIME,
+            "runtime": NUMBER,
+            "popularity": NUMBER,
+            "vote_average": NUMBER,
+            "vote_count": NUMBER,
+        },
+        "credits": {"id": NUMBER},
+        "keywords": {"id": NUMBER},
+    }
+
+    # Explicit date formats (an inferred one would depend on the first value of
+    # the column, i.e. differ between chunks)
+    DATE_FORMATS: Dict[str, str] = {"release_date": "%Y-%m-%d"}
+
     def __init__(self, settings: Settings):
         """Initialize use case.
 
@@ -23,8 +64,12 @@ class TransformMoviesUseCase:
             settings: Application settings
         """
         self.settings = settings
-        self.bronze_repo = DataRepository(settings.bronze_dir)
-        self.silver_repo = DataRepository(settings.silver_dir)
+        self.bronze_repo = DataRepository.for_layer(settings, "bronze")
+        self.silver_repo = DataRepository.for_layer(settings, "silver")
+        self.coercers = {
+            table: ColumnCoercer(types, self.DATE_FORMATS)
+            for table, types in self.COLUMN_TYPES.items()
+        }
 
     def execute(self) -> Dict[str, Any]:
         """Execute data transformation.
@@ -42,35 +87,34 @@ class TransformMoviesUseCase:
 
             stats = {}
 
-            # Transform movies metadata
-            logger.info("Transforming movies_metadata.csv...")
-            movies_df = self._transform_movies()
-            self.silver_repo.save_parquet(movies_df, "movies")
-            stats["movies"] = {"rows": len(movies_df), "columns": len(movies_df.columns)}
-
-            # Transform credits
-            logger.info("Transforming credits.csv...")
-            credits_df = self._transform_credits()
-            self.silver_repo.save_parquet(credits_df, "credits")
-            stats["credits"] = {"rows": len(credits_df), "columns": len(credits_df.columns)}
-
-            # Transform keywords
-            logger.info("Transforming keywords.csv...")
-            keywords_df = self._transform_keywords()
-            self.silver_repo.save_parquet(keywords_df, "keywords")
-            stats["keywords"] = {"rows": len(keywords_df), "columns": len(keywords_df.columns)}
-
-            # Transform ratings (if exists)
-            try:
-                logger.info("Transforming ratings_small.csv...")
-                ratings_df = self._transform_ratings()
-                self.silver_repo.save_parquet(ratings_df, "ratings")
-                stats["ratings"] = {
-                    "rows": len(ratings_df),
-                    "columns": len(ratings_df.columns),
-                }
-            except FileNotFoundError:
-                logger.warning("ratings_small.csv not found, skipping...")
+            # Publish all Silver tables together as one generation
+            with self.silver_repo.generation():
+                # Transform movies metadata
+                logger.info("Transforming movies_metadata.csv...")
+                stats["movies"] = self._process(
+                    "movies", "movies_metadata", self._transform_movies, self._clean_movies
+                )
+
+                # Transform credits
+                logger.info("Transforming credits.csv...")
+                stats["credits"] = self._process(
+                    "credits", "credits", self._transform_credits, self._clean_credits
+                )
+
+                # Transform keywords
+                logger.info("Transforming keywords.csv...")
+                stats["keywords"] = self._process(
+                    "keywords", "keywords", self._transform_keywords, self._clean_keywords
+                )
+
+                # Transform ratings (if exists)
+                try:
+                    logger.info("Transforming ratings_small.csv...")
+                    stats["ratings"] = self._process(
+                        "ratings", "ratings_small", self._transform_ratings, self._clean_ratings
+                    )
+                except FileNotFoundError:
+                    logger.warning("ratings_small.csv not found, skipping...")
 
             logger.info("Data transformation completed successfully")
             logger.info(f"Transformation statistics: {stats}")
@@ -81,119 +125,367 @@ class TransformMoviesUseCase:
             logger.error(f"Data transformation failed: {e}")
             raise DataTransformationError(f"Failed to transform data: {e}")
 
-    def _transform_movies(self) -> pd.DataFrame:
+    def _process(
+        self,
+        table: str,
+        source: str,
+        transform: Callable[[], Any],
+        clean: Callable[[pd.DataFrame], pd.DataFrame],
+    ) -> Dict[str, int]:
+        """Build and save one Silver table in the configured execution mode.
+
+        Args:
+            table: Silver table name
+            source: Bronze CSV name
+            transform: In-memory transformation (reads the whole CSV)
+            clean: Cleaning step applied to each chunk in out-of-core mode
+
+        Returns:
+            Row and column counts of the table, and its validation metrics
+        """
+        if table in self.coercers:
+            self.coercers[table].reset()
+        if self.settings.execution_mode == "out_of_core":
+            # Chunks are always cleaned with pandas
+            return self._process_chunked(table, source, clean)
+
+        df = transform()
+        data = df if isinstance(df, pd.DataFrame) else self._polars().to_arrow(df)
+
+        data, metrics, rejects = self._validate(data, table)
+        optimizer = self._schema_optimizer(table)
+        if optimizer is not None:
+            if isinstance(data, pd.DataFrame):
+                data = pa.Table.from_pandas(data)
+            data = optimizer.optimize(data)
+        self._save(data, table)
+        self._save_rejects(rejects, table)
+        return {
+            "rows": len(data),
+            "columns": len(data.columns),
+            **self._quality(table, metrics),
+            **self._coercion(table),
+            **self._memory(table, optimizer),
+        }
+
+    def _process_chunked(
+        self, table: str, source: str, clean: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> Dict[str, int]:
+        """Clean a Bronze CSV chunk by chunk and stream it into a Silver table.
+
+        Every cleaning step is row-local, so the result matches the in-memory
+        transformation (up to the stored index).
+
+        Args:
+            table: Silver table name
+            source: Bronze CSV name
+            clean: Cleaning step applied to each chunk
+
+        Returns:
+            Row and column counts of the table, and its validation metrics
+        """
+        shape = {"rows": 0, "columns": 0}
+        metrics: List[Dict[str, int]] = []
+        rejects: List[pd.DataFrame] = []
+        optimizer = self._schema_optimizer(table)
+
+        def cleaned_chunks() -> Iterator[pd.DataFrame]:
+            for chunk in self.bronze_repo.iter_csv(source, self.settings.chunk_size):
+                df, chunk_metrics, chunk_rejects = self._validate(clean(chunk), table)
+                if chunk_rejects is not None:
+                    metrics.append(chunk_metrics)
+                    rejects.append(chunk_rejects)
+                if optimizer is not None:
+                    optimizer.observe(pa.Table.from_pandas(df, preserve_index=False))
+                shape["rows"] += len(df)
+                shape["columns"] = len(df.columns)
+                yield df
+
+        with track(f"transform_{table}") as tracker:
+            self.silver_repo.save_parquet_chunks(
+                cleaned_chunks(),
+                table,
+                profile=self._profile_for(table),
+                spill_dir=self.settings.spill_dir,
+                # Chunks are narrowed once the types fitting all of them are known
+                finalize_schema=optimizer.schema if optimizer is not None else None,
+            )
+            if tracker is not None:
+                tracker.rows = shape["rows"]
+
+        logger.info(f"Transformed {shape['rows']} {table} records out-of-core")
+
+        if rejects:
+            self._save_rejects(pd.concat(rejects), table)
+        return {
+            **shape,
+            **self._quality(table, merge_metrics(metrics)),
+            **self._coercion(table),
+            **self._memory(table, optimizer),
+        }
+
+    def _validate(self, data: Any, table: str) -> Tuple[Any, Dict[str, int], Any]:
+        """Validate a Silver table against its entity, if it has one.
+
+        Args:
+            data: pandas DataFrame or Arrow table
+            table: Silver table name
+
+        Returns:
+            Valid rows, validation metrics and rejected rows (None without entity)
+        """
+        validator = self.ENTITY_VALIDATORS.get(table)
+        if validator is None:
+            return data, {}, None
+
+        result = validator.validate(data)
+        valid = result.valid
+        if table == "movies":
+            # Clamped budgets and revenues change the columns derived from them
+            valid = self._derive_financials(valid)
+        return valid, result.metrics, result.rejects
+
+    @staticmethod
+    def _derive_financials(data: Any) -> Any:
+        """Derive profit, ROI and the has_budget/has_revenue flags of movies.
+
+        Args:
+            data: pandas DataFrame or Arrow table with budget and revenue
+
+        Returns:
+            The table with the derived columns (replaced if present)
+        """
+        if isinstance(data, pd.DataFrame):
+            data = data.copy(deep=False)
+            data["profit"] = data["revenue"] - data["budget"]
+            data["has_budget"] = data["budget"] > 0
+            data["has_revenue"] = data["revenue"] > 0
+            data["roi"] = (data["profit"] / data["budget"] * 100).where(data["has_budget"])
+            return data
+
+        budget, revenue = data.column("budget"), data.column("revenue")
+        profit = pc.subtract(revenue, budget)
+        has_budget = pc.greater(budget, 0)
+        derived = {
+            "profit": profit,
+            "has_budget": has_budget,
+            "has_revenue": pc.greater(revenue, 0),
+            "roi": pc.if_else(
+                has_budget,
+                pc.multiply(pc.divide(pc.cast(profit, pa.float64()), budget), 100),
+                pa.scalar(None, pa.float64()),
+            ),
+        }
+        for column, values in derived.items():
+            if column in data.column_names:
+                index = data.column_names.index(column)
+                field = data.schema.field(index)
+                data = data.set_column(index, field, pc.cast(values, field.type))
+            else:
+                data = data.append_column(column, values)
+        return data
+
+    def _schema_optimizer(self, table: str) -> Optional[SchemaOptimizer]:
+        """Create the schema optimizer of a Silver table (None if disabled).
+
+        The types recorded with the published table are never narrowed, so
+        they only change when new values need wider ones.
+        """
+        if not self.settings.silver_schema_optimization:
+            return None
+
+        snapshot = self.silver_repo.snapshot()
+        schema = snapshot.schema(table) if snapshot.has_table(table) else None
+        return SchemaOptimizer(SchemaOptimizer.recorded_types(schema))
+
+    def _coercion(self, table: str) -> Dict[str, Any]:
+        """Summarize the raw values of a table that could not be converted."""
+        coercer = self.coercers.get(table)
+        if coercer is None or not coercer.rejected:
+            # Not coerced (the Polars engine casts natively)
+            return {}
+        if any(coercer.rejected.values()):
+            logger.warning(f"Could not convert {table} values: {coercer.rejected}")
+        return {"unparsed": dict(coercer.rejected)}
+
+    @staticmethod
+    def _memory(table: str, optimizer: Optional[SchemaOptimizer]) -> Dict[str, Any]:
+        """Summarize the memory saved by the schema optimizer for the statistics."""
+        if optimizer is None:
+            return {}
+        memory = optimizer.memory()
+        logger.info(
+            f"Narrowed {table} columns to {optimizer.types()}, saving "
+            f"{memory['bytes_saved'] / 1e6:.1f} of {memory['bytes'] / 1e6:.1f} MB"
+        )
+        return {"memory": memory}
+
+    def _save_rejects(self, rejects: Any, table: str) -> None:
+        """Save the rejected rows of a Silver table (even none, to replace older ones)."""
+        if rejects is not None:
+            self.silver_repo.save_parquet(rejects, f"{table}_rejects")
+
+    @staticmethod
+    def _quality(table: str, metrics: Dict[str, int]) -> Dict[str, Any]:
+        """Summarize the validation metrics of a table for the statistics."""
+        if not metrics:
+            return {}
+        if metrics["rejected"]:
+            logger.warning(f"Rejected {metrics['rejected']} {table} rows: {metrics}")
+        return {"rejected": metrics["rejected"], "quality": metrics}
+
+    def _save(self, data: Any, table: str) -> None:
+        """Save a Silver table using its configured Parquet write profile.
+
+        Args:
+            data: pandas DataFrame or Arrow table to save
+            table: Table name
+        """
+        self.silver_repo.save_parquet(data, table, profile=self._profile_for(table))
+
+    def _read_clean(self, source: str, clean: Callable[[pd.DataFrame], pd.DataFrame]) -> Any:
+        """Read a Bronze CSV and clean it with the configured engine.
+
+        Args:
+            source: Bronze CSV name
+            clean: pandas cleaning step (the Polars engine uses its namesake)
+
+        Returns:
+            Cleaned pandas or Polars DataFrame
+        """
+        if self.settings.engine == "polars":
+            engine = self._polars()
+            content = self.bronze_repo.read_bytes(f"{source}.csv")
+            return getattr(engine, clean.__name__.lstrip("_"))(engine.read_csv(content))
+
+        return clean(self.bronze_repo.read_csv(source))
+
+    @staticmethod
+    def _polars() -> ModuleType:
+        """Import the Polars engine (optional dependency)."""
+        try:
+            from src.application.transformation import polars_transform
+        except ImportError:
+            raise DataTransformationError(
+                "The polars engine requires the 'polars' package: pip install polars"
+            )
+        return polars_transform
+
+    def _profile_for(self, table: str) -> str:
+        """Get the Parquet write profile of a Silver table."""
+        return self.settings.parquet_profile_for(
+            table, self.DEFAULT_PARQUET_PROFILES.get(table, "default")
+        )
+
+    @instrumented()
+    def _transform_movies(self) -> Any:
         """Transform movies metadata."""
-        df = self.bronze_repo.read_csv("movies_metadata")
+        df = self._read_clean("movies_metadata", self._clean_movies)
+
+        logger.info(f"Transformed {len(df)} movies")
 
+        return df
+
+    def _clean_movies(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean raw movies metadata rows."""
         # Remove rows with invalid IDs
         df = df[df["id"].notna()]
-        df["id"] = pd.to_numeric(df["id"], errors="coerce")
+        # Convert the numeric and date columns
+        df = self.coercers["movies"].coerce(df)
         df = df.dropna(subset=["id"])
         df["id"] = df["id"].astype(int)
 
         # Parse JSON columns
-        df["genres"] = df["genres"].apply(self._safe_parse_json)
-        df["production_companies"] = df["production_companies"].apply(self._safe_parse_json)
-        df["production_countries"] = df["production_countries"].apply(self._safe_parse_json)
-        df["spoken_languages"] = df["spoken_languages"].apply(self._safe_parse_json)
+        df["genres"] = df["genres"].apply(parse_literal)
+        df["production_companies"] = df["production_companies"].apply(parse_literal)
+        df["production_countries"] = df["production_countries"].apply(parse_literal)
+        df["spoken_languages"] = df["spoken_languages"].apply(parse_literal)
 
         # Extract genre names
-        df["genre_names"] = df["genres"].apply(
-            lambda x: [g["name"] for g in x if isinstance(g, dict) and "name" in g]
-            if isinstance(x, list)
-            else []
-        )
+        df["genre_names"] = df["genres"].apply(extract_names)
 
         # Clean financial data
-        df["budget"] = pd.to_numeric(df["budget"], errors="coerce").fillna(0)
-        df["revenue"] = pd.to_numeric(df["revenue"], errors="coerce").fillna(0)
+        df["budget"] = df["budget"].fillna(0)
+        df["revenue"] = df["revenue"].fillna(0)
 
         # Clean dates
-        df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
         df["release_year"] = df["release_date"].dt.year
 
         # Clean numeric columns
-        df["runtime"] = pd.to_numeric(df["runtime"], errors="coerce")
-        df["popularity"] = pd.to_numeric(df["popularity"], errors="coerce").fillna(0)
-        df["vote_average"] = pd.to_numeric(df["vote_average"], errors="coerce").fillna(0)
-        df["vote_count"] = pd.to_numeric(df["vote_count"], errors="coerce").fillna(0)
+        df["popularity"] = df["popularity"].fillna(0)
+        df["vote_average"] = df["vote_average"].fillna(0)
+        df["vote_count"] = df["vote_count"].fillna(0)
 
         # Calculate derived columns
-        df["profit"] = df["revenue"] - df["budget"]
-        df["has_budget"] = df["budget"] > 0
-        df["has_revenue"] = df["revenue"] > 0
-        df["roi"] = df.apply(
-            lambda row: (row["profit"] / row["budget"] * 100) if row["budget"] > 0 else None,
-            axis=1,
-        )
+        df = self._derive_financials(df)
 
         # Filter valid movies
         df = df[df["title"].notna()]
         df = df[df["status"].notna()]
 
-        logger.info(f"Transformed {len(df)} movies")
-
         return df
 
-    def _transform_credits(self) -> pd.DataFrame:
+    @instrumented()
+    def _transform_credits(self) -> Any:
         """Transform credits data."""
-        df = self.bronze_repo.read_csv("credits")
+        df = self._read_clean("credits", self._clean_credits)
+
+        logger.info(f"Transformed {len(df)} credit records")
+
+        return df
 
+    def _clean_credits(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean raw credits rows."""
         # Clean IDs
-        df["id"] = pd.to_numeric(df["id"], errors="coerce")
+        df = self.coercers["credits"].coerce(df)
         df = df.dropna(subset=["id"])
         df["id"] = df["id"].astype(int)
 
         # Parse JSON columns
-        df["cast"] = df["cast"].apply(self._safe_parse_json)
-        df["crew"] = df["crew"].apply(self._safe_parse_json)
+        df["cast"] = df["cast"].apply(parse_literal)
+        df["crew"] = df["crew"].apply(parse_literal)
 
         # Extract cast names (top 10)
-        df["cast_names"] = df["cast"].apply(
-            lambda x: [c["name"] for c in x[:10] if isinstance(c, dict) and "name" in c]
-            if isinstance(x, list)
-            else []
-        )
+        df["cast_names"] = df["cast"].apply(extract_names, limit=10)
 
         # Extract director
-        df["director"] = df["crew"].apply(
-            lambda x: next(
-                (c["name"] for c in x if isinstance(c, dict) and c.get("job") == "Director"),
-                None,
-            )
-            if isinstance(x, list)
-            else None
-        )
-
-        logger.info(f"Transformed {len(df)} credit records")
+        df["director"] = df["crew"].apply(find_director)
 
         return df
 
-    def _transform_keywords(self) -> pd.DataFrame:
+    @instrumented()
+    def _transform_keywords(self) -> Any:
         """Transform keywords data."""
-        df = self.bronze_repo.read_csv("keywords")
+        df = self._read_clean("keywords", self._clean_keywords)
 
+        logger.info(f"Transformed {len(df)} keyword records")
+
+        return df
+
+    def _clean_keywords(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean raw keywords rows."""
         # Clean IDs
-        df["id"] = pd.to_numeric(df["id"], errors="coerce")
+        df = self.coercers["keywords"].coerce(df)
         df = df.dropna(subset=["id"])
         df["id"] = df["id"].astype(int)
 
         # Parse keywords
-        df["keywords"] = df["keywords"].apply(self._safe_parse_json)
-        df["keyword_names"] = df["keywords"].apply(
-            lambda x: [k["name"] for k in x if isinstance(k, dict) and "name" in k]
-            if isinstance(x, list)
-            else []
-        )
-
-        logger.info(f"Transformed {len(df)} keyword records")
+        df["keywords"] = df["keywords"].apply(parse_literal)
+        df["keyword_names"] = df["keywords"].apply(extract_names)
 
         return df
 
-    def _transform_ratings(self) -> pd.DataFrame:
+    @instrumented()
+    def _transform_ratings(self) -> Any:
         """Transform ratings data."""
-        df = self.bronze_repo.read_csv("ratings_small")
+        df = self._read_clean("ratings_small", self._clean_ratings)
+
+        logger.info(f"Transformed {len(df)} rating records")
 
+        return df
+
+    def _clean_ratings(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Clean raw ratings rows."""
         # Clean and validate
         df = df.dropna()
         df["userId"] = df["userId"].astype(int)
@@ -204,28 +496,4 @@ class TransformMoviesUseCase:
         # Validate rating range
         df = df[(df["rating"] >= 0.5) & (df["rating"] <= 5.0)]
 
-        logger.info(f"Transformed {len(df)} rating records")
-
         return df
-
-    @staticmethod
-    def _safe_parse_json(value: Any) -> Any:
-        """Safely parse JSON string.
-
-        Args:
-            value: Value to parse
-
-        Returns:
-            Parsed value or empty list
-        """
-        if pd.isna(value):
-            return []
-
-        if isinstance(value, str):
-            try:
-                return ast.literal_eval(value)
-            except (ValueError, SyntaxError):
-                return []
-
-        return value
-
@@ -0,0 +1,236 @@
+"""Columnar validation of Silver tables against the domain entities.
+
+Validating every row through the pydantic models would cost one Python object
+per row. Instead, each scalar field of an entity becomes a few whole-column
+checks, derived from its definition:
+
+- a missing value rejects the row if the field is required, is replaced by
+  the field default if it has one, and is accepted if the field is optional;
+- a value that does not convert to the field type (``int``, ``float``,
+  ``date``/``datetime``) rejects the row, as pydantic would;
+- ``Clamp`` constraints clip the column, as the entity validators do.
+
+List and model fields are built by the Silver parsers and are not checked.
+"""
+
+import datetime
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pydantic import BaseModel
+
+from src.domain.entities import Clamp
+from src.domain.exceptions import DataValidationError
+
+# Silver frames the validator accepts (pandas DataFrame or Arrow table)
+Frame = Union[pd.DataFrame, pa.Table]
+
+# Column of the rejects table naming the first failed check of each row
+REASON_COLUMN = "reject_reason"
+
+_NUMERIC_TYPES = (int, float)
+_TEMPORAL_TYPES = (datetime.date, datetime.datetime)
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating a table.
+
+    Attributes:
+        valid: Rows passing every check, with clamps and defaults applied
+        rejects: Rejected rows, with the failed check in ``reject_reason``
+        metrics: Row counts (``rows``, ``valid``, ``rejected``), rows per
+            failed check and values clamped or defaulted per field
+    """
+
+    valid: Frame
+    rejects: Frame
+    metrics: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _FieldRule:
+    """Column checks derived from one entity field."""
+
+    name: str
+    column: str
+    kind: type
+    required: bool
+    nullable: bool
+    default: Any
+    clamps: Tuple[Clamp, ...]
+
+
+class ColumnarValidator:
+    """Vectorized validator of a table against a pydantic entity."""
+
+    def __init__(self, entity: Type[BaseModel], columns: Optional[Dict[str, str]] = None):
+        """Initialize validator.
+
+        Args:
+            entity: Entity the rows must satisfy
+            columns: Entity field -> table column, for columns named otherwise
+        """
+        self.entity = entity
+        self.rules = self._rules(entity, columns or {})
+
+    def validate(self, data: Frame) -> ValidationResult:
+        """Validate a table.
+
+        Args:
+            data: pandas DataFrame or Arrow table
+
+        Returns:
+            Valid rows and rejects, of the same type as ``data``, and metrics
+
+        Raises:
+            DataValidationError: If a column of a required field is missing
+        """
+        present = set(data.columns) if isinstance(data, pd.DataFrame) else set(data.column_names)
+        missing = [
+            rule.column for rule in self.rules if rule.required and rule.column not in present
+        ]
+        if missing:
+            raise DataValidationError(
+                f"Columns {missing} required by {self.entity.__name__} not found"
+            )
+
+        metrics: Dict[str, int] = {}
+        reasons: List[str] = []
+        failed = np.full(len(data), -1, dtype=np.int64)
+
+        for rule in self.rules:
+            if rule.column not in present:
+                continue
+            values = self._column(data, rule.column)
+            nulls = values.isna().to_numpy()
+            repaired = values
+
+            if rule.kind in _NUMERIC_TYPES:
+                numbers = pd.to_numeric(values, errors="coerce")
+                bad = numbers.isna().to_numpy() & ~nulls
+                if rule.kind is int:
+                    floats = numbers.to_numpy(dtype="float64", na_value=np.nan)
+                    bad |= ~nulls & ~(np.isfinite(floats) & (floats == np.round(floats)))
+                for clamp in rule.clamps:
+                    clipped = numbers.clip(lower=clamp.lower, upper=clamp.upper)
+                    changed = (clipped != numbers).to_numpy() & ~nulls & ~bad
+                    if changed.any():
+                        numbers = numbers.where(~changed, clipped)
+                        repaired = repaired.where(~changed, clipped)
+                    self._count(metrics, f"clamped_{rule.name}", changed.sum())
+            elif rule.kind in _TEMPORAL_TYPES:
+                if pd.api.types.is_datetime64_any_dtype(values):
+                    bad = np.zeros(len(values), dtype=bool)
+                else:
+                    dates = pd.to_datetime(values, errors="coerce", format="ISO8601")
+                    bad = dates.isna().to_numpy() & ~nulls
+            else:
+                bad = np.zeros(len(values), dtype=bool)
+
+            if not rule.nullable:
+                if rule.required:
+                    bad |= nulls
+                elif nulls.any():
+                    repaired = repaired.where(~nulls, rule.default)
+                    self._count(metrics, f"defaulted_{rule.name}", nulls.sum())
+
+            checks = ((f"missing_{rule.name}", bad & nulls), (f"invalid_{rule.name}", bad & ~nulls))
+            for reason, mask in checks:
+                first = mask & (failed < 0)
+                if first.any():
+                    failed[first] = len(reasons)
+                    reasons.append(reason)
+
+            if repaired is not values:
+                data = self._replace(data, rule.column, repaired)
+
+        rejected = failed >= 0
+        for code, reason in enumerate(reasons):
+            self._count(metrics, reason, (failed == code).sum())
+
+        reject_reasons = np.asarray(reasons, dtype=object)[failed[rejected]]
+        metrics.update(rows=len(data), valid=int((~rejected).sum()), rejected=int(rejected.sum()))
+        return ValidationResult(
+            valid=self._filter(data, ~rejected),
+            rejects=self._with_reasons(self._filter(data, rejected), reject_reasons),
+            metrics=metrics,
+        )
+
+    @staticmethod
+    def _rules(entity: Type[BaseModel], columns: Dict[str, str]) -> List[_FieldRule]:
+        """Derive the column checks of the scalar fields of an entity."""
+        rules = []
+        for name, info in entity.model_fields.items():
+            kind, nullable = info.annotation, False
+            if typing.get_origin(kind) is Union:
+                args = [arg for arg in typing.get_args(kind) if arg is not type(None)]
+                nullable = len(args) < len(typing.get_args(kind))
+                kind = args[0] if len(args) == 1 else None
+            if kind not in _NUMERIC_TYPES + _TEMPORAL_TYPES + (str,):
+                continue
+
+            rules.append(
+                _FieldRule(
+                    name=name,
+                    column=columns.get(name, name),
+                    kind=kind,
+                    required=info.is_required(),
+                    nullable=nullable,
+                    default=None if info.is_required() else info.get_default(),
+                    clamps=tuple(meta for meta in info.metadata if isinstance(meta, Clamp)),
+                )
+            )
+        return rules
+
+    @staticmethod
+    def _column(data: Frame, column: str) -> pd.Series:
+        """Get a column as a pandas Series."""
+        if isinstance(data, pd.DataFrame):
+            return data[column]
+        return data.column(column).to_pandas()
+
+    @staticmethod
+    def _replace(data: Frame, column: str, values: pd.Series) -> Frame:
+        """Replace a column, keeping its type."""
+        if isinstance(data, pd.DataFrame):
+            data = data.copy(deep=False)
+            data[column] = values.astype(data[column].dtype, copy=False)
+            return data
+
+        index = data.column_names.index(column)
+        array = pa.array(values, type=data.schema.field(index).type, from_pandas=True)
+        return data.set_column(index, data.schema.field(index), array)
+
+    @staticmethod
+    def _filter(data: Frame, mask: np.ndarray) -> Frame:
+        """Keep the rows of a table where ``mask`` is True."""
+        if isinstance(data, pd.DataFrame):
+            return data[mask]
+        return data.filter(pa.array(mask))
+
+    @staticmethod
+    def _with_reasons(rejects: Frame, reasons: np.ndarray) -> Frame:
+        """Add the reject reason column."""
+        if isinstance(rejects, pd.DataFrame):
+            return rejects.assign(**{REASON_COLUMN: reasons.astype(str)})
+        return rejects.append_column(REASON_COLUMN, pa.array(reasons, type=pa.string()))
+
+    @staticmethod
+    def _count(metrics: Dict[str, int], name: str, count: int) -> None:
+        """Add a non-zero count to the metrics."""
+        if count:
+            metrics[name] = metrics.get(name, 0) + int(count)
+
+
+def merge_metrics(metrics: List[Dict[str, int]]) -> Dict[str, int]:
+    """Add up the metrics of several validated chunks of a table."""
+    merged: Dict[str, int] = {}
+    for chunk in metrics:
+        for name, count in chunk.items():
+            merged[name] = merged.get(name, 0) + count
+    return merged
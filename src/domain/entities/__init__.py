@@ -1,6 +1,27 @@
 """Domain entities."""
 
-from src.domain.entities.movie import Movie, MovieMetadata, MovieRating
-
-__all__ = ["Movie", "MovieMetadata", "MovieRating"]
+from src.domain.entities.constraints import Clamp
+from src.domain.entities.movie import (
+    FinancialMixin,
+    Movie,
+    MovieGenre,
+    MovieMetadata,
+    MovieRating,
+    ProductionCompany,
+)
+from src.domain.entities.rows import EntityRows, MovieRatingRow, MovieRow, RowView, row_view
 
+__all__ = [
+    "Clamp",
+    "EntityRows",
+    "FinancialMixin",
+    "Movie",
+    "MovieGenre",
+    "MovieMetadata",
+    "MovieRating",
+    "MovieRatingRow",
+    "MovieRow",
+    "ProductionCompany",
+    "RowView",
+    "row_view",
+]
@@ -0,0 +1,38 @@
+"""Declarative field constraints of the domain entities."""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+@dataclass(frozen=True)
+class Clamp:
+    """Clamp a numeric field into ``[lower, upper]`` instead of rejecting it.
+
+    Used as ``Annotated`` metadata of an entity field. Pydantic applies it
+    after type validation, and the columnar validator reads it from the field
+    definition to clip whole columns at once.
+
+    Attributes:
+        lower: Lowest allowed value (unbounded if None)
+        upper: Highest allowed value (unbounded if None)
+    """
+
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+    def __call__(self, value: float) -> float:
+        """Clamp one value."""
+        if self.lower is not None and value < self.lower:
+            return self.lower
+        if self.upper is not None and value > self.upper:
+            return self.upper
+        return value
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Run the clamp after the field's own validation."""
+        return core_schema.no_info_after_validator_function(self, handler(source_type))
@@ -1,9 +1,11 @@
 """Movie domain entities."""
 
 from datetime import date
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
+
+from src.domain.entities.constraints import Clamp
 
 
 class MovieGenre(BaseModel):
@@ -20,41 +22,13 @@ class ProductionCompany(BaseModel):
     name: str
 
 
-class Movie(BaseModel):
-    """Movie entity representing core business data."""
+class FinancialMixin:
+    """Financial properties of anything with ``budget`` and ``revenue`` attributes.
 
-    id: int
-    title: str
-    original_title: Optional[str] = None
-    overview: Optional[str] = None
-    tagline: Optional[str] = None
-    release_date: Optional[date] = None
-    budget: float = 0.0
-    revenue: float = 0.0
-    runtime: Optional[int] = None
-    status: Optional[str] = None
-    original_language: Optional[str] = None
-    genres: List[MovieGenre] = Field(default_factory=list)
-    production_companies: List[ProductionCompany] = Field(default_factory=list)
-    popularity: float = 0.0
-    vote_average: float = 0.0
-    vote_count: int = 0
+    Shared by ``Movie`` and its row views, so both compute them the same way.
+    """
 
-    @validator("budget", "revenue")
-    def validate_positive_money(cls, v: float) -> float:
-        """Validate that money values are non-negative."""
-        if v < 0:
-            return 0.0
-        return v
-
-    @validator("vote_average")
-    def validate_vote_range(cls, v: float) -> float:
-        """Validate vote average is in valid range."""
-        if v < 0:
-            return 0.0
-        if v > 10:
-            return 10.0
-        return v
+    __slots__ = ()
 
     @property
     def profit(self) -> float:
@@ -74,6 +48,27 @@ class Movie(BaseModel):
         return self.budget > 0 and self.revenue > 0
 
 
+class Movie(FinancialMixin, BaseModel):
+    """Movie entity representing core business data."""
+
+    id: int
+    title: str
+    original_title: Optional[str] = None
+    overview: Optional[str] = None
+    tagline: Optional[str] = None
+    release_date: Optional[date] = None
+    budget: Annotated[float, Clamp(lower=0.0)] = 0.0
+    revenue: Annotated[float, Clamp(lower=0.0)] = 0.0
+    runtime: Optional[int] = None
+    status: Optional[str] = None
+    original_language: Optional[str] = None
+    genres: List[MovieGenre] = Field(default_factory=list)
+    production_companies: List[ProductionCompany] = Field(default_factory=list)
+    popularity: float = 0.0
+    vote_average: Annotated[float, Clamp(lower=0.0, upper=10.0)] = 0.0
+    vote_count: int = 0
+
+
 class MovieMetadata(BaseModel):
     """Movie metadata with extended information."""
 
@@ -90,15 +85,6 @@ class MovieRating(BaseModel):
 
     movie_id: int
     user_id: int
-    rating: float
+    rating: Annotated[float, Clamp(lower=0.5, upper=5.0)]
     timestamp: int
 
-    @validator("rating")
-    def validate_rating(cls, v: float) -> float:
-        """Validate rating is in valid range."""
-        if v < 0.5:
-            return 0.5
-        if v > 5.0:
-            return 5.0
-        return v
-
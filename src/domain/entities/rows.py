@@ -0,0 +1,177 @@
+"""Lightweight row views over columnar data for bulk APIs.
+
+A pydantic entity per record costs kilobytes of heap and microseconds of
+validation, which rules it out for tables of millions of rows. A row view
+instead holds a reference to the table's columns and a row index (two slots,
+no ``__dict__``): attributes are read from the columns on access, and the
+business properties of the entity are shared through mixins.
+"""
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.domain.entities.movie import FinancialMixin, Movie, MovieRating
+
+R = TypeVar("R", bound="RowView")
+
+
+class RowView:
+    """Read-only view of one row of an ``EntityRows`` table."""
+
+    __slots__ = ("_columns", "_index")
+
+    # Entity the view mirrors and field -> column it reads each field from
+    entity: Type[BaseModel]
+    fields: Dict[str, str]
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], index: int):
+        """Initialize view.
+
+        Args:
+            columns: Column name -> values of the table
+            index: Row position
+        """
+        self._columns = columns
+        self._index = index
+
+    def to_entity(self) -> BaseModel:
+        """Materialize the row as a validated entity."""
+        available = [name for name, column in self.fields.items() if column in self._columns]
+        return self.entity(**{name: getattr(self, name) for name in available})
+
+    def __repr__(self) -> str:
+        """Show the row position and the fields available in the table."""
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name, column in self.fields.items()
+            if column in self._columns
+        )
+        return f"{type(self).__name__}[{self._index}]({values})"
+
+
+def row_view(
+    entity: Type[BaseModel],
+    columns: Optional[Dict[str, str]] = None,
+    bases: Tuple[type, ...] = (),
+) -> Type[RowView]:
+    """Create the row view class of an entity.
+
+    Every field of the entity becomes a read-only property of the view.
+
+    Args:
+        entity: Entity to mirror
+        columns: Entity field -> table column, for columns named otherwise
+        bases: Mixins providing the entity's derived properties
+
+    Returns:
+        Row view class
+    """
+    fields = {name: (columns or {}).get(name, name) for name in entity.model_fields}
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "__doc__": f"Row view of a {entity.__name__} table.",
+        "entity": entity,
+        "fields": fields,
+    }
+    for name, column in fields.items():
+        namespace[name] = property(_field_getter(column), doc=f"``{column}`` of the row.")
+
+    return type(f"{entity.__name__}Row", (*bases, RowView), namespace)
+
+
+def _field_getter(column: str) -> Any:
+    """Build the getter of one column, returning Python values (None if missing)."""
+
+    def getter(row: RowView) -> Any:
+        value = row._columns[column][row._index]
+        if isinstance(value, np.datetime64):
+            # Nanosecond timestamps have no datetime counterpart
+            value = value.astype("datetime64[us]")
+        if isinstance(value, (np.generic, np.ndarray)):
+            value = value.tolist()
+        return None if value is None or value != value else value
+
+    return getter
+
+
+class EntityRows(Sequence[R]):
+    """Table of rows exposed as row views of an entity.
+
+    Indexing and iteration return an independent view per row (two slots
+    each), so the table works with ``max``, ``sorted`` and ``list`` like any
+    sequence. ``iter_cursor`` moves a single view along the table instead,
+    for scans that only read each row while it is current.
+    """
+
+    def __init__(self, row_type: Type[R], columns: Mapping[str, Sequence[Any]]):
+        """Initialize table.
+
+        Args:
+            row_type: Row view class (see ``row_view``)
+            columns: Column name -> values, all of the same length
+        """
+        self.row_type = row_type
+        self.columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+
+    @classmethod
+    def from_table(cls, row_type: Type[R], data: Any) -> "EntityRows[R]":
+        """View the entity columns of a pandas DataFrame or an Arrow table.
+
+        Columns are converted to arrays once (without copies where their type
+        allows); columns the entity does not define are ignored.
+
+        Args:
+            row_type: Row view class
+            data: pandas DataFrame or Arrow table
+
+        Returns:
+            Row table
+        """
+        names = data.column_names if hasattr(data, "column_names") else list(data.columns)
+        columns = {}
+        for column in row_type.fields.values():
+            if column not in names:
+                continue
+            if hasattr(data, "column_names"):
+                columns[column] = data.column(column).to_numpy()
+            else:
+                columns[column] = data[column].to_numpy()
+        return cls(row_type, columns)
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Get a row view (or a list of them for a slice)."""
+        if isinstance(index, slice):
+            return [self.row_type(self.columns, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Row {index} out of range for {self._length} rows")
+        return self.row_type(self.columns, index)
+
+    def __iter__(self) -> Iterator[R]:
+        """Iterate over the rows, one view per row."""
+        for index in range(self._length):
+            yield self.row_type(self.columns, index)
+
+    def iter_cursor(self) -> Iterator[R]:
+        """Iterate over the rows with one view moved from row to row.
+
+        Iterating a million rows allocates one object, but every row yielded
+        is the same view: it must not be kept past the next step (use
+        ``rows[i]`` or plain iteration to hold rows).
+        """
+        cursor = self.row_type(self.columns, 0)
+        for index in range(self._length):
+            cursor._index = index
+            yield cursor
+
+
+MovieRow = row_view(Movie, bases=(FinancialMixin,))
+MovieRatingRow = row_view(MovieRating, {"movie_id": "movieId", "user_id": "userId"})
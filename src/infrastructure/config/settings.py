@@ -3,7 +3,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -18,6 +18,10 @@ class Settings(BaseSettings):
 
     # Google Gemini API
     google_api_key: Optional[str] = Field(default=None, alias="GOOGLE_API_KEY")
+    # Seconds a streamed chat answer may take in full before it is abandoned
+    chat_timeout_seconds: float = 60.0
+    # Estimated tokens of Gold rows retrieved into each chat prompt
+    chat_context_tokens: int = 1200
 
     # Pipeline configuration
     environment: str = "development"
@@ -42,6 +46,55 @@ class Settings(BaseSettings):
 
     # Dataset configuration
     kaggle_dataset: str = "rounakbanik/the-movies-dataset"
+    # Sources ingested into Bronze: Kaggle dataset ids ("owner/dataset") or file
+    # URLs, e.g. '["owner/a", "https://host/b.zip"]' (default: kaggle_dataset)
+    ingestion_sources: List[str] = Field(default_factory=list)
+    kaggle_api_url: str = "https://www.kaggle.com/api/v1"
+    # Sources downloaded at once; retries per source, the first one after
+    # ingestion_backoff_seconds and each next one after twice the delay
+    ingestion_concurrency: int = 4
+    ingestion_retries: int = 3
+    ingestion_backoff_seconds: float = 1.0
+    ingestion_timeout_seconds: float = 60.0
+
+    # Execution configuration
+    # in_memory loads whole tables into pandas; out_of_core streams them in
+    # chunks of chunk_size rows with bounded memory, spilling to spill_dir
+    execution_mode: Literal["in_memory", "out_of_core"] = "in_memory"
+    chunk_size: int = 250_000
+    spill_dir: Optional[Path] = None
+    # DataFrame library of the in-memory transformations: pandas or polars
+    # (optional dependency; out_of_core always uses pandas chunks)
+    engine: Literal["pandas", "polars"] = "pandas"
+    # incremental updates the Gold tables from the Silver rows changed since
+    # the last Gold build; full always rebuilds them from the whole layer
+    gold_refresh: Literal["full", "incremental"] = "incremental"
+    # Store Silver columns in the narrowest types holding their values
+    # (recorded per table and only widened by later runs)
+    silver_schema_optimization: bool = True
+
+    # Write a keyed changelog of each Bronze CSV against its previous ingestion
+    bronze_changelog_enabled: bool = True
+
+    # Storage configuration
+    # Backend holding the data lake layers: local, s3, gcs or azure
+    storage_backend: str = "local"
+    # Custom S3 endpoint for MinIO-style stand-ins, e.g. "http://localhost:9000"
+    s3_endpoint_override: Optional[str] = None
+    # Threads for background multipart uploads and concurrent ranged reads
+    storage_io_threads: int = 8
+    # Local files uploaded concurrently to the object store
+    storage_upload_workers: int = 4
+    # Local read-through cache for Parquet files of remote layers
+    layer_cache_enabled: bool = True
+    layer_cache_dir: Path = Path("./.cache/layers")
+    layer_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    # Per-table Parquet write profile overrides, e.g. {"movies_enriched": "scan"}
+    parquet_profiles: Dict[str, str] = Field(default_factory=dict)
+    # Published generations kept per layer for readers pinned to older snapshots
+    layer_generations_to_keep: int = 3
+    # Generations published within this many days are kept as well (0: count only)
+    layer_retention_days: float = 0
 
     model_config = {
         "env_file": ".env",
@@ -64,6 +117,18 @@ class Settings(BaseSettings):
         """Get gold layer directory path."""
         return self.data_dir / "refined"
 
+    def parquet_profile_for(self, table: str, default: str = "default") -> str:
+        """Get the Parquet write profile configured for a table.
+
+        Args:
+            table: Table name (file name without extension)
+            default: Profile used when the table has no override
+
+        Returns:
+            Profile name
+        """
+        return self.parquet_profiles.get(table, default)
+
     def ensure_directories(self) -> None:
         """Ensure all data directories exist."""
         self.bronze_dir.mkdir(parents=True, exist_ok=True)
@@ -1,6 +1,9 @@
 """External services integration."""
 
-from src.infrastructure.external.kaggle_client import KaggleDatasetClient
-
-__all__ = ["KaggleDatasetClient"]
+from src.infrastructure.external.dataset_downloader import (
+    DatasetDownloader,
+    DownloadReport,
+    kaggle_credentials,
+)
 
+__all__ = ["DatasetDownloader", "DownloadReport", "kaggle_credentials"]
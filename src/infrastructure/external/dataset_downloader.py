@@ -0,0 +1,327 @@
+"""Concurrent, resumable HTTP downloads of dataset sources."""
+
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import requests
+
+from src.domain.exceptions import DataIngestionError
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying (throttling and transient server errors)
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class DownloadReport:
+    """Outcome of downloading one source.
+
+    Attributes:
+        source: Source as configured
+        path: Downloaded file
+        bytes: Bytes transferred by this run
+        resumed_from: Bytes already on disk from an interrupted download
+        attempts: Requests made
+        seconds: Wall time spent on the source
+    """
+
+    source: str
+    path: Path
+    bytes: int
+    resumed_from: int
+    attempts: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Get the transfer rate in MB/s."""
+        return self.bytes / 1024 / 1024 / self.seconds if self.seconds > 0 else 0.0
+
+
+class _RetryableError(Exception):
+    """Failure of one attempt that a later attempt may not hit."""
+
+    def __init__(self, message: str, received: int = 0):
+        super().__init__(message)
+        # Bytes written to the part file before the failure
+        self.received = received
+
+
+class DatasetDownloader:
+    """Download dataset sources over HTTP, several at a time.
+
+    A source is either a Kaggle dataset id (``owner/dataset``, fetched as a
+    zip archive from the Kaggle REST API) or the URL of a file. Each source is
+    written to ``<name>.part`` in the download directory and renamed when
+    complete. A failed attempt is retried with exponential backoff, resuming
+    from the bytes already written with a ``Range`` request; the part's
+    ``ETag`` is sent as ``If-Range`` so that a file changed upstream is
+    downloaded again from the start instead of being spliced.
+    """
+
+    # Bytes read from the response per write (an interrupted read loses at most this)
+    CHUNK_BYTES = 64 * 1024
+
+    # Seconds between progress log lines of one download
+    PROGRESS_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        download_dir: Path,
+        kaggle_api_url: str = "https://www.kaggle.com/api/v1",
+        auth: Optional[Tuple[str, str]] = None,
+        max_concurrency: int = 4,
+        retries: int = 3,
+        backoff_seconds: float = 1.0,
+        timeout: float = 60.0,
+    ):
+        """Initialize downloader.
+
+        Args:
+            download_dir: Directory receiving the downloaded files
+            kaggle_api_url: Base URL of the Kaggle REST API
+            auth: Basic auth credentials (Kaggle username and key)
+            max_concurrency: Sources downloaded at once
+            retries: Retries per source after the first attempt
+            backoff_seconds: Delay before the first retry (doubled each time)
+            timeout: Connect and read timeout of each request in seconds
+        """
+        self.download_dir = Path(download_dir)
+        self.kaggle_api_url = kaggle_api_url.rstrip("/")
+        self.auth = auth
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+
+    def download_all(self, sources: List[str]) -> List[DownloadReport]:
+        """Download sources concurrently.
+
+        Args:
+            sources: Kaggle dataset ids or file URLs
+
+        Returns:
+            One report per source, in the order of ``sources``
+
+        Raises:
+            DataIngestionError: If two sources would be saved to the same file,
+                or a source cannot be downloaded (the other downloads are
+                finished first, so they can be resumed)
+        """
+        names: Dict[str, str] = {}
+        for source in sources:
+            other = names.setdefault(self.file_name(source), source)
+            if other != source or sources.count(source) > 1:
+                raise DataIngestionError(f"Sources {other} and {source} share a download file")
+        start = time.perf_counter()
+
+        workers = max(min(self.max_concurrency, len(sources)), 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="download") as pool:
+            futures = [pool.submit(self.download, source) for source in sources]
+
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            raise DataIngestionError("; ".join(str(error) for error in errors))
+
+        reports = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+        total = sum(report.bytes for report in reports)
+        logger.info(
+            f"Downloaded {len(reports)} sources: {total / 1024 / 1024:.2f} MB in "
+            f"{elapsed:.2f}s ({total / 1024 / 1024 / max(elapsed, 1e-9):.2f} MB/s)"
+        )
+        return reports
+
+    def download(self, source: str) -> DownloadReport:
+        """Download one source, retrying and resuming failed attempts.
+
+        Args:
+            source: Kaggle dataset id or file URL
+
+        Returns:
+            Download report
+
+        Raises:
+            DataIngestionError: If the download fails after every retry
+        """
+        url = self.url_for(source)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        target = self.download_dir / self.file_name(source)
+        part = target.with_name(f"{target.name}.part")
+        resumed_from = part.stat().st_size if part.exists() else 0
+
+        start = time.perf_counter()
+        transferred = 0
+        attempt = 0
+        with requests.Session() as session:
+            while True:
+                attempt += 1
+                try:
+                    transferred += self._fetch(session, source, url, part)
+                    break
+                except _RetryableError as e:
+                    transferred += e.received
+                    if attempt > self.retries:
+                        raise DataIngestionError(
+                            f"Failed to download {source} after {attempt} attempts: {e}"
+                        )
+                    delay = self.backoff_seconds * 2 ** (attempt - 1)
+                    logger.warning(f"Download of {source} failed ({e}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+
+        os.replace(part, target)
+        self._etag_path(part).unlink(missing_ok=True)
+
+        report = DownloadReport(
+            source=source,
+            path=target,
+            bytes=transferred,
+            resumed_from=resumed_from,
+            attempts=attempt,
+            seconds=time.perf_counter() - start,
+        )
+        logger.info(
+            f"Downloaded {source}: {report.bytes / 1024 / 1024:.2f} MB in "
+            f"{report.seconds:.2f}s ({report.throughput:.2f} MB/s, {attempt} attempts)"
+        )
+        return report
+
+    def url_for(self, source: str) -> str:
+        """Get the URL of a source."""
+        if urlparse(source).scheme in ("http", "https"):
+            return source
+        if re.fullmatch(r"[\w.-]+/[\w.-]+", source):
+            return f"{self.kaggle_api_url}/datasets/download/{source}"
+        raise DataIngestionError(f"Unknown dataset source '{source}' (use owner/dataset or a URL)")
+
+    @staticmethod
+    def file_name(source: str) -> str:
+        """Get the local file name of a source."""
+        parsed = urlparse(source)
+        if parsed.scheme in ("http", "https"):
+            name = unquote(Path(parsed.path).name)
+            return name or parsed.netloc
+        return f"{source.replace('/', '__')}.zip"
+
+    def _fetch(self, session: requests.Session, source: str, url: str, part: Path) -> int:
+        """Make one attempt, appending to the part file when the server allows it.
+
+        Returns:
+            Bytes received
+
+        Raises:
+            _RetryableError: If the attempt failed in a way worth retrying
+            DataIngestionError: If the server refused the request
+        """
+        offset = part.stat().st_size if part.exists() else 0
+        etag_path = self._etag_path(part)
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if etag_path.exists():
+                headers["If-Range"] = etag_path.read_text()
+
+        try:
+            response = session.get(
+                url, headers=headers, auth=self.auth, stream=True, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            raise _RetryableError(str(e))
+
+        with response:
+            if response.status_code == 416:
+                # The part is stale or already complete: start over
+                part.unlink(missing_ok=True)
+                raise _RetryableError("requested range not satisfiable")
+            if response.status_code in RETRYABLE_STATUS:
+                raise _RetryableError(f"HTTP {response.status_code}")
+            if response.status_code not in (200, 206):
+                raise DataIngestionError(
+                    f"Failed to download {source}: HTTP {response.status_code} from {url}"
+                )
+
+            if response.status_code == 206:
+                total = self._range_total(response.headers.get("Content-Range", ""))
+                mode = "ab"
+            else:
+                length = response.headers.get("Content-Length")
+                total = int(length) if length else None
+                offset, mode = 0, "wb"
+
+            etag = response.headers.get("ETag")
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+
+            received = 0
+            last_log = time.perf_counter()
+            try:
+                with open(part, mode) as f:
+                    for chunk in response.iter_content(chunk_size=self.CHUNK_BYTES):
+                        f.write(chunk)
+                        received += len(chunk)
+                        if time.perf_counter() - last_log >= self.PROGRESS_INTERVAL:
+                            last_log = time.perf_counter()
+                            self._log_progress(source, offset + received, total)
+            except (requests.RequestException, OSError) as e:
+                raise _RetryableError(
+                    f"transfer interrupted after {received} bytes: {e}", received
+                )
+
+        if total is not None and offset + received != total:
+            raise _RetryableError(f"received {offset + received} of {total} bytes", received)
+        return received
+
+    @staticmethod
+    def _range_total(content_range: str) -> Optional[int]:
+        """Get the full size from a ``Content-Range: bytes a-b/total`` header."""
+        _, _, total = content_range.rpartition("/")
+        return int(total) if total.isdigit() else None
+
+    @staticmethod
+    def _log_progress(source: str, done: int, total: Optional[int]) -> None:
+        """Log how much of a download is on disk."""
+        if total:
+            logger.info(f"{source}: {done / 1024 / 1024:.1f} MB ({done / total:.0%})")
+        else:
+            logger.info(f"{source}: {done / 1024 / 1024:.1f} MB")
+
+    @staticmethod
+    def _etag_path(part: Path) -> Path:
+        """Get the file holding the ETag of a partial download."""
+        return part.with_name(f"{part.name}.etag")
+
+
+def kaggle_credentials(
+    username: Optional[str] = None, key: Optional[str] = None
+) -> Optional[Tuple[str, str]]:
+    """Get the Kaggle API credentials.
+
+    Uses the given username and key, or else ``~/.kaggle/kaggle.json`` (or
+    ``$KAGGLE_CONFIG_DIR/kaggle.json``), as the Kaggle SDK does.
+
+    Returns:
+        Username and key, or None if none are configured
+    """
+    if username and key:
+        return username, key
+
+    config_dir = Path(os.environ.get("KAGGLE_CONFIG_DIR", Path.home() / ".kaggle"))
+    config = config_dir / "kaggle.json"
+    if not config.exists():
+        return None
+    try:
+        credentials = json.loads(config.read_text())
+        return credentials["username"], credentials["key"]
+    except (ValueError, KeyError) as e:
+        raise DataIngestionError(f"Invalid Kaggle credentials in {config}: {e}")
@@ -0,0 +1,41 @@
+"""Deferred imports of heavy modules."""
+
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module on first attribute access instead of now.
+
+    Entry points bind heavy optional modules (plotly, the Gemini SDK) at the
+    top of the file, as usual, but only pay for them in the code paths that
+    use them. Parent packages are imported right away.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        The module, executed when one of its attributes is first read
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
@@ -0,0 +1,20 @@
+"""Pipeline instrumentation and metrics reporting."""
+
+from src.infrastructure.monitoring.profiling import PROFILERS, profile_to
+from src.infrastructure.monitoring.run_metrics import (
+    RunMetrics,
+    instrumented,
+    record_bytes_read,
+    record_bytes_written,
+    track,
+)
+
+__all__ = [
+    "PROFILERS",
+    "RunMetrics",
+    "instrumented",
+    "profile_to",
+    "record_bytes_read",
+    "record_bytes_written",
+    "track",
+]
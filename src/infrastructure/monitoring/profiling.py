@@ -0,0 +1,64 @@
+"""Per-stage profiler dumps."""
+
+import cProfile
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+@contextmanager
+def profile_to(directory: Path, name: str, profiler: Optional[str]) -> Iterator[None]:
+    """Profile a block and dump the result to ``directory``.
+
+    ``cprofile`` writes ``<name>.prof`` (open with ``snakeviz`` or ``pstats``);
+    ``pyinstrument`` writes ``<name>.html`` and falls back to cProfile when the
+    package is not installed.
+
+    Args:
+        directory: Directory receiving the dump
+        name: Dump file name without extension
+        profiler: Profiler to use, or None to run the block unprofiled
+
+    Yields:
+        None
+    """
+    if profiler is None:
+        yield
+        return
+
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{profiler}' (available: {', '.join(PROFILERS)})")
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument is not installed, falling back to cProfile")
+        else:
+            sampler = Profiler()
+            sampler.start()
+            try:
+                yield
+            finally:
+                sampler.stop()
+                path = directory / f"{name}.html"
+                path.write_text(sampler.output_html(), encoding="utf-8")
+                logger.info(f"Profile written to {path}")
+            return
+
+    tracer = cProfile.Profile()
+    tracer.enable()
+    try:
+        yield
+    finally:
+        tracer.disable()
+        path = directory / f"{name}.prof"
+        tracer.dump_stats(str(path))
+        logger.info(f"Profile written to {path}")
@@ -0,0 +1,301 @@
+"""Per-stage and per-step run metrics."""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_ACTIVE_RUN: ContextVar[Optional["RunMetrics"]] = ContextVar("active_run", default=None)
+
+# Process-wide I/O counters fed by the data repositories
+_IO_LOCK = threading.Lock()
+_IO_COUNTERS = {"bytes_read": 0, "bytes_written": 0}
+
+_PROMETHEUS_METRICS = {
+    "wall_seconds": "Wall-clock time of the pipeline step",
+    "cpu_seconds": "CPU time (all threads) of the pipeline step",
+    "peak_rss_bytes": "Peak resident set size during the pipeline step",
+    "bytes_read": "Bytes read from the data lake during the pipeline step",
+    "bytes_written": "Bytes written to the data lake during the pipeline step",
+    "rows": "Rows produced by the pipeline step",
+    "rows_per_second": "Rows produced per second of wall time",
+}
+
+
+def record_bytes_read(nbytes: int) -> None:
+    """Account bytes read from storage.
+
+    Args:
+        nbytes: Number of bytes read
+    """
+    with _IO_LOCK:
+        _IO_COUNTERS["bytes_read"] += nbytes
+
+
+def record_bytes_written(nbytes: int) -> None:
+    """Account bytes written to storage.
+
+    Args:
+        nbytes: Number of bytes written
+    """
+    with _IO_LOCK:
+        _IO_COUNTERS["bytes_written"] += nbytes
+
+
+class StepTracker:
+    """Handle for a running step, used to report the rows it produced."""
+
+    def __init__(self, name: str, parent: Optional["StepTracker"]):
+        """Initialize tracker.
+
+        Args:
+            name: Step name
+            parent: Enclosing step, if any
+        """
+        self.name = name
+        self.parent = parent
+        self.rows: Optional[int] = None
+        self.observed_peak_rss: Optional[int] = None
+
+
+class RunMetrics:
+    """Collector of metrics for one pipeline run.
+
+    Steps are nested: a stage such as ``transformation`` contains sub-steps
+    such as ``transform_movies``. Each step records wall time, CPU time, peak
+    RSS, bytes read/written through the repositories and rows per second.
+    """
+
+    def __init__(self, run_id: Optional[str] = None):
+        """Initialize collector.
+
+        Args:
+            run_id: Identifier of the run (generated if None)
+        """
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.started_at = datetime.now(timezone.utc)
+        self.steps: List[Dict[str, Any]] = []
+        self._stack: List[StepTracker] = []
+
+    @contextmanager
+    def activate(self) -> Iterator["RunMetrics"]:
+        """Make this collector the target of ``track`` and ``instrumented``.
+
+        Yields:
+            This collector
+        """
+        token = _ACTIVE_RUN.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_RUN.reset(token)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepTracker]:
+        """Measure a step.
+
+        Args:
+            name: Step name
+
+        Yields:
+            Tracker used to report produced rows
+        """
+        parent = self._stack[-1] if self._stack else None
+        tracker = StepTracker(name, parent)
+        self._stack.append(tracker)
+
+        # The high-water mark is reset for every step; keep what the parent
+        # has reached so far before resetting it
+        if parent is not None:
+            _observe_peak_rss(parent)
+        _reset_peak_rss()
+        with _IO_LOCK:
+            io_start = dict(_IO_COUNTERS)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        status = "success"
+
+        try:
+            yield tracker
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            with _IO_LOCK:
+                bytes_read = _IO_COUNTERS["bytes_read"] - io_start["bytes_read"]
+                bytes_written = _IO_COUNTERS["bytes_written"] - io_start["bytes_written"]
+
+            _observe_peak_rss(tracker)
+            peak_rss = tracker.observed_peak_rss
+            if parent is not None and peak_rss is not None:
+                parent.observed_peak_rss = max(parent.observed_peak_rss or 0, peak_rss)
+
+            rows_per_second = None
+            if tracker.rows is not None and wall > 0:
+                rows_per_second = round(tracker.rows / wall, 2)
+
+            self._stack.pop()
+            self.steps.append(
+                {
+                    "step": name,
+                    "parent": parent.name if parent else None,
+                    "status": status,
+                    "wall_seconds": round(wall, 6),
+                    "cpu_seconds": round(cpu, 6),
+                    "peak_rss_bytes": peak_rss,
+                    "bytes_read": bytes_read,
+                    "bytes_written": bytes_written,
+                    "rows": tracker.rows,
+                    "rows_per_second": rows_per_second,
+                }
+            )
+            logger.debug(f"Step metrics: {self.steps[-1]}")
+
+    def report(self) -> Dict[str, Any]:
+        """Build the run report.
+
+        Returns:
+            Dictionary with run information and step metrics
+        """
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            "steps": self.steps,
+        }
+
+    def write_json(self, path: Path) -> None:
+        """Write the run report as JSON.
+
+        Args:
+            path: Destination file
+        """
+        _write_atomic(path, json.dumps(self.report(), indent=2))
+        logger.info(f"Run metrics written to {path}")
+
+    def write_prometheus(self, path: Path) -> None:
+        """Write the step metrics in Prometheus textfile collector format.
+
+        Args:
+            path: Destination ``.prom`` file
+        """
+        lines = []
+        for metric, description in _PROMETHEUS_METRICS.items():
+            name = f"movies_pipeline_step_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} gauge")
+            for step in self.steps:
+                value = step[metric]
+                if value is None:
+                    continue
+                labels = f'step="{step["step"]}",parent="{step["parent"] or ""}"'
+                lines.append(f"{name}{{{labels}}} {value}")
+
+        _write_atomic(path, "\n".join(lines) + "\n")
+        logger.info(f"Prometheus metrics written to {path}")
+
+
+@contextmanager
+def track(name: str) -> Iterator[Optional[StepTracker]]:
+    """Measure a step in the active run, if any.
+
+    Args:
+        name: Step name
+
+    Yields:
+        Step tracker, or None when no run is being recorded
+    """
+    run = _ACTIVE_RUN.get()
+    if run is None:
+        yield None
+        return
+
+    with run.step(name) as tracker:
+        yield tracker
+
+
+def instrumented(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorate a method so that each call is recorded as a step.
+
+    When the method returns a DataFrame its length is recorded as rows.
+
+    Args:
+        name: Step name (defaults to the function name without leading
+            underscores)
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: F) -> F:
+        step_name = name or func.__name__.lstrip("_")
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with track(step_name) as tracker:
+                result = func(*args, **kwargs)
+                if tracker is not None and hasattr(result, "shape"):
+                    tracker.rows = len(result)
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _observe_peak_rss(tracker: StepTracker) -> None:
+    """Fold the current RSS high-water mark into a step's observed peak."""
+    peak = _peak_rss()
+    if peak is not None:
+        tracker.observed_peak_rss = max(tracker.observed_peak_rss or 0, peak)
+
+
+def _reset_peak_rss() -> None:
+    """Reset the kernel's RSS high-water mark where supported (Linux)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> Optional[int]:
+    """Get the RSS high-water mark in bytes, if available on this platform."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a text file through a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -1,6 +1,22 @@
 """Data repositories for storage operations."""
 
+from src.infrastructure.repositories.change_capture import BronzeChangeCapture
 from src.infrastructure.repositories.data_repository import DataRepository
+from src.infrastructure.repositories.layer_snapshot import LayerSnapshot
+from src.infrastructure.repositories.parquet_profiles import (
+    PARQUET_PROFILES,
+    ParquetWriteProfile,
+    get_parquet_profile,
+)
+from src.infrastructure.repositories.row_hashes import hash_rows, sum_by_key
 
-__all__ = ["DataRepository"]
-
+__all__ = [
+    "BronzeChangeCapture",
+    "DataRepository",
+    "LayerSnapshot",
+    "ParquetWriteProfile",
+    "PARQUET_PROFILES",
+    "get_parquet_profile",
+    "hash_rows",
+    "sum_by_key",
+]
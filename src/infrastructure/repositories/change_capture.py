@@ -0,0 +1,285 @@
+"""Keyed change data capture between successive Bronze snapshots."""
+
+import csv
+import logging
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from src.domain.exceptions import DataIngestionError
+from src.infrastructure.repositories.row_hashes import hash_rows, sum_by_key
+
+logger = logging.getLogger(__name__)
+
+# Changelog column holding the kind of change of each key
+CHANGE_COLUMN = "change"
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+_KEY = "_key"
+_HASH = "_hash"
+_ROWS = "_rows"
+
+
+class BronzeChangeCapture:
+    """Row-level diff of Bronze CSVs against their previous snapshot.
+
+    Each CSV is reduced to one signature per key: the sum of the 64-bit
+    hashes of the key's raw rows (every column read as text, so parsing never
+    hides a change) and its row count. Signatures are kept next to the Bronze
+    files; the next capture compares the new ones with them and writes the
+    inserted, updated and deleted keys to a changelog Parquet file.
+
+    Files are read in blocks, and both signature sets are hash-partitioned by
+    key into local spill files before being compared bucket by bucket, so
+    memory stays bounded by the block and chunk sizes whatever the file size.
+
+    The changelog is an audit record of each ingestion; the pipeline stages
+    do not read it. Incremental Gold refreshes diff per-movie signatures of
+    Silver instead, which also catches changes made by the Silver cleaning
+    and stays correct when Gold was not refreshed after every ingestion (a
+    changelog only covers the last one).
+    """
+
+    CHANGES_DIR = "_changes"
+    STATE_DIR = "_row_hashes"
+
+    # Bytes of CSV parsed per block
+    CSV_BLOCK_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, bronze_dir: Path, chunk_size: int, spill_dir: Optional[Path] = None):
+        """Initialize change capture.
+
+        Args:
+            bronze_dir: Local Bronze directory holding the CSV files
+            chunk_size: Signatures per spill bucket
+            spill_dir: Parent directory for spill files (system temp if None)
+        """
+        self.bronze_dir = Path(bronze_dir)
+        self.chunk_size = chunk_size
+        self.spill_dir = spill_dir
+
+    def changelog_path(self, filename: str) -> Path:
+        """Get the changelog written by the last capture of a CSV."""
+        return self.bronze_dir / self.CHANGES_DIR / f"{Path(filename).stem}.parquet"
+
+    def has_snapshot(self, filename: str) -> bool:
+        """Check whether the signatures of a previous snapshot of a CSV exist."""
+        return self._state_path(filename).exists()
+
+    def snapshot(self, filename: str, keys: List[str]) -> None:
+        """Record the signatures of a CSV as the baseline of the next capture.
+
+        Args:
+            filename: CSV file name inside the Bronze directory
+            keys: Key columns
+
+        Raises:
+            DataIngestionError: If the file cannot be hashed
+        """
+        state = self._state_path(filename)
+        state.parent.mkdir(parents=True, exist_ok=True)
+
+        self._hash_csv(filename, keys, self._temp_path(state))
+        os.replace(self._temp_path(state), state)
+
+    def capture(self, filename: str, keys: List[str]) -> Dict[str, int]:
+        """Diff a CSV against its previous snapshot and record it as the new one.
+
+        Without a previous snapshot every key is reported as inserted.
+
+        Args:
+            filename: CSV file name inside the Bronze directory
+            keys: Key columns
+
+        Returns:
+            Number of inserted, updated and deleted keys
+
+        Raises:
+            DataIngestionError: If the diff fails
+        """
+        state = self._state_path(filename)
+        changelog = self.changelog_path(filename)
+        state.parent.mkdir(parents=True, exist_ok=True)
+        changelog.parent.mkdir(parents=True, exist_ok=True)
+
+        current = self._temp_path(state)
+        try:
+            self._hash_csv(filename, keys, current)
+            previous = state if state.exists() else None
+            counts = self._diff(previous, current, keys, self._temp_path(changelog))
+        except BaseException:
+            current.unlink(missing_ok=True)
+            self._temp_path(changelog).unlink(missing_ok=True)
+            raise
+
+        os.replace(self._temp_path(changelog), changelog)
+        os.replace(current, state)
+
+        logger.info(
+            f"{filename}: {counts[INSERT]} inserted, {counts[UPDATE]} updated, "
+            f"{counts[DELETE]} deleted keys"
+        )
+        return counts
+
+    def _hash_csv(self, filename: str, keys: List[str], output: Path) -> None:
+        """Stream a CSV into per-block key signatures."""
+        path = self.bronze_dir / filename
+        logger.info(f"Hashing rows of {path}")
+
+        try:
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                columns = next(csv.reader(f), [])
+            missing = [key for key in keys if key not in columns]
+            if missing:
+                raise DataIngestionError(f"Key columns {missing} not found in {filename}")
+
+            reader = pacsv.open_csv(
+                str(path),
+                read_options=pacsv.ReadOptions(block_size=self.CSV_BLOCK_SIZE),
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={column: pa.string() for column in columns},
+                    strings_can_be_null=False,
+                ),
+            )
+
+            with pq.ParquetWriter(str(output), self._state_schema(keys)) as writer:
+                for batch in reader:
+                    rows = pa.Table.from_batches([batch])
+                    key_values = rows.select(keys)
+                    key_hashes = hash_rows(key_values)
+
+                    unique, sums, counts = sum_by_key(key_hashes, hash_rows(rows))
+                    _, first = np.unique(key_hashes, return_index=True)
+                    writer.write_table(
+                        key_values.take(first)
+                        .append_column(_KEY, pa.array(unique))
+                        .append_column(_HASH, pa.array(sums))
+                        .append_column(_ROWS, pa.array(counts))
+                    )
+        except DataIngestionError:
+            raise
+        except Exception as e:
+            raise DataIngestionError(f"Failed to hash rows of {filename}: {e}")
+
+    def _diff(
+        self, previous: Optional[Path], current: Path, keys: List[str], output: Path
+    ) -> Dict[str, int]:
+        """Compare two signature files bucket by bucket into a changelog."""
+        sides = {"previous": previous, "current": current}
+        rows = max(pq.ParquetFile(str(path)).metadata.num_rows for path in sides.values() if path)
+        n_buckets = max(math.ceil(rows / self.chunk_size), 1)
+
+        counts = dict.fromkeys((INSERT, UPDATE, DELETE), 0)
+        schema = pa.schema([(key, pa.string()) for key in keys] + [(CHANGE_COLUMN, pa.string())])
+
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(prefix="cdc-", dir=self.spill_dir) as tmp_dir:
+            buckets_dir = Path(tmp_dir)
+            for side, path in sides.items():
+                (buckets_dir / side).mkdir()
+                if path is not None:
+                    self._partition(path, buckets_dir / side, n_buckets)
+
+            with pq.ParquetWriter(str(output), schema) as writer:
+                for bucket in range(n_buckets):
+                    before = self._read_bucket(buckets_dir / "previous", bucket, keys)
+                    after = self._read_bucket(buckets_dir / "current", bucket, keys)
+                    changes = self._compare(before, after, keys)
+
+                    for change, n in changes[CHANGE_COLUMN].value_counts().items():
+                        counts[change] += int(n)
+                    writer.write_table(
+                        pa.Table.from_pandas(changes, schema=schema, preserve_index=False)
+                    )
+
+        return counts
+
+    def _partition(self, path: Path, buckets_dir: Path, n_buckets: int) -> None:
+        """Hash-partition a signature file by key into spill files."""
+        writers: Dict[int, pq.ParquetWriter] = {}
+        try:
+            for batch in pq.ParquetFile(str(path)).iter_batches(batch_size=self.chunk_size):
+                data = pa.Table.from_batches([batch])
+                bucket_ids = data.column(_KEY).to_numpy() % np.uint64(n_buckets)
+                for bucket in np.unique(bucket_ids):
+                    if bucket not in writers:
+                        writers[bucket] = pq.ParquetWriter(
+                            str(buckets_dir / f"{bucket}.parquet"), data.schema, compression="none"
+                        )
+                    writers[bucket].write_table(data.filter(pa.array(bucket_ids == bucket)))
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+    @staticmethod
+    def _read_bucket(buckets_dir: Path, bucket: int, keys: List[str]) -> pd.DataFrame:
+        """Read one bucket and combine the block signatures of each key."""
+        path = buckets_dir / f"{bucket}.parquet"
+        if not path.exists():
+            columns = {key: pd.Series(dtype=object) for key in keys}
+            columns.update({_HASH: pd.Series(dtype="uint64"), _ROWS: pd.Series(dtype="int64")})
+            return pd.DataFrame(columns, index=pd.Index([], dtype="uint64"))
+
+        data = pq.read_table(str(path))
+        key_hashes = data.column(_KEY).to_numpy()
+        unique, sums, counts = sum_by_key(
+            key_hashes, data.column(_HASH).to_numpy(), data.column(_ROWS).to_numpy()
+        )
+        _, first = np.unique(key_hashes, return_index=True)
+
+        signatures = data.select(keys).take(first).to_pandas()
+        signatures.index = pd.Index(unique)
+        return signatures.assign(**{_HASH: sums, _ROWS: counts})
+
+    @staticmethod
+    def _compare(before: pd.DataFrame, after: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+        """List the keys inserted, updated and deleted between two signature sets."""
+        common = before.index.intersection(after.index)
+        old, new = before.loc[common], after.loc[common]
+        updated = common[
+            (old[_HASH].to_numpy() != new[_HASH].to_numpy())
+            | (old[_ROWS].to_numpy() != new[_ROWS].to_numpy())
+        ]
+
+        return pd.concat(
+            [
+                after.loc[after.index.difference(before.index), keys].assign(
+                    **{CHANGE_COLUMN: INSERT}
+                ),
+                after.loc[updated, keys].assign(**{CHANGE_COLUMN: UPDATE}),
+                before.loc[before.index.difference(after.index), keys].assign(
+                    **{CHANGE_COLUMN: DELETE}
+                ),
+            ],
+            ignore_index=True,
+        )
+
+    @staticmethod
+    def _state_schema(keys: List[str]) -> pa.Schema:
+        """Get the schema of a signature file."""
+        return pa.schema(
+            [(key, pa.string()) for key in keys]
+            + [(_KEY, pa.uint64()), (_HASH, pa.uint64()), (_ROWS, pa.int64())]
+        )
+
+    def _state_path(self, filename: str) -> Path:
+        """Get the signature file of a CSV."""
+        return self.bronze_dir / self.STATE_DIR / f"{Path(filename).stem}.parquet"
+
+    @staticmethod
+    def _temp_path(path: Path) -> Path:
+        """Get the path a file is written to before replacing ``path``."""
+        return path.with_name(f".{path.name}.tmp")
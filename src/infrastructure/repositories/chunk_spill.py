@@ -0,0 +1,160 @@
+"""Local spill area for tables written chunk by chunk."""
+
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.types as pat
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkSpill:
+    """Spill Arrow chunks to local disk and replay them with one schema.
+
+    pandas infers column types per chunk, so a column that is entirely empty in
+    one chunk (``double`` or ``list<null>``) can hold strings or structs in
+    another. Chunks are spilled as uncompressed Arrow IPC files, then replayed
+    cast to the schema the whole table would have had if converted at once.
+    """
+
+    def __init__(self, spill_dir: Optional[Path] = None):
+        """Initialize spill area.
+
+        Args:
+            spill_dir: Parent directory for spill files (system temp if None)
+        """
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix="spill-", dir=spill_dir))
+        self._paths: List[Path] = []
+        self._schemas: List[pa.Schema] = []
+        self._empty_columns: List[set] = []
+        self.num_rows = 0
+
+    def __enter__(self) -> "ChunkSpill":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add(self, table: pa.Table) -> None:
+        """Spill a chunk.
+
+        Args:
+            table: Chunk to spill
+        """
+        path = self.directory / f"{len(self._paths):06d}.arrow"
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        self._paths.append(path)
+        self._schemas.append(table.schema)
+        self._empty_columns.append(
+            {
+                name
+                for name, column in zip(table.column_names, table.columns)
+                if column.null_count == len(column)
+            }
+        )
+        self.num_rows += table.num_rows
+
+    def schema(self) -> pa.Schema:
+        """Get the unified schema of the spilled chunks.
+
+        For each column the type of the first chunk where the column has
+        values (and no ``null``-typed children) is used. Conflicting numeric
+        types are widened to ``float64`` and other conflicts fall back to
+        ``string``.
+
+        Returns:
+            Unified schema (metadata of the first chunk)
+
+        Raises:
+            ValueError: If no chunk was spilled
+        """
+        if not self._schemas:
+            raise ValueError("No chunks were spilled")
+
+        first = self._schemas[0]
+        fields = []
+        for field in first:
+            candidates = [
+                schema.field(field.name).type
+                for schema, empty in zip(self._schemas, self._empty_columns)
+                if field.name not in empty and not _has_null_type(schema.field(field.name).type)
+            ]
+            fields.append(pa.field(field.name, _common_type(candidates, field.type)))
+
+        return pa.schema(fields, metadata=first.metadata)
+
+    def tables(self, schema: Optional[pa.Schema] = None) -> Iterator[pa.Table]:
+        """Replay the spilled chunks cast to one schema.
+
+        Args:
+            schema: Schema to cast to (the unified schema if None)
+
+        Yields:
+            One table per spilled chunk, in spill order
+        """
+        schema = schema or self.schema()
+        for path in self._paths:
+            with pa.memory_map(str(path)) as source:
+                yield cast_table(pa.ipc.open_file(source).read_all(), schema)
+
+    def close(self) -> None:
+        """Delete the spill files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def cast_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast the columns of a table to a schema.
+
+    Only the columns that need it are cast (casting identical nested types
+    with null-typed children is not safe in all pyarrow versions), and
+    columns cast to dictionaries are dictionary-encoded.
+
+    Args:
+        table: Table holding the schema's columns
+        schema: Target schema
+
+    Returns:
+        Table with the schema
+    """
+    columns = []
+    for column, field in zip(table.select(schema.names).columns, schema):
+        if column.type.equals(field.type):
+            columns.append(column)
+        elif pat.is_dictionary(field.type) and not pat.is_dictionary(column.type):
+            encoded = pc.dictionary_encode(column.cast(field.type.value_type))
+            columns.append(encoded.cast(field.type))
+        else:
+            columns.append(column.cast(field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _has_null_type(data_type: pa.DataType) -> bool:
+    """Check whether a type is or contains the ``null`` type."""
+    if pat.is_null(data_type):
+        return True
+    return any(_has_null_type(data_type.field(i).type) for i in range(data_type.num_fields))
+
+
+def _common_type(candidates: List[pa.DataType], fallback: pa.DataType) -> pa.DataType:
+    """Pick the type a column takes across chunks."""
+    if not candidates:
+        return fallback
+
+    distinct = list(dict.fromkeys(candidates))
+    if len(distinct) == 1:
+        return distinct[0]
+    if all(pat.is_integer(t) or pat.is_floating(t) for t in distinct):
+        return pa.float64()
+
+    logger.warning(f"Conflicting chunk types {distinct}, falling back to string")
+    return pa.string()
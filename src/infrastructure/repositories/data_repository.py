@@ -1,39 +1,119 @@
 """Data repository for file operations."""
 
+import fnmatch
+import hashlib
+import json
 import logging
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 
 from src.domain.exceptions import DataLoadingError
+from src.infrastructure.config import Settings
+from src.infrastructure.monitoring import record_bytes_read, record_bytes_written
+from src.infrastructure.repositories.chunk_spill import ChunkSpill
+from src.infrastructure.repositories.layer_snapshot import LayerSnapshot
+from src.infrastructure.repositories.parquet_profiles import (
+    ParquetWriteProfile,
+    get_parquet_profile,
+)
+from src.infrastructure.storage import get_filesystem, layer_root, supports_atomic_rename
 
 logger = logging.getLogger(__name__)
 
 
 class DataRepository:
-    """Repository for data storage operations."""
-
-    def __init__(self, base_path: Path):
+    """Repository for data storage operations.
+
+    The repository works on any ``pyarrow.fs`` filesystem (local disk, S3,
+    GCS, Azure). On local disk files are written to a temporary name and
+    renamed into place; on object stores each object is uploaded in a single
+    atomic PUT. Either way a reader never observes a partially written file.
+
+    Inside a ``generation()`` block, Parquet tables are staged under
+    ``_generations/<id>/`` and become visible together when the layer's
+    ``_CURRENT`` pointer is switched to the new manifest. On publish, staged
+    files are moved to ``_objects/`` under the SHA-256 of their content, so a
+    table rewritten with the same content is stored once. Every generation
+    stays readable (``snapshot(generation)``) and can be made current again
+    (``rollback``) until the retention policy collects it.
+    """
+
+    CURRENT_POINTER = "_CURRENT"
+    MANIFESTS_DIR = "_manifests"
+    GENERATIONS_DIR = "_generations"
+    OBJECTS_DIR = "_objects"
+
+    def __init__(
+        self,
+        base_path: Union[Path, str],
+        keep_generations: int = 3,
+        filesystem: Optional[pafs.FileSystem] = None,
+        retention_days: float = 0,
+    ):
         """Initialize data repository.
 
         Args:
-            base_path: Base directory for data storage
+            base_path: Base directory for data storage (path inside
+                ``filesystem`` when one is given)
+            keep_generations: Number of published generations kept on disk
+            filesystem: Filesystem to use (local filesystem if None)
+            retention_days: Also keep generations published within this many days
+        """
+        if filesystem is None:
+            filesystem = pafs.LocalFileSystem()
+            base_path = Path(base_path).resolve()
+
+        self.filesystem = filesystem
+        self.root = Path(base_path).as_posix() if isinstance(base_path, Path) else base_path
+        self.root = self.root.rstrip("/")
+        self.base_path = Path(self.root)
+        self.keep_generations = keep_generations
+        self.retention_days = retention_days
+        self._atomic_rename = supports_atomic_rename(filesystem)
+        self._pending: Optional[Dict[str, Any]] = None
+
+        self.filesystem.create_dir(self.root, recursive=True)
+
+    @classmethod
+    def for_layer(cls, settings: Settings, layer: str) -> "DataRepository":
+        """Create a repository for a data lake layer on the configured backend.
+
+        Args:
+            settings: Application settings
+            layer: Layer name ('bronze', 'silver' or 'gold')
+
+        Returns:
+            Data repository sharing the process-wide filesystem
         """
-        self.base_path = base_path
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        return cls(
+            layer_root(settings, layer),
+            keep_generations=settings.layer_generations_to_keep,
+            filesystem=get_filesystem(settings),
+            retention_days=settings.layer_retention_days,
+        )
 
     def save_parquet(
-        self, df: pd.DataFrame, filename: str, partition_cols: Optional[List[str]] = None
+        self,
+        df: Union[pd.DataFrame, pa.Table],
+        filename: str,
+        partition_cols: Optional[List[str]] = None,
+        profile: Union[str, ParquetWriteProfile] = "default",
     ) -> Path:
         """Save DataFrame as Parquet file.
 
         Args:
-            df: DataFrame to save
+            df: DataFrame (or Arrow table, written as is) to save
             filename: Name of the file (without extension)
             partition_cols: Columns to use for partitioning
+            profile: Write profile name (see ``PARQUET_PROFILES``) or definition
 
         Returns:
             Path to saved file
@@ -42,34 +122,132 @@ class DataRepository:
             DataLoadingError: If save fails
         """
         try:
-            filepath = self.base_path / f"{filename}.parquet"
+            target_dir = self._staging_dir() or self.root
+            filepath = f"{target_dir}/{filename}.parquet"
 
-            logger.info(f"Saving Parquet file to {filepath}")
-            logger.info(f"DataFrame shape: {df.shape}")
+            write_profile = get_parquet_profile(profile)
 
-            table = pa.Table.from_pandas(df)
+            logger.info(f"Saving Parquet file to {filepath} (profile: {write_profile.name})")
+            if isinstance(df, pa.Table):
+                logger.info(f"Table shape: {(df.num_rows, df.num_columns)}")
+                table = write_profile.prepare_table(df)
+            else:
+                logger.info(f"DataFrame shape: {df.shape}")
+                table = pa.Table.from_pandas(write_profile.prepare(df))
 
             if partition_cols:
-                pq.write_to_dataset(
-                    table,
-                    root_path=str(self.base_path / filename),
-                    partition_cols=partition_cols,
+                filepath = f"{target_dir}/{filename}"
+                self._write_dir(
+                    filepath,
+                    lambda path: pq.write_to_dataset(
+                        table,
+                        root_path=path,
+                        partition_cols=partition_cols,
+                        filesystem=self.filesystem,
+                        **write_profile.write_options(),
+                    ),
                 )
             else:
-                pq.write_table(table, str(filepath), compression="snappy")
+                self._write_file(
+                    filepath,
+                    lambda path: pq.write_table(
+                        table, path, filesystem=self.filesystem, **write_profile.write_options()
+                    ),
+                )
+
+            if self._pending is not None:
+                self._pending["tables"][filename] = self._relative(filepath)
+
+            record_bytes_written(self._path_size(filepath))
+
+            logger.info(f"Successfully saved Parquet file: {filepath}")
+
+            return Path(filepath)
+
+        except Exception as e:
+            raise DataLoadingError(f"Failed to save Parquet file: {e}")
+
+    def save_parquet_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        filename: str,
+        profile: Union[str, ParquetWriteProfile] = "default",
+        spill_dir: Optional[Path] = None,
+        finalize_schema: Optional[Callable[[pa.Schema], pa.Schema]] = None,
+    ) -> Path:
+        """Save a table produced chunk by chunk as one Parquet file.
+
+        Only one chunk is held in memory at a time: chunks are spilled to local
+        disk, then streamed into the Parquet writer cast to a common schema.
+        The profile's sort order is applied within each chunk and each chunk
+        becomes at most ``row_group_size`` rows per row group. Chunk indexes
+        are not stored.
+
+        Args:
+            chunks: DataFrames with the same columns
+            filename: Name of the file (without extension)
+            profile: Write profile name (see ``PARQUET_PROFILES``) or definition
+            spill_dir: Local directory for spill files (system temp if None)
+            finalize_schema: Adjusts the common schema of the chunks once they
+                were all produced (e.g. to types decided from all their values)
+
+        Returns:
+            Path to saved file
+
+        Raises:
+            DataLoadingError: If save fails or no chunk is produced
+        """
+        try:
+            target_dir = self._staging_dir() or self.root
+            filepath = f"{target_dir}/{filename}.parquet"
+
+            write_profile = get_parquet_profile(profile)
+            options = write_profile.write_options()
+            row_group_size = options.pop("row_group_size", None)
+
+            logger.info(f"Saving Parquet file to {filepath} (profile: {write_profile.name})")
+
+            with ChunkSpill(spill_dir) as spill:
+                for chunk in chunks:
+                    chunk = write_profile.prepare(chunk)
+                    spill.add(pa.Table.from_pandas(chunk, preserve_index=False))
+
+                schema = spill.schema()
+                if finalize_schema is not None:
+                    schema = finalize_schema(schema)
+
+                def _write(path: str) -> None:
+                    with pq.ParquetWriter(
+                        path, schema, filesystem=self.filesystem, **options
+                    ) as writer:
+                        for table in spill.tables(schema):
+                            writer.write_table(table, row_group_size=row_group_size)
+
+                self._write_file(filepath, _write)
+
+                logger.info(f"Wrote {spill.num_rows} rows in {len(schema)} columns")
+
+            if self._pending is not None:
+                self._pending["tables"][filename] = self._relative(filepath)
+
+            record_bytes_written(self._path_size(filepath))
 
             logger.info(f"Successfully saved Parquet file: {filepath}")
 
-            return filepath
+            return Path(filepath)
 
         except Exception as e:
             raise DataLoadingError(f"Failed to save Parquet file: {e}")
 
-    def read_parquet(self, filename: str) -> pd.DataFrame:
+    def read_parquet(self, filename: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """Read Parquet file into DataFrame.
 
+        Tables staged by an open generation are read first, then the current
+        published generation, then the legacy flat layout.
+
         Args:
             filename: Name of the file (with or without extension)
+            columns: Columns to read (all columns if None)
 
         Returns:
             Loaded DataFrame
@@ -77,22 +255,130 @@ class DataRepository:
         Raises:
             DataLoadingError: If read fails
         """
-        try:
-            if not filename.endswith(".parquet"):
-                filename = f"{filename}.parquet"
+        table = filename[: -len(".parquet")] if filename.endswith(".parquet") else filename
 
-            filepath = self.base_path / filename
+        if self._pending is not None and table in self._pending["tables"]:
+            staged = LayerSnapshot(
+                self.filesystem, self.root, self._pending["id"], self._pending["tables"]
+            )
+            return staged.read_parquet(table, columns=columns)
 
-            logger.info(f"Reading Parquet file from {filepath}")
+        return self.snapshot().read_parquet(table, columns=columns)
 
-            df = pd.read_parquet(filepath)
+    def snapshot(self, generation: Optional[str] = None) -> LayerSnapshot:
+        """Pin a consistent view of a generation of the layer.
 
-            logger.info(f"Successfully loaded DataFrame with shape: {df.shape}")
+        Args:
+            generation: Generation to read (the current one if None)
 
-            return df
+        Returns:
+            Snapshot of the generation, or of the flat layout when the layer
+            has never been written through ``generation()``
 
-        except Exception as e:
-            raise DataLoadingError(f"Failed to read Parquet file: {e}")
+        Raises:
+            DataLoadingError: If the generation does not exist
+        """
+        generation = generation or self.current_generation()
+
+        if generation is None:
+            tables = {
+                info.base_name[: -len(".parquet")]: info.base_name
+                for info in self._list(self.root)
+                if info.base_name.endswith(".parquet")
+            }
+            return LayerSnapshot(self.filesystem, self.root, None, tables)
+
+        manifest = self._read_manifest(generation)
+        return LayerSnapshot(self.filesystem, self.root, generation, manifest["tables"])
+
+    def current_generation(self) -> Optional[str]:
+        """Get the id of the published generation.
+
+        Returns:
+            Generation id, or None if no generation was published yet
+        """
+        content = self._read_text(f"{self.root}/{self.CURRENT_POINTER}")
+        if content is None:
+            return None
+        return content.strip() or None
+
+    def generations(self) -> List[Dict[str, Any]]:
+        """List the generations kept on disk, oldest first.
+
+        Returns:
+            Manifest of each generation (id, parent, creation time, tables)
+        """
+        return [self._read_manifest(generation) for generation in self._generation_ids()]
+
+    def rollback(self, generation: Optional[str] = None) -> str:
+        """Make an earlier generation current again.
+
+        Only the current pointer is rewritten; no table is copied. Later
+        generations stay available until the retention policy collects them.
+
+        Args:
+            generation: Generation to restore (parent of the current one if None)
+
+        Returns:
+            Id of the restored generation
+
+        Raises:
+            DataLoadingError: If there is nothing to roll back to
+        """
+        if self._pending is not None:
+            raise DataLoadingError(f"Generation {self._pending['id']} is still open")
+
+        if generation is None:
+            current = self.current_generation()
+            if current is None:
+                raise DataLoadingError(f"No generation published in {self.root}")
+            generation = self._read_manifest(current)["parent"]
+            if generation is None:
+                raise DataLoadingError(f"Generation {current} has no parent to roll back to")
+            if not self._manifest_exists(generation):
+                raise DataLoadingError(f"Parent generation {generation} was already collected")
+
+        self._read_manifest(generation)
+        self._write_text_atomic(f"{self.root}/{self.CURRENT_POINTER}", generation)
+
+        logger.info(f"Rolled back {self.root} to generation {generation}")
+
+        return generation
+
+    @contextmanager
+    def generation(self) -> Iterator[str]:
+        """Stage writes into a new generation and publish them atomically.
+
+        Tables not rewritten inside the block are carried over from the
+        previous generation. If the block raises, nothing is published.
+
+        Yields:
+            Id of the generation being written
+
+        Raises:
+            DataLoadingError: If a generation is already open
+        """
+        if self._pending is not None:
+            raise DataLoadingError(f"Generation {self._pending['id']} is already open")
+
+        previous = self.current_generation()
+        tables = dict(self._read_manifest(previous)["tables"]) if previous else {}
+        generation_id = self._new_generation_id()
+        self._pending = {"id": generation_id, "parent": previous, "tables": tables}
+
+        logger.info(f"Opened generation {generation_id} in {self.root}")
+
+        try:
+            yield generation_id
+            pending = self._pending
+        except BaseException:
+            self._delete(self._generation_dir(generation_id))
+            logger.warning(f"Discarded generation {generation_id}")
+            raise
+        finally:
+            self._pending = None
+
+        self._publish(pending)
 
     def save_csv(self, df: pd.DataFrame, filename: str) -> Path:
         """Save DataFrame as CSV file.
@@ -108,15 +394,17 @@ class DataRepository:
             DataLoadingError: If save fails
         """
         try:
-            filepath = self.base_path / f"{filename}.csv"
+            filepath = f"{self.root}/{filename}.csv"
 
             logger.info(f"Saving CSV file to {filepath}")
 
-            df.to_csv(filepath, index=False)
+            content = df.to_csv(index=False).encode("utf-8")
+            self._write_file(filepath, lambda path: self._write_bytes(path, content))
+            record_bytes_written(len(content))
 
             logger.info(f"Successfully saved CSV file: {filepath}")
 
-            return filepath
+            return Path(filepath)
 
         except Exception as e:
             raise DataLoadingError(f"Failed to save CSV file: {e}")
@@ -137,11 +425,13 @@ class DataRepository:
             if not filename.endswith(".csv"):
                 filename = f"{filename}.csv"
 
-            filepath = self.base_path / filename
+            filepath = f"{self.root}/{filename}"
 
             logger.info(f"Reading CSV file from {filepath}")
 
-            df = pd.read_csv(filepath)
+            with self.filesystem.open_input_stream(filepath) as stream:
+                df = pd.read_csv(stream)
+            record_bytes_read(self._path_size(filepath))
 
             logger.info(f"Successfully loaded DataFrame with shape: {df.shape}")
 
@@ -150,6 +440,63 @@ class DataRepository:
         except Exception as e:
             raise DataLoadingError(f"Failed to read CSV file: {e}")
 
+    def read_bytes(self, filename: str) -> bytes:
+        """Read the raw content of a file.
+
+        Args:
+            filename: Name of the file (with extension)
+
+        Returns:
+            File content
+
+        Raises:
+            DataLoadingError: If read fails
+        """
+        try:
+            filepath = f"{self.root}/{filename}"
+
+            logger.info(f"Reading file from {filepath}")
+
+            with self.filesystem.open_input_stream(filepath) as stream:
+                content = stream.read()
+            record_bytes_read(len(content))
+
+            return content
+
+        except Exception as e:
+            raise DataLoadingError(f"Failed to read file: {e}")
+
+    def iter_csv(self, filename: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read a CSV file in chunks.
+
+        Chunk indexes continue across chunks, as in a single ``read_csv``.
+
+        Args:
+            filename: Name of the file (with or without extension)
+            chunk_size: Rows per chunk
+
+        Yields:
+            DataFrame chunks
+
+        Raises:
+            DataLoadingError: If read fails
+        """
+        if not filename.endswith(".csv"):
+            filename = f"{filename}.csv"
+
+        filepath = f"{self.root}/{filename}"
+
+        logger.info(f"Reading CSV file from {filepath} in chunks of {chunk_size} rows")
+
+        try:
+            with self.filesystem.open_input_stream(filepath) as stream:
+                with pd.read_csv(stream, chunksize=chunk_size) as reader:
+                    for chunk in reader:
+                        yield chunk
+            record_bytes_read(self._path_size(filepath))
+        except Exception as e:
+            raise DataLoadingError(f"Failed to read CSV file: {e}")
+
     def list_files(self, pattern: str = "*") -> List[Path]:
         """List files in the repository.
 
@@ -159,5 +506,244 @@ class DataRepository:
         Returns:
             List of file paths
         """
-        return list(self.base_path.glob(pattern))
+        return [
+            Path(info.path)
+            for info in self._list(self.root)
+            if fnmatch.fnmatch(info.base_name, pattern)
+        ]
+
+    def _publish(self, pending: Dict[str, Any]) -> None:
+        """Write the manifest and switch the current pointer to it."""
+        generation_id = pending["id"]
+        manifest = {
+            "generation": generation_id,
+            "parent": pending["parent"],
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "tables": self._store_objects(generation_id, pending["tables"]),
+        }
+
+        manifests_dir = f"{self.root}/{self.MANIFESTS_DIR}"
+        self.filesystem.create_dir(manifests_dir, recursive=True)
+        self._write_text_atomic(
+            f"{manifests_dir}/{generation_id}.json", json.dumps(manifest, indent=2)
+        )
+        self._write_text_atomic(f"{self.root}/{self.CURRENT_POINTER}", generation_id)
+
+        logger.info(f"Published generation {generation_id} in {self.root}")
+
+        self._prune_generations()
+
+    def _store_objects(self, generation: str, tables: Dict[str, str]) -> Dict[str, str]:
+        """Move the files staged by a generation to content-addressed objects.
+
+        Partitioned tables (directories) stay in the generation directory.
 
+        Args:
+            generation: Generation being published
+            tables: Table name -> path relative to the root
+
+        Returns:
+            Tables with the staged files replaced by their object paths
+        """
+        staging_dir = self._generation_dir(generation)
+        stored = dict(tables)
+
+        for table, relpath in tables.items():
+            path = f"{self.root}/{relpath}"
+            if not path.startswith(f"{staging_dir}/"):
+                continue
+            if self.filesystem.get_file_info(path).type != pafs.FileType.File:
+                continue
+
+            digest = self._content_digest(path)
+            object_path = f"{self.root}/{self.OBJECTS_DIR}/{digest[:2]}/{digest}.parquet"
+            if self.filesystem.get_file_info(object_path).type == pafs.FileType.File:
+                logger.info(f"Table {table} is unchanged, reusing object {digest[:12]}")
+                self._delete(path)
+            else:
+                self.filesystem.create_dir(object_path.rpartition("/")[0], recursive=True)
+                self.filesystem.move(path, object_path)
+            stored[table] = self._relative(object_path)
+
+        if not self._list(staging_dir):
+            self._delete(staging_dir)
+
+        return stored
+
+    def _content_digest(self, path: str) -> str:
+        """Get the SHA-256 of a file's content."""
+        digest = hashlib.sha256()
+        with self.filesystem.open_input_stream(path) as stream:
+            while True:
+                block = stream.read(8 * 1024 * 1024)
+                if not block:
+                    break
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _prune_generations(self) -> None:
+        """Delete generations outside the retention policy and unreferenced files.
+
+        The newest ``keep_generations`` generations, those published within
+        ``retention_days`` and the current one are kept.
+        """
+        manifests_dir = f"{self.root}/{self.MANIFESTS_DIR}"
+        generations = self._generation_ids()
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        kept = set(generations[-self.keep_generations :] if self.keep_generations > 0 else [])
+        kept.add(self.current_generation())
+        kept.update(g for g in generations if self._generation_time(g) >= cutoff)
+
+        expired = [generation for generation in generations if generation not in kept]
+        if not expired:
+            return
+
+        referenced = {
+            relpath
+            for generation in generations
+            if generation in kept
+            for relpath in self._read_manifest(generation)["tables"].values()
+        }
+
+        for generation in expired:
+            self._delete(f"{manifests_dir}/{generation}.json")
+            generation_dir = self._generation_dir(generation)
+            entries = self._list(generation_dir)
+            remaining = 0
+            for info in entries:
+                if self._relative(info.path) in referenced:
+                    remaining += 1
+                    continue
+                self._delete(info.path)
+            if not remaining:
+                self._delete(generation_dir)
+
+            logger.info(f"Pruned generation {generation} from {self.root}")
+
+        objects_dir = f"{self.root}/{self.OBJECTS_DIR}"
+        selector = pafs.FileSelector(objects_dir, recursive=True, allow_not_found=True)
+        for info in self.filesystem.get_file_info(selector):
+            if info.type == pafs.FileType.File and self._relative(info.path) not in referenced:
+                self._delete(info.path)
+
+    def _generation_ids(self) -> List[str]:
+        """List the ids of the generations with a manifest, oldest first."""
+        return sorted(
+            info.base_name[: -len(".json")]
+            for info in self._list(f"{self.root}/{self.MANIFESTS_DIR}")
+            if info.base_name.endswith(".json")
+        )
+
+    @staticmethod
+    def _generation_time(generation: str) -> datetime:
+        """Get the creation time encoded in a generation id."""
+        timestamp = generation.partition("-")[0]
+        return datetime.strptime(timestamp, "%Y%m%dT%H%M%S%fZ").replace(tzinfo=timezone.utc)
+
+    def _manifest_exists(self, generation: str) -> bool:
+        """Check whether a generation still has a manifest."""
+        path = f"{self.root}/{self.MANIFESTS_DIR}/{generation}.json"
+        return self.filesystem.get_file_info(path).type == pafs.FileType.File
+
+    def _read_manifest(self, generation: str) -> Dict[str, Any]:
+        """Load the manifest of a generation."""
+        content = self._read_text(f"{self.root}/{self.MANIFESTS_DIR}/{generation}.json")
+        if content is None:
+            raise DataLoadingError(f"Manifest for generation {generation} not found")
+        return json.loads(content)
+
+    def _staging_dir(self) -> Optional[str]:
+        """Get the directory of the open generation, creating it if needed."""
+        if self._pending is None:
+            return None
+        staging_dir = self._generation_dir(self._pending["id"])
+        self.filesystem.create_dir(staging_dir, recursive=True)
+        return staging_dir
+
+    def _generation_dir(self, generation: str) -> str:
+        """Get the data directory of a generation."""
+        return f"{self.root}/{self.GENERATIONS_DIR}/{generation}"
+
+    def _relative(self, path: str) -> str:
+        """Get a path relative to the repository root."""
+        return path[len(self.root) + 1 :]
+
+    def _path_size(self, path: str) -> int:
+        """Get the size of a file, or the total size of a dataset directory."""
+        info = self.filesystem.get_file_info(path)
+        if info.type != pafs.FileType.Directory:
+            return info.size or 0
+        selector = pafs.FileSelector(path, recursive=True)
+        return sum(entry.size or 0 for entry in self.filesystem.get_file_info(selector))
+
+    def _list(self, directory: str) -> List[pafs.FileInfo]:
+        """List the direct children of a directory (empty if it is missing)."""
+        selector = pafs.FileSelector(directory, allow_not_found=True)
+        return self.filesystem.get_file_info(selector)
+
+    def _read_text(self, path: str) -> Optional[str]:
+        """Read a small text file, returning None if it does not exist."""
+        if self.filesystem.get_file_info(path).type == pafs.FileType.NotFound:
+            return None
+        with self.filesystem.open_input_stream(path) as stream:
+            return stream.read().decode("utf-8")
+
+    def _write_bytes(self, path: str, content: bytes) -> None:
+        """Write raw bytes to a path."""
+        with self.filesystem.open_output_stream(path) as stream:
+            stream.write(content)
+
+    def _write_text_atomic(self, path: str, content: str) -> None:
+        """Write a small text file atomically."""
+        self._write_file(path, lambda target: self._write_bytes(target, content.encode("utf-8")))
+
+    def _write_file(self, path: str, writer: Callable[[str], Any]) -> None:
+        """Run a file writer so that ``path`` appears atomically."""
+        if not self._atomic_rename:
+            writer(path)
+            return
+
+        tmp_path = self._temp_path(path)
+        try:
+            writer(tmp_path)
+            self.filesystem.move(tmp_path, path)
+        finally:
+            self._delete(tmp_path)
+
+    def _write_dir(self, path: str, writer: Callable[[str], Any]) -> None:
+        """Run a directory writer, replacing any previous directory at ``path``."""
+        if not self._atomic_rename:
+            self._delete(path)
+            writer(path)
+            return
+
+        tmp_dir = self._temp_path(path)
+        writer(tmp_dir)
+        backup = None
+        if self.filesystem.get_file_info(path).type != pafs.FileType.NotFound:
+            backup = self._temp_path(path)
+            self.filesystem.move(path, backup)
+        self.filesystem.move(tmp_dir, path)
+        if backup is not None:
+            self._delete(backup)
+
+    def _delete(self, path: str) -> None:
+        """Delete a file or directory if it exists."""
+        file_type = self.filesystem.get_file_info(path).type
+        if file_type == pafs.FileType.Directory:
+            self.filesystem.delete_dir(path)
+        elif file_type == pafs.FileType.File:
+            self.filesystem.delete_file(path)
+
+    @staticmethod
+    def _new_generation_id() -> str:
+        """Create a sortable, unique generation id."""
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        return f"{timestamp}-{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _temp_path(path: str) -> str:
+        """Get a hidden temporary sibling path for an atomic write."""
+        parent, _, name = path.rpartition("/")
+        return f"{parent}/.{name}.{uuid.uuid4().hex}.tmp"
@@ -0,0 +1,114 @@
+"""Vectorized 64-bit row hashes of Arrow tables.
+
+Used to detect which keyed rows changed between two versions of a table
+without comparing them value by value. Nested columns (lists and structs, as
+in the parsed Silver columns) are hashed from their child arrays, so no row
+is ever converted to Python objects.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.types as pat
+
+_NULL_HASH = np.uint64(0x2545F4914F6CDD1D)
+_COLUMN_PRIME = np.uint64(0x100000001B3)
+
+
+def hash_rows(table: pa.Table) -> np.ndarray:
+    """Hash every row of a table.
+
+    Rows with equal values (and types) in the same column order get the same
+    hash across runs and processes.
+
+    Args:
+        table: Table to hash
+
+    Returns:
+        ``uint64`` array with one hash per row
+    """
+    hashes = np.zeros(table.num_rows, dtype=np.uint64)
+    for column in table.columns:
+        values = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+        hashes = hashes * _COLUMN_PRIME + _hash_array(values)
+    return _mix(hashes)
+
+
+def sum_by_key(
+    keys: np.ndarray, hashes: np.ndarray, counts: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Combine row hashes into one signature per key.
+
+    Signatures are order-independent (hashes are added modulo 2**64), so a
+    key's rows can be hashed in any order and in several batches, and the
+    signatures of several batches combined with another call.
+
+    Args:
+        keys: Key of each row
+        hashes: Hash of each row
+        counts: Rows behind each hash (1 each if None)
+
+    Returns:
+        Sorted unique keys, their hash sums and their row counts
+    """
+    if counts is None:
+        counts = np.ones(len(keys), dtype=np.int64)
+    if len(keys) == 0:
+        return keys, hashes, counts
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    sums = np.add.reduceat(hashes[order], starts)
+    return keys[starts], sums, np.add.reduceat(counts[order], starts)
+
+
+def _hash_array(array: pa.Array) -> np.ndarray:
+    """Hash each value of an Arrow array."""
+    data_type = array.type
+
+    if pat.is_struct(data_type):
+        hashes = np.zeros(len(array), dtype=np.uint64)
+        for field in array.flatten():
+            hashes = hashes * _COLUMN_PRIME + _hash_array(field)
+        hashes = _mix(hashes)
+    elif pat.is_list(data_type) or pat.is_large_list(data_type):
+        hashes = _hash_list(array)
+    elif pat.is_null(data_type):
+        hashes = np.full(len(array), _NULL_HASH, dtype=np.uint64)
+    else:
+        values = array.to_numpy(zero_copy_only=False)
+        hashes = pd.util.hash_array(values, categorize=False)
+
+    if array.null_count:
+        hashes = np.where(array.is_null().to_numpy(zero_copy_only=False), _NULL_HASH, hashes)
+    return hashes
+
+
+def _hash_list(array: pa.Array) -> np.ndarray:
+    """Hash lists from the hashes of their items and positions."""
+    offsets = array.offsets.to_numpy().astype(np.int64)
+    first = offsets[0]
+    items = array.values.slice(first, offsets[-1] - first)
+    offsets = offsets - first
+
+    lengths = np.diff(offsets)
+    positions = np.arange(len(items), dtype=np.uint64) - np.repeat(
+        offsets[:-1].astype(np.uint64), lengths
+    )
+    item_hashes = _mix(_hash_array(items) + positions)
+
+    cumulative = np.concatenate([[np.uint64(0)], np.cumsum(item_hashes, dtype=np.uint64)])
+    sums = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+    return _mix(sums + lengths.astype(np.uint64))
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """Scramble 64-bit values (splitmix64 finalizer)."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
@@ -0,0 +1,22 @@
+"""Storage backends for the data lake layers."""
+
+from src.infrastructure.storage.cache import ReadThroughCache, cached_filesystem
+from src.infrastructure.storage.filesystem import (
+    LAYERS,
+    get_filesystem,
+    get_read_cache,
+    layer_root,
+    supports_atomic_rename,
+    upload_files,
+)
+
+__all__ = [
+    "LAYERS",
+    "ReadThroughCache",
+    "cached_filesystem",
+    "get_filesystem",
+    "get_read_cache",
+    "layer_root",
+    "supports_atomic_rename",
+    "upload_files",
+]
@@ -0,0 +1,400 @@
+"""Read-through disk cache for remote layer files."""
+
+import hashlib
+import io
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+
+logger = logging.getLogger(__name__)
+
+# (object key, offset, length)
+_RangeKey = Tuple[str, int, int]
+
+# Object metadata fields holding a content version (ETag) or checksum, by
+# preference (compared case-insensitively)
+VERSION_FIELDS = ("etag", "md5hash", "content-md5", "crc32c")
+
+
+class DelegatingFileSystemHandler(pafs.FileSystemHandler):
+    """``pyarrow.fs`` handler forwarding every call to another filesystem.
+
+    Subclasses override the operations they want to intercept.
+    """
+
+    def __init__(self, filesystem: pafs.FileSystem):
+        """Initialize handler.
+
+        Args:
+            filesystem: Filesystem receiving the calls
+        """
+        self.filesystem = filesystem
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, type(self)) and self.filesystem.equals(other.filesystem)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def get_type_name(self) -> str:
+        return f"{type(self).__name__}({self.filesystem.type_name})"
+
+    def normalize_path(self, path: str) -> str:
+        return self.filesystem.normalize_path(path)
+
+    def get_file_info(self, paths: List[str]) -> List[pafs.FileInfo]:
+        return self.filesystem.get_file_info(paths)
+
+    def get_file_info_selector(self, selector: pafs.FileSelector) -> List[pafs.FileInfo]:
+        return self.filesystem.get_file_info(selector)
+
+    def create_dir(self, path: str, recursive: bool) -> None:
+        self.filesystem.create_dir(path, recursive=recursive)
+
+    def delete_dir(self, path: str) -> None:
+        self.filesystem.delete_dir(path)
+
+    def delete_dir_contents(self, path: str, missing_dir_ok: bool = False) -> None:
+        self.filesystem.delete_dir_contents(path, missing_dir_ok=missing_dir_ok)
+
+    def delete_root_dir_contents(self) -> None:
+        self.filesystem.delete_dir_contents("", accept_root_dir=True)
+
+    def delete_file(self, path: str) -> None:
+        self.filesystem.delete_file(path)
+
+    def move(self, src: str, dest: str) -> None:
+        self.filesystem.move(src, dest)
+
+    def copy_file(self, src: str, dest: str) -> None:
+        self.filesystem.copy_file(src, dest)
+
+    def open_input_stream(self, path: str) -> pa.NativeFile:
+        return self.filesystem.open_input_stream(path)
+
+    def open_input_file(self, path: str) -> pa.NativeFile:
+        return self.filesystem.open_input_file(path)
+
+    def open_output_stream(self, path: str, metadata: Optional[Dict[str, str]]) -> pa.NativeFile:
+        return self.filesystem.open_output_stream(path, metadata=metadata)
+
+    def open_append_stream(self, path: str, metadata: Optional[Dict[str, str]]) -> pa.NativeFile:
+        return self.filesystem.open_append_stream(path, metadata=metadata)
+
+
+class ReadThroughCache:
+    """Size-bounded LRU disk cache of remote byte ranges.
+
+    Entries are keyed by object path and version (see
+    ``ReadThroughCacheHandler``) plus the byte range. Parquet readers
+    request one range per (coalesced) column chunk, so entries map to column
+    chunks and a later read of a subset of columns is served from disk.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cached ranges
+            max_bytes: Maximum total size of cached ranges
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[_RangeKey, int]" = OrderedDict()
+        self._ranges: Dict[str, List[Tuple[int, int]]] = {}
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_from_cache = 0
+        self.bytes_from_remote = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    def read(
+        self, path: str, version: str, offset: int, length: int, fetch: Callable[[int, int], bytes]
+    ) -> bytes:
+        """Read a byte range, fetching and caching it on a miss.
+
+        Args:
+            path: Remote object path
+            version: Object version marker
+            offset: Start of the range
+            length: Number of bytes
+            fetch: Callable reading ``(offset, length)`` from the remote object
+
+        Returns:
+            Requested bytes
+        """
+        key = self._object_key(path, version)
+
+        with self._lock:
+            covering = self._find_covering(key, offset, length)
+            if covering is not None:
+                self._lru.move_to_end(covering)
+
+        if covering is not None:
+            data = self._read_entry(covering, offset, length)
+            if data is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.bytes_from_cache += len(data)
+                return data
+
+        data = fetch(offset, length)
+
+        with self._lock:
+            self.misses += 1
+            self.bytes_from_remote += len(data)
+
+        if data and len(data) <= self.max_bytes:
+            self._store((key, offset, len(data)), data)
+
+        return data
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss metrics.
+
+        Returns:
+            Dictionary with counters, current size and hit ratio
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests if requests else 0.0,
+                "bytes_from_cache": self.bytes_from_cache,
+                "bytes_from_remote": self.bytes_from_remote,
+                "evictions": self.evictions,
+                "entries": len(self._lru),
+                "size_bytes": self._total_bytes,
+            }
+
+    def _find_covering(self, key: str, offset: int, length: int) -> Optional[_RangeKey]:
+        """Find a cached range containing ``[offset, offset + length)``."""
+        for start, size in self._ranges.get(key, []):
+            if start <= offset and offset + length <= start + size:
+                return (key, start, size)
+        return None
+
+    def _read_entry(self, entry: _RangeKey, offset: int, length: int) -> Optional[bytes]:
+        """Read part of a cached range from disk."""
+        path = self._entry_path(entry)
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset - entry[1])
+                data = f.read(length)
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            # Evicted by another process sharing the cache directory
+            with self._lock:
+                self._forget(entry)
+            return None
+
+    def _store(self, entry: _RangeKey, data: bytes) -> None:
+        """Write a range to disk and evict least recently used entries."""
+        path = self._entry_path(entry)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if entry in self._lru:
+                return
+            self._lru[entry] = len(data)
+            self._ranges.setdefault(entry[0], []).append((entry[1], entry[2]))
+            self._total_bytes += len(data)
+
+            while self._total_bytes > self.max_bytes and self._lru:
+                evicted = next(iter(self._lru))
+                self._forget(evicted)
+                self._entry_path(evicted).unlink(missing_ok=True)
+                self.evictions += 1
+
+    def _forget(self, entry: _RangeKey) -> None:
+        """Remove an entry from the in-memory index (lock must be held)."""
+        size = self._lru.pop(entry, None)
+        if size is None:
+            return
+        self._total_bytes -= size
+        ranges = self._ranges.get(entry[0], [])
+        if (entry[1], entry[2]) in ranges:
+            ranges.remove((entry[1], entry[2]))
+        if not ranges:
+            self._ranges.pop(entry[0], None)
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the files left by previous processes."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.bin"):
+            try:
+                offset, length = (int(part) for part in path.stem.split("_"))
+                entries.append((path.stat().st_mtime, (path.parent.name, offset, length)))
+            except (ValueError, FileNotFoundError):
+                continue
+
+        for _, entry in sorted(entries):
+            self._lru[entry] = entry[2]
+            self._ranges.setdefault(entry[0], []).append((entry[1], entry[2]))
+            self._total_bytes += entry[2]
+
+        if entries:
+            logger.info(
+                f"Loaded {len(entries)} cached ranges ({self._total_bytes / 1024 / 1024:.2f} MB) "
+                f"from {self.cache_dir}"
+            )
+
+    def _entry_path(self, entry: _RangeKey) -> Path:
+        """Get the file holding a cached range."""
+        return self.cache_dir / entry[0] / f"{entry[1]}_{entry[2]}.bin"
+
+    @staticmethod
+    def _object_key(path: str, version: str) -> str:
+        """Hash an object path and version into a directory name."""
+        return hashlib.sha1(f"{path}\0{version}".encode("utf-8")).hexdigest()
+
+
+class _CachedInputFile(io.RawIOBase):
+    """Random-access file whose reads go through a ``ReadThroughCache``."""
+
+    def __init__(
+        self,
+        cache: ReadThroughCache,
+        remote: pa.NativeFile,
+        path: str,
+        version: str,
+        size: int,
+    ):
+        super().__init__()
+        self._cache = cache
+        self._remote = remote
+        self._path = path
+        self._version = version
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = self._size + offset
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = max(self._size - self._position, 0)
+        length = remaining if size is None or size < 0 else min(size, remaining)
+        if length == 0:
+            return b""
+
+        data = self._cache.read(self._path, self._version, self._position, length, self._fetch)
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def close(self) -> None:
+        self._remote.close()
+        super().close()
+
+    def _fetch(self, offset: int, length: int) -> bytes:
+        """Read a range from the remote object."""
+        return self._remote.read_at(length, offset)
+
+
+class ReadThroughCacheHandler(DelegatingFileSystemHandler):
+    """Filesystem handler serving random-access reads through a disk cache.
+
+    Only ``open_input_file`` (used by Parquet readers) is cached. Sequential
+    streams, such as the generation pointer and manifests, always hit the
+    remote store so that new generations are seen immediately.
+
+    Cached ranges belong to one version of an object: its ETag or checksum
+    when the store reports one, else its size and modification time (an
+    object rewritten with the same size within the store's timestamp
+    resolution would then be served stale).
+    """
+
+    def __init__(self, filesystem: pafs.FileSystem, cache: ReadThroughCache):
+        """Initialize handler.
+
+        Args:
+            filesystem: Remote filesystem
+            cache: Cache serving byte ranges
+        """
+        super().__init__(filesystem)
+        self.cache = cache
+
+    def open_input_file(self, path: str) -> pa.NativeFile:
+        remote = self.filesystem.open_input_file(path)
+        version = self._content_version(path, remote)
+        if version is None:
+            info = self.filesystem.get_file_info(path)
+            version = f"{info.size}-{info.mtime_ns}"
+
+        handle = _CachedInputFile(self.cache, remote, path, version, remote.size())
+        return pa.PythonFile(handle, mode="r")
+
+    def _content_version(self, path: str, remote: pa.NativeFile) -> Optional[str]:
+        """Get the ETag or checksum of an object, if the store reports one.
+
+        Native object stores return it with the metadata of the opened file;
+        fsspec filesystems (Azure) with the object info.
+
+        Args:
+            path: Object path
+            remote: Object opened on the remote filesystem
+
+        Returns:
+            Version marker, or None if the store reports neither
+        """
+        metadata = dict(remote.metadata())
+        handler = getattr(self.filesystem, "handler", None)
+        if isinstance(handler, pafs.FSSpecHandler):
+            metadata.update(handler.fs.info(path))
+
+        fields = {str(name).lower(): value for name, value in metadata.items() if value}
+        for name in VERSION_FIELDS:
+            if name in fields:
+                value = fields[name]
+                value = value.decode("utf-8") if isinstance(value, bytes) else str(value)
+                return f"{name}:{value}"
+        return None
+
+
+def cached_filesystem(filesystem: pafs.FileSystem, cache: ReadThroughCache) -> pafs.FileSystem:
+    """Wrap a remote filesystem with a read-through cache.
+
+    Args:
+        filesystem: Remote filesystem
+        cache: Cache serving byte ranges
+
+    Returns:
+        Filesystem with cached random-access reads
+    """
+    return pafs.PyFileSystem(ReadThroughCacheHandler(filesystem, cache))
@@ -0,0 +1,240 @@
+"""Filesystem abstraction over local disk and cloud object stores."""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+
+from src.domain.exceptions import DataLoadingError
+from src.infrastructure.config import Settings
+from src.infrastructure.storage.cache import ReadThroughCache, cached_filesystem
+
+logger = logging.getLogger(__name__)
+
+LAYERS = ("bronze", "silver", "gold")
+
+# One filesystem (and therefore one HTTP connection pool) per backend
+# configuration, shared by every repository and pipeline stage in the process.
+_FILESYSTEMS: Dict[Tuple, pafs.FileSystem] = {}
+_FILESYSTEMS_LOCK = threading.Lock()
+_READ_CACHES: Dict[Path, ReadThroughCache] = {}
+
+
+def get_filesystem(settings: Settings) -> pafs.FileSystem:
+    """Get the shared filesystem for the configured storage backend.
+
+    Remote backends are wrapped with the local read-through cache unless
+    ``layer_cache_enabled`` is off.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        PyArrow filesystem
+
+    Raises:
+        DataLoadingError: If the backend is unknown or unavailable
+    """
+    key = (
+        settings.storage_backend,
+        settings.aws_region,
+        settings.aws_access_key_id,
+        settings.s3_endpoint_override,
+        settings.gcp_region,
+        settings.azure_storage_account,
+        settings.layer_cache_enabled,
+        settings.layer_cache_dir,
+    )
+
+    with _FILESYSTEMS_LOCK:
+        if key not in _FILESYSTEMS:
+            # Thread pool used for background multipart uploads and
+            # coalesced ranged reads
+            pa.set_io_thread_count(settings.storage_io_threads)
+            filesystem = _create_filesystem(settings)
+            cache = _get_read_cache_locked(settings)
+            if cache is not None:
+                filesystem = cached_filesystem(filesystem, cache)
+            _FILESYSTEMS[key] = filesystem
+            logger.info(f"Initialized '{settings.storage_backend}' storage backend")
+        return _FILESYSTEMS[key]
+
+
+def get_read_cache(settings: Settings) -> Optional[ReadThroughCache]:
+    """Get the read-through cache used for remote layer files.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared cache, or None for local storage or when caching is disabled
+    """
+    with _FILESYSTEMS_LOCK:
+        return _get_read_cache_locked(settings)
+
+
+def layer_root(settings: Settings, layer: str) -> str:
+    """Get the root path of a layer inside the configured filesystem.
+
+    The object store layout follows the Terraform modules: AWS uses one bucket
+    with ``bronze/``, ``silver/`` and ``gold/`` prefixes, GCP one bucket per
+    layer named ``<gcp_bucket>-<layer>`` and Azure one container per layer.
+
+    Args:
+        settings: Application settings
+        layer: Layer name ('bronze', 'silver' or 'gold')
+
+    Returns:
+        Root path of the layer
+
+    Raises:
+        DataLoadingError: If the layer or backend configuration is invalid
+    """
+    if layer not in LAYERS:
+        raise DataLoadingError(f"Unknown layer '{layer}' (available: {', '.join(LAYERS)})")
+
+    backend = settings.storage_backend
+
+    if backend == "local":
+        local_dirs = {
+            "bronze": settings.bronze_dir,
+            "silver": settings.silver_dir,
+            "gold": settings.gold_dir,
+        }
+        return local_dirs[layer].resolve().as_posix()
+
+    if backend == "s3":
+        _require(settings.aws_s3_bucket, "AWS_S3_BUCKET")
+        return f"{settings.aws_s3_bucket}/{layer}"
+
+    if backend == "gcs":
+        _require(settings.gcp_bucket, "GCP_BUCKET")
+        return f"{settings.gcp_bucket}-{layer}"
+
+    if backend == "azure":
+        _require(settings.azure_storage_account, "AZURE_STORAGE_ACCOUNT")
+        return layer
+
+    raise DataLoadingError(f"Unknown storage backend '{backend}'")
+
+
+def supports_atomic_rename(filesystem: pafs.FileSystem) -> bool:
+    """Check whether ``move`` is an atomic rename on a filesystem.
+
+    Object stores implement ``move`` as copy + delete, but a single object PUT
+    is already atomic there, so files can be written directly to their key.
+
+    Args:
+        filesystem: Filesystem to inspect
+
+    Returns:
+        True for local filesystems
+    """
+    while isinstance(filesystem, pafs.SubTreeFileSystem):
+        filesystem = filesystem.base_fs
+    return isinstance(filesystem, pafs.LocalFileSystem)
+
+
+def upload_files(
+    paths: List[Path],
+    filesystem: pafs.FileSystem,
+    destination_root: str,
+    max_workers: int = 4,
+    chunk_size: int = 8 * 1024 * 1024,
+) -> int:
+    """Upload local files to a filesystem in parallel.
+
+    Files are copied concurrently, and each object store output stream uploads
+    its multipart parts in the background while the next chunk is read.
+
+    Args:
+        paths: Local files to upload
+        filesystem: Destination filesystem
+        destination_root: Destination directory inside the filesystem
+        max_workers: Number of files uploaded concurrently
+        chunk_size: Copy buffer (and multipart part) size in bytes
+
+    Returns:
+        Total number of bytes uploaded
+
+    Raises:
+        DataLoadingError: If any upload fails
+    """
+    local_fs = pafs.LocalFileSystem()
+    filesystem.create_dir(destination_root, recursive=True)
+
+    def _upload(path: Path) -> int:
+        destination = f"{destination_root}/{path.name}"
+        logger.info(f"Uploading {path} to {destination}")
+        pafs.copy_files(
+            str(path.resolve()),
+            destination,
+            source_filesystem=local_fs,
+            destination_filesystem=filesystem,
+            chunk_size=chunk_size,
+            use_threads=True,
+        )
+        return path.stat().st_size
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(_upload, paths))
+    except Exception as e:
+        raise DataLoadingError(f"Failed to upload files to {destination_root}: {e}")
+
+
+def _get_read_cache_locked(settings: Settings) -> Optional[ReadThroughCache]:
+    """Get or create the read cache (``_FILESYSTEMS_LOCK`` must be held)."""
+    if settings.storage_backend == "local" or not settings.layer_cache_enabled:
+        return None
+
+    cache_dir = settings.layer_cache_dir.resolve()
+    if cache_dir not in _READ_CACHES:
+        _READ_CACHES[cache_dir] = ReadThroughCache(cache_dir, settings.layer_cache_max_bytes)
+    return _READ_CACHES[cache_dir]
+
+
+def _create_filesystem(settings: Settings) -> pafs.FileSystem:
+    """Build the filesystem for the configured backend."""
+    backend = settings.storage_backend
+
+    if backend == "local":
+        return pafs.LocalFileSystem()
+
+    if backend == "s3":
+        endpoint = settings.s3_endpoint_override
+        scheme = None
+        if endpoint and "://" in endpoint:
+            scheme, endpoint = endpoint.split("://", 1)
+        return pafs.S3FileSystem(
+            region=settings.aws_region,
+            access_key=settings.aws_access_key_id,
+            secret_key=settings.aws_secret_access_key,
+            endpoint_override=endpoint,
+            scheme=scheme,
+            background_writes=True,
+        )
+
+    if backend == "gcs":
+        return pafs.GcsFileSystem(default_bucket_location=settings.gcp_region)
+
+    if backend == "azure":
+        # pyarrow ships no native Azure filesystem in the supported versions
+        try:
+            from adlfs import AzureBlobFileSystem
+        except ImportError:
+            raise DataLoadingError("Azure storage requires the 'adlfs' package: pip install adlfs")
+        azure_fs = AzureBlobFileSystem(account_name=settings.azure_storage_account)
+        return pafs.PyFileSystem(pafs.FSSpecHandler(azure_fs))
+
+    raise DataLoadingError(f"Unknown storage backend '{backend}'")
+
+
+def _require(value: object, env_var: str) -> None:
+    """Ensure a backend setting is configured."""
+    if not value:
+        raise DataLoadingError(f"{env_var} must be set for the configured storage backend")
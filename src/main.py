@@ -1,9 +1,12 @@
 """Main entry point for the Movies Big Data Pipeline."""
 
 import argparse
+import logging
 import sys
+from pathlib import Path
 
 from src.infrastructure.config import get_settings
+from src.infrastructure.monitoring import PROFILERS, RunMetrics
 from src.presentation.cli import PipelineCLI
 
 
@@ -33,6 +36,68 @@ def parse_arguments() -> argparse.Namespace:
         help="Logging level (overrides environment variable)",
     )
 
+    parser.add_argument(
+        "--execution-mode",
+        type=str,
+        choices=["in_memory", "out_of_core"],
+        default=None,
+        help="Process tables whole or in chunks (overrides environment variable)",
+    )
+
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["pandas", "polars"],
+        default=None,
+        help="DataFrame library of the in-memory stages (overrides environment variable)",
+    )
+
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Rebuild the Gold tables from the whole Silver layer instead of updating them",
+    )
+
+    parser.add_argument(
+        "--rollback",
+        type=str,
+        metavar="LAYER[:GENERATION]",
+        default=None,
+        help="Make a previous generation of 'silver' or 'gold' current again and exit "
+        "(default generation: parent of the current one)",
+    )
+
+    parser.add_argument(
+        "--metrics-report",
+        type=Path,
+        default=Path("pipeline_metrics.json"),
+        help="JSON run report with per-stage metrics (default: pipeline_metrics.json)",
+    )
+
+    parser.add_argument(
+        "--prometheus-textfile",
+        type=Path,
+        default=None,
+        help="Also write the metrics for the Prometheus node_exporter textfile collector",
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=str,
+        nargs="?",
+        const="cprofile",
+        choices=PROFILERS,
+        default=None,
+        help="Dump a profile per stage (default profiler: cprofile)",
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profiles"),
+        help="Directory for profile dumps (default: profiles)",
+    )
+
     return parser.parse_args()
 
 
@@ -51,14 +116,41 @@ def main() -> int:
     if args.log_level:
         settings.log_level = args.log_level
 
-    # Initialize CLI
-    cli = PipelineCLI(settings)
+    # Override execution mode if specified
+    if args.execution_mode:
+        settings.execution_mode = args.execution_mode
+
+    # Override engine if specified
+    if args.engine:
+        settings.engine = args.engine
 
-    # Execute pipeline
-    if args.stage == "all":
-        success = cli.run_full_pipeline()
-    else:
-        success = cli.run_stage(args.stage)
+    # Force a full Gold rebuild if requested
+    if args.full_refresh:
+        settings.gold_refresh = "full"
+
+    # Initialize CLI
+    cli = PipelineCLI(settings, profiler=args.profile, profile_dir=args.profile_dir)
+
+    # Roll a layer back instead of running the pipeline
+    if args.rollback:
+        layer, _, generation = args.rollback.partition(":")
+        return 0 if cli.rollback(layer, generation or None) else 1
+
+    # Execute pipeline; the report is written even when a stage fails
+    metrics = RunMetrics()
+    try:
+        with metrics.activate():
+            if args.stage == "all":
+                success = cli.run_full_pipeline()
+            else:
+                success = cli.run_stage(args.stage)
+    finally:
+        try:
+            metrics.write_json(args.metrics_report)
+            if args.prometheus_textfile:
+                metrics.write_prometheus(args.prometheus_textfile)
+        except OSError as e:
+            logging.getLogger(__name__).error(f"Failed to write run metrics: {e}")
 
     return 0 if success else 1
 
@@ -3,12 +3,15 @@
 import logging
 import sys
 import time
-from typing import Optional
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
 
-from src.application.ingestion import IngestMoviesUseCase
-from src.application.loading import LoadAnalyticsUseCase
-from src.application.transformation import TransformMoviesUseCase
 from src.infrastructure.config import Settings
+from src.infrastructure.monitoring import profile_to, track
+
+# Use cases (and through them pandas, pyarrow and Polars) are imported
+# by the stage that runs them, so a single stage only loads what it needs
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +19,23 @@ logger = logging.getLogger(__name__)
 class PipelineCLI:
     """CLI for pipeline execution."""
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        profiler: Optional[str] = None,
+        profile_dir: Path = Path("profiles"),
+    ):
         """Initialize CLI.
 
         Args:
             settings: Application settings
+            profiler: Profiler dumping one profile per stage ('cprofile' or
+                'pyinstrument'), or None to disable profiling
+            profile_dir: Directory receiving the profile dumps
         """
         self.settings = settings
+        self.profiler = profiler
+        self.profile_dir = profile_dir
         self._setup_logging()
 
     def _setup_logging(self) -> None:
@@ -49,24 +62,31 @@ class PipelineCLI:
         start_time = time.time()
 
         try:
-            # Ensure directories exist
-            self.settings.ensure_directories()
+            with track("pipeline"):
+                # Ensure directories exist
+                self.settings.ensure_directories()
 
-            # Stage 1: Ingestion
-            if not self.run_ingestion():
-                return False
+                # Stage 1: Ingestion
+                if not self.run_ingestion():
+                    return False
 
-            # Stage 2: Transformation
-            if not self.run_transformation():
-                return False
+                # Stage 2: Transformation
+                if not self.run_transformation():
+                    return False
 
-            # Stage 3: Loading
-            if not self.run_loading():
-                return False
+                # Stage 3: Loading
+                if not self.run_loading():
+                    return False
 
             elapsed_time = time.time() - start_time
             logger.info("=" * 80)
             logger.info(f"Pipeline completed successfully in {elapsed_time:.2f} seconds")
+
+            from src.infrastructure.storage import get_read_cache
+
+            cache = get_read_cache(self.settings)
+            if cache is not None:
+                logger.info(f"Layer read cache: {cache.stats()}")
             logger.info("=" * 80)
 
             return True
@@ -86,8 +106,11 @@ class PipelineCLI:
         logger.info("-" * 80)
 
         try:
-            use_case = IngestMoviesUseCase(self.settings)
-            use_case.execute()
+            with self._measure("ingestion"):
+                from src.application.ingestion import IngestMoviesUseCase
+
+                use_case = IngestMoviesUseCase(self.settings)
+                use_case.execute()
             logger.info("✓ Ingestion completed")
             return True
 
@@ -106,8 +129,11 @@ class PipelineCLI:
         logger.info("-" * 80)
 
         try:
-            use_case = TransformMoviesUseCase(self.settings)
-            stats = use_case.execute()
+            with self._measure("transformation"):
+                from src.application.transformation import TransformMoviesUseCase
+
+                use_case = TransformMoviesUseCase(self.settings)
+                stats = use_case.execute()
             logger.info(f"✓ Transformation completed: {stats}")
             return True
 
@@ -126,8 +152,11 @@ class PipelineCLI:
         logger.info("-" * 80)
 
         try:
-            use_case = LoadAnalyticsUseCase(self.settings)
-            stats = use_case.execute()
+            with self._measure("loading"):
+                from src.application.loading import LoadAnalyticsUseCase
+
+                use_case = LoadAnalyticsUseCase(self.settings)
+                stats = use_case.execute()
             logger.info(f"✓ Loading completed: {stats}")
             return True
 
@@ -157,3 +186,37 @@ class PipelineCLI:
 
         return stage_map[stage]()
 
+    def rollback(self, layer: str, generation: Optional[str] = None) -> bool:
+        """Make an earlier generation of a layer current again.
+
+        Args:
+            layer: Layer name ('silver' or 'gold')
+            generation: Generation to restore (parent of the current one if None)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            from src.infrastructure.repositories import DataRepository
+
+            repository = DataRepository.for_layer(self.settings, layer)
+            restored = repository.rollback(generation)
+            logger.info(f"✓ {layer} rolled back to generation {restored}")
+            return True
+
+        except Exception as e:
+            logger.error(f"✗ Rollback of {layer} failed: {e}")
+            return False
+
+    @contextmanager
+    def _measure(self, stage: str) -> Iterator[None]:
+        """Record a stage in the active run metrics and profile it if enabled.
+
+        Args:
+            stage: Stage name
+
+        Yields:
+            None
+        """
+        with track(stage), profile_to(self.profile_dir, stage, self.profiler):
+            yield
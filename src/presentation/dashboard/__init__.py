@@ -0,0 +1,8 @@
+"""Dashboard support."""
+
+from src.presentation.dashboard.chat_stream import AnswerStream
+from src.presentation.dashboard.figures import FigureCache, point_trace
+from src.presentation.dashboard.gold_store import GoldDataStore
+from src.presentation.dashboard.prompt_context import ContextRetriever
+
+__all__ = ["AnswerStream", "ContextRetriever", "FigureCache", "GoldDataStore", "point_trace"]
@@ -0,0 +1,116 @@
+"""Streamed chat answers with cancellation and a time budget."""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the model stream in the chunk queue
+_DONE = object()
+
+
+class AnswerStream:
+    """Stream the answer of a generative model as its chunks arrive.
+
+    The model stream is read in a background thread and handed over through a
+    queue, so the reader can give up at any time: when the answer exceeds its
+    time budget (``TimeoutError``) or when it is cancelled, typically because
+    the user sent a new prompt. The background thread then stops reading and
+    closes the model stream at its next chunk.
+
+    Any model with ``generate_content(prompt, stream=True, request_options=...)``
+    returning an iterable of chunks with a ``text`` attribute can be streamed
+    (the Gemini SDK, or a local fake in tests).
+    """
+
+    def __init__(self, model: Any, prompt: str, timeout: float = 60.0):
+        """Initialize and start streaming.
+
+        Args:
+            model: Generative model
+            prompt: Prompt to answer
+            timeout: Seconds the whole answer may take
+        """
+        self.model = model
+        self.prompt = prompt
+        self.timeout = timeout
+        self.text = ""
+        # Seconds until the first chunk arrived (the latency users notice)
+        self.first_chunk_seconds: Optional[float] = None
+        self._cancelled = threading.Event()
+        self._chunks: "queue.Queue[Any]" = queue.Queue()
+        self._started = time.monotonic()
+        self._reader = threading.Thread(target=self._read, name="answer-stream", daemon=True)
+        self._reader.start()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the stream was cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop streaming (the chunks received so far stay in ``text``)."""
+        self._cancelled.set()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the answer chunk by chunk.
+
+        Yields:
+            Text chunks, in order
+
+        Raises:
+            TimeoutError: If the answer exceeded its time budget
+            Exception: Any error raised by the model
+        """
+        try:
+            while not self.cancelled:
+                remaining = self.timeout - (time.monotonic() - self._started)
+                try:
+                    chunk = self._chunks.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    raise TimeoutError(f"No complete answer after {self.timeout:.0f}s")
+
+                if chunk is _DONE:
+                    return
+                if isinstance(chunk, Exception):
+                    raise chunk
+                if self.first_chunk_seconds is None:
+                    self.first_chunk_seconds = time.monotonic() - self._started
+                self.text += chunk
+                yield chunk
+        finally:
+            # Also reached when the reader stops early (e.g. a Streamlit rerun)
+            self.cancel()
+
+    def _read(self) -> None:
+        """Read the model stream into the queue until it ends or is cancelled."""
+        response = None
+        try:
+            response = self.model.generate_content(
+                self.prompt, stream=True, request_options={"timeout": self.timeout}
+            )
+            for chunk in response:
+                if self.cancelled:
+                    logger.info("Answer stream cancelled")
+                    return
+                text = _text(chunk)
+                if text:
+                    self._chunks.put(text)
+        except Exception as e:
+            self._chunks.put(e)
+        finally:
+            close = getattr(response, "close", None)
+            if self.cancelled and callable(close):
+                close()
+            self._chunks.put(_DONE)
+
+
+def _text(chunk: Any) -> str:
+    """Get the text of a model chunk (empty for chunks without text, e.g. the last one)."""
+    try:
+        return chunk.text or ""
+    except (AttributeError, ValueError):
+        return ""
@@ -0,0 +1,93 @@
+"""Figures built once per chart, filter state and Gold generation."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from src.infrastructure.lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+
+class FigureCache:
+    """Keep the built dashboard figures across reruns and sessions.
+
+    Streamlit reruns the whole page on every interaction, rebuilding every
+    chart although only the ones whose filters changed differ. Figures are
+    looked up by chart id, filter values and Gold generation, so a rerun only
+    builds the charts affected by the change; the least recently used figures
+    are dropped past ``MAX_FIGURES``.
+
+    Cached figures are shared: callers must not modify them.
+    """
+
+    MAX_FIGURES = 128
+
+    def __init__(self, max_figures: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            max_figures: Figures kept (``MAX_FIGURES`` if None)
+        """
+        self.max_figures = max_figures or self.MAX_FIGURES
+        self._figures: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, chart: str, generation: Optional[str], build: Callable[[], Any], **filters: Hashable
+    ) -> Any:
+        """Get a figure, building it if this chart has no figure for these inputs.
+
+        Args:
+            chart: Chart id
+            generation: Gold generation the figure is drawn from
+            build: Builds the figure
+            **filters: Widget values the figure depends on
+
+        Returns:
+            The plotly figure
+        """
+        key = (chart, generation, tuple(sorted(filters.items())))
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return figure
+
+        figure = build()
+        with self._lock:
+            self.misses += 1
+            self._figures[key] = figure
+            while len(self._figures) > self.max_figures:
+                self._figures.popitem(last=False)
+        return figure
+
+    def clear(self) -> None:
+        """Drop every figure (after a new Gold generation was swapped in)."""
+        with self._lock:
+            self._figures.clear()
+
+
+# Point traces above this many points are drawn with WebGL
+WEBGL_POINTS = 1000
+
+
+def point_trace(x: Any, y: Any, **kwargs: Any) -> Any:
+    """Create a scatter trace, drawn with WebGL (``Scattergl``) when it is large.
+
+    SVG scatter traces slow the browser down past a few thousand points, while
+    WebGL ones stay interactive with hundreds of thousands.
+
+    Args:
+        x: Horizontal coordinates
+        y: Vertical coordinates
+        **kwargs: Other ``Scatter`` attributes
+
+    Returns:
+        ``go.Scatter`` or ``go.Scattergl`` trace
+    """
+    trace = go.Scattergl if len(x) > WEBGL_POINTS else go.Scatter
+    return trace(x=x, y=y, **kwargs)
@@ -0,0 +1,114 @@
+"""Gold data shared by the dashboard sessions, reloaded in the background."""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.infrastructure.repositories import DataRepository, LayerSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class GoldDataStore:
+    """Serve the loaded Gold generation and swap in newer ones without a pause.
+
+    The store watches the Gold ``_CURRENT`` pointer (a small file read at most
+    every ``POLL_INTERVAL`` seconds). When the pipeline publishes a new
+    generation, it is loaded in a background thread while readers keep getting
+    the previous one; the loaded data then replaces it in a single assignment
+    and the ``on_swap`` callbacks evict whatever was derived from the old one.
+    Only the very first load, before any generation is in memory, blocks.
+    """
+
+    # Seconds between two reads of the Gold version pointer
+    POLL_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        repository: "DataRepository",
+        loader: Callable[["LayerSnapshot"], Any],
+        on_swap: Iterable[Callable[[], None]] = (),
+    ):
+        """Initialize store.
+
+        Args:
+            repository: Gold layer repository
+            loader: Loads the data served for a pinned Gold snapshot
+            on_swap: Callbacks run after a new generation replaced the old one
+        """
+        self.repository = repository
+        self.loader = loader
+        self.on_swap = list(on_swap)
+        # (generation, data), replaced as a whole so readers never see a mix
+        self._current: Optional[Tuple[Optional[str], Any]] = None
+        self._lock = threading.Lock()
+        self._reload: Optional[threading.Thread] = None
+        self._checked_at = float("-inf")
+
+    @property
+    def generation(self) -> Optional[str]:
+        """Get the Gold generation being served (None before the first load)."""
+        current = self._current
+        return current[0] if current is not None else None
+
+    def get(self) -> Any:
+        """Get the data of the loaded generation, starting a reload if it is stale.
+
+        Returns:
+            Data returned by the loader for the served generation
+        """
+        current = self._current
+        if current is None:
+            with self._lock:
+                if self._current is None:
+                    generation = self.repository.current_generation()
+                    self._current = (generation, self._load(generation))
+                    self._checked_at = time.monotonic()
+            return self._current[1]
+
+        if time.monotonic() - self._checked_at >= self.POLL_INTERVAL:
+            self.check()
+        return current[1]
+
+    def check(self) -> Optional[threading.Thread]:
+        """Start loading the published generation if it is not the served one.
+
+        Returns:
+            The thread loading the new generation (None if nothing changed)
+        """
+        self._checked_at = time.monotonic()
+        generation = self.repository.current_generation()
+        with self._lock:
+            if generation == self.generation:
+                return None
+            if self._reload is not None and self._reload.is_alive():
+                return self._reload
+            self._reload = threading.Thread(
+                target=self._swap, args=(generation,), name="gold-reload", daemon=True
+            )
+            self._reload.start()
+            return self._reload
+
+    def _swap(self, generation: Optional[str]) -> None:
+        """Load a generation and make it the served one."""
+        started = time.perf_counter()
+        try:
+            data = self._load(generation)
+        except Exception as e:
+            # Keep serving the loaded generation; the next check retries
+            logger.warning(f"Failed to load Gold generation {generation}: {e}")
+            return
+
+        self._current = (generation, data)
+        for callback in self.on_swap:
+            callback()
+        logger.info(
+            f"Swapped in Gold generation {generation} "
+            f"(loaded in {time.perf_counter() - started:.2f}s)"
+        )
+
+    def _load(self, generation: Optional[str]) -> Any:
+        """Load the data of a generation through the loader."""
+        return self.loader(self.repository.snapshot(generation))
@@ -0,0 +1,289 @@
+"""Gold rows relevant to a chat question, selected under a token budget.
+
+Instead of sending the same aggregates whatever the question, the chat prompt
+gets the rows of the Gold tables the question is about. Every row of the
+indexed tables is a small document made of its names (director, genres,
+title, ranking) and years; a question is scored against them with BM25, and
+questions about a table as a whole ("which genre...", "over the years...")
+also get its leading rows. The best rows are rendered per table until the
+token budget is spent.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class ContextTable:
+    """How a Gold table is searched and rendered in prompts.
+
+    Attributes:
+        title: Heading of the table section in the prompt
+        search: Columns whose values make the row document
+        columns: Columns rendered in the prompt
+        order: Column ordering the leading rows of the table
+        ascending: Whether leading rows have the lowest ``order`` values
+        aliases: Question words about the table as a whole
+    """
+
+    title: str
+    search: Sequence[str]
+    columns: Sequence[str]
+    order: str
+    ascending: bool = False
+    aliases: Sequence[str] = ()
+
+
+# Tables indexed, keyed by the dashboard data keys
+CONTEXT_TABLES: Dict[str, ContextTable] = {
+    "directors": ContextTable(
+        title="DIRETORES",
+        search=["director"],
+        columns=["director", "movie_count", "total_revenue", "avg_revenue", "avg_rating"],
+        order="total_revenue",
+        aliases="diretor diretores director directors cineasta cineastas".split(),
+    ),
+    "genres": ContextTable(
+        title="GÊNEROS",
+        search=["genre_names"],
+        columns=["genre_names", "movie_count", "avg_budget", "avg_revenue", "avg_rating"],
+        order="movie_count",
+        aliases="genero generos genre genres".split(),
+    ),
+    "yearly": ContextTable(
+        title="POR ANO",
+        search=["release_year"],
+        columns=["release_year", "movie_count", "avg_revenue", "total_revenue", "avg_profit"],
+        order="release_year",
+        aliases=(
+            "ano anos anual decada decadas tendencia tendencias evolucao historico "
+            "year years trend trends"
+        ).split(),
+    ),
+    "top_movies": ContextTable(
+        title="TOP FILMES",
+        search=["title", "release_year", "genre_names", "director", "rank_type"],
+        columns=["rank_type", "rank", "title", "release_year", "revenue", "profit", "vote_average"],
+        order="rank",
+        ascending=True,
+        aliases=(
+            "top ranking melhor melhores maior maiores bilheteria sucesso sucessos "
+            "lucrativo lucrativos best highest"
+        ).split(),
+    ),
+}
+
+# Words too common in questions to select rows
+STOPWORDS = frozenset(
+    "a o as os de da do das dos e em no na nos nas um uma uns umas por para com que qual "
+    "quais quem como onde quando se ao aos mais menos sobre entre foi sao ser tem teve the "
+    "of and in on for to is are was what which who how with by".split()
+)
+
+# Characters per token of the prompt, to estimate its size
+CHARS_PER_TOKEN = 4
+
+_WORD = re.compile(r"[a-z0-9]+")
+# "anos 90", "decada de 1990", "1990s", "90s"
+_DECADE = re.compile(r"\b(?:(?:anos|decada(?: de)?)\s+(\d{2}|\d{4})|(\d{2}|\d{4})s)\b")
+
+
+class ContextRetriever:
+    """BM25 index over the rows of the Gold tables shown to the chat model."""
+
+    # BM25 term frequency saturation and length normalization
+    K1 = 1.2
+    B = 0.75
+    # Leading rows added when a question is about a table as a whole
+    TABLE_ROWS = 10
+    # Matching rows are kept down to this fraction of the best score (a row
+    # matching one word of a two-word name is not about the question)
+    RELATIVE_SCORE = 0.6
+
+    def __init__(self, tables: Dict[str, pd.DataFrame]):
+        """Index the rows of the dashboard tables.
+
+        Args:
+            tables: Dashboard data (tables missing from it are not indexed)
+        """
+        self.tables = {
+            key: tables[key].reset_index(drop=True)
+            for key in CONTEXT_TABLES
+            if key in tables and not tables[key].empty
+        }
+        # Document i is row rows[i] of table keys[i]
+        self._keys: List[str] = []
+        self._rows: List[int] = []
+        postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        lengths = []
+
+        for key, df in self.tables.items():
+            spec = CONTEXT_TABLES[key]
+            columns = [df[column].tolist() for column in spec.search if column in df]
+            for row, values in enumerate(zip(*columns)):
+                terms = [term for value in values for term in _value_terms(value)]
+                doc = len(self._keys)
+                self._keys.append(key)
+                self._rows.append(row)
+                lengths.append(len(terms))
+                for term in terms:
+                    postings[term][doc] = postings[term].get(doc, 0) + 1
+
+        self._lengths = np.asarray(lengths, dtype="float64")
+        self._average_length = self._lengths.mean() if len(lengths) else 0.0
+        self._postings = {
+            term: (np.fromiter(docs, dtype=np.int64), np.fromiter(docs.values(), dtype="float64"))
+            for term, docs in postings.items()
+        }
+
+    def search(self, question: str, limit: int = 50) -> List[Tuple[str, int, float]]:
+        """Find the rows matching a question best.
+
+        Args:
+            question: Chat question
+            limit: Rows returned at most
+
+        Returns:
+            (table key, row position, BM25 score) of the matching rows, best first
+        """
+        scores = np.zeros(len(self._keys))
+        n_docs = len(self._keys)
+        for term in set(question_terms(question)):
+            if term not in self._postings:
+                continue
+            docs, frequencies = self._postings[term]
+            idf = np.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = self.K1 * (1 - self.B + self.B * self._lengths[docs] / self._average_length)
+            scores[docs] += idf * frequencies * (self.K1 + 1) / (frequencies + norm)
+
+        matched = np.flatnonzero(scores)
+        best = matched[np.argsort(-scores[matched], kind="stable")][:limit]
+        return [(self._keys[doc], self._rows[doc], float(scores[doc])) for doc in best]
+
+    def context(self, question: str, max_tokens: int = 1200) -> str:
+        """Render the rows relevant to a question, within a token budget.
+
+        Rows matching the question best come first, then the leading rows of
+        the tables the question is about as a whole (of every table if the
+        question points to none).
+
+        Args:
+            question: Chat question
+            max_tokens: Estimated tokens the context may take
+
+        Returns:
+            Table sections with the selected rows (empty without data)
+        """
+        matches = self.search(question)
+        candidates = [
+            (key, row)
+            for key, row, score in matches
+            if score >= matches[0][2] * self.RELATIVE_SCORE
+        ]
+        words = set(question_terms(question))
+        asked = [key for key in self.tables if words & set(CONTEXT_TABLES[key].aliases)]
+        if not asked and not candidates:
+            asked = list(self.tables)
+        for key in asked:
+            candidates.extend((key, row) for row in self._leading_rows(key))
+
+        selected: Dict[str, List[str]] = defaultdict(list)
+        seen = set()
+        budget = max_tokens * CHARS_PER_TOKEN
+        for key, row in candidates:
+            if (key, row) in seen:
+                continue
+            seen.add((key, row))
+            line = self._render_row(key, row)
+            cost = len(line) + 1
+            if not selected[key]:
+                cost += len(self._header(key)) + 1
+            if cost > budget:
+                continue
+            budget -= cost
+            selected[key].append(line)
+
+        sections = [
+            "\n".join([self._header(key), *selected[key]])
+            for key in self.tables
+            if selected[key]
+        ]
+        return "\n\n".join(sections)
+
+    def _leading_rows(self, key: str) -> List[int]:
+        """Get the positions of the leading rows of a table."""
+        spec = CONTEXT_TABLES[key]
+        df = self.tables[key]
+        if spec.order not in df:
+            return list(range(min(self.TABLE_ROWS, len(df))))
+        order = df[spec.order].sort_values(ascending=spec.ascending, kind="stable")
+        return order.index[: self.TABLE_ROWS].tolist()
+
+    def _header(self, key: str) -> str:
+        """Render the heading and column names of a table section."""
+        spec = CONTEXT_TABLES[key]
+        columns = [column for column in spec.columns if column in self.tables[key]]
+        return f"{spec.title}:\n" + " | ".join(columns)
+
+    def _render_row(self, key: str, row: int) -> str:
+        """Render a row of a table as one line."""
+        spec = CONTEXT_TABLES[key]
+        record = self.tables[key].iloc[row]
+        return " | ".join(
+            _format(record[column]) for column in spec.columns if column in record.index
+        )
+
+
+def question_terms(text: str) -> List[str]:
+    """Split a question into search terms (decades such as "anos 90" become "1990s")."""
+    folded = _fold(text)
+    decades = [_decade(short or full) for short, full in _DECADE.findall(folded)]
+    words = [word for word in _WORD.findall(folded) if word not in STOPWORDS]
+    return words + decades
+
+
+def _value_terms(value: Any) -> List[str]:
+    """Split a searched cell into terms (years also give their decade)."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [term for item in value for term in _value_terms(item)]
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        year = int(value)
+        return [str(year), f"{year // 10 * 10}s"]
+    return [word for word in _WORD.findall(_fold(str(value))) if word not in STOPWORDS]
+
+
+def _decade(digits: str) -> str:
+    """Normalize "90", "1990" or "10" to the decade term ("1990s", "2010s")."""
+    year = int(digits)
+    if len(digits) == 2:
+        year += 1900 if year >= 20 else 2000
+    return f"{year // 10 * 10}s"
+
+
+def _fold(text: str) -> str:
+    """Lowercase text and strip its accents."""
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in normalized if not unicodedata.combining(char))
+
+
+def _format(value: Any) -> str:
+    """Render a cell compactly (amounts in millions)."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return ", ".join(str(item) for item in value)
+    if isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return "-"
+        if abs(value) >= 1e6:
+            return f"{value / 1e6:,.1f}M"
+        if float(value).is_integer():
+            return str(int(value))
+        return f"{value:.2f}"
+    return str(value)
@@ -0,0 +1,112 @@
+"""Unit tests for Bronze change data capture."""
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.domain.exceptions import DataIngestionError
+from src.infrastructure.repositories import BronzeChangeCapture
+
+MOVIES_V1 = """id,title,overview,budget
+1,Alpha,"Two
+lines",100
+2,Beta,Plain,
+3,Gamma,Plain,300
+3,Gamma,Duplicate row,300
+4,Delta,Plain,400
+"""
+
+MOVIES_V2 = """id,title,overview,budget
+1,Alpha,"Two
+lines",100
+2,Beta,Plain,0
+3,Gamma,Plain,300
+5,Epsilon,New,500
+4,Delta,Plain,400
+"""
+
+
+def _write(directory: Path, content: str) -> None:
+    (directory / "movies_metadata.csv").write_text(content, encoding="utf-8")
+
+
+def _changelog(capture: BronzeChangeCapture) -> dict:
+    changes = pq.read_table(capture.changelog_path("movies_metadata.csv")).to_pandas()
+    return dict(zip(changes["id"], changes["change"]))
+
+
+class TestBronzeChangeCapture:
+    """Tests keyed diffs of successive Bronze snapshots."""
+
+    @pytest.fixture
+    def capture(self, tmp_path: Path) -> BronzeChangeCapture:
+        """Create a change capture with one key per spill bucket."""
+        return BronzeChangeCapture(tmp_path, chunk_size=1, spill_dir=tmp_path / "spill")
+
+    def test_first_capture_inserts_every_key(
+        self, tmp_path: Path, capture: BronzeChangeCapture
+    ) -> None:
+        """Test all keys are inserted when there is no previous snapshot."""
+        _write(tmp_path, MOVIES_V1)
+
+        counts = capture.capture("movies_metadata.csv", ["id"])
+
+        assert counts == {"insert": 4, "update": 0, "delete": 0}
+        assert set(_changelog(capture).values()) == {"insert"}
+
+    def test_diff_against_previous_snapshot(
+        self, tmp_path: Path, capture: BronzeChangeCapture
+    ) -> None:
+        """Test inserted, updated and deleted keys, including duplicated keys."""
+        _write(tmp_path, MOVIES_V1)
+        capture.snapshot("movies_metadata.csv", ["id"])
+        _write(tmp_path, MOVIES_V2)
+
+        counts = capture.capture("movies_metadata.csv", ["id"])
+
+        assert counts == {"insert": 1, "update": 2, "delete": 0}
+        assert _changelog(capture) == {"5": "insert", "2": "update", "3": "update"}
+
+    def test_unchanged_content_has_no_changes(
+        self, tmp_path: Path, capture: BronzeChangeCapture
+    ) -> None:
+        """Test reordered rows and different quoting are not changes."""
+        _write(tmp_path, MOVIES_V2)
+        capture.snapshot("movies_metadata.csv", ["id"])
+
+        df = pd.read_csv(tmp_path / "movies_metadata.csv", dtype=str, keep_default_na=False)
+        df.iloc[::-1].to_csv(tmp_path / "movies_metadata.csv", index=False, quoting=1)
+
+        assert capture.capture("movies_metadata.csv", ["id"]) == {
+            "insert": 0,
+            "update": 0,
+            "delete": 0,
+        }
+
+    def test_composite_keys_and_deletes(self, tmp_path: Path) -> None:
+        """Test rows keyed by several columns."""
+        ratings = tmp_path / "ratings.csv"
+        ratings.write_text("userId,movieId,rating\n1,10,4.0\n1,11,3.0\n2,10,5.0\n")
+        capture = BronzeChangeCapture(tmp_path, chunk_size=2)
+        capture.snapshot("ratings.csv", ["userId", "movieId"])
+
+        ratings.write_text("userId,movieId,rating\n1,10,4.0\n2,10,4.5\n")
+        counts = capture.capture("ratings.csv", ["userId", "movieId"])
+
+        changes = pq.read_table(capture.changelog_path("ratings.csv")).to_pandas()
+        assert counts == {"insert": 0, "update": 1, "delete": 1}
+        assert sorted(map(tuple, changes.values.tolist())) == [
+            ("1", "11", "delete"),
+            ("2", "10", "update"),
+        ]
+
+    def test_missing_key_column(self, tmp_path: Path, capture: BronzeChangeCapture) -> None:
+        """Test an unknown key column is reported and keeps the previous snapshot."""
+        _write(tmp_path, MOVIES_V1)
+
+        with pytest.raises(DataIngestionError, match="movie_id"):
+            capture.capture("movies_metadata.csv", ["movie_id"])
+
+        assert not capture.has_snapshot("movies_metadata.csv")
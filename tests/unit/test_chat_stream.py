@@ -0,0 +1,105 @@
+"""Unit tests for streamed chat answers (with a local fake model)."""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator, List, Optional
+
+import pytest
+
+from src.presentation.dashboard import AnswerStream
+
+
+class FakeStreamingModel:
+    """Model streaming canned chunks with a delay between them, offline."""
+
+    def __init__(self, chunks: List[str], delay: float = 0.0, error: Optional[Exception] = None):
+        self.chunks = chunks
+        self.delay = delay
+        self.error = error
+        self.request_options: Optional[dict] = None
+        self.sent = 0
+        self.closed = threading.Event()
+
+    def generate_content(self, prompt: str, stream: bool, request_options: dict) -> "FakeStream":
+        assert stream
+        self.request_options = request_options
+        return FakeStream(self)
+
+
+class FakeStream:
+    """Stream of a fake model response."""
+
+    def __init__(self, model: FakeStreamingModel):
+        self.model = model
+
+    def __iter__(self) -> Iterator[SimpleNamespace]:
+        for chunk in self.model.chunks:
+            time.sleep(self.model.delay)
+            self.model.sent += 1
+            yield SimpleNamespace(text=chunk)
+        if self.model.error is not None:
+            raise self.model.error
+
+    def close(self) -> None:
+        self.model.closed.set()
+
+
+class TestAnswerStream:
+    """Tests streaming, time budget and cancellation."""
+
+    def test_chunks_arrive_in_order(self) -> None:
+        """Test the answer is yielded as the model produces it."""
+        model = FakeStreamingModel(["Os ", "filmes ", "de ", "2015."], delay=0.01)
+        stream = AnswerStream(model, "pergunta", timeout=5)
+
+        chunks = list(stream)
+
+        assert chunks == ["Os ", "filmes ", "de ", "2015."]
+        assert stream.text == "Os filmes de 2015."
+        assert 0 < stream.first_chunk_seconds < 1
+        assert model.request_options == {"timeout": 5}
+
+    def test_first_chunk_before_full_answer(self) -> None:
+        """Test the first chunk is available long before the answer is complete."""
+        model = FakeStreamingModel(["a"] * 20, delay=0.02)
+        stream = AnswerStream(model, "pergunta", timeout=5)
+        started = time.monotonic()
+
+        first = next(iter(stream))
+
+        assert first == "a" and time.monotonic() - started < 0.2
+        assert model.sent < 20
+
+    def test_timeout_keeps_partial_answer(self) -> None:
+        """Test an answer over its time budget stops with what arrived."""
+        model = FakeStreamingModel(["rápido ", "lento"], delay=0.2)
+        stream = AnswerStream(model, "pergunta", timeout=0.3)
+
+        with pytest.raises(TimeoutError):
+            for _ in stream:
+                pass
+
+        assert stream.text == "rápido "
+        assert model.closed.wait(2)
+
+    def test_cancel_closes_model_stream(self) -> None:
+        """Test cancelling (a new prompt) stops reading the model."""
+        model = FakeStreamingModel(["a"] * 50, delay=0.01)
+        stream = AnswerStream(model, "pergunta", timeout=5)
+
+        for _ in stream:
+            stream.cancel()
+
+        assert stream.text == "a"
+        assert model.closed.wait(2)
+        assert model.sent < 50
+
+    def test_model_errors_propagate(self) -> None:
+        """Test a model failure reaches the reader after the streamed chunks."""
+        model = FakeStreamingModel(["parte"], error=RuntimeError("quota"))
+        stream = AnswerStream(model, "pergunta", timeout=5)
+
+        with pytest.raises(RuntimeError, match="quota"):
+            list(stream)
+        assert stream.text == "parte"
@@ -0,0 +1,85 @@
+"""Unit tests for the batch column coercion."""
+
+import pandas as pd
+
+from src.application.transformation.coercion import DATETIME, NUMBER, ColumnCoercer
+
+
+def _raw() -> pd.DataFrame:
+    """Create raw columns as pandas reads them from a dirty CSV."""
+    return pd.DataFrame(
+        {
+            "id": ["12", "1997-08-20", "7", None],
+            "budget": ["100", " 2.5e3", "/ff9qCepilowshEtG2GYWwzt2bs4.jpg", "-4"],
+            "count": ["1", "2", "3", "4"],
+            "runtime": [90.0, None, 120.0, 95.0],
+            "release_date": ["1995-10-30", "18/05/1964", "1", None],
+        },
+        index=[10, 11, 12, 13],
+    )
+
+
+class TestColumnCoercer:
+    """Tests converting raw columns in one pass."""
+
+    def test_matches_pandas(self) -> None:
+        """Test numbers and dates are converted as pandas would."""
+        raw = _raw()
+        coercer = ColumnCoercer(
+            {
+                "id": NUMBER,
+                "budget": NUMBER,
+                "count": NUMBER,
+                "runtime": NUMBER,
+                "release_date": DATETIME,
+            },
+            {"release_date": "%Y-%m-%d"},
+        )
+
+        coerced = coercer.coerce(raw)
+
+        for column in ("id", "budget", "count", "runtime"):
+            pd.testing.assert_series_equal(
+                coerced[column], pd.to_numeric(raw[column], errors="coerce")
+            )
+        pd.testing.assert_series_equal(
+            coerced["release_date"],
+            pd.to_datetime(raw["release_date"], errors="coerce", format="ISO8601"),
+        )
+        assert coerced["count"].dtype == "int64"
+
+    def test_counts_rejected_values(self) -> None:
+        """Test values that could not be converted are counted across chunks."""
+        raw = _raw()
+        coercer = ColumnCoercer({"id": NUMBER, "budget": NUMBER, "release_date": DATETIME})
+
+        for start in range(0, len(raw), 2):
+            coercer.coerce(raw.iloc[start : start + 2])
+
+        assert coercer.rejected == {"id": 1, "budget": 1, "release_date": 2}
+        coercer.reset()
+        assert coercer.rejected == {}
+
+    def test_detected_format_is_kept(self) -> None:
+        """Test the format detected on the first chunk parses the following ones."""
+        coercer = ColumnCoercer({"date": DATETIME})
+
+        first = coercer.coerce(pd.DataFrame({"date": ["30/10/1995", "01/02/2000", None]}))
+        second = coercer.coerce(pd.DataFrame({"date": ["2000-01-31", "12/06/2001"]}))
+
+        assert coercer.formats == {"date": "%d/%m/%Y"}
+        assert first["date"].tolist()[:2] == [
+            pd.Timestamp("1995-10-30"),
+            pd.Timestamp("2000-02-01"),
+        ]
+        assert second["date"].isna().tolist() == [True, False]
+
+    def test_out_of_range_dates_are_rejected(self) -> None:
+        """Test dates pandas cannot store become missing instead of wrapping around."""
+        coercer = ColumnCoercer({"date": DATETIME}, {"date": "%Y-%m-%d"})
+
+        dates = pd.DataFrame({"date": ["1500-01-01", "2000-01-01", "9999-01-01"]})
+        coerced = coercer.coerce(dates)
+
+        assert coerced["date"].isna().tolist() == [True, False, True]
+        assert coercer.rejected == {"date": 2}
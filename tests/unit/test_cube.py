@@ -0,0 +1,180 @@
+"""Unit tests for the analytics cube."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.loading.aggregates import finalize, partial_aggregate
+from src.application.loading.cube import (
+    DIMENSIONS,
+    KEY_COLUMN,
+    AnalyticsCube,
+    add_dimensions,
+    cell_dimensions,
+    cell_key,
+    cube_rows,
+)
+
+MEASURES = {
+    "movie_count": ("id", "count"),
+    "total_revenue": ("revenue", "sum"),
+    "avg_rating": ("vote_average", "mean"),
+}
+
+
+def _country(*codes: str) -> list:
+    """Create production countries as stored in the enriched movies."""
+    return [{"iso_3166_1": code, "name": code} for code in codes]
+
+
+@pytest.fixture
+def movies() -> pd.DataFrame:
+    """Create enriched movies with multi-valued genres and countries."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "release_year": [1994.0, 1995.0, 2001.0, np.nan, 1880.0, 1995.0],
+            "genre_names": [
+                ["Drama", "Comedy"],
+                ["Drama"],
+                ["Action", "Drama", "Drama"],
+                ["Comedy"],
+                [],
+                ["Comedy"],
+            ],
+            "original_language": ["en", "fr", "en", "en", None, "en"],
+            "production_countries": [
+                _country("US", "GB"),
+                _country("FR"),
+                _country("US"),
+                _country(),
+                _country("US"),
+                _country("US"),
+            ],
+            "revenue": [100.0, 50.0, 300.0, 10.0, 5.0, 40.0],
+            "vote_average": [7.0, 6.0, 8.0, np.nan, 5.0, 6.5],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+def _cube(movies: pd.DataFrame) -> pd.DataFrame:
+    """Build the cube table of some movies."""
+    rows = cube_rows(movies, ["id", "revenue", "vote_average"], min_year=1900)
+    return add_dimensions(
+        finalize(partial_aggregate(rows, KEY_COLUMN, MEASURES), KEY_COLUMN, MEASURES)
+    )
+
+
+def _members(movie: pd.Series, time: str) -> dict:
+    """Get the members of a movie on each dimension (with None for all)."""
+    year = movie["release_year"]
+    known_year = not np.isnan(year) and year >= 1900
+    times = {
+        "release_year": [int(year)] if known_year else [],
+        "decade": [int(year) // 10 * 10] if known_year else [],
+        "all": [None],
+    }
+    countries = {country["iso_3166_1"] for country in movie["production_countries"]}
+    language = movie["original_language"]
+    return {
+        "time": times[time],
+        "genre": [*set(movie["genre_names"]), None],
+        "original_language": [*([language] if language else []), None],
+        "production_country": [*countries, None],
+    }
+
+
+class TestCubeRows:
+    """Tests the cube cells hold the movies of their slice."""
+
+    def test_every_roll_up_level_matches_a_direct_filter(self, movies: pd.DataFrame) -> None:
+        """Test each cell aggregates the movies of its slice, each movie once."""
+        cube = AnalyticsCube(_cube(movies))
+
+        expected = {}
+        for time in ("release_year", "decade", "all"):
+            for _, movie in movies.iterrows():
+                members = _members(movie, time)
+                for time_member, *others in itertools.product(*members.values()):
+                    cell = dict(zip(DIMENSIONS, others))
+                    if time != "all":
+                        cell[time] = time_member
+                    expected.setdefault(cell_key(**cell), []).append(movie)
+
+        assert len(cube.cells) == len(expected)
+        for key, members in expected.items():
+            cell = cube.cells.loc[key]
+            assert cell["movie_count"] == len(members)
+            assert cell["total_revenue"] == sum(movie["revenue"] for movie in members)
+
+    def test_lists_count_once_in_rolled_up_cells(self, movies: pd.DataFrame) -> None:
+        """Test a movie with several genres or countries counts once in their roll-ups."""
+        cube = AnalyticsCube(_cube(movies))
+
+        assert cube.cell()["movie_count"] == 6
+        assert cube.cell(decade=1990)["movie_count"] == 3
+        assert cube.cell(genre="Drama")["movie_count"] == 3
+        assert cube.cell(production_country="US", original_language="en")["movie_count"] == 3
+        assert cube.cell(release_year=1994, production_country="GB")["total_revenue"] == 100
+        # Unknown and pre-1900 years only count among all years
+        assert cube.members["release_year"] == [1994, 1995, 2001]
+
+
+class TestAnalyticsCube:
+    """Tests looking up slices."""
+
+    def test_cell(self, movies: pd.DataFrame) -> None:
+        """Test a slice is found by its members, with its dimensions."""
+        cube = AnalyticsCube(_cube(movies))
+
+        cell = cube.cell(decade=1990, genre="Drama", original_language="en")
+
+        assert cell["movie_count"] == 1 and cell["avg_rating"] == 7.0
+        assert cell["decade"] == 1990 and pd.isna(cell["release_year"])
+        assert cell["genre"] == "Drama" and cell["production_country"] is None
+        assert cube.cell(genre="Western") is None
+
+    def test_breakdown(self, movies: pd.DataFrame) -> None:
+        """Test a dimension is broken down within a slice, in member order."""
+        cube = AnalyticsCube(_cube(movies))
+
+        by_year = cube.breakdown("release_year", genre="Comedy")
+        by_genre = cube.breakdown("genre", production_country="US")
+
+        assert by_year["release_year"].tolist() == [1994, 1995]
+        assert by_year["movie_count"].tolist() == [1, 1]
+        assert by_genre["genre"].tolist() == ["Action", "Comedy", "Drama"]
+        assert by_genre["movie_count"].tolist() == [1, 2, 2]
+
+    def test_invalid_slices(self, movies: pd.DataFrame) -> None:
+        """Test slices mixing time levels or unknown dimensions are rejected."""
+        cube = AnalyticsCube(_cube(movies))
+
+        with pytest.raises(ValueError):
+            cube.cell(release_year=1995, decade=1990)
+        with pytest.raises(ValueError):
+            cube.cell(director="Nolan")
+        with pytest.raises(ValueError):
+            cube.breakdown("release_year", decade=1990)
+
+
+def test_cell_key_round_trip() -> None:
+    """Test cell keys decode into the members they were built from."""
+    keys = pd.Series(
+        [
+            cell_key(release_year=1995, genre="Drama", production_country="US"),
+            cell_key(decade=1987, original_language="fr"),
+            cell_key(),
+        ]
+    )
+
+    dimensions = cell_dimensions(keys)
+
+    assert keys.tolist() == ["1995|Drama|*|US", "1980s|*|fr|*", "*|*|*|*"]
+    assert dimensions["release_year"].tolist() == [1995, pd.NA, pd.NA]
+    assert dimensions["decade"].tolist() == [1990, 1980, pd.NA]
+    assert dimensions["genre"].tolist() == ["Drama", None, None]
+    assert dimensions["original_language"].tolist() == [None, "fr", None]
@@ -0,0 +1,229 @@
+"""Unit tests for the data repository."""
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.domain.exceptions import DataLoadingError
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository, get_parquet_profile
+
+
+@pytest.fixture
+def movies_df() -> pd.DataFrame:
+    """Small movies table."""
+    return pd.DataFrame(
+        {
+            "id": [30, 10, 20, 40],
+            "title": ["C", "A", "B", "D"],
+            "release_year": [2001.0, 1999.0, None, 1995.0],
+            "revenue": [3.0, 1.0, 2.0, 4.0],
+        }
+    )
+
+
+class TestParquetProfiles:
+    """Tests for Parquet write profiles."""
+
+    def test_default_profile_uses_snappy(self, tmp_path: Path, movies_df: pd.DataFrame) -> None:
+        """Test the default profile keeps the historical snappy output."""
+        repo = DataRepository(tmp_path)
+        filepath = repo.save_parquet(movies_df, "movies")
+
+        column = pq.ParquetFile(filepath).metadata.row_group(0).column(0)
+        assert column.compression == "SNAPPY"
+        pd.testing.assert_frame_equal(repo.read_parquet("movies"), movies_df)
+
+    def test_archive_profile_uses_zstd(self, tmp_path: Path, movies_df: pd.DataFrame) -> None:
+        """Test archive profile compression."""
+        filepath = DataRepository(tmp_path).save_parquet(movies_df, "movies", profile="archive")
+
+        column = pq.ParquetFile(filepath).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+
+    def test_scan_profile_sorts_by_release_year(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test scan profile clusters rows by year with nulls last."""
+        repo = DataRepository(tmp_path)
+        repo.save_parquet(movies_df, "movies", profile="scan")
+
+        assert repo.read_parquet("movies")["id"].tolist() == [40, 10, 30, 20]
+
+    def test_lookup_profile_row_groups_and_page_index(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test lookup profile writes small sorted row groups with a page index."""
+        df = pd.concat([movies_df] * 6000, ignore_index=True)
+        filepath = DataRepository(tmp_path).save_parquet(df, "movies", profile="lookup")
+
+        metadata = pq.ParquetFile(filepath).metadata
+        assert metadata.num_row_groups == 3
+        assert metadata.row_group(0).column(0).has_offset_index
+        assert pq.read_table(filepath, columns=["id"])["id"].to_pylist()[:2] == [10, 10]
+
+    @pytest.mark.parametrize("profile", ["scan", "lookup"])
+    def test_sorted_profiles_do_not_store_the_index(
+        self, tmp_path: Path, movies_df: pd.DataFrame, profile: str
+    ) -> None:
+        """Test sorted profiles write only the table columns, read back with a range index."""
+        repo = DataRepository(tmp_path)
+        filepath = repo.save_parquet(movies_df, "movies", profile=profile)
+
+        assert pq.ParquetFile(filepath).schema_arrow.names == list(movies_df.columns)
+        result = repo.read_parquet("movies")
+        assert list(result.columns) == list(movies_df.columns)
+        assert isinstance(result.index, pd.RangeIndex)
+
+    def test_unknown_profile_raises(self, tmp_path: Path, movies_df: pd.DataFrame) -> None:
+        """Test unknown profile names are rejected."""
+        with pytest.raises(DataLoadingError, match="Unknown Parquet profile"):
+            DataRepository(tmp_path).save_parquet(movies_df, "movies", profile="nope")
+
+    def test_profile_missing_sort_column_is_ignored(self, tmp_path: Path) -> None:
+        """Test profiles can be used on tables without their sort column."""
+        df = pd.DataFrame({"genre_names": ["Drama", "Action"]})
+        profile = get_parquet_profile("scan")
+
+        pd.testing.assert_frame_equal(profile.prepare(df), df)
+
+    def test_settings_override_per_table(self) -> None:
+        """Test per-table profile overrides from settings."""
+        settings = Settings(parquet_profiles={"movies_enriched": "scan"})
+
+        assert settings.parquet_profile_for("movies_enriched") == "scan"
+        assert settings.parquet_profile_for("ratings", "archive") == "archive"
+
+
+class TestGenerations:
+    """Tests for atomic writes and generation snapshots."""
+
+    def test_save_leaves_no_temporary_files(self, tmp_path: Path, movies_df: pd.DataFrame) -> None:
+        """Test atomic writes rename the temporary file into place."""
+        repo = DataRepository(tmp_path)
+        repo.save_parquet(movies_df, "movies")
+        repo.save_csv(movies_df, "movies")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["movies.csv", "movies.parquet"]
+
+    def test_generation_is_invisible_until_published(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test readers keep seeing the previous generation while one is open."""
+        repo = DataRepository(tmp_path)
+        with repo.generation():
+            repo.save_parquet(movies_df, "movies")
+
+        reader = DataRepository(tmp_path)
+        with repo.generation() as generation:
+            repo.save_parquet(movies_df.head(1), "movies")
+            assert len(reader.read_parquet("movies")) == 4
+            assert len(repo.read_parquet("movies")) == 1
+
+        assert reader.current_generation() == generation
+        assert len(reader.read_parquet("movies")) == 1
+
+    def test_snapshot_is_pinned_across_tables(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test a snapshot keeps resolving the generation it was opened on."""
+        repo = DataRepository(tmp_path)
+        with repo.generation():
+            repo.save_parquet(movies_df, "movies")
+            repo.save_parquet(movies_df, "top_movies")
+
+        snapshot = repo.snapshot()
+        with repo.generation():
+            repo.save_parquet(movies_df.head(2), "movies")
+            repo.save_parquet(movies_df.head(2), "top_movies")
+
+        assert len(snapshot.read_parquet("movies")) == 4
+        assert len(snapshot.read_parquet("top_movies.parquet")) == 4
+        assert len(repo.snapshot().read_parquet("movies")) == 2
+
+    def test_failed_generation_is_discarded(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test an exception inside the block publishes nothing."""
+        repo = DataRepository(tmp_path)
+        with repo.generation() as first:
+            repo.save_parquet(movies_df, "movies")
+
+        with pytest.raises(RuntimeError):
+            with repo.generation() as second:
+                repo.save_parquet(movies_df.head(1), "movies")
+                raise RuntimeError("stage failed")
+
+        assert repo.current_generation() == first
+        assert not (tmp_path / DataRepository.GENERATIONS_DIR / second).exists()
+        assert len(repo.read_parquet("movies")) == 4
+
+    def test_unchanged_tables_are_carried_over_and_pruned_safely(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test tables not rewritten survive pruning of their generation."""
+        repo = DataRepository(tmp_path, keep_generations=2)
+        with repo.generation():
+            repo.save_parquet(movies_df, "ratings")
+            repo.save_parquet(movies_df, "movies")
+
+        for _ in range(3):
+            with repo.generation():
+                repo.save_parquet(movies_df.head(1), "movies")
+
+        manifests = list((tmp_path / DataRepository.MANIFESTS_DIR).glob("*.json"))
+        assert len(manifests) == 2
+        assert len(repo.read_parquet("ratings")) == 4
+        assert len(list((tmp_path / DataRepository.OBJECTS_DIR).rglob("*.parquet"))) == 2
+        assert not any((tmp_path / DataRepository.GENERATIONS_DIR).iterdir())
+
+    def test_identical_tables_are_stored_once(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test rewriting a table with the same content reuses its object."""
+        repo = DataRepository(tmp_path)
+        for _ in range(2):
+            with repo.generation():
+                repo.save_parquet(movies_df, "movies")
+                repo.save_parquet(movies_df.head(2), "top_movies")
+
+        first, second = repo.generations()
+        assert first["tables"] == second["tables"]
+        assert len(list((tmp_path / DataRepository.OBJECTS_DIR).rglob("*.parquet"))) == 2
+
+    def test_rollback_switches_pointer(self, tmp_path: Path, movies_df: pd.DataFrame) -> None:
+        """Test rolling back restores the previous generation and keeps the newer one."""
+        repo = DataRepository(tmp_path)
+        with repo.generation() as good:
+            repo.save_parquet(movies_df, "movies")
+        with repo.generation() as bad:
+            repo.save_parquet(movies_df.head(1), "movies")
+
+        assert repo.rollback() == good
+        assert repo.current_generation() == good
+        assert len(repo.read_parquet("movies")) == 4
+        assert len(repo.snapshot(bad).read_parquet("movies")) == 1
+
+        with pytest.raises(DataLoadingError, match="no parent"):
+            repo.rollback()
+
+    def test_retention_collects_old_generations(
+        self, tmp_path: Path, movies_df: pd.DataFrame
+    ) -> None:
+        """Test pruning keeps the newest generations, recent ones and their objects."""
+        repo = DataRepository(tmp_path, keep_generations=0)
+        for rows in (1, 2, 3):
+            with repo.generation():
+                repo.save_parquet(movies_df.head(rows), "movies")
+
+        assert [g["generation"] for g in repo.generations()] == [repo.current_generation()]
+        assert len(list((tmp_path / DataRepository.OBJECTS_DIR).rglob("*.parquet"))) == 1
+        assert len(repo.read_parquet("movies")) == 3
+
+        recent = DataRepository(tmp_path, keep_generations=1, retention_days=1)
+        with recent.generation():
+            recent.save_parquet(movies_df, "movies")
+        assert len(recent.generations()) == 2
+        assert len(list((tmp_path / DataRepository.OBJECTS_DIR).rglob("*.parquet"))) == 2
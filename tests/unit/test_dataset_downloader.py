@@ -0,0 +1,205 @@
+"""Unit tests for concurrent, resumable dataset downloads."""
+
+import io
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+
+from src.application.ingestion import IngestMoviesUseCase
+from src.domain.exceptions import DataIngestionError
+from src.infrastructure.config import Settings
+from src.infrastructure.external import DatasetDownloader
+
+
+def _zip(files: Dict[str, str]) -> bytes:
+    """Build a zip archive in memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local stand-in for the Kaggle download API.
+
+    Serves ``files`` (path -> bytes) with ``Range``/``If-Range`` support.
+    ``failures`` queues faults per path: an HTTP status to answer with, or
+    ``"cut"`` to drop the connection halfway through the body.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files: Dict[str, bytes] = {}
+        self.etags: Dict[str, str] = {}
+        self.failures: Dict[str, List] = {}
+        self.requests: List[Dict[str, str]] = []
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandInServer
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        server = self.server
+        server.requests.append({"path": self.path, **self.headers})
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+
+        failures = server.failures.get(self.path, [])
+        fault = failures.pop(0) if failures else None
+        if isinstance(fault, int):
+            self.send_error(fault)
+            return
+
+        etag = server.etags.get(self.path, '"v1"')
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            start = int(range_header.split("=")[1].split("-")[0])
+
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body) - start))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+
+        if fault == "cut":
+            self.wfile.write(body[start : start + (len(body) - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[StandInServer]:
+    """Run the stand-in server in a background thread."""
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _downloader(server: StandInServer, tmp_path: Path, **kwargs: object) -> DatasetDownloader:
+    return DatasetDownloader(
+        tmp_path / "downloads", kaggle_api_url=server.url, backoff_seconds=0.01, **kwargs
+    )
+
+
+class TestDatasetDownloader:
+    """Tests downloads against the stand-in server."""
+
+    def test_downloads_sources_concurrently(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test Kaggle ids and URLs are downloaded, in source order."""
+        server.files["/datasets/download/owner/movies"] = b"movies" * 1000
+        server.files["/files/ratings.csv"] = b"userId,movieId\n1,2\n"
+
+        reports = _downloader(server, tmp_path, max_concurrency=2).download_all(
+            ["owner/movies", f"{server.url}/files/ratings.csv"]
+        )
+
+        assert [report.path.name for report in reports] == ["owner__movies.zip", "ratings.csv"]
+        assert reports[0].path.read_bytes() == b"movies" * 1000
+        assert reports[1].bytes == len(b"userId,movieId\n1,2\n")
+        assert not list((tmp_path / "downloads").glob("*.part*"))
+
+    def test_interrupted_transfer_resumes(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test a dropped connection is retried from the bytes already received."""
+        body = bytes(range(256)) * 4096
+        server.files["/datasets/download/owner/big"] = body
+        server.failures["/datasets/download/owner/big"] = ["cut"]
+
+        report = _downloader(server, tmp_path).download("owner/big")
+
+        assert report.path.read_bytes() == body
+        assert report.attempts == 2 and report.bytes == len(body)
+        retry = server.requests[-1]
+        assert retry["Range"] == f"bytes={len(body) // 2}-" and retry["If-Range"] == '"v1"'
+
+    def test_changed_file_restarts(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test a part of an older version of the file is not spliced with the new one."""
+        path = "/datasets/download/owner/changing"
+        server.files[path] = b"a" * 256 * 1024
+        server.failures[path] = ["cut"]
+        downloader = _downloader(server, tmp_path, retries=0)
+        with pytest.raises(DataIngestionError):
+            downloader.download("owner/changing")
+
+        server.files[path], server.etags[path] = b"b" * 1000, '"v2"'
+        report = downloader.download("owner/changing")
+
+        assert report.resumed_from == 128 * 1024
+        assert report.path.read_bytes() == b"b" * 1000
+
+    def test_retries_transient_errors(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test throttling and server errors are retried with backoff."""
+        server.files["/datasets/download/owner/flaky"] = b"data"
+        server.failures["/datasets/download/owner/flaky"] = [429, 503]
+
+        report = _downloader(server, tmp_path).download("owner/flaky")
+
+        assert report.attempts == 3 and report.path.read_bytes() == b"data"
+
+    def test_client_errors_are_not_retried(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test a missing dataset fails on the first attempt."""
+        with pytest.raises(DataIngestionError, match="HTTP 404"):
+            _downloader(server, tmp_path).download_all(["owner/missing"])
+
+        assert len(server.requests) == 1
+
+    def test_sources_sharing_a_file(self, tmp_path: Path) -> None:
+        """Test sources downloaded to the same file are refused before downloading."""
+        downloader = DatasetDownloader(tmp_path)
+
+        with pytest.raises(DataIngestionError, match="share a download file"):
+            downloader.download_all(["http://a/data.zip", "http://b/data.zip"])
+
+
+class TestMultiSourceIngestion:
+    """Tests ingestion of several sources into Bronze."""
+
+    def test_sources_are_unpacked_into_bronze(self, server: StandInServer, tmp_path: Path) -> None:
+        """Test archives are extracted, changelogs written and duplicates refused."""
+        server.files["/datasets/download/owner/movies"] = _zip(
+            {"movies_metadata.csv": "id,title\n1,Alpha\n", "README.txt": "notes"}
+        )
+        server.files["/datasets/download/owner/ratings"] = _zip(
+            {"ratings_small.csv": "userId,movieId,rating,timestamp\n1,1,4.0,0\n"}
+        )
+        settings = Settings(
+            data_dir=tmp_path,
+            kaggle_api_url=server.url,
+            ingestion_sources=["owner/movies", "owner/ratings"],
+        )
+
+        IngestMoviesUseCase(settings).execute()
+
+        bronze = settings.bronze_dir
+        assert (bronze / "movies_metadata.csv").read_text() == "id,title\n1,Alpha\n"
+        assert (bronze / "ratings_small.csv").exists() and (bronze / "README.txt").exists()
+        assert (bronze / "_changes" / "ratings_small.parquet").exists()
+        assert not list((bronze / IngestMoviesUseCase.DOWNLOADS_DIR).iterdir())
+
+        server.files["/datasets/download/other/movies"] = server.files[
+            "/datasets/download/owner/movies"
+        ]
+        settings.ingestion_sources = ["owner/movies", "other/movies"]
+        with pytest.raises(DataIngestionError, match="both provide"):
+            IngestMoviesUseCase(settings).execute()
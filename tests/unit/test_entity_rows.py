@@ -0,0 +1,85 @@
+"""Unit tests for row views of the domain entities."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.domain.entities import EntityRows, Movie, MovieRatingRow, MovieRow
+
+
+@pytest.fixture
+def movies() -> pd.DataFrame:
+    """Create Silver-like movies."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "title": ["Alpha", "Beta", "Gamma"],
+            "budget": [100.0, 0.0, 50.0],
+            "revenue": [250.0, 10.0, 0.0],
+            "runtime": [90.0, np.nan, 120.0],
+            "release_date": pd.to_datetime(["2000-01-01", None, "2010-05-06"]),
+            "extra": ["x", "y", "z"],
+        }
+    )
+
+
+class TestEntityRows:
+    """Tests row views over columnar data."""
+
+    def test_row_matches_entity(self, movies: pd.DataFrame) -> None:
+        """Test fields and financial properties match the pydantic entity."""
+        rows = EntityRows.from_table(MovieRow, movies)
+
+        for index in range(len(rows)):
+            row, entity = rows[index], rows[index].to_entity()
+            assert isinstance(entity, Movie) and entity.id == row.id
+            assert (row.profit, row.roi, row.has_financial_data) == (
+                entity.profit,
+                entity.roi,
+                entity.has_financial_data,
+            )
+
+        assert rows[1].runtime is None and rows[1].release_date is None
+        assert rows[-1].title == "Gamma" and isinstance(rows[0].id, int)
+
+    def test_rows_are_slotted(self, movies: pd.DataFrame) -> None:
+        """Test views have no per-instance dictionary."""
+        row = EntityRows.from_table(MovieRow, movies)[0]
+
+        assert not hasattr(row, "__dict__")
+        with pytest.raises(AttributeError):
+            row.title = "Changed"
+
+    def test_iteration_gives_independent_views(self) -> None:
+        """Test iterated rows can be kept, compared and sorted like any sequence."""
+        movies = pd.DataFrame(
+            {"id": [1, 2, 3], "budget": [10.0, 100.0, 5.0], "revenue": [20.0, 500.0, 6.0]}
+        )
+        rows = EntityRows.from_table(MovieRow, movies)
+
+        best = max(rows, key=lambda row: row.profit)
+        ranked = sorted(rows, key=lambda row: row.profit)
+
+        assert (best.id, best.profit) == (2, 400.0)
+        assert [row.id for row in ranked] == [3, 1, 2]
+        assert [row.id for row in list(rows)] == [1, 2, 3]
+
+    def test_cursor_reuses_one_view(self) -> None:
+        """Test the cursor moves a single view, while indexing gives stable ones."""
+        ratings = pa.table(
+            {"userId": [1, 1, 2], "movieId": [10, 11, 10], "rating": [4.0, 3.5, 5.0]}
+        )
+        rows = EntityRows.from_table(MovieRatingRow, ratings)
+
+        views = list(rows.iter_cursor())
+        kept = rows[0:2]
+
+        assert len({id(view) for view in views}) == 1
+        assert [view.movie_id for view in kept] == [10, 11]
+        assert sum(row.rating for row in rows.iter_cursor()) == 12.5
+
+    def test_index_out_of_range(self, movies: pd.DataFrame) -> None:
+        """Test indexing past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            EntityRows.from_table(MovieRow, movies)[3]
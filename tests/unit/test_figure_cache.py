@@ -0,0 +1,73 @@
+"""Unit tests for the dashboard figure cache."""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from src.presentation.dashboard import FigureCache, point_trace
+
+
+def _builder(calls: list, name: str):
+    """Create a figure builder recording its calls."""
+
+    def build() -> go.Figure:
+        calls.append(name)
+        return go.Figure(layout={"title": name})
+
+    return build
+
+
+class TestFigureCache:
+    """Tests reusing figures across reruns."""
+
+    def test_unchanged_inputs_reuse_figure(self) -> None:
+        """Test a figure is only rebuilt when its filters or generation change."""
+        cache = FigureCache()
+        calls: list = []
+
+        first = cache.get("top_movies", "g1", _builder(calls, "a"), rank_type="revenue", top_n=20)
+        again = cache.get("top_movies", "g1", _builder(calls, "b"), top_n=20, rank_type="revenue")
+        cache.get("top_movies", "g1", _builder(calls, "c"), rank_type="profit", top_n=20)
+        cache.get("top_movies", "g2", _builder(calls, "d"), rank_type="revenue", top_n=20)
+        cache.get("ratings", "g1", _builder(calls, "e"))
+
+        assert again is first
+        assert calls == ["a", "c", "d", "e"]
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    def test_least_recently_used_are_dropped(self) -> None:
+        """Test the cache keeps its most recently used figures."""
+        cache = FigureCache(max_figures=2)
+        calls: list = []
+
+        cache.get("a", None, _builder(calls, "a"))
+        cache.get("b", None, _builder(calls, "b"))
+        cache.get("a", None, _builder(calls, "a"))
+        cache.get("c", None, _builder(calls, "c"))
+        cache.get("a", None, _builder(calls, "a"))
+        cache.get("b", None, _builder(calls, "b"))
+
+        assert calls == ["a", "b", "c", "b"]
+
+    def test_clear(self) -> None:
+        """Test clearing the cache rebuilds every figure."""
+        cache = FigureCache()
+        calls: list = []
+
+        cache.get("a", "g1", _builder(calls, "a"))
+        cache.clear()
+        cache.get("a", "g1", _builder(calls, "a"))
+
+        assert calls == ["a", "a"]
+
+
+class TestPointTrace:
+    """Tests choosing the scatter renderer."""
+
+    def test_large_traces_use_webgl(self) -> None:
+        """Test only traces with many points are drawn with WebGL."""
+        small = point_trace(x=np.arange(10), y=np.arange(10), mode="markers")
+        large = point_trace(x=np.arange(5000), y=np.arange(5000), mode="markers")
+
+        assert isinstance(small, go.Scatter)
+        assert isinstance(large, go.Scattergl)
+        assert large.mode == "markers"
@@ -0,0 +1,84 @@
+"""Unit tests for the dashboard Gold data store."""
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository, LayerSnapshot
+from src.presentation.dashboard import GoldDataStore
+
+
+def _publish(repository: DataRepository, value: int) -> str:
+    """Publish a Gold generation holding one value."""
+    with repository.generation():
+        repository.save_parquet(pd.DataFrame({"value": [value]}), "table")
+    return repository.current_generation()
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> DataRepository:
+    """Create a Gold layer with one generation."""
+    repository = DataRepository.for_layer(Settings(data_dir=tmp_path), "gold")
+    _publish(repository, 1)
+    return repository
+
+
+def _value(snapshot: LayerSnapshot) -> int:
+    """Read the value of a generation."""
+    return int(snapshot.read_parquet("table")["value"].iloc[0])
+
+
+class TestGoldDataStore:
+    """Tests serving Gold generations and swapping in new ones."""
+
+    def test_first_load_blocks(self, repository: DataRepository) -> None:
+        """Test the first read loads the current generation."""
+        store = GoldDataStore(repository, _value)
+
+        assert store.generation is None
+        assert store.get() == 1
+        assert store.generation == repository.current_generation()
+        assert store.check() is None
+
+    def test_new_generation_loads_in_background(self, repository: DataRepository) -> None:
+        """Test readers keep the old generation until the new one is loaded."""
+        release = threading.Event()
+        swaps = []
+
+        def loader(snapshot: LayerSnapshot) -> int:
+            if _value(snapshot) == 2:
+                release.wait(5)
+            return _value(snapshot)
+
+        store = GoldDataStore(repository, loader, on_swap=[lambda: swaps.append(store.get())])
+        store.POLL_INTERVAL = 0
+        store.get()
+        generation = _publish(repository, 2)
+
+        reload = store.check()
+        assert store.get() == 1 and reload.is_alive()
+        assert store.check() is reload
+
+        release.set()
+        reload.join(5)
+        assert store.get() == 2 and store.generation == generation
+        assert swaps == [2]
+
+    def test_failed_load_keeps_serving(
+        self, repository: DataRepository, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a generation that fails to load is retried on the next check."""
+        store = GoldDataStore(repository, _value)
+        store.get()
+        _publish(repository, 3)
+
+        monkeypatch.setattr(store, "loader", lambda snapshot: 1 / 0)
+        store.check().join(5)
+        assert store.get() == 1
+
+        monkeypatch.setattr(store, "loader", _value)
+        store.check().join(5)
+        assert store.get() == 3
@@ -0,0 +1,90 @@
+"""Unit tests for the import-time cost of the entry points."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from src.infrastructure.lazy_imports import lazy_import
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Modules only the stages themselves may load
+HEAVY_MODULES = ("pandas", "pyarrow", "numpy", "polars", "plotly")
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Run an import in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    """Tests the pipeline entry point defers the stage dependencies."""
+
+    def test_main_loads_no_stage_dependencies(self) -> None:
+        """Test importing src.main does not import any data library."""
+        times = _import_times("import src.main")
+
+        assert "src.main" in times
+        assert [module for module in HEAVY_MODULES if module in times] == []
+
+    def test_main_within_budget(self) -> None:
+        """Test src.main imports faster than pandas alone (machine-independent budget)."""
+        main = _import_times("import src.main")["src.main"]
+        pandas = _import_times("import pandas")["pandas"]
+
+        assert main < pandas
+
+    def test_single_stage_loads_only_its_dependencies(self) -> None:
+        """Test the loading stage does not pull in ingestion or optional engines."""
+        times = _import_times("import src.application.loading")
+
+        assert "polars" not in times
+        assert "src.application.ingestion" not in times
+
+
+class TestLazyImport:
+    """Tests deferred module imports."""
+
+    def test_module_runs_on_first_attribute(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the module body only runs when an attribute is read."""
+        (tmp_path / "lazy_probe.py").write_text(
+            "import os\nos.environ['LAZY_PROBE'] = 'imported'\nVALUE = 42\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setenv("LAZY_PROBE", "pending")
+        monkeypatch.delitem(sys.modules, "lazy_probe", raising=False)
+
+        module = lazy_import("lazy_probe")
+        assert os.environ["LAZY_PROBE"] == "pending"
+
+        assert module.VALUE == 42
+        assert os.environ["LAZY_PROBE"] == "imported"
+        monkeypatch.delitem(sys.modules, "lazy_probe")
+
+    def test_missing_module(self) -> None:
+        """Test a missing module fails at binding time, not on first use."""
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import("no_such_module_for_lazy_import")
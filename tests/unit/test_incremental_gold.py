@@ -0,0 +1,244 @@
+"""Unit tests for incremental Gold refreshes."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from benchmarks.synthetic_dataset import generate_dataset
+from src.application.loading import LoadAnalyticsUseCase
+from src.application.loading.aggregates import (
+    combine_partials,
+    finalize,
+    partial_aggregate,
+    subtract_partials,
+)
+from src.application.transformation import TransformMoviesUseCase
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository, hash_rows, sum_by_key
+
+GOLD_TABLES = [
+    "yearly_analytics",
+    "genre_analytics",
+    "top_movies",
+    "leaderboards",
+    "director_analytics",
+    "cube_analytics",
+    "movies_enriched",
+    "yearly_partials",
+    "genre_partials",
+    "director_partials",
+    "cube_partials",
+    "yearly_sketches",
+    "director_sketches",
+    "rater_sketches",
+]
+
+
+def _edit_bronze(raw_dir: Path) -> None:
+    """Change, remove and add a few movies and change one director."""
+    movies_path = raw_dir / "movies_metadata.csv"
+    movies = pd.read_csv(movies_path, dtype=str, keep_default_na=False)
+    movies.loc[0:4, "budget"] = "12345678"
+    movies.loc[0:4, "revenue"] = "98765432"
+    movies.loc[6, "genres"] = "[{'id': 18, 'name': 'Drama'}]"
+    added = movies.loc[[7]].assign(id=str(movies["id"].astype(int).max() + 1))
+    added["release_date"] = "1999-05-01"
+    pd.concat([movies.drop(index=5), added]).to_csv(movies_path, index=False)
+
+    credits_path = raw_dir / "credits.csv"
+    credits = pd.read_csv(credits_path, dtype=str, keep_default_na=False)
+    director = "[{'job': 'Director', 'name': 'Incremental Director'}]"
+    credits.loc[credits["id"] == movies.loc[8, "id"], "crew"] = director
+    credits.to_csv(credits_path, index=False)
+
+
+@pytest.fixture(scope="module")
+def refreshes(tmp_path_factory: pytest.TempPathFactory) -> tuple:
+    """Refresh Gold incrementally after a Bronze edit, and rebuild it in full."""
+    root = tmp_path_factory.mktemp("incremental")
+    generate_dataset(root / "incremental" / "raw", scale="0.01", seed=5)
+
+    incremental = Settings(data_dir=root / "incremental")
+    TransformMoviesUseCase(incremental).execute()
+    LoadAnalyticsUseCase(incremental).execute()
+
+    _edit_bronze(root / "incremental" / "raw")
+    shutil.copytree(root / "incremental" / "raw", root / "full" / "raw")
+
+    full = Settings(data_dir=root / "full", gold_refresh="full")
+    for settings in (incremental, full):
+        TransformMoviesUseCase(settings).execute()
+        LoadAnalyticsUseCase(settings).execute()
+
+    return incremental, full
+
+
+class TestIncrementalRefresh:
+    """Tests incremental refreshes match a full rebuild."""
+
+    @pytest.mark.parametrize("table", GOLD_TABLES)
+    def test_gold(self, refreshes: tuple, table: str) -> None:
+        """Test Gold tables are identical after both refreshes."""
+        incremental, full = refreshes
+
+        pd.testing.assert_frame_equal(
+            DataRepository.for_layer(full, "gold").read_parquet(table).reset_index(drop=True),
+            DataRepository.for_layer(incremental, "gold")
+            .read_parquet(table)
+            .reset_index(drop=True),
+            rtol=1e-9,
+        )
+
+    def test_similarity_index(self, refreshes: tuple) -> None:
+        """Test the updated similarity index scores movies as the rebuilt one."""
+        indexes = [
+            LoadAnalyticsUseCase(settings)._read_similarity(
+                DataRepository.for_layer(settings, "gold").snapshot()
+            )
+            for settings in refreshes
+        ]
+
+        assert sorted(indexes[0].ids) == sorted(indexes[1].ids)
+        for movie_id in indexes[1].ids[:20]:
+            incremental_similar, full_similar = (
+                index.similar(movie_id, n_probe=len(index.centroids)) for index in indexes
+            )
+            pd.testing.assert_frame_equal(incremental_similar, full_similar, rtol=1e-5)
+
+    def test_refresh_stores_current_signatures(self, refreshes: tuple) -> None:
+        """Test the refreshed Gold generation records the Silver it was built from."""
+        incremental, _ = refreshes
+        use_case = LoadAnalyticsUseCase(incremental)
+        gold = use_case.gold_repo.snapshot()
+
+        signatures = use_case._silver_signatures(use_case.silver_repo.snapshot())
+        stored = gold.read_parquet(LoadAnalyticsUseCase.SIGNATURE_TABLE)
+
+        assert len(use_case._changed_ids(stored, signatures)) == 0
+        assert use_case._can_refresh(gold)
+
+    def test_unchanged_silver_keeps_generation(self, refreshes: tuple) -> None:
+        """Test a refresh without Silver changes publishes nothing."""
+        incremental, _ = refreshes
+        gold_repo = DataRepository.for_layer(incremental, "gold")
+        generation = gold_repo.current_generation()
+
+        LoadAnalyticsUseCase(incremental).execute()
+
+        assert gold_repo.current_generation() == generation
+
+    def test_ratings_change_refreshes_rater_sketches(self, tmp_path: Path) -> None:
+        """Test a ratings-only change republishes just the rater sketches."""
+        generate_dataset(tmp_path / "raw", scale="0.01", seed=5)
+        settings = Settings(data_dir=tmp_path)
+        TransformMoviesUseCase(settings).execute()
+        LoadAnalyticsUseCase(settings).execute()
+        gold_repo = DataRepository.for_layer(settings, "gold")
+        before = gold_repo.snapshot()
+
+        ratings_path = tmp_path / "raw" / "ratings_small.csv"
+        ratings = pd.read_csv(ratings_path)
+        extra = ratings.head(1).assign(userId=ratings["userId"].max() + 1)
+        pd.concat([ratings, extra]).to_csv(ratings_path, index=False)
+        TransformMoviesUseCase(settings).execute()
+        LoadAnalyticsUseCase(settings).execute()
+        after = gold_repo.snapshot()
+
+        movie = extra["movieId"].iloc[0]
+        raters = [
+            snapshot.read_parquet("rater_sketches").set_index("movieId").loc[movie]
+            for snapshot in (before, after)
+        ]
+        assert after.generation != before.generation
+        assert raters[1]["raters_distinct"] == raters[0]["raters_distinct"] + 1
+        assert after.path_for("top_movies") == before.path_for("top_movies")
+
+    def test_missing_state_rebuilds_in_full(self, tmp_path: Path) -> None:
+        """Test Gold without partials is rebuilt rather than refreshed."""
+        generate_dataset(tmp_path / "raw", scale="0.01", seed=5)
+        settings = Settings(data_dir=tmp_path)
+        TransformMoviesUseCase(settings).execute()
+
+        use_case = LoadAnalyticsUseCase(settings)
+        assert not use_case._can_refresh(use_case.gold_repo.snapshot())
+
+        use_case.execute()
+        assert use_case._can_refresh(use_case.gold_repo.snapshot())
+
+
+class TestPartialRetraction:
+    """Tests retracting rows from partial aggregates."""
+
+    MEASURES = {
+        "n": ("value", "count"),
+        "total": ("value", "sum"),
+        "mean": ("value", "mean"),
+        "std": ("value", "std"),
+    }
+
+    def test_subtract_matches_groupby(self) -> None:
+        """Test a partial minus removed rows equals aggregating the rest."""
+        df = pd.DataFrame(
+            {
+                "key": ["a", "a", "a", "b", "b", "c"],
+                "value": [1.0, 2.0, 4.0, np.nan, 3.0, 5.0],
+            }
+        )
+        removed = df.iloc[[1, 4, 5]]
+
+        partial = subtract_partials(
+            partial_aggregate(df, "key", self.MEASURES),
+            partial_aggregate(removed, "key", self.MEASURES),
+        )
+
+        expected = df.drop(index=removed.index).groupby("key").agg(**self.MEASURES).reset_index()
+        pd.testing.assert_frame_equal(finalize(partial, "key", self.MEASURES), expected)
+
+    def test_added_and_removed_rows_cancel(self) -> None:
+        """Test adding then retracting rows restores the partial."""
+        df = pd.DataFrame({"key": [1, 1, 2], "value": [1.5, 2.5, 3.5]})
+        extra = pd.DataFrame({"key": [2, 3], "value": [10.0, 20.0]})
+        partial = partial_aggregate(df, "key", self.MEASURES)
+
+        restored = subtract_partials(
+            combine_partials([partial, partial_aggregate(extra, "key", self.MEASURES)]),
+            partial_aggregate(extra, "key", self.MEASURES),
+        )
+
+        pd.testing.assert_frame_equal(restored, partial)
+
+
+class TestRowHashes:
+    """Tests row hash signatures."""
+
+    def test_signatures_ignore_row_order_and_batching(self) -> None:
+        """Test signatures only depend on each key's rows."""
+        table = pa.table(
+            {
+                "id": [1, 2, 1, 3],
+                "names": [["a", "b"], [], None, ["c"]],
+                "value": [1.0, None, 3.0, 4.0],
+            }
+        )
+        keys, sums, counts = sum_by_key(table.column("id").to_numpy(), hash_rows(table))
+
+        reordered = table.take([3, 2, 1, 0])
+        hashes = np.concatenate([hash_rows(reordered.slice(0, 2)), hash_rows(reordered.slice(2))])
+        other_keys, other_sums, _ = sum_by_key(reordered.column("id").to_numpy(), hashes)
+
+        assert keys.tolist() == [1, 2, 3] and counts.tolist() == [2, 1, 1]
+        assert other_keys.tolist() == keys.tolist() and other_sums.tolist() == sums.tolist()
+
+    def test_hash_changes_with_values(self) -> None:
+        """Test changing a nested or scalar value changes the row hash."""
+        table = pa.table({"names": [["a", "b"], ["a", "b"]], "value": [1, 1]})
+        swapped = pa.table({"names": [["b", "a"], ["a", "b"]], "value": [1, 2]})
+
+        hashes, other = hash_rows(table), hash_rows(swapped)
+
+        assert hashes[0] == hashes[1]
+        assert hashes[0] != other[0] and hashes[1] != other[1]
@@ -0,0 +1,142 @@
+"""Unit tests for out-of-core execution."""
+
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from benchmarks.synthetic_dataset import generate_dataset
+from src.application.loading import LoadAnalyticsUseCase
+from src.application.loading.aggregates import combine_partials, finalize, partial_aggregate
+from src.application.transformation import TransformMoviesUseCase
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository
+from src.infrastructure.repositories.chunk_spill import ChunkSpill
+
+SILVER_TABLES = {
+    "movies": ["id"],
+    "credits": ["id"],
+    "keywords": ["id"],
+    "ratings": ["userId", "movieId", "timestamp"],
+}
+GOLD_TABLES = {
+    "yearly_analytics": None,
+    "genre_analytics": None,
+    "top_movies": None,
+    "leaderboards": None,
+    "director_analytics": None,
+    "cube_analytics": None,
+    "movies_enriched": ["id"],
+}
+
+
+@pytest.fixture(scope="module")
+def pipelines(tmp_path_factory: pytest.TempPathFactory) -> tuple:
+    """Run both execution modes over the same synthetic Bronze layer."""
+    root = tmp_path_factory.mktemp("out_of_core")
+    generate_dataset(root / "in_memory" / "raw", scale="0.01", seed=3)
+    shutil.copytree(root / "in_memory" / "raw", root / "out_of_core" / "raw")
+
+    in_memory = Settings(data_dir=root / "in_memory")
+    out_of_core = Settings(
+        data_dir=root / "out_of_core", execution_mode="out_of_core", chunk_size=150
+    )
+    for settings in (in_memory, out_of_core):
+        TransformMoviesUseCase(settings).execute()
+        LoadAnalyticsUseCase(settings).execute()
+
+    return in_memory, out_of_core
+
+
+def _assert_same_table(expected: pd.DataFrame, actual: pd.DataFrame, key: list) -> None:
+    """Compare two tables, ignoring row order when a key is given."""
+    if key:
+        expected = expected.sort_values(key, kind="stable")
+        actual = actual.sort_values(key, kind="stable")
+    pd.testing.assert_frame_equal(
+        expected.reset_index(drop=True), actual.reset_index(drop=True), rtol=1e-9
+    )
+
+
+class TestOutOfCoreParity:
+    """Tests out-of-core results match the in-memory pipeline."""
+
+    @pytest.mark.parametrize("table", list(SILVER_TABLES))
+    def test_silver(self, pipelines: tuple, table: str) -> None:
+        """Test Silver tables are identical in both modes."""
+        in_memory, out_of_core = pipelines
+
+        _assert_same_table(
+            DataRepository.for_layer(in_memory, "silver").read_parquet(table),
+            DataRepository.for_layer(out_of_core, "silver").read_parquet(table),
+            SILVER_TABLES[table],
+        )
+
+    @pytest.mark.parametrize("table", list(GOLD_TABLES))
+    def test_gold(self, pipelines: tuple, table: str) -> None:
+        """Test Gold tables are identical in both modes."""
+        in_memory, out_of_core = pipelines
+
+        _assert_same_table(
+            DataRepository.for_layer(in_memory, "gold").read_parquet(table),
+            DataRepository.for_layer(out_of_core, "gold").read_parquet(table),
+            GOLD_TABLES[table],
+        )
+
+    def test_gold_write_profiles(self, pipelines: tuple) -> None:
+        """Test year-keyed Gold tables are written clustered by year, with zstd."""
+        for settings in pipelines:
+            gold = DataRepository.for_layer(settings, "gold").snapshot()
+            for table in LoadAnalyticsUseCase.DEFAULT_PARQUET_PROFILES:
+                assert gold.has_table(table)
+            for table in ("yearly_analytics", "cube_analytics"):
+                metadata = pq.ParquetFile(gold.path_for(table)).metadata
+                assert metadata.row_group(0).column(0).compression == "ZSTD"
+                years = gold.read_parquet(table)["release_year"]
+                assert years.dropna().is_monotonic_increasing
+                # Nulls last
+                assert years.notna().is_monotonic_decreasing
+
+
+class TestChunkSpill:
+    """Tests for ChunkSpill."""
+
+    def test_schema_unification(self, tmp_path: Path) -> None:
+        """Test chunks with drifting types are replayed with one schema."""
+        with ChunkSpill(tmp_path) as spill:
+            spill.add(pa.table({"a": pa.array([None, None], pa.null()), "b": [1, 2]}))
+            spill.add(pa.table({"a": ["x", None], "b": [1.5, 2.5]}))
+
+            tables = list(spill.tables())
+
+        assert spill.num_rows == 4
+        assert all(table.schema.field("a").type == pa.string() for table in tables)
+        assert all(table.schema.field("b").type == pa.float64() for table in tables)
+        assert not spill.directory.exists()
+
+
+class TestAggregates:
+    """Tests for mergeable partial aggregates."""
+
+    def test_matches_groupby(self) -> None:
+        """Test combined partials match a single groupby."""
+        df = pd.DataFrame(
+            {
+                "key": ["a", "b", "a", "c", "b", "a"],
+                "value": [1.0, None, 3.0, None, 5.0, 2.0],
+            }
+        )
+        measures = {
+            "n": ("value", "count"),
+            "total": ("value", "sum"),
+            "average": ("value", "mean"),
+        }
+
+        partials = [partial_aggregate(df.iloc[i : i + 2], "key", measures) for i in (0, 2, 4)]
+        result = finalize(combine_partials(partials + [None]), "key", measures)
+
+        expected = df.groupby("key").agg(**measures).reset_index()
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,132 @@
+"""Unit tests for selecting the Gold rows sent to the chat model."""
+
+import pandas as pd
+import pytest
+
+from src.presentation.dashboard import ContextRetriever
+from src.presentation.dashboard.prompt_context import CHARS_PER_TOKEN, question_terms
+
+
+@pytest.fixture
+def tables() -> dict:
+    """Create small dashboard tables."""
+    directors = pd.DataFrame(
+        {
+            "director": [
+                "Christopher Nolan",
+                "James Cameron",
+                "Steven Spielberg",
+                "Chris Columbus",
+            ],
+            "movie_count": [8, 7, 27, 10],
+            "total_revenue": [4.2e9, 6.1e9, 9.1e9, 3.0e9],
+            "avg_revenue": [5.2e8, 8.7e8, 3.4e8, 3.0e8],
+            "avg_rating": [7.9, 7.0, 6.9, 6.3],
+        }
+    )
+    genres = pd.DataFrame(
+        {
+            "genre_names": ["Drama", "Comedy", "Action", "Animation"],
+            "movie_count": [2000, 1500, 1100, 230],
+            "avg_budget": [2.0e7, 2.5e7, 5.0e7, 6.0e7],
+            "avg_revenue": [4.0e7, 5.0e7, 1.2e8, 2.3e8],
+            "avg_rating": [6.4, 5.9, 5.9, 6.3],
+        }
+    )
+    years = list(range(1980, 2018))
+    yearly = pd.DataFrame(
+        {
+            "release_year": years,
+            "movie_count": [50 + i for i in range(len(years))],
+            "avg_revenue": [1.0e7 * (i + 1) for i in range(len(years))],
+            "total_revenue": [1.0e9 * (i + 1) for i in range(len(years))],
+            "avg_profit": [5.0e6 * (i + 1) for i in range(len(years))],
+        }
+    )
+    top_movies = pd.DataFrame(
+        {
+            "rank_type": ["revenue", "revenue", "profit"],
+            "rank": [1, 2, 1],
+            "title": ["Avatar", "Titanic", "Avatar"],
+            "release_year": [2009, 1997, 2009],
+            "genre_names": [["Action", "Adventure"], ["Drama", "Romance"], ["Action", "Adventure"]],
+            "director": ["James Cameron", "James Cameron", "James Cameron"],
+            "revenue": [2.78e9, 1.84e9, 2.78e9],
+            "profit": [2.55e9, 1.64e9, 2.55e9],
+            "vote_average": [7.2, 7.5, 7.2],
+        }
+    )
+    return {"directors": directors, "genres": genres, "yearly": yearly, "top_movies": top_movies}
+
+
+def _section(context: str, title: str) -> list:
+    """Get the row lines of a section of a rendered context."""
+    for section in context.split("\n\n"):
+        lines = section.split("\n")
+        if lines[0] == f"{title}:":
+            return lines[2:]
+    return []
+
+
+class TestContextRetriever:
+    """Tests retrieving the rows a question is about."""
+
+    def test_name_matches_rank_first(self, tables: dict) -> None:
+        """Test rows naming what the question asks about are found and ranked first."""
+        retriever = ContextRetriever(tables)
+
+        key, row, _ = retriever.search("Qual a receita dos filmes de Christopher Nolan?")[0]
+        context = retriever.context("Qual a receita dos filmes de Christopher Nolan?")
+
+        assert (key, row) == ("directors", 0)
+        rows = _section(context, "DIRETORES")
+        assert rows == ["Christopher Nolan | 8 | 4,200.0M | 520.0M | 7.90"]
+        # "Chris Columbus" shares no word with the question
+        assert "Columbus" not in context
+
+    def test_decade_selects_its_years(self, tables: dict) -> None:
+        """Test a question about a decade gets the yearly rows of that decade."""
+        retriever = ContextRetriever(tables)
+
+        context = retriever.context("Como foi a receita nos anos 90?")
+
+        years = [int(line.split(" | ")[0]) for line in _section(context, "POR ANO")]
+        assert set(range(1990, 2000)) <= set(years)
+        assert min(years[:10]) == 1990 and max(years[:10]) == 1999
+
+    def test_table_alias_adds_leading_rows(self, tables: dict) -> None:
+        """Test a question about a table as a whole gets its leading rows."""
+        retriever = ContextRetriever(tables)
+
+        context = retriever.context("Quais gêneros têm mais filmes?")
+
+        rows = _section(context, "GÊNEROS")
+        assert [row.split(" | ")[0] for row in rows] == ["Drama", "Comedy", "Action", "Animation"]
+        assert _section(context, "DIRETORES") == []
+
+    def test_token_budget_is_respected(self, tables: dict) -> None:
+        """Test the context stays within its token budget."""
+        retriever = ContextRetriever(tables)
+
+        for max_tokens in (40, 80, 200):
+            context = retriever.context("Tendência de receita por ano", max_tokens=max_tokens)
+            assert 0 < len(context) <= max_tokens * CHARS_PER_TOKEN
+
+    def test_unmatched_question_gets_every_table(self, tables: dict) -> None:
+        """Test a question matching no row gets an overview of every table."""
+        retriever = ContextRetriever(tables)
+
+        context = retriever.context("Me conte algo interessante", max_tokens=5000)
+
+        for title in ("DIRETORES", "GÊNEROS", "POR ANO", "TOP FILMES"):
+            assert _section(context, title)
+        assert ContextRetriever({}).context("Me conte algo interessante") == ""
+
+
+def test_question_terms() -> None:
+    """Test questions are folded, stripped of stopwords and given decade terms."""
+    terms = question_terms("Qual o gênero da década de 1980?")
+    assert terms == "genero decada 1980 1980s".split()
+    assert question_terms("Filmes dos anos 2000 e dos 90s") == (
+        "filmes anos 2000 90s 2000s 1990s".split()
+    )
@@ -0,0 +1,89 @@
+"""Unit tests for grouped top-N rankings."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.loading.ranking import Ranking, rank_frame, select_top
+
+
+@pytest.fixture
+def movies() -> pd.DataFrame:
+    """Create enriched-like movies with ties, missing values and list groups."""
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "genre_names": [["Drama", "Comedy"], ["Drama"], [], None, ["Comedy"], ["Drama"]],
+            "release_year": [1991.0, 1995.0, 2003.0, np.nan, 1988.0, 2009.0],
+            "vote_average": [8.0, 8.0, 6.0, 9.0, 7.0, np.nan],
+            "vote_count": [200.0, 50.0, 300.0, 400.0, 100.0, 500.0],
+        }
+    )
+
+
+class TestSelectTop:
+    """Tests partial selection of the top values."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_nlargest(self, seed: int) -> None:
+        """Test the global ranking keeps nlargest's rows, order and tie breaking."""
+        rng = np.random.default_rng(seed)
+        values = rng.integers(0, 20, 500).astype(float)
+        values[rng.random(500) < 0.1] = np.nan
+        df = pd.DataFrame({"value": values})
+
+        positions, ranks = select_top(values, 30)
+
+        expected = df.dropna().nlargest(30, "value").index.to_numpy()
+        np.testing.assert_array_equal(positions, expected)
+        np.testing.assert_array_equal(ranks, np.arange(1, 31))
+
+    def test_ties_all(self) -> None:
+        """Test all rows tied at the cut are kept and share the lowest rank."""
+        positions, ranks = select_top(np.array([5.0, 7.0, 5.0, 1.0, 5.0]), 2, ties="all")
+
+        assert positions.tolist() == [1, 0, 2, 4]
+        assert ranks.tolist() == [1, 2, 2, 2]
+
+    def test_groups(self) -> None:
+        """Test each group is ranked on its own and negative codes are skipped."""
+        values = np.array([1.0, 4.0, 3.0, 2.0, 9.0, 5.0])
+        groups = np.array([1, 0, 1, 0, -1, 1])
+
+        positions, ranks = select_top(values, 2, groups)
+
+        assert positions.tolist() == [1, 3, 5, 2]
+        assert ranks.tolist() == [1, 2, 1, 2]
+
+
+class TestRankFrame:
+    """Tests rankings declared over DataFrame columns."""
+
+    def test_list_groups(self, movies: pd.DataFrame) -> None:
+        """Test a movie is ranked in each of its genres."""
+        ranking = Ranking("by_genre", "vote_average", n=1, by="genre_names", ties="all")
+
+        ranked = rank_frame(movies, ranking, ["id"])
+
+        assert ranked.to_dict("list") == {
+            "id": [1, 1, 2],
+            "group": ["Comedy", "Drama", "Drama"],
+            "rank": [1, 1, 1],
+        }
+
+    def test_buckets_and_min_support(self, movies: pd.DataFrame) -> None:
+        """Test decades are ranked among the movies with enough votes."""
+        ranking = Ranking(
+            "by_decade",
+            "vote_average",
+            n=1,
+            by="release_year",
+            bucket=10,
+            support="vote_count",
+            min_support=100,
+        )
+
+        ranked = rank_frame(movies, ranking, ["id"])
+
+        assert ranked["group"].tolist() == ["1980", "1990", "2000"]
+        assert ranked["id"].tolist() == [5, 1, 3]
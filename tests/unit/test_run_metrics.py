@@ -0,0 +1,108 @@
+"""Unit tests for pipeline run metrics."""
+
+import json
+import pstats
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.monitoring import RunMetrics, instrumented, profile_to, track
+from src.infrastructure.repositories import DataRepository
+
+
+class _Stage:
+    """Minimal use case with an instrumented sub-step."""
+
+    def __init__(self, repository: DataRepository):
+        self.repository = repository
+
+    @instrumented()
+    def _transform_numbers(self) -> pd.DataFrame:
+        df = pd.DataFrame({"id": range(1000), "value": range(1000)})
+        self.repository.save_parquet(df, "numbers")
+        return self.repository.read_parquet("numbers")
+
+
+class TestRunMetrics:
+    """Tests for RunMetrics."""
+
+    def test_nested_steps(self, tmp_path: Path) -> None:
+        """Test stages and sub-steps are recorded with their metrics."""
+        metrics = RunMetrics("test-run")
+        stage = _Stage(DataRepository(tmp_path))
+
+        with metrics.activate():
+            with track("transformation"):
+                stage._transform_numbers()
+
+        steps = {step["step"]: step for step in metrics.steps}
+        sub_step = steps["transform_numbers"]
+        assert sub_step["parent"] == "transformation"
+        assert sub_step["status"] == "success"
+        assert sub_step["rows"] == 1000
+        assert sub_step["rows_per_second"] > 0
+        assert sub_step["bytes_written"] > 0
+        assert sub_step["bytes_read"] > 0
+
+        parent = steps["transformation"]
+        assert parent["parent"] is None
+        assert parent["wall_seconds"] >= sub_step["wall_seconds"]
+        assert parent["bytes_written"] == sub_step["bytes_written"]
+        if parent["peak_rss_bytes"] is not None:
+            assert parent["peak_rss_bytes"] >= sub_step["peak_rss_bytes"]
+
+    def test_failed_step(self) -> None:
+        """Test failures are recorded and re-raised."""
+        metrics = RunMetrics()
+
+        with metrics.activate(), pytest.raises(RuntimeError):
+            with track("loading"):
+                raise RuntimeError("boom")
+
+        assert metrics.steps[0]["status"] == "failed"
+
+    def test_inactive_run(self) -> None:
+        """Test instrumentation is a no-op without an active run."""
+        metrics = RunMetrics()
+
+        with track("ingestion") as tracker:
+            assert tracker is None
+
+        assert metrics.steps == []
+
+    def test_reports(self, tmp_path: Path) -> None:
+        """Test JSON and Prometheus textfile output."""
+        metrics = RunMetrics("test-run")
+        with metrics.activate(), track("loading"):
+            pass
+
+        metrics.write_json(tmp_path / "metrics.json")
+        metrics.write_prometheus(tmp_path / "metrics.prom")
+
+        report = json.loads((tmp_path / "metrics.json").read_text())
+        assert report["run_id"] == "test-run"
+        assert report["steps"][0]["step"] == "loading"
+
+        prom = (tmp_path / "metrics.prom").read_text()
+        assert "# TYPE movies_pipeline_step_wall_seconds gauge" in prom
+        assert 'movies_pipeline_step_wall_seconds{step="loading",parent=""}' in prom
+
+
+class TestProfiling:
+    """Tests for per-stage profiler dumps."""
+
+    def test_cprofile_dump(self, tmp_path: Path) -> None:
+        """Test cProfile writes a loadable stats file."""
+        with profile_to(tmp_path, "transformation", "cprofile"):
+            sum(range(1000))
+
+        stats = pstats.Stats(str(tmp_path / "transformation.prof"))
+        assert stats.total_calls > 0
+
+    def test_disabled(self, tmp_path: Path) -> None:
+        """Test no dump is written when profiling is off."""
+        with profile_to(tmp_path / "profiles", "loading", None):
+            pass
+
+        assert not (tmp_path / "profiles").exists()
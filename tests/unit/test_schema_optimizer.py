@@ -0,0 +1,148 @@
+"""Unit tests for Silver column type minimization."""
+
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from benchmarks.synthetic_dataset import generate_dataset
+from src.application.transformation import TransformMoviesUseCase
+from src.application.transformation.schema_optimizer import (
+    CATEGORY,
+    SchemaOptimizer,
+    restore_types,
+)
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository
+
+
+def _table() -> pa.Table:
+    """Create a table exercising every kind of column."""
+    return pa.table(
+        {
+            "small": pa.array([1, -5, 300], pa.int64()),
+            "large": pa.array([1, 70_000, 2], pa.int64()),
+            "year": pa.array([1999.0, None, 2015.0], pa.float64()),
+            "rating": pa.array([0.5, 4.0, None], pa.float64()),
+            "score": pa.array([0.1, 2.0, 3.0], pa.float64()),
+            "status": pa.array(["Released", "Rumored", None], pa.string()),
+            "flag": pa.array([True, False, True]),
+        }
+    )
+
+
+class TestSchemaOptimizer:
+    """Tests picking the narrowest lossless types."""
+
+    def test_narrowest_types(self) -> None:
+        """Test each column gets the narrowest type holding its values."""
+        optimizer = SchemaOptimizer()
+        optimizer.CATEGORY_RATIO = 1.0
+        optimized = optimizer.optimize(_table())
+
+        assert optimizer.types() == {
+            "small": "int16",
+            "large": "int32",
+            "year": "int16",
+            "rating": "float32",
+            "score": "float64",
+            "status": CATEGORY,
+        }
+        assert optimized.schema.field("flag").type == pa.bool_()
+        assert pa.types.is_dictionary(optimized.schema.field("status").type)
+        assert optimized.column("year").to_pylist() == [1999, None, 2015]
+        assert optimized.column("score").to_pylist() == [0.1, 2.0, 3.0]
+
+    def test_many_distinct_strings_stay_strings(self) -> None:
+        """Test strings with a value per row are not worth a dictionary."""
+        optimizer = SchemaOptimizer()
+        optimizer.observe(pa.table({"title": [f"Movie {i}" for i in range(100)]}))
+
+        assert "title" not in optimizer.types()
+
+    def test_recorded_types_are_never_narrowed(self) -> None:
+        """Test a previous run's types are the floor of the next one."""
+        optimizer = SchemaOptimizer({"small": "int32", "rating": "float64", "status": "string"})
+        optimizer.CATEGORY_RATIO = 1.0
+        optimizer.observe(_table())
+        chosen = optimizer.types()
+
+        assert chosen["small"] == "int32"
+        assert chosen["rating"] == "float64"
+        assert "status" not in chosen
+
+        recorded = SchemaOptimizer.recorded_types(optimizer.schema(_table().schema))
+        assert recorded == chosen
+
+    def test_chunks_match_whole_table(self) -> None:
+        """Test observing chunks picks the types observing the table would."""
+        rng = np.random.default_rng(0)
+        whole = pa.table(
+            {
+                "id": pa.array(rng.integers(0, 40_000, 1000)),
+                "value": pa.array(rng.integers(0, 100, 1000).astype(float)),
+            }
+        )
+        # A chunk without missing values may have been read as integers
+        first = whole.slice(0, 500)
+        first = first.set_column(1, "value", first.column("value").cast(pa.int64()))
+        chunked = SchemaOptimizer()
+        for chunk in (first, whole.slice(500)):
+            chunked.observe(chunk)
+        single = SchemaOptimizer()
+        single.observe(whole)
+
+        assert chunked.types() == single.types() == {"id": "int32", "value": "int16"}
+
+    def test_restore_types(self) -> None:
+        """Test readers get back the columns cleaning produced."""
+        table = _table()
+        optimizer = SchemaOptimizer()
+        optimizer.CATEGORY_RATIO = 1.0
+        optimized = optimizer.optimize(table)
+
+        restored = restore_types(optimized, optimized.schema)
+
+        assert restored.select(table.column_names).cast(table.schema).equals(table)
+        assert restored.schema.field("year").type == pa.float64()
+        assert restored.schema.field("status").type == pa.string()
+
+    def test_memory_estimate(self) -> None:
+        """Test the memory report counts the bytes narrowing saves."""
+        optimizer = SchemaOptimizer()
+        optimizer.observe(pa.table({"id": pa.array(np.arange(1000), pa.int64())}))
+
+        assert optimizer.memory() == {"bytes": 8000, "bytes_saved": 6000}
+
+
+@pytest.fixture(scope="module")
+def silver(tmp_path_factory: pytest.TempPathFactory) -> tuple:
+    """Transform a small dataset twice."""
+    root = tmp_path_factory.mktemp("silver")
+    generate_dataset(Path(root) / "raw", scale="0.01", seed=3)
+    settings = Settings(data_dir=root)
+    stats = TransformMoviesUseCase(settings).execute()
+    first = DataRepository.for_layer(settings, "silver").snapshot()
+    TransformMoviesUseCase(settings).execute()
+    return stats, first, DataRepository.for_layer(settings, "silver").snapshot()
+
+
+class TestSilverTypes:
+    """Tests Silver tables are stored with minimized types."""
+
+    def test_tables_are_narrowed(self, silver: tuple) -> None:
+        """Test Silver stores narrowed types and reports the memory saved."""
+        stats, snapshot, _ = silver
+        schema = snapshot.schema("ratings")
+
+        assert schema.field("userId").type == pa.int16()
+        assert schema.field("rating").type == pa.float32()
+        assert stats["ratings"]["memory"]["bytes_saved"] > 0
+        assert snapshot.schema("movies").field("release_year").type == pa.int16()
+
+    def test_types_are_stable_across_runs(self, silver: tuple) -> None:
+        """Test rerunning the transformation keeps the recorded types."""
+        _, first, second = silver
+        for table in ("movies", "credits", "keywords", "ratings"):
+            assert second.schema(table).remove_metadata() == first.schema(table).remove_metadata()
@@ -0,0 +1,122 @@
+"""Unit tests for the similar movies index."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.loading.similarity import SimilarityIndex
+
+TOPICS = [
+    "space ship crew alien planet orbit galaxy captain",
+    "detective murder police crime killer city investigation",
+    "love wedding romance couple heart summer letter",
+    "war soldier battle army general front mission",
+    "school student teacher friends exam prom teenage",
+    "monster haunted house ghost night fear curse",
+]
+
+
+def _movies(n: int, seed: int, first_id: int = 1) -> pd.DataFrame:
+    """Create movies whose words, keywords and genres mostly come from one topic."""
+    rng = np.random.default_rng(seed)
+    topics = [topic.split() for topic in TOPICS]
+    common = "the man woman story life world young old new find".split()
+    rows = []
+    for movie_id in range(first_id, first_id + n):
+        topic = rng.integers(len(topics))
+        words = rng.choice(topics[topic] + common, rng.integers(8, 30))
+        rows.append(
+            {
+                "id": movie_id,
+                "overview": " ".join(words).capitalize() + ".",
+                "tagline": None if rng.random() < 0.3 else " ".join(words[:3]),
+                "keyword_names": list(rng.choice(topics[topic], 2, replace=False)),
+                "genre_names": [f"Genre {topic}", "Drama"][: rng.integers(1, 3)],
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def _exact(index: SimilarityIndex, movie_id: int, n: int = 10) -> pd.DataFrame:
+    """Find similar movies probing every list (an exhaustive search)."""
+    return index.similar(movie_id, n, n_probe=len(index.centroids))
+
+
+@pytest.fixture(scope="module")
+def movies() -> pd.DataFrame:
+    """Create a catalog of movies."""
+    return _movies(2000, seed=0)
+
+
+@pytest.fixture(scope="module")
+def index(movies: pd.DataFrame) -> SimilarityIndex:
+    """Build an index of the catalog."""
+    return SimilarityIndex.build(movies)
+
+
+class TestSimilarityIndex:
+    """Tests building, querying and updating the index."""
+
+    def test_exhaustive_search_is_exact_cosine(
+        self, movies: pd.DataFrame, index: SimilarityIndex
+    ) -> None:
+        """Test probing every list ranks all movies by TF-IDF cosine."""
+        similar = _exact(index, 7, n=2000)
+
+        assert 7 not in similar["id"].to_numpy()
+        assert similar["score"].is_monotonic_decreasing
+        assert similar["score"].between(0, 1 + 1e-6).all()
+        # Movies of the same genre and keywords come first
+        same_topic = movies.set_index("id")["genre_names"].str[0] == movies["genre_names"][6][0]
+        assert same_topic[similar["id"].head(20)].mean() > 0.9
+
+    def test_recall(self, index: SimilarityIndex) -> None:
+        """Test probing a few lists finds most of the exact top movies."""
+        ids = np.random.default_rng(1).choice(index.ids, 50, replace=False)
+
+        recall = [
+            len(set(index.similar(i)["id"]) & set(_exact(index, i)["id"])) / 10 for i in ids
+        ]
+
+        assert np.mean(recall) > 0.9
+
+    def test_updates_match_rebuild(self, movies: pd.DataFrame) -> None:
+        """Test adding, replacing and removing movies scores as a rebuild would."""
+        changed = _movies(100, seed=2, first_id=1901)
+        added = _movies(400, seed=3, first_id=2001)
+
+        updated = SimilarityIndex.build(movies)
+        updated.add(pd.concat([changed, added]))
+        updated.remove([5, 6, 7])
+        current = pd.concat([movies[movies["id"] <= 1900], changed, added])
+        rebuilt = SimilarityIndex.build(current[~current["id"].isin([5, 6, 7])])
+
+        assert updated.num_docs == rebuilt.num_docs == 2397
+        for movie_id in (1, 1950, 2100):
+            pd.testing.assert_frame_equal(_exact(updated, movie_id), _exact(rebuilt, movie_id))
+
+    def test_growth_retrains(self, movies: pd.DataFrame) -> None:
+        """Test the lists are clustered again once the catalog outgrew them."""
+        index = SimilarityIndex.build(movies.head(400))
+        index.add(movies.iloc[400:440])
+        assert index.trained_docs == 400
+
+        index.add(movies.iloc[440:])
+        assert index.trained_docs == 2000
+        assert len(index.centroids) == round(np.sqrt(2000))
+
+    def test_round_trip(self, movies: pd.DataFrame) -> None:
+        """Test an index survives its Gold tables and keeps updating the same way."""
+        index = SimilarityIndex.build(movies)
+        restored = SimilarityIndex.from_tables(*index.to_tables().values())
+        pd.testing.assert_frame_equal(restored.similar(3), index.similar(3))
+
+        more = _movies(50, seed=4, first_id=5001)
+        index.add(more)
+        restored.add(more)
+        pd.testing.assert_frame_equal(restored.similar(5001), index.similar(5001))
+
+    def test_unknown_movie(self, index: SimilarityIndex) -> None:
+        """Test querying a movie that is not indexed fails."""
+        with pytest.raises(KeyError, match="12345678"):
+            index.similar(12345678)
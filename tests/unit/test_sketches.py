@@ -0,0 +1,159 @@
+"""Unit tests for mergeable sketches."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.application.loading.sketches import (
+    DistinctSketch,
+    HeavyHitters,
+    QuantileSketch,
+    combine_sketches,
+    partial_sketches,
+    read_sketches,
+    sketch_table,
+)
+
+SKETCHES = {
+    "value": ("value", "quantiles"),
+    "users": ("user", "distinct"),
+    "tags": ("tags", "heavy_hitters"),
+}
+
+
+def _merge_chunks(sketch_type: type, values: np.ndarray, n_chunks: int) -> object:
+    """Sketch values chunk by chunk and merge the chunk sketches."""
+    chunks = [sketch_type().update(chunk) for chunk in np.array_split(values, n_chunks)]
+    merged = chunks[0]
+    for chunk in chunks[1:]:
+        merged.merge(chunk)
+    return merged
+
+
+class TestQuantileSketch:
+    """Tests KLL quantiles."""
+
+    def test_exact_below_capacity(self) -> None:
+        """Test up to k values are kept as they are."""
+        values = np.random.default_rng(0).normal(size=200)
+
+        sketch = QuantileSketch(k=200).update(values)
+
+        for q in (0.1, 0.5, 0.9, 1.0):
+            assert sketch.quantile(q) == np.quantile(values, q, method="inverted_cdf")
+
+    @pytest.mark.parametrize("n_chunks", [1, 25])
+    def test_rank_error(self, n_chunks: int) -> None:
+        """Test quantiles of many values, sketched whole or merged, are within 1% rank."""
+        values = np.random.default_rng(1).lognormal(10, 2, 200_000)
+
+        sketch = _merge_chunks(QuantileSketch, values, n_chunks)
+
+        assert sketch.n == len(values)
+        assert sum(map(len, sketch.levels)) < 3 * sketch.k
+        for q in (0.1, 0.25, 0.5, 0.9, 0.99):
+            assert abs((values <= sketch.quantile(q)).mean() - q) < 0.01
+
+    def test_serialization(self) -> None:
+        """Test a sketch survives a round trip and keeps merging the same way."""
+        sketch = QuantileSketch().update(np.arange(5000.0))
+
+        restored = QuantileSketch.from_bytes(sketch.to_bytes())
+        sketch.update(np.arange(100.0))
+        restored.update(np.arange(100.0))
+
+        assert restored.to_bytes() == sketch.to_bytes()
+        assert np.isnan(QuantileSketch().quantile(0.5))
+
+
+class TestDistinctSketch:
+    """Tests HyperLogLog distinct counts."""
+
+    def test_estimates(self) -> None:
+        """Test repeated values count once and estimates stay within the error bounds."""
+        values = np.random.default_rng(2).integers(0, 10**9, 400_000)
+
+        small = DistinctSketch().update(np.r_[values[:300], values[:300]])
+        large = _merge_chunks(DistinctSketch, values, 10)
+
+        assert abs(small.estimate() / 300 - 1) < 0.03
+        assert abs(large.estimate() / len(np.unique(values)) - 1) < 3 * 1.04 / 64
+
+    def test_merge_is_union(self) -> None:
+        """Test merging overlapping sketches equals sketching the union."""
+        values = np.array([f"user{i}" for i in range(3000)], dtype=object)
+
+        merged = DistinctSketch().update(values[:2000])
+        merged.merge(DistinctSketch().update(values[1000:]))
+        whole = DistinctSketch().update(values)
+
+        assert merged.to_bytes() == whole.to_bytes()
+        assert DistinctSketch.from_bytes(whole.to_bytes()).estimate() == whole.estimate()
+
+    def test_precisions_must_match(self) -> None:
+        """Test sketches of different precisions are not merged."""
+        with pytest.raises(ValueError, match="precision"):
+            DistinctSketch(10).merge(DistinctSketch(12))
+
+
+class TestHeavyHitters:
+    """Tests Space-Saving heavy hitters."""
+
+    def test_guarantees(self) -> None:
+        """Test frequent items are kept with bounded overestimates."""
+        rng = np.random.default_rng(3)
+        values = rng.zipf(1.3, 100_000)
+        exact = pd.Series(values).value_counts()
+
+        sketch = _merge_chunks(lambda: HeavyHitters(capacity=50), values, 20)
+
+        frequent = exact[exact > len(values) / 50]
+        assert set(frequent.index) <= set(sketch.counts.index)
+        true_counts = exact.reindex(sketch.counts.index, fill_value=0)
+        assert (sketch.counts >= true_counts).all()
+        assert (sketch.counts - sketch.errors <= true_counts).all()
+        assert [item for item, _ in sketch.top(3)] == exact.index[:3].tolist()
+
+    def test_serialization(self) -> None:
+        """Test items and counts survive a round trip."""
+        sketch = HeavyHitters(capacity=2).update(["a", "b", "a", "c", "a", "b"])
+
+        restored = HeavyHitters.from_bytes(sketch.to_bytes())
+
+        assert restored.top(2) == sketch.top(2) == [("a", 3), ("b", 2)]
+        assert restored.floor == 2
+
+
+class TestPartialSketches:
+    """Tests sketches per group."""
+
+    @pytest.fixture
+    def rows(self) -> pd.DataFrame:
+        """Create rows with missing groups, values and lists."""
+        return pd.DataFrame(
+            {
+                "group": ["x", "y", "x", None, "y", "x"],
+                "value": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0],
+                "user": [1, 2, 1, 3, 3, 2],
+                "tags": [["a", "b"], ["a"], [], ["c"], None, ["a"]],
+            }
+        )
+
+    def test_groups_and_summaries(self, rows: pd.DataFrame) -> None:
+        """Test rows are sketched per group, list values item by item."""
+        table = sketch_table(partial_sketches(rows, "group", SKETCHES), SKETCHES)
+
+        assert table["group"].tolist() == ["x", "y"]
+        assert table["value_p50"].tolist() == [1.0, 2.0]
+        assert table["users_distinct"].tolist() == [2, 2]
+        assert table["tags_top"].tolist() == [["a", "b"], ["a"]]
+
+    def test_chunks_combine_to_whole(self, rows: pd.DataFrame) -> None:
+        """Test combining chunk sketches, also after a round trip, equals one pass."""
+        whole = sketch_table(partial_sketches(rows, "group", SKETCHES), SKETCHES)
+
+        first = partial_sketches(rows.iloc[:3], "group", SKETCHES)
+        stored = sketch_table(partial_sketches(rows.iloc[3:], "group", SKETCHES), SKETCHES)
+        combined = combine_sketches([None, first, read_sketches(stored, "group", SKETCHES)])
+
+        pd.testing.assert_frame_equal(sketch_table(combined, SKETCHES), whole)
@@ -0,0 +1,271 @@
+"""Unit tests for the storage backends."""
+
+import io
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pytest
+
+from src.domain.exceptions import DataLoadingError
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository
+from src.infrastructure.storage import (
+    ReadThroughCache,
+    cached_filesystem,
+    get_filesystem,
+    get_read_cache,
+    layer_root,
+    supports_atomic_rename,
+    upload_files,
+)
+from src.infrastructure.storage.cache import DelegatingFileSystemHandler
+
+# In-memory filesystem shipped with pyarrow, used as an in-process object store
+_MockFileSystem = pytest.importorskip("pyarrow._fs")._MockFileSystem
+
+
+@pytest.fixture
+def object_store() -> pafs.FileSystem:
+    """In-process object store stand-in."""
+    return _MockFileSystem()
+
+
+class TestLayerRoots:
+    """Tests for layer path resolution."""
+
+    def test_local_layers(self, tmp_path: Path) -> None:
+        """Test local layers map to the data directories."""
+        settings = Settings(data_dir=tmp_path)
+
+        assert layer_root(settings, "gold") == (tmp_path / "refined").resolve().as_posix()
+
+    def test_object_store_layouts(self) -> None:
+        """Test object store layouts follow the Terraform modules."""
+        s3 = Settings(storage_backend="s3", aws_s3_bucket="lake")
+        gcs = Settings(storage_backend="gcs", gcp_bucket="movies-dev")
+        azure = Settings(storage_backend="azure", azure_storage_account="moviesdevsa")
+
+        assert layer_root(s3, "silver") == "lake/silver"
+        assert layer_root(gcs, "bronze") == "movies-dev-bronze"
+        assert layer_root(azure, "gold") == "gold"
+
+    def test_missing_bucket_raises(self) -> None:
+        """Test object store backends require their bucket setting."""
+        with pytest.raises(DataLoadingError, match="AWS_S3_BUCKET"):
+            layer_root(Settings(storage_backend="s3"), "gold")
+
+    def test_unknown_layer_raises(self) -> None:
+        """Test unknown layers are rejected."""
+        with pytest.raises(DataLoadingError, match="Unknown layer"):
+            layer_root(Settings(), "platinum")
+
+
+class TestFilesystems:
+    """Tests for filesystem creation and sharing."""
+
+    def test_filesystem_is_shared(self) -> None:
+        """Test stages reuse one filesystem (and connection pool) per backend."""
+        assert get_filesystem(Settings()) is get_filesystem(Settings())
+
+    def test_atomic_rename_detection(self, tmp_path: Path, object_store: pafs.FileSystem) -> None:
+        """Test only local filesystems are treated as rename-atomic."""
+        subtree = pafs.SubTreeFileSystem(str(tmp_path), pafs.LocalFileSystem())
+
+        assert supports_atomic_rename(subtree)
+        assert not supports_atomic_rename(object_store)
+
+    def test_for_layer_uses_configured_backend(self, tmp_path: Path) -> None:
+        """Test layer repositories are created on the shared filesystem."""
+        settings = Settings(data_dir=tmp_path)
+        repo = DataRepository.for_layer(settings, "silver")
+
+        assert repo.filesystem is get_filesystem(settings)
+        assert (tmp_path / "processed").is_dir()
+
+
+class TestObjectStoreRepository:
+    """Tests for the repository on an object store."""
+
+    def test_generation_round_trip(self, object_store: pafs.FileSystem) -> None:
+        """Test tables are published and read back through the object store."""
+        repo = DataRepository("lake/gold", filesystem=object_store)
+        df = pd.DataFrame({"id": [1, 2], "title": ["A", "B"], "revenue": [1.0, 2.0]})
+
+        with repo.generation() as generation:
+            repo.save_parquet(df, "movies_enriched")
+
+        reader = DataRepository("lake/gold", filesystem=object_store)
+        assert reader.current_generation() == generation
+        pd.testing.assert_frame_equal(reader.read_parquet("movies_enriched"), df)
+        assert reader.read_parquet("movies_enriched", columns=["id"]).columns.tolist() == ["id"]
+
+    def test_csv_round_trip(self, object_store: pafs.FileSystem) -> None:
+        """Test CSV files are written and read through the object store."""
+        repo = DataRepository("lake/bronze", filesystem=object_store)
+        df = pd.DataFrame({"id": [1, 2], "title": ["A", "B"]})
+
+        repo.save_csv(df, "movies_metadata")
+
+        pd.testing.assert_frame_equal(repo.read_csv("movies_metadata"), df)
+        assert [p.name for p in repo.list_files("*.csv")] == ["movies_metadata.csv"]
+
+    def test_upload_files(self, tmp_path: Path, object_store: pafs.FileSystem) -> None:
+        """Test local files are uploaded in parallel to the object store."""
+        paths = []
+        for name in ["credits.csv", "keywords.csv", "movies_metadata.csv"]:
+            path = tmp_path / name
+            path.write_text("id\n1\n")
+            paths.append(path)
+
+        uploaded = upload_files(paths, object_store, "lake/bronze", max_workers=3)
+
+        repo = DataRepository("lake/bronze", filesystem=object_store)
+        assert uploaded == 15
+        assert sorted(p.name for p in repo.list_files()) == [p.name for p in paths]
+
+
+class SlowRemoteHandler(DelegatingFileSystemHandler):
+    """Local filesystem that behaves like a slow remote store."""
+
+    def __init__(self, filesystem: pafs.FileSystem, latency: float = 0.01):
+        super().__init__(filesystem)
+        self.latency = latency
+        self.reads = 0
+
+    def open_input_file(self, path: str) -> pa.NativeFile:
+        handler = self
+
+        class _SlowFile(io.RawIOBase):
+            def __init__(self) -> None:
+                self._file = handler.filesystem.open_input_file(path)
+
+            def readable(self) -> bool:
+                return True
+
+            def seekable(self) -> bool:
+                return True
+
+            def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+                return self._file.seek(offset, whence)
+
+            def tell(self) -> int:
+                return self._file.tell()
+
+            def read(self, size: int = -1) -> bytes:
+                handler.reads += 1
+                time.sleep(handler.latency)
+                return self._file.read(size)
+
+        return pa.PythonFile(_SlowFile(), mode="r")
+
+
+class TestReadThroughCache:
+    """Tests for the read-through cache of remote layer files."""
+
+    @pytest.fixture
+    def remote(self, tmp_path: Path) -> SlowRemoteHandler:
+        """Slow remote store with one published Gold table."""
+        handler = SlowRemoteHandler(pafs.LocalFileSystem())
+        remote_fs = pafs.PyFileSystem(handler)
+        df = pd.DataFrame({"id": range(1000), "revenue": [float(i) for i in range(1000)]})
+        repo = DataRepository((tmp_path / "remote").as_posix(), filesystem=remote_fs)
+        with repo.generation():
+            repo.save_parquet(df, "movies_enriched")
+        return handler
+
+    def test_second_read_is_served_from_cache(
+        self, tmp_path: Path, remote: SlowRemoteHandler
+    ) -> None:
+        """Test repeated reads no longer touch the remote store."""
+        cache = ReadThroughCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        fs = cached_filesystem(pafs.PyFileSystem(remote), cache)
+        repo = DataRepository((tmp_path / "remote").as_posix(), filesystem=fs)
+
+        first = repo.read_parquet("movies_enriched")
+        remote_reads = remote.reads
+        second = repo.read_parquet("movies_enriched")
+
+        pd.testing.assert_frame_equal(first, second)
+        assert remote.reads == remote_reads
+        stats = cache.stats()
+        assert stats["hits"] > 0 and stats["misses"] > 0
+        assert stats["bytes_from_remote"] == stats["size_bytes"]
+
+    def test_column_subset_is_served_from_cached_chunks(
+        self, tmp_path: Path, remote: SlowRemoteHandler
+    ) -> None:
+        """Test reading a single column reuses the cached column chunk."""
+        cache = ReadThroughCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        fs = cached_filesystem(pafs.PyFileSystem(remote), cache)
+        repo = DataRepository((tmp_path / "remote").as_posix(), filesystem=fs)
+
+        repo.read_parquet("movies_enriched", columns=["revenue"])
+        remote_reads = remote.reads
+        repo.read_parquet("movies_enriched", columns=["revenue"])
+
+        assert remote.reads == remote_reads
+
+    def test_cache_survives_restart(self, tmp_path: Path, remote: SlowRemoteHandler) -> None:
+        """Test a new process reuses ranges cached on disk."""
+        for _ in range(2):
+            cache = ReadThroughCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+            fs = cached_filesystem(pafs.PyFileSystem(remote), cache)
+            DataRepository((tmp_path / "remote").as_posix(), filesystem=fs).read_parquet(
+                "movies_enriched"
+            )
+
+        assert cache.stats()["misses"] == 0
+
+    def test_new_version_is_not_served_stale(self, tmp_path: Path) -> None:
+        """Test a rewritten object is fetched again instead of served stale."""
+        cache = ReadThroughCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        fs = cached_filesystem(pafs.LocalFileSystem(), cache)
+        repo = DataRepository((tmp_path / "remote").as_posix(), filesystem=fs)
+
+        repo.save_parquet(pd.DataFrame({"id": [1]}), "movies")
+        assert len(repo.read_parquet("movies")) == 1
+        repo.save_parquet(pd.DataFrame({"id": [1, 2, 3]}), "movies")
+
+        assert len(repo.read_parquet("movies")) == 3
+
+    def test_same_size_rewrite_is_keyed_by_etag(
+        self, tmp_path: Path, object_store: pafs.FileSystem
+    ) -> None:
+        """Test an object rewritten with the same size and mtime is told apart by its ETag."""
+        cache = ReadThroughCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        fs = cached_filesystem(object_store, cache)
+        object_store.create_dir("lake")
+
+        contents = []
+        for etag, content in (("v1", b"first"), ("v2", b"other")):
+            with object_store.open_output_stream("lake/x", metadata={"ETag": etag}) as out:
+                out.write(content)
+            with fs.open_input_file("lake/x") as f:
+                contents.append(f.read())
+
+        # The mock store keeps one modification time for every write
+        assert contents == [b"first", b"other"]
+        assert cache.stats()["hits"] == 0
+
+    def test_lru_eviction_respects_size_cap(self, tmp_path: Path) -> None:
+        """Test the least recently used ranges are evicted first."""
+        cache = ReadThroughCache(tmp_path / "cache", max_bytes=250)
+        fetch = lambda offset, length: b"x" * length  # noqa: E731
+
+        cache.read("a", "v1", 0, 100, fetch)
+        cache.read("b", "v1", 0, 100, fetch)
+        cache.read("a", "v1", 10, 50, fetch)
+        cache.read("c", "v1", 0, 100, fetch)
+
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["size_bytes"] == 200
+        cache.read("a", "v1", 0, 100, fetch)
+        assert cache.stats()["hits"] == 2
+
+    def test_disabled_for_local_backend(self) -> None:
+        """Test local layers are never cached."""
+        assert get_read_cache(Settings()) is None
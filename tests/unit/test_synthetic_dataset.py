@@ -0,0 +1,61 @@
+"""Unit tests for the synthetic dataset generator."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_dataset import BASE_ROWS, QUIRK_RATES, generate_dataset
+from src.application.transformation import TransformMoviesUseCase
+from src.infrastructure.config import Settings
+
+
+@pytest.fixture(scope="module")
+def bronze_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Small synthetic Bronze layer."""
+    data_dir = tmp_path_factory.mktemp("synthetic")
+    generate_dataset(data_dir / "raw", scale="0.01", seed=7, chunk_rows=200)
+    return data_dir
+
+
+class TestSyntheticDataset:
+    """Tests for generate_dataset."""
+
+    def test_row_counts(self, bronze_dir: Path) -> None:
+        """Test files are written with the scaled row counts."""
+        for name, rows in BASE_ROWS.items():
+            df = pd.read_csv(bronze_dir / "raw" / f"{name}.csv")
+            assert len(df) == int(rows * 0.01)
+
+    def test_deterministic(self, bronze_dir: Path, tmp_path: Path) -> None:
+        """Test the same seed reproduces the same files."""
+        generate_dataset(tmp_path, scale="0.01", seed=7, chunk_rows=200)
+
+        for name in BASE_ROWS:
+            expected = (bronze_dir / "raw" / f"{name}.csv").read_bytes()
+            assert (tmp_path / f"{name}.csv").read_bytes() == expected
+
+    def test_quirks(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the Kaggle quirks are present."""
+        for quirk in QUIRK_RATES:
+            monkeypatch.setitem(QUIRK_RATES, quirk, 0.2)
+        generate_dataset(tmp_path, scale="0.002", seed=7)
+
+        movies = pd.read_csv(tmp_path / "movies_metadata.csv", dtype=str)
+
+        assert movies["genres"].str.startswith("[{'id': ").any()
+        assert pd.to_numeric(movies["id"], errors="coerce").isna().any()
+        assert movies["release_date"].str.contains("/", na=False).any()
+        assert movies["release_date"].isna().any()
+
+    def test_silver_transformation(self, bronze_dir: Path) -> None:
+        """Test the Silver stage processes the synthetic files."""
+        stats = TransformMoviesUseCase(Settings(data_dir=bronze_dir)).execute()
+
+        assert stats["movies"]["rows"] > 0
+        assert stats["credits"]["rows"] == int(BASE_ROWS["credits"] * 0.01)
+
+    def test_invalid_scale(self, tmp_path: Path) -> None:
+        """Test invalid scales are rejected."""
+        with pytest.raises(ValueError):
+            generate_dataset(tmp_path, scale="huge")
@@ -0,0 +1,141 @@
+"""Unit tests for columnar entity validation."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.application.transformation import TransformMoviesUseCase
+from src.application.transformation.validation import REASON_COLUMN, ColumnarValidator
+from src.domain.entities import Movie, MovieRating
+from src.domain.exceptions import DataValidationError
+from src.infrastructure.config import Settings
+from src.infrastructure.repositories import DataRepository
+
+
+@pytest.fixture
+def movies() -> pd.DataFrame:
+    """Create Silver-like movies with one problem per row."""
+    return pd.DataFrame(
+        {
+            "id": [1.0, 2.0, np.nan, 4.0, 5.0],
+            "title": ["Alpha", None, "Gamma", "Delta", "Epsilon"],
+            "budget": [-5.0, 1.0, 2.0, np.nan, 3.0],
+            "vote_average": [11.0, 5.0, 5.0, -1.0, 5.0],
+            "runtime": [90.0, 95.0, np.nan, np.nan, 90.5],
+            "release_date": pd.to_datetime(["2000-01-01", None, None, "2001-02-03", None]),
+        }
+    )
+
+
+class TestColumnarValidator:
+    """Tests checks derived from the entity definitions."""
+
+    def test_rejects_and_repairs(self, movies: pd.DataFrame) -> None:
+        """Test required, type and clamp checks on a DataFrame."""
+        result = ColumnarValidator(Movie).validate(movies)
+
+        assert result.valid["id"].tolist() == [1.0, 4.0]
+        assert result.valid["budget"].tolist() == [0.0, 0.0]
+        assert result.valid["vote_average"].tolist() == [10.0, 0.0]
+        assert dict(zip(result.rejects["id"].fillna(0), result.rejects[REASON_COLUMN])) == {
+            2.0: "missing_title",
+            0.0: "missing_id",
+            5.0: "invalid_runtime",
+        }
+        assert result.metrics == {
+            "rows": 5,
+            "valid": 2,
+            "rejected": 3,
+            "missing_id": 1,
+            "missing_title": 1,
+            "invalid_runtime": 1,
+            "clamped_budget": 1,
+            "defaulted_budget": 1,
+            "clamped_vote_average": 2,
+        }
+
+    def test_arrow_matches_pandas(self, movies: pd.DataFrame) -> None:
+        """Test an Arrow table gets the same result as the DataFrame."""
+        validator = ColumnarValidator(Movie)
+        table = pa.Table.from_pandas(movies, preserve_index=False)
+
+        expected = validator.validate(movies)
+        result = validator.validate(table)
+
+        assert isinstance(result.valid, pa.Table) and result.metrics == expected.metrics
+        assert result.valid.schema == table.schema
+        pd.testing.assert_frame_equal(
+            result.valid.to_pandas(), expected.valid.reset_index(drop=True)
+        )
+        pd.testing.assert_frame_equal(
+            result.rejects.to_pandas(), expected.rejects.reset_index(drop=True)
+        )
+
+    def test_entity_agrees_with_columns(self) -> None:
+        """Test clamped columns hold what the pydantic entity would."""
+        ratings = pd.DataFrame(
+            {"movieId": [1, 2, 3], "userId": [1, 1, 2], "rating": [0.1, 3.5, 7.0], "timestamp": 0}
+        )
+
+        result = ColumnarValidator(
+            MovieRating, {"movie_id": "movieId", "user_id": "userId"}
+        ).validate(ratings)
+
+        expected = [
+            MovieRating(movie_id=m, user_id=u, rating=r, timestamp=0).rating
+            for m, u, r in ratings[["movieId", "userId", "rating"]].itertuples(index=False)
+        ]
+        assert result.valid["rating"].tolist() == expected
+        assert result.valid["movieId"].dtype == "int64"
+
+    def test_missing_required_column(self) -> None:
+        """Test a table without a required column is an error."""
+        with pytest.raises(DataValidationError, match="title"):
+            ColumnarValidator(Movie).validate(pd.DataFrame({"id": [1]}))
+
+
+class TestSilverValidation:
+    """Tests validation wired into the Silver stage."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"execution_mode": "out_of_core", "chunk_size": 1}, {"engine": "polars"}],
+    )
+    def test_rejects_table(self, tmp_path: Path, options: dict) -> None:
+        """Test rejected movies are saved apart and counted in the statistics."""
+        raw = tmp_path / "raw"
+        raw.mkdir()
+        (raw / "movies_metadata.csv").write_text(
+            "id,title,status,genres,production_companies,production_countries,"
+            "spoken_languages,budget,revenue,release_date,runtime,popularity,"
+            "vote_average,vote_count\n"
+            "1,Alpha,Released,[],[],[],[],-10,100,2000-01-01,90,1.0,7.5,10\n"
+            "2,Beta,Released,[],[],[],[],0,0,2001-01-01,95.5,1.0,11,3\n"
+            "3,Gamma,Released,[],[],[],[],50,-20,2002-01-01,80,1.0,6.0,4\n"
+        )
+        (raw / "credits.csv").write_text("id,cast,crew\n")
+        (raw / "keywords.csv").write_text("id,keywords\n")
+        (raw / "ratings_small.csv").write_text("userId,movieId,rating,timestamp\n1,1,4.0,0\n")
+
+        settings = Settings(data_dir=tmp_path, **options)
+        stats = TransformMoviesUseCase(settings).execute()
+
+        silver = DataRepository.for_layer(settings, "silver")
+        rejects = silver.read_parquet("movies_rejects")
+        movies = silver.read_parquet("movies").sort_values("id")
+        assert movies["budget"].tolist() == [0, 50]
+        assert movies["revenue"].tolist() == [100, 0]
+        # Derived from the clamped budget and revenue, not the raw ones
+        assert movies["profit"].tolist() == [100, -50]
+        assert movies["has_budget"].tolist() == [False, True]
+        assert movies["has_revenue"].tolist() == [True, False]
+        assert pd.isna(movies["roi"].iloc[0]) and movies["roi"].iloc[1] == -100
+        assert rejects["id"].tolist() == [2]
+        assert rejects[REASON_COLUMN].tolist() == ["invalid_runtime"]
+        assert stats["movies"]["rejected"] == 1
+        assert stats["movies"]["quality"]["clamped_budget"] == 1
+        assert stats["movies"]["quality"]["clamped_revenue"] == 1
+        assert silver.read_parquet("ratings_rejects").empty